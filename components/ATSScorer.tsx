@@ -26,17 +26,37 @@ import {
   saveLlmApiKeyForProvider,
   type AtsHistoryItem,
   type AtsProvider,
+  type AtsResult,
+  type FixResumePartialEvent,
   type FixResumeResult,
   type MissingKeywordItem,
 } from '../services/atsService';
 import { mapImprovedResumeToResumeInfo } from '../services/improvedResumeMapper';
 import { highlightAddedKeywords } from '../utils/highlightAddedKeywords';
 import FixResumeTemplatePreview from './fix-resume/FixResumeTemplatePreview';
-import { ResumePreviewTemplateView, type ResumePreviewData } from './fix-resume/ResumePreviewTemplateView';
+import {
+  ResumePreviewTemplateView,
+  type ResumePreviewData,
+  type ResumePreviewSection,
+} from './fix-resume/ResumePreviewTemplateView';
 
 const SELECTED_PROVIDER_STORAGE = 'pb_ats_llm_provider';
 const API_KEY_STORAGE_PREFIX = 'pb_ats_api_key_';
 const API_KEY_STORAGE = 'pb_ats_gemini_api_key';
+
+/** Folds a streamed AI render event into the in-progress preview (JSON render only). */
+function applyFixPartial(prev: ResumePreviewData | null, ev: FixResumePartialEvent): ResumePreviewData | null {
+  const base: ResumePreviewData = prev ?? { name: '', subtitle: [], contacts: [], sections: [] };
+  if (ev.event === 'field') {
+    return { ...base, [ev.key]: ev.value } as ResumePreviewData;
+  }
+  if (ev.event === 'section' && ev.section) {
+    const sections = base.sections.slice();
+    sections[ev.index] = ev.section as unknown as ResumePreviewSection;
+    return { ...base, sections };
+  }
+  return prev;
+}
 const LEGACY_API_KEY_STORAGE = 'pb_ats_llm_api_key';
 const PRIMARY = '#FF6B00';
 const RING_RADIUS = 52;
@@ -237,6 +257,8 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
   const [isAnalyzing, setIsAnalyzing] = useState(false);
   const [hasAnalyzed, setHasAnalyzed] = useState(false);
   const [result, setResult] = useState<AnalysisResult | null>(null);
+  /** Instant local estimate shown while the LLM analysis is still running. */
+  const [provisional, setProvisional] = useState<AtsResult | null>(null);
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
   /** When true, user chose to paste a one-off key instead of the Settings-saved key. */
   const [useDifferentKey, setUseDifferentKey] = useState(false);
@@ -256,6 +278,8 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
   const [fixLoading, setFixLoading] = useState(false);
   const [fixError, setFixError] = useState<string | null>(null);
   const [fixOutcome, setFixOutcome] = useState<FixResumeResult | null>(null);
+  /** Sections of the AI render received so far (streaming dev server only). */
+  const [fixPartial, setFixPartial] = useState<ResumePreviewData | null>(null);
   const [fixUseLlmPolish, setFixUseLlmPolish] = useState(false);
   const [fixUseAiMapFields, setFixUseAiMapFields] = useState(true);
   const [fixRenderApiKey, setFixRenderApiKey] = useState('');
@@ -441,6 +465,22 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
     setIsAnalyzing(true);
     setHasAnalyzed(false);
     setResult(null);
+    setProvisional(null);
+    let settled = false;
+    // Deterministic estimate (milliseconds server-side, no LLM / trial use) fills the wait for the full score.
+    void analyzeAtsWithProvider({
+      provider,
+      ...(userId ? { userId } : {}),
+      jobDescription: jobDescription.trim(),
+      resumeFile,
+      scoringMode: 'local',
+    })
+      .then((quick) => {
+        if (!settled && quick.success && quick.atsResult) setProvisional(quick.atsResult);
+      })
+      .catch(() => {
+        /* the full analysis reports errors */
+      });
     try {
       const out = await analyzeAtsWithProvider({
         provider,
@@ -474,6 +514,8 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
     } catch (e) {
       setErrorMessage(e instanceof Error ? e.message : 'Network error. Try again.');
     } finally {
+      settled = true;
+      setProvisional(null);
       setIsAnalyzing(false);
     }
   };
@@ -511,6 +553,7 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
   const handleFixResume = async () => {
     if (!resumeFile || !result?.missingKeywords?.length) return;
     setFixError(null);
+    setFixPartial(null);
     setFixLoading(true);
     // Fix server loads saved keys from DynamoDB only when it has AWS access (works on deployed Lambda).
     // Locally, merge the main BYOK field so a key still in the input works without DynamoDB on Python.
@@ -529,6 +572,7 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
         ...(fixLlmPolishAllowed && fixUseLlmPolish && apiKey.trim()
           ? { provider, apiKey: apiKey.trim() }
           : {}),
+        onPartial: (ev) => setFixPartial((prev) => applyFixPartial(prev, ev)),
       });
       if (!out.success) {
         setFixError(out.message || 'Could not improve resume.');
@@ -539,6 +583,7 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
       setFixError(e instanceof Error ? e.message : 'Network error. Try again.');
     } finally {
       setFixLoading(false);
+      setFixPartial(null);
     }
   };
 
@@ -935,6 +980,19 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
             <Loader2 className="h-4 w-4 animate-spin text-[#FF6B00] shrink-0" aria-hidden />
             Scoring… usually a few seconds.
           </p>
+          {provisional && (
+            <div className="mb-5 rounded-lg border border-orange-100 bg-orange-50 px-4 py-3 text-sm text-gray-800">
+              <p>
+                Quick estimate: <span className="font-semibold text-[#FF6B00]">{provisional.overallScore}/100</span>
+                <span className="text-gray-500"> · full analysis in progress</span>
+              </p>
+              {provisional.missingKeywords.length > 0 && (
+                <p className="mt-1 text-xs text-gray-600">
+                  Likely missing: {provisional.missingKeywords.slice(0, 6).join(', ')}
+                </p>
+              )}
+            </div>
+          )}
           <div className="animate-pulse">
             <div className="flex flex-col md:flex-row md:items-center gap-8">
               <div className="h-36 w-36 rounded-full bg-gray-200 mx-auto md:mx-0" />
@@ -1085,10 +1143,19 @@ const ATSScorer: React.FC<ATSScorerProps> = ({ onBack, onNavigateToSettings, sav
                   aria-live="polite"
                 >
                   <Loader2 className="h-3.5 w-3.5 animate-spin text-[#FF6B00] shrink-0" aria-hidden />
-                  Working…
+                  {fixPartial?.sections.length ? `Writing… ${fixPartial.sections.length} section(s) ready` : 'Working…'}
                 </div>
               )}
 
+              {fixLoading && fixPartial && (fixPartial.name || fixPartial.sections.length > 0) ? (
+                <div className="rounded-lg border border-dashed border-gray-200 bg-white overflow-auto max-h-[min(560px,70vh)] opacity-80">
+                  <ResumePreviewTemplateView
+                    data={{ ...fixPartial, sections: fixPartial.sections.filter(Boolean) }}
+                    highlightTerms={[]}
+                  />
+                </div>
+              ) : null}
+
               {fixOutcome?.success &&
               !fixLoading &&
               fixOutcome.resumeData &&
@@ -548,6 +548,8 @@ const JobHuntPage: React.FC<JobHuntPageProps> = ({ toggleSidebar }) => {
     useJobHuntShell();
   const [jobs, setJobs] = useState<JobListing[]>([]);
   const [total, setTotal] = useState(0);
+  /** next_cursor per page number, reset when tab / page size / user changes */
+  const pageCursorsRef = useRef<{ scope: string; byPage: Map<number, string> }>({ scope: '', byPage: new Map() });
   const [isLoading, setIsLoading] = useState(true);
   const [isRefreshing, setIsRefreshing] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -618,6 +620,11 @@ const JobHuntPage: React.FC<JobHuntPageProps> = ({ toggleSidebar }) => {
     setError(null);
     const offset = (currentPage - 1) * itemsPerPage;
     const uid = getJobHuntUserId();
+    const cursorScope = `${jobListTab}:${itemsPerPage}:${uid || ''}`;
+    if (pageCursorsRef.current.scope !== cursorScope) {
+      pageCursorsRef.current = { scope: cursorScope, byPage: new Map() };
+    }
+    const cursors = pageCursorsRef.current.byPage;
     try {
       if (jobListTab === 'saved' && !uid) {
         setJobs([]);
@@ -627,10 +634,13 @@ const JobHuntPage: React.FC<JobHuntPageProps> = ({ toggleSidebar }) => {
       const result = await fetchJobs({
         limit: itemsPerPage,
         offset,
+        cursor: cursors.get(currentPage),
         userId: uid || undefined,
         savedOnly: jobListTab === 'saved',
       });
       if (result.success && result.data) {
+        if (result.data.next_cursor) cursors.set(currentPage + 1, result.data.next_cursor);
+        else cursors.delete(currentPage + 1);
         setJobs(result.data.jobs);
         setTotal(result.data.total);
         setSavedIds((prev) => {
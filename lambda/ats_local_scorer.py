@@ -0,0 +1,366 @@
+"""
+Deterministic ATS pre-scorer: résumé text + job description → provisional ATS result in
+milliseconds, without an LLM call.
+
+Output has the same shape as the LLM scorer's (overallScore, breakdown with the WEIGHTS
+keys, matchedKeywords, missingKeywords, missingKeywordDetails, feedback) plus
+"provisional": True, "scoredBy": "local" and the raw "signals" behind the score:
+
+- keywords: JD terms (tech tokens such as C++ / Node.js / AWS, a skills lexicon, known
+  multi-word phrases) checked against the résumé with keyword_matcher (stemming + synonyms)
+- sections: Summary / Skills / Experience / Projects / Education headings
+- format: contact details, bullets, length
+- achievements: quantified lines and action verbs; experience years vs the JD's "N+ years"
+
+The numbers are heuristics, so callers treat them as an estimate: the ATS Lambda returns
+it instantly for scoringMode=local and only skips the LLM (scoringMode=auto) when the
+estimate is clearly decisive (see is_decisive). score_many scores one résumé against many
+JDs (batch scoring) with the résumé-side signals computed once.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from datetime import datetime
+
+import keyword_matcher
+
+WEIGHTS = {
+    "skillsMatch": 30,
+    "experience": 25,
+    "education": 15,
+    "formatting": 15,
+    "achievements": 10,
+    "locationAndSoft": 5,
+}
+
+try:
+    MAX_JD_KEYWORDS = max(5, min(60, int(os.environ.get("ATS_LOCAL_MAX_KEYWORDS", "25"))))
+except ValueError:
+    MAX_JD_KEYWORDS = 25
+try:
+    DECISIVE_BELOW = int(os.environ.get("ATS_LOCAL_DECISIVE_BELOW", "35"))
+except ValueError:
+    DECISIVE_BELOW = 35
+try:
+    DECISIVE_ABOVE = int(os.environ.get("ATS_LOCAL_DECISIVE_ABOVE", "90"))
+except ValueError:
+    DECISIVE_ABOVE = 90
+
+_SKILL_WORDS = frozenset(
+    """
+    python java javascript typescript golang go rust ruby php kotlin swift scala sql nosql html css
+    react angular vue django flask fastapi spring node express graphql rest grpc kafka rabbitmq redis
+    postgres postgresql mysql mongodb dynamodb cassandra elasticsearch spark hadoop airflow snowflake
+    aws azure gcp lambda docker kubernetes terraform ansible jenkins linux git microservices serverless
+    pandas numpy tensorflow pytorch scikit-learn tableau excel powerbi figma jira
+    agile scrum kanban devops testing automation security observability monitoring
+    leadership communication collaboration mentoring stakeholder stakeholders ownership teamwork
+    """.split()
+)
+_SKILL_PHRASES = (
+    "system design", "distributed systems", "machine learning", "deep learning", "data science",
+    "data structures", "data analysis", "data engineering", "natural language processing",
+    "computer vision", "object oriented", "unit testing", "test driven development", "code review",
+    "version control", "cloud computing", "ci/cd", "rest api", "problem solving",
+    "project management", "stakeholder management", "product management", "computer science",
+)
+_SOFT_TERMS = (
+    "communication", "leadership", "collaboration", "teamwork", "stakeholder", "mentoring",
+    "problem solving", "ownership", "presentation", "negotiation",
+)
+_STOP = frozenset(
+    """
+    a an and or the of to in on for with at by from as is are be been being this that these those
+    we you our your us they their it its will would can could should may might must have has had
+    do does did not no yes all any both each more most other some such only own same so than too
+    very just about above after again against before below between into through during under
+    up down out off over also etc e.g i.e per via using use used work working team teams role
+    job title company location description required requirements preferred responsibilities
+    skills skill experience years year ability strong knowledge understanding plus including
+    new who what when where why how which while within across based level senior junior
+    """.split()
+)
+_PHRASE_RE = re.compile(
+    r"(?<![\w/])(?:" + "|".join(re.escape(p) for p in sorted(_SKILL_PHRASES, key=len, reverse=True)) + r")(?![\w/])"
+)
+_TERM_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*(?:[+#]{1,2}|(?:[./-][A-Za-z0-9]+)+)?")
+_SENTENCE_START_RE = re.compile(r"(?:^|[.!?:;•\n]\s*|[-*]\s+)$")
+
+_SECTION_HEADINGS = {
+    "Summary": ("summary", "professional summary", "objective", "profile", "about me"),
+    "Skills": ("skills", "technical skills", "core competencies", "tech stack", "technologies"),
+    "Experience": ("experience", "work experience", "professional experience", "employment",
+                   "work history", "internships", "internship"),
+    "Projects": ("projects", "personal projects", "academic projects", "key projects"),
+    "Education": ("education", "academic background", "qualifications", "academics"),
+}
+_HEADING_TO_SECTION = {alias: sec for sec, aliases in _SECTION_HEADINGS.items() for alias in aliases}
+_HEADING_LINE_RE = re.compile(r"^[\s#*•\-]*([A-Za-z][A-Za-z &/]{2,40}?)\s*:?\s*$")
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+_PHONE_RE = re.compile(r"\+?\d[\d\s().-]{8,}\d")
+_BULLET_RE = re.compile(r"(?m)^\s*(?:[-*•●▪◦‣]|\d+[.)])\s+\S")
+_QUANTIFIED_RE = re.compile(
+    r"\d+(?:\.\d+)?\s*(?:%|x\b|k\b|m\b|\+|percent)|[$₹€£]\s?\d|"
+    r"\b\d[\d,]*\s+(?:users|customers|clients|requests|transactions|engineers|people|members|services|hours|days)\b",
+    re.I,
+)
+_ACTION_VERBS = (
+    "led", "built", "designed", "developed", "implemented", "improved", "reduced", "increased",
+    "launched", "delivered", "optimized", "optimised", "automated", "mentored", "migrated",
+    "architected", "scaled", "owned", "shipped", "created",
+)
+_ACTION_VERB_RE = re.compile(r"\b(?:" + "|".join(_ACTION_VERBS) + r")\b", re.I)
+_DATE_RANGE_RE = re.compile(
+    r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|till date|ongoing)\b", re.I
+)
+_JD_YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years|yrs)", re.I)
+_DEGREE_RE = re.compile(
+    r"\b(?:b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|m\.?\s?e\b|b\.?\s?sc|m\.?\s?sc|b\.?s\.?|m\.?s\.?|bachelor'?s?|"
+    r"master'?s?|ph\.?d|mba|bca|mca|degree|diploma)\b",
+    re.I,
+)
+
+
+def extract_jd_keywords(job_description: str, limit: int | None = None) -> list[str]:
+    """
+    Important JD terms in display form, most frequent first (ties: first seen): known skill
+    phrases, skills-lexicon words, and tech-shaped tokens (C++, Node.js, AWS, JavaScript)
+    or capitalised terms that do not start a sentence.
+    """
+    jd = job_description or ""
+    jd_lower = jd.lower()
+    counts: dict[str, int] = {}
+    first_seen: dict[str, int] = {}
+    display: dict[str, str] = {}
+
+    def add(term: str, pos: int) -> None:
+        key = term.lower()
+        counts[key] = counts.get(key, 0) + 1
+        if key not in first_seen:
+            first_seen[key] = pos
+            display[key] = term
+
+    phrase_spans = []
+    for m in _PHRASE_RE.finditer(jd_lower):
+        add(jd[m.start():m.end()], m.start())
+        phrase_spans.append((m.start(), m.end()))
+
+    for m in _TERM_RE.finditer(jd):
+        if any(s <= m.start() < e for s, e in phrase_spans):
+            continue  # already counted as part of a phrase ("stakeholder" of "stakeholder management")
+        term = m.group(0).rstrip(".-/")
+        low = term.lower()
+        if len(term) < 2 or low in _STOP:
+            continue
+        tech_shaped = any(c in term for c in "+#./") or any(c.isdigit() for c in term)
+        acronym = term.isupper() and len(term) >= 2
+        mixed_case = any(c.isupper() for c in term[1:]) and any(c.islower() for c in term)
+        capitalised = term[0].isupper() and not _SENTENCE_START_RE.search(jd[max(0, m.start() - 3):m.start()])
+        if low in _SKILL_WORDS or tech_shaped or acronym or mixed_case or capitalised:
+            add(term, m.start())
+
+    ranked = sorted(counts, key=lambda k: (-counts[k], first_seen[k]))
+    return [display[k] for k in ranked[: limit or MAX_JD_KEYWORDS]]
+
+
+def suggested_sections(keyword: str) -> list[str]:
+    """Section hints following the LLM prompt's mapping rules."""
+    low = keyword.lower()
+    if _DEGREE_RE.search(low) or "certif" in low:
+        return ["Education"]
+    if any(t in low for t in _SOFT_TERMS) or low in ("ownership", "mentoring"):
+        return ["Experience", "Projects"]
+    if low in _SKILL_WORDS or any(c in keyword for c in "+#./") or keyword.isupper():
+        return ["Skills", "Projects"]
+    if low in _SKILL_PHRASES:
+        return ["Skills", "Projects"] if len(low.split()) <= 2 else ["Summary", "Projects"]
+    return ["Summary", "Projects"]
+
+
+def _heading_section(line: str) -> str | None:
+    if len(line) > 48:
+        return None
+    m = _HEADING_LINE_RE.match(line)
+    return _HEADING_TO_SECTION.get(re.sub(r"\s+", " ", m.group(1)).strip().lower()) if m else None
+
+
+def detect_sections(resume_text: str) -> list[str]:
+    found: list[str] = []
+    for line in (resume_text or "").splitlines():
+        sec = _heading_section(line)
+        if sec and sec not in found:
+            found.append(sec)
+    return found
+
+
+def _experience_years(resume_text: str) -> float:
+    """Years covered by date ranges outside the Education section (overlaps merged)."""
+    now = datetime.now().year
+    current, kept = None, []
+    for line in (resume_text or "").splitlines():
+        current = _heading_section(line) or current
+        if current != "Education":
+            kept.append(line)
+    spans = []
+    for start, end in _DATE_RANGE_RE.findall("\n".join(kept)):
+        s = int(start)
+        e = now if not end[:1].isdigit() else int(end)
+        if s <= e <= now + 1:
+            spans.append((s, e))
+    if not spans:
+        return 0.0
+    # Union of year ranges so overlapping roles are not double counted
+    spans.sort()
+    total, cur_s, cur_e = 0, spans[0][0], spans[0][1]
+    for s, e in spans[1:]:
+        if s > cur_e:
+            total += cur_e - cur_s
+            cur_s, cur_e = s, e
+        else:
+            cur_e = max(cur_e, e)
+    total += cur_e - cur_s
+    return float(max(total, 0.5))
+
+
+def _clamp(v: float) -> int:
+    return int(round(max(0.0, min(100.0, v))))
+
+
+def _resume_signals(resume: str) -> dict:
+    """Résumé-only inputs of the score (independent of the JD); computed once per batch."""
+    return {
+        "index": keyword_matcher.index_for(resume),
+        "sections": detect_sections(resume),
+        "words": len(resume.split()),
+        "bullets": len(_BULLET_RE.findall(resume)),
+        "quantified": len(_QUANTIFIED_RE.findall(resume)),
+        "action_verbs": len(_ACTION_VERB_RE.findall(resume)),
+        "has_email": bool(_EMAIL_RE.search(resume)),
+        "has_phone": bool(_PHONE_RE.search(resume)),
+        "years": _experience_years(resume),
+        "has_degree": bool(_DEGREE_RE.search(resume)),
+    }
+
+
+def score_locally(resume_text: str, job_description: str) -> dict:
+    """Provisional ATS result (see module docstring); pure function of the two texts."""
+    return _score(_resume_signals(resume_text or ""), job_description or "")
+
+
+def score_many(resume_text: str, job_descriptions: list[str]) -> list[dict]:
+    """
+    score_locally for one résumé against many JDs (batch scoring): the résumé is parsed and
+    indexed once and only the JD side is computed per job. Results follow the input order.
+    """
+    resume = _resume_signals(resume_text or "")
+    return [_score(resume, jd or "") for jd in job_descriptions]
+
+
+def _score(resume: dict, jd: str) -> dict:
+    index = resume["index"]
+    keywords = extract_jd_keywords(jd)
+    matched = [k for k in keywords if index.covers(k)]
+    missing = [k for k in keywords if k not in matched]
+    coverage = len(matched) / len(keywords) if keywords else 0.5
+
+    sections = resume["sections"]
+    words = resume["words"]
+    bullets = resume["bullets"]
+    quantified = resume["quantified"]
+    action_verbs = resume["action_verbs"]
+    has_email = resume["has_email"]
+    has_phone = resume["has_phone"]
+    years = resume["years"]
+    jd_years = [int(y) for y in _JD_YEARS_RE.findall(jd)]
+    required_years = min(jd_years) if jd_years else 0
+    resume_has_degree = resume["has_degree"]
+    jd_wants_degree = bool(_DEGREE_RE.search(jd))
+    jd_soft = [t for t in _SOFT_TERMS if t in jd.lower()]
+
+    skills_score = coverage * 100
+
+    if required_years:
+        years_part = min(years / required_years, 1.0) * 50
+    else:
+        years_part = 50 if years else 25
+    experience_score = (30 if "Experience" in sections else 0) + years_part + 20 * coverage
+
+    education_score = (50 if "Education" in sections else 0) + (30 if resume_has_degree else 0)
+    education_score += 20 if (resume_has_degree or not jd_wants_degree) else 0
+
+    core = ("Summary", "Skills", "Experience", "Projects", "Education")
+    length_part = 25 if 300 <= words <= 1200 else 25 * min(words / 300, 1200 / max(words, 1), 1.0)
+    formatting_score = (
+        8 * sum(1 for s in core if s in sections)
+        + (10 if has_email else 0)
+        + (10 if has_phone else 0)
+        + (15 if bullets >= 3 else 5 * bullets)
+        + length_part
+    )
+
+    achievements_score = min(quantified, 6) / 6 * 70 + min(action_verbs, 6) / 6 * 30
+
+    if jd_soft:
+        soft_score = 100 * sum(1 for t in jd_soft if index.covers(t)) / len(jd_soft)
+    else:
+        soft_score = 70 + 10 * min(sum(1 for t in _SOFT_TERMS if index.covers(t)), 3)
+
+    breakdown = {
+        "skillsMatch": _clamp(skills_score),
+        "experience": _clamp(experience_score),
+        "education": _clamp(education_score),
+        "formatting": _clamp(formatting_score),
+        "achievements": _clamp(achievements_score),
+        "locationAndSoft": _clamp(soft_score),
+    }
+    overall = _clamp(sum(breakdown[k] * w for k, w in WEIGHTS.items()) / sum(WEIGHTS.values()))
+
+    feedback: list[str] = []
+    if missing:
+        feedback.append(
+            f"Show where you have used {', '.join(missing[:3])} (skills, projects or experience bullets) if it applies to you."
+        )
+    absent = [s for s in ("Skills", "Experience", "Education") if s not in sections]
+    if absent:
+        feedback.append(f"Add a clear {' / '.join(absent)} heading so ATS parsers can find that section.")
+    if quantified < 3:
+        feedback.append("Quantify more achievements (%, $, users, time saved) in your experience bullets.")
+    if words > 1200:
+        feedback.append("Tighten the résumé to one or two pages; long résumés bury the matching keywords.")
+    elif words < 250:
+        feedback.append("Expand your experience and project bullets; the résumé is too short to match many JD terms.")
+    if not (has_email and has_phone):
+        feedback.append("Put an email address and phone number at the top of the résumé.")
+    if not feedback:
+        feedback.append("Strong keyword and structure match; tailor the summary to the role's top requirements.")
+
+    return {
+        "overallScore": overall,
+        "breakdown": breakdown,
+        "matchedKeywords": matched,
+        "missingKeywords": missing,
+        "missingKeywordDetails": [{"keyword": k, "suggestedSection": suggested_sections(k)} for k in missing],
+        "feedback": feedback[:4],
+        "provisional": True,
+        "scoredBy": "local",
+        "signals": {
+            "keywordCoverage": round(coverage, 3),
+            "jdKeywords": len(keywords),
+            "sections": list(sections),
+            "words": words,
+            "bullets": bullets,
+            "quantifiedLines": quantified,
+            "experienceYears": years,
+            "requiredYears": required_years,
+        },
+    }
+
+
+def is_decisive(local_result: dict) -> bool:
+    """True when the local estimate is far enough from the middle that an LLM would not change the verdict."""
+    score = local_result.get("overallScore", 50)
+    enough_keywords = (local_result.get("signals") or {}).get("jdKeywords", 0) >= 5
+    return enough_keywords and (score <= DECISIVE_BELOW or score >= DECISIVE_ABOVE)
@@ -5,13 +5,30 @@ Modes:
 1) BYOK provider — POST JSON with provider + API key, jobDescription, and either resumeText OR
    resumeBase64 + resumeFileName (.pdf / .docx). Supports openai/openrouter/gemini/anthropic; key is not stored.
 2) Legacy — userId + jobDescription + resumeText or resumeBase64: loads llmApiKeys from DynamoDB Users,
-   uses selected provider or OpenAI → Claude → Gemini → OpenRouter.
+   uses selected provider or OpenAI → Claude → Gemini → OpenRouter, reordered by recent provider
+   latency/errors and hedged (backup provider fires after a delay; see llm_race.py).
+3) Batch — either credential style plus "jobs": [{jobId, jobDescription}, ...] (JobListings rows with
+   description / job_title work too): one résumé scored against every job; see run_batch.
 
 Optional env:
 - ATS_HISTORY_TABLE (default AtsScoreHistory): save reports when userId present
 - ATS_RESUME_S3_BUCKET: if set, upload resume bytes to S3 when saving history; stores resumeS3Bucket, resumeS3Key, resumeFileUrl, resume (same URL) on the item
 - ATS_RESUME_S3_PREFIX (default ats-resume-history/): key prefix under the bucket
 - PDF/DOCX text extraction: see resume_text_extract.py (ENABLE_TEXTRACT_OCR, OCR_MAX_PDF_PAGES, MIN_PDF_TEXT_CHARS)
+- LLM_HEDGE_DELAY_SECONDS / LLM_RACE_MAX_IN_FLIGHT: provider hedging for the legacy flow (see llm_race.py)
+- LLM_CACHE_ENTRIES / LLM_CACHE_TTL_SECONDS / LLM_CACHE_TABLE: identical prompts (re-submits, retries) are
+  answered from the LLM response cache (see llm_cache.py)
+- HTTP_POOL_MAX_IDLE_PER_HOST / HTTP_RETRIES ...: provider calls reuse keep-alive connections (see http_client.py)
+- KEYWORD_INDEX_CACHE_ENTRIES (default 32): résumé keyword indexes kept warm (see keyword_matcher.py)
+- ATS_SCORING_MODE (default llm): used when the request has no scoringMode.
+    llm   — always score with the LLM
+    local — deterministic estimate from ats_local_scorer.py only (milliseconds, no LLM call, no trial use,
+            no history); the frontend fires this alongside the LLM request to show a provisional score
+    auto  — return the local estimate when it is decisive (ATS_LOCAL_DECISIVE_BELOW / _ABOVE, default 35 / 90),
+            otherwise call the LLM
+- ATS_BATCH_MAX_JOBS (default 8) / ATS_BATCH_CONCURRENCY (default 4): batch size cap and LLM calls in flight.
+  The defaults keep a batch to two waves of LLM calls so it answers inside the ~30s HTTP API limit; the
+  frontend splits longer job lists into several requests
 
 Dependencies: PyPDF2, pdfminer.six, PyMuPDF (fitz), python-docx (see ats_resume_scorer_requirements.txt).
 """
@@ -26,9 +43,17 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
-from feature_entitlement import check_entitlement_or_error, consume_feature_use
+import ats_local_scorer
+import http_client
+import keyword_matcher
+import llm_cache
+import llm_race
+import llm_stream
+from ats_local_scorer import WEIGHTS
+from feature_entitlement import EntitlementContext, check_entitlement_or_error, consume_feature_use
 
 # Optional AWS deps (local dev may not have boto3/botocore installed).
 try:
@@ -51,6 +76,20 @@ ATS_RESUME_S3_PREFIX = (os.environ.get("ATS_RESUME_S3_PREFIX") or "ats-resume-hi
 if ATS_RESUME_S3_PREFIX and not ATS_RESUME_S3_PREFIX.endswith("/"):
     ATS_RESUME_S3_PREFIX += "/"
 
+ATS_SCORING_MODES = ("llm", "local", "auto")
+ATS_SCORING_MODE = (os.environ.get("ATS_SCORING_MODE") or "llm").strip().lower()
+if ATS_SCORING_MODE not in ATS_SCORING_MODES:
+    ATS_SCORING_MODE = "llm"
+
+try:
+    ATS_BATCH_MAX_JOBS = max(1, int(os.environ.get("ATS_BATCH_MAX_JOBS", "8")))
+except ValueError:
+    ATS_BATCH_MAX_JOBS = 8
+try:
+    ATS_BATCH_CONCURRENCY = max(1, int(os.environ.get("ATS_BATCH_CONCURRENCY", "4")))
+except ValueError:
+    ATS_BATCH_CONCURRENCY = 4
+
 # boto3 requires a region for DynamoDB/S3 clients (local dev often has no ~/.aws/config).
 _AWS_REGION = (os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "ap-south-2").strip()
 
@@ -124,16 +163,6 @@ def _upload_resume_to_s3(user_id: str, report_id: str, raw_bytes: bytes, file_na
         return None, None
 
 
-WEIGHTS = {
-    "skillsMatch": 30,
-    "experience": 25,
-    "education": 15,
-    "formatting": 15,
-    "achievements": 10,
-    "locationAndSoft": 5,
-}
-
-
 def response(status, body):
     return {
         "statusCode": status,
@@ -188,6 +217,38 @@ def _field_str(data, *keys):
     return ""
 
 
+def _scoring_mode(body):
+    mode = _field_str(body, "scoringMode", "scoring_mode").lower()
+    return mode if mode in ATS_SCORING_MODES else ATS_SCORING_MODE
+
+
+def _read_resume(body):
+    """(resume_text, resume_bytes, file_name, error_response) from resumeText or resumeBase64 + resumeFileName."""
+    resume_text = _field_str(body, "resumeText", "resume_text")
+    b64 = body.get("resumeBase64") or body.get("resume_base64")
+    file_name = _field_str(body, "resumeFileName", "resume_file_name")
+    if not file_name:
+        file_name = "resume.pdf" if b64 else "resume-from-builder.txt"
+    resume_bytes = None
+
+    if b64:
+        try:
+            resume_bytes = base64.b64decode(b64, validate=False)
+            if len(resume_bytes) > 6 * 1024 * 1024:
+                return "", None, file_name, response(400, {"success": False, "message": "Resume file too large (max ~6MB)."})
+            if not resume_text:
+                resume_text = extract_text_from_bytes(resume_bytes, file_name)
+        except Exception as e:
+            print(f"resume extract error: {e}")
+            return "", None, file_name, response(400, {"success": False, "message": f"Could not read resume file: {str(e)}"})
+
+    if not resume_text:
+        return "", resume_bytes, file_name, response(
+            400, {"success": False, "message": "Provide resumeText or resumeBase64 + resumeFileName (.pdf / .docx)."}
+        )
+    return resume_text, resume_bytes, file_name, None
+
+
 def _normalize_provider(value):
     p = (value or "").strip().lower()
     if p in ("openai",):
@@ -245,44 +306,6 @@ def _extract_byok_credentials(body):
     return provider, api_key, model
 
 
-_SYNONYM_GROUPS = [
-    ("communication", "communicating", "communicate", "communications"),
-    ("stakeholder", "stakeholders"),
-    ("analyze", "analytical", "analysis"),
-    ("machine learning", "ml"),
-    ("data science", "data scientist"),
-    ("predict", "predictive"),
-    ("collaborate", "collaboration", "collaborative"),
-]
-
-_SYNONYM_TO_CANON = {}
-for grp in _SYNONYM_GROUPS:
-    c = grp[0]
-    for w in grp:
-        _SYNONYM_TO_CANON[w.lower()] = c
-
-
-def _simple_stem(word: str) -> str:
-    w = word.lower()
-    if len(w) < 4:
-        return w
-    for suf in ("ing", "ed", "es", "tion", "sions", "ness"):
-        if w.endswith(suf) and len(w) > len(suf) + 2:
-            return w[: -len(suf)]
-    if w.endswith("s") and len(w) > 4:
-        return w[:-1]
-    return w
-
-
-def _resume_stem_index(resume_lower: str):
-    words = re.findall(r"[a-zA-Z0-9+]{2,}", resume_lower)
-    stems = set()
-    for w in words:
-        stems.add(w.lower())
-        stems.add(_simple_stem(w))
-    return stems
-
-
 _ALLOWED_RESUME_SECTIONS = ("Skills", "Projects", "Summary", "Experience", "Education")
 
 
@@ -380,35 +403,11 @@ def refine_keyword_lists(result, resume_text: str):
     """Remove false 'missing' keywords when resume clearly covers phrase (case, stemming, synonyms)."""
     if not resume_text:
         return
-    rlow = resume_text.lower()
-    stems = _resume_stem_index(rlow)
+    index = keyword_matcher.index_for(resume_text)
     matched = [m for m in (result.get("matchedKeywords") or []) if isinstance(m, str)]
     missing_entries = _parse_missing_keyword_entries_from_result(result)
     new_entries: list[dict] = []
 
-    def _phrase_known(phrase: str) -> bool:
-        pl = phrase.lower().strip()
-        if not pl:
-            return True
-        if pl in rlow:
-            return True
-        toks = [t for t in re.split(r"[^\w+]+", pl) if t and len(t) > 1]
-        if not toks:
-            return False
-        for tok in toks:
-            canon = _SYNONYM_TO_CANON.get(tok, tok)
-            ok = False
-            if tok in rlow or _simple_stem(tok) in stems:
-                ok = True
-            for syn in _SYNONYM_GROUPS:
-                if canon in syn or tok in syn:
-                    if any(s in rlow for s in syn):
-                        ok = True
-                        break
-            if not ok:
-                return False
-        return True
-
     for ent in missing_entries:
         phrase = ent.get("keyword") or ""
         if not isinstance(phrase, str):
@@ -418,7 +417,7 @@ def refine_keyword_lists(result, resume_text: str):
             continue
         secs = ent.get("suggestedSection") if isinstance(ent.get("suggestedSection"), list) else []
         secs = [s for s in secs if isinstance(s, str) and s.strip()]
-        if _phrase_known(phrase):
+        if index.covers(phrase):
             if phrase not in matched:
                 matched.append(phrase)
         else:
@@ -437,12 +436,17 @@ def _maybe_save_ats_history(
     resume_file_name: str,
     resume_bytes: bytes | None = None,
     resume_text_for_s3_fallback: str | None = None,
+    resume_s3: tuple | None = None,
 ):
+    """
+    Save one report row. Returns the (bucket, key) the résumé was uploaded to; pass it back as
+    resume_s3 to save more reports for the same résumé without uploading it again.
+    """
     if not user_id:
         print("ATS history: skipped — no userId (sign in + send userId, or history is not saved)")
-        return
+        return resume_s3
     if not ats_result:
-        return
+        return resume_s3
     try:
         ms = int(time.time() * 1000)
         rid = f"{ms}#{uuid.uuid4().hex[:12]}"
@@ -474,7 +478,9 @@ def _maybe_save_ats_history(
             "resumeFileName": display_name[:200],
             "jobDescriptionPreview": (job_description or "")[:500],
         }
-        bkt, s3key = _upload_resume_to_s3(user_id, rid, upload_bytes, display_name)
+        if resume_s3 is None:
+            resume_s3 = _upload_resume_to_s3(user_id, rid, upload_bytes, display_name)
+        bkt, s3key = resume_s3
         if bkt and s3key:
             url = _s3_object_https_url(bkt, s3key)
             item["resumeS3Bucket"] = bkt
@@ -495,14 +501,15 @@ def _maybe_save_ats_history(
             print("ATS_HISTORY_TABLE missing; skip history write")
         else:
             print(f"_maybe_save_ats_history: {e}")
+    return resume_s3
 
 
-def get_user_llm_config(user_id):
-    if users_table is None:
+def get_user_llm_config(user_id, user_item=None):
+    """(llmApiKeys, llmModels) for the user; pass an already-loaded Users row to skip the read."""
+    if users_table is None and user_item is None:
         return None, None
     try:
-        r = users_table.get_item(Key={"userId": user_id})
-        item = r.get("Item")
+        item = user_item if user_item is not None else users_table.get_item(Key={"userId": user_id}).get("Item")
         if not item:
             return None, None
         keys = item.get("llmApiKeys") or {}
@@ -518,9 +525,33 @@ def get_user_llm_config(user_id):
         return None, None
 
 
-def _call_openai(api_key, prompt, model=None):
+def _cached_call(provider, model, prompt, request, api_key, accept, on_delta):
+    """
+    llm_cache lookup around request(on_delta). accept: optional check a response must pass to be
+    cached (see llm_cache.cached_completion). on_delta: optional sink for streamed text; a cache
+    hit is replayed to it as one chunk.
+    """
+    requested = []
+
+    def call():
+        requested.append(True)
+        return request(on_delta)
+
+    text = llm_cache.cached_completion(provider, model, prompt, call, variant="ats", api_key=api_key, accept=accept)
+    if on_delta is not None and not requested and text:
+        on_delta(text)
+    return text
+
+
+def _call_openai(api_key, prompt, model=None, accept=None, on_delta=None):
     model = model or "gpt-4o-mini"
-    data = json.dumps({
+    return _cached_call(
+        "openai", model, prompt, lambda sink: _request_openai(api_key, prompt, model, sink), api_key, accept, on_delta
+    )
+
+
+def _request_openai(api_key, prompt, model, on_delta=None):
+    payload = {
         "model": model,
         "messages": [
             {"role": "system", "content": "You are an ATS (Applicant Tracking System) scorer for engineering and tech architect roles. Respond only with valid JSON, no markdown or extra text."},
@@ -528,26 +559,37 @@ def _call_openai(api_key, prompt, model=None):
         ],
         "temperature": 0.3,
         "max_tokens": 2000,
-    }).encode("utf-8")
+    }
+    if on_delta is not None:
+        payload["stream"] = True
     req = urllib.request.Request(
         "https://api.openai.com/v1/chat/completions",
-        data=data,
+        data=json.dumps(payload).encode("utf-8"),
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
         method="POST",
     )
-    with urllib.request.urlopen(req, timeout=90) as resp:
+    with http_client.urlopen(req, timeout=90) as resp:
+        if on_delta is not None:
+            return llm_stream.read_sse_text(resp, llm_stream.openai_text, on_delta).strip()
         out = json.loads(resp.read().decode("utf-8"))
     text = (out.get("choices") or [{}])[0].get("message", {}).get("content") or ""
     return text.strip()
 
 
-def _call_openrouter(api_key, prompt, model=None):
+def _call_openrouter(api_key, prompt, model=None, accept=None, on_delta=None):
     """OpenAI-compatible chat at openrouter.ai (any OpenRouter API key)."""
     model = model or OPENROUTER_DEFAULT_MODEL
-    data = json.dumps({
+    return _cached_call(
+        "openrouter", model, prompt, lambda sink: _request_openrouter(api_key, prompt, model, sink), api_key, accept,
+        on_delta,
+    )
+
+
+def _request_openrouter(api_key, prompt, model, on_delta=None):
+    payload = {
         "model": model,
         "messages": [
             {"role": "system", "content": "You are an ATS (Applicant Tracking System) scorer for engineering and tech architect roles. Respond only with valid JSON, no markdown or extra text."},
@@ -555,10 +597,12 @@ def _call_openrouter(api_key, prompt, model=None):
         ],
         "temperature": 0.3,
         "max_tokens": 2000,
-    }).encode("utf-8")
+    }
+    if on_delta is not None:
+        payload["stream"] = True
     req = urllib.request.Request(
         "https://openrouter.ai/api/v1/chat/completions",
-        data=data,
+        data=json.dumps(payload).encode("utf-8"),
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
@@ -567,7 +611,9 @@ def _call_openrouter(api_key, prompt, model=None):
         },
         method="POST",
     )
-    with urllib.request.urlopen(req, timeout=90) as resp:
+    with http_client.urlopen(req, timeout=90) as resp:
+        if on_delta is not None:
+            return llm_stream.read_sse_text(resp, llm_stream.openai_text, on_delta).strip()
         out = json.loads(resp.read().decode("utf-8"))
     err = out.get("error")
     if err:
@@ -577,18 +623,27 @@ def _call_openrouter(api_key, prompt, model=None):
     return text.strip()
 
 
-def _call_claude(api_key, prompt, model=None):
+def _call_claude(api_key, prompt, model=None, accept=None, on_delta=None):
     model = model or "claude-3-haiku-20240307"
-    data = json.dumps({
+    return _cached_call(
+        "anthropic", model, prompt, lambda sink: _request_claude(api_key, prompt, model, sink), api_key, accept,
+        on_delta,
+    )
+
+
+def _request_claude(api_key, prompt, model, on_delta=None):
+    payload = {
         "model": model,
         "max_tokens": 2000,
         "messages": [
             {"role": "user", "content": prompt},
         ],
-    }).encode("utf-8")
+    }
+    if on_delta is not None:
+        payload["stream"] = True
     req = urllib.request.Request(
         "https://api.anthropic.com/v1/messages",
-        data=data,
+        data=json.dumps(payload).encode("utf-8"),
         headers={
             "x-api-key": api_key,
             "Content-Type": "application/json",
@@ -596,7 +651,9 @@ def _call_claude(api_key, prompt, model=None):
         },
         method="POST",
     )
-    with urllib.request.urlopen(req, timeout=90) as resp:
+    with http_client.urlopen(req, timeout=90) as resp:
+        if on_delta is not None:
+            return llm_stream.read_sse_text(resp, llm_stream.anthropic_text, on_delta).strip()
         out = json.loads(resp.read().decode("utf-8"))
     for block in (out.get("content") or []):
         if block.get("type") == "text":
@@ -604,14 +661,21 @@ def _call_claude(api_key, prompt, model=None):
     return ""
 
 
-def _call_gemini(api_key, prompt, model=None):
-    """Call Gemini generateContent; tries JSON MIME type first, then plain text."""
+def _call_gemini(api_key, prompt, model=None, accept=None, on_delta=None):
     model = model or "gemini-2.0-flash"
+    return _cached_call(
+        "gemini", model, prompt, lambda sink: _request_gemini(api_key, prompt, model, sink), api_key, accept, on_delta
+    )
+
+
+def _request_gemini(api_key, prompt, model, on_delta=None):
+    """Call Gemini generateContent (streamGenerateContent with on_delta); tries JSON MIME type first, then plain text."""
     fallback_model = "gemini-2.0-flash"
     to_try = [model] if model == fallback_model else [model, fallback_model]
 
     for try_model in to_try:
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{try_model}:generateContent?key={api_key}"
+        method = "streamGenerateContent?alt=sse&" if on_delta is not None else "generateContent?"
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{try_model}:{method}key={api_key}"
         for json_mode in (True, False):
             # Keep output modest — large payloads slow Gemini and risk API Gateway ~30s HTTP API limit
             gen_config = {"temperature": 0.3, "maxOutputTokens": 2048}
@@ -632,7 +696,9 @@ def _call_gemini(api_key, prompt, model=None):
                 url, data=data, headers={"Content-Type": "application/json"}, method="POST"
             )
             try:
-                with urllib.request.urlopen(req, timeout=25) as resp:
+                with http_client.urlopen(req, timeout=25) as resp:
+                    if on_delta is not None:
+                        return llm_stream.read_sse_text(resp, llm_stream.gemini_text, on_delta).strip()
                     out = json.loads(resp.read().decode("utf-8"))
                 err = out.get("error")
                 if err:
@@ -667,6 +733,43 @@ def _call_gemini(api_key, prompt, model=None):
     return ""
 
 
+def _call_stored_provider(provider, api_key, prompt, model=None, accept=None):
+    """One call for a provider key stored in Users.llmApiKeys (claude = Anthropic)."""
+    if provider == "openai":
+        return _call_openai(api_key, prompt, model, accept=accept)
+    if provider == "openrouter":
+        return _call_openrouter(api_key, prompt, model or OPENROUTER_DEFAULT_MODEL, accept=accept)
+    if provider == "claude":
+        sys_prompt = "You are an ATS scorer for engineering roles. Respond only with valid JSON, no markdown."
+        return _call_claude(api_key, f"{sys_prompt}\n\n{prompt}", model, accept=accept)
+    return _call_gemini(api_key, prompt, model, accept=accept)
+
+
+def _stored_provider_calls(keys, models, requested_provider, prompt):
+    """llm_race.race() calls for the user's stored keys: the requested provider, else all ranked."""
+    if requested_provider in ("openai", "openrouter", "claude", "gemini"):
+        provider_order = [requested_provider]
+    else:
+        provider_order = llm_race.rank(["openai", "claude", "gemini", "openrouter"])
+    return [
+        (provider, lambda p=provider: _call_stored_provider(p, keys[p], prompt, models.get(p), accept=parse_llm_json))
+        for provider in provider_order
+        if keys.get(provider)
+    ]
+
+
+def _race_error_message(e):
+    error_msg = "Could not get ATS score from any configured LLM."
+    if e.tried:
+        error_msg += f" Tried: {', '.join(e.tried)}."
+    if e.last_error is not None:
+        if isinstance(e.last_error, json.JSONDecodeError):
+            error_msg += " Last error: invalid JSON from scorer."
+        else:
+            error_msg += f" Last error: {e.last_error}"
+    return error_msg
+
+
 def build_ats_prompt(resume_text, job_description):
     w = WEIGHTS
     return f"""You are an ATS (Applicant Tracking System) scorer for engineering and tech architect roles.
@@ -816,14 +919,65 @@ def normalize_ats_result(result):
     return result
 
 
+def run_local_preview(body):
+    """scoringMode=local: deterministic estimate only — no LLM call, no trial use, no history row."""
+    user_id = _field_str(body, "userId", "user_id")
+    if user_id:
+        allowed, ent_err = check_entitlement_or_error(user_id, "ats-scorer", ctx=EntitlementContext(user_id))
+        if not allowed:
+            return response(403, {"success": False, "message": ent_err})
+
+    job_description = _field_str(body, "jobDescription", "job_description")
+    if not job_description:
+        return response(400, {"success": False, "message": "jobDescription is required"})
+    resume_text, _, _, err = _read_resume(body)
+    if err:
+        return err
+    return response(200, {"success": True, "atsResult": ats_local_scorer.score_locally(resume_text, job_description)})
+
+
+def _finish_local_result(body, ent_ctx, result, job_description, file_name, resume_bytes, resume_text):
+    """scoringMode=auto with a decisive local estimate: counts as a scan and is saved like an LLM report."""
+    user_id = _field_str(body, "userId", "user_id")
+    print(f"ATS scored locally ({result['overallScore']}); LLM skipped")
+    if user_id:
+        session_id = _field_str(body, "sessionId", "session_id") or str(uuid.uuid4())
+        ok_consume, _, consume_err = consume_feature_use(user_id, "ats-scorer", session_id=session_id, ctx=ent_ctx)
+        if not ok_consume:
+            return response(403, {"success": False, "message": consume_err or "Trial limit reached"})
+    _maybe_save_ats_history(user_id, "local", result, job_description, file_name, resume_bytes, resume_text)
+    return response(200, {"success": True, "atsResult": result})
+
+
+def _call_byok(provider, api_key, model, prompt):
+    """One scoring call with the request's own key (provider from _extract_byok_credentials)."""
+    if provider == "openai":
+        return _call_openai(api_key, prompt, model or "gpt-4o-mini", accept=parse_llm_json)
+    if provider == "openrouter":
+        return _call_openrouter(api_key, prompt, model or OPENROUTER_DEFAULT_MODEL, accept=parse_llm_json)
+    if provider == "anthropic":
+        sys_prompt = "You are an ATS scorer for engineering roles. Respond only with valid JSON, no markdown."
+        full_prompt = f"{sys_prompt}\n\n{prompt}"
+        return _call_claude(api_key, full_prompt, model or "claude-3-haiku-20240307", accept=parse_llm_json)
+    return _call_gemini(api_key, prompt, model or "gemini-2.0-flash", accept=parse_llm_json)
+
+
+def _history_provider(stored_provider):
+    """Users.llmApiKeys provider id → provider name saved with the report (claude = anthropic)."""
+    if stored_provider == "claude":
+        return "anthropic"
+    return stored_provider or "openai"
+
+
 def run_byok_provider(body):
     provider, api_key, model = _extract_byok_credentials(body)
     if not provider or not api_key:
         return None
 
     user_id = _field_str(body, "userId", "user_id")
+    ent_ctx = EntitlementContext(user_id) if user_id else None
     if user_id:
-        allowed, ent_err = check_entitlement_or_error(user_id, "ats-scorer")
+        allowed, ent_err = check_entitlement_or_error(user_id, "ats-scorer", ctx=ent_ctx)
         if not allowed:
             return response(403, {"success": False, "message": ent_err})
 
@@ -831,40 +985,19 @@ def run_byok_provider(body):
     if not job_description:
         return response(400, {"success": False, "message": "jobDescription is required"})
 
-    resume_text = _field_str(body, "resumeText", "resume_text")
-    b64 = body.get("resumeBase64") or body.get("resume_base64")
-    file_name = _field_str(body, "resumeFileName", "resume_file_name")
-    if not file_name:
-        file_name = "resume.pdf" if b64 else "resume-from-builder.txt"
-    resume_bytes = None
-
-    if b64:
-        try:
-            resume_bytes = base64.b64decode(b64, validate=False)
-            if len(resume_bytes) > 6 * 1024 * 1024:
-                return response(400, {"success": False, "message": "Resume file too large (max ~6MB)."})
-            if not resume_text:
-                resume_text = extract_text_from_bytes(resume_bytes, file_name)
-        except Exception as e:
-            print(f"resume extract error: {e}")
-            return response(400, {"success": False, "message": f"Could not read resume file: {str(e)}"})
+    resume_text, resume_bytes, file_name, err = _read_resume(body)
+    if err:
+        return err
 
-    if not resume_text:
-        return response(400, {"success": False, "message": "Provide resumeText or resumeBase64 + resumeFileName (.pdf / .docx)."})
+    if _scoring_mode(body) == "auto":
+        local = ats_local_scorer.score_locally(resume_text, job_description)
+        if ats_local_scorer.is_decisive(local):
+            return _finish_local_result(body, ent_ctx, local, job_description, file_name, resume_bytes, resume_text)
 
     prompt = build_ats_prompt(resume_text, job_description)
 
     try:
-        if provider == "openai":
-            raw = _call_openai(api_key, prompt, model or "gpt-4o-mini")
-        elif provider == "openrouter":
-            raw = _call_openrouter(api_key, prompt, model or OPENROUTER_DEFAULT_MODEL)
-        elif provider == "anthropic":
-            sys_prompt = "You are an ATS scorer for engineering roles. Respond only with valid JSON, no markdown."
-            full_prompt = f"{sys_prompt}\n\n{prompt}"
-            raw = _call_claude(api_key, full_prompt, model or "claude-3-haiku-20240307")
-        else:
-            raw = _call_gemini(api_key, prompt, model or "gemini-2.0-flash")
+        raw = _call_byok(provider, api_key, model, prompt)
     except Exception as e:
         print(f"BYOK {provider} error: {e}")
         return response(502, {"success": False, "message": str(e)})
@@ -881,7 +1014,7 @@ def run_byok_provider(body):
     if uid_hist:
         session_id = _field_str(body, "sessionId", "session_id") or f"ats-byok-{uuid.uuid4()}"
         ok_consume, _, consume_err = consume_feature_use(
-            uid_hist, "ats-scorer", session_id=session_id
+            uid_hist, "ats-scorer", session_id=session_id, ctx=ent_ctx
         )
         if not ok_consume:
             return response(403, {"success": False, "message": consume_err or "Trial limit reached"})
@@ -893,109 +1026,216 @@ def run_byok_provider(body):
 
 def run_dynamodb_user_flow(body):
     user_id = _field_str(body, "userId", "user_id")
-    resume_text = _field_str(body, "resumeText", "resume_text")
-    b64 = body.get("resumeBase64") or body.get("resume_base64")
-    file_name = _field_str(body, "resumeFileName", "resume_file_name")
-    if not file_name:
-        file_name = "resume.pdf" if body.get("resumeBase64") or body.get("resume_base64") else "resume-from-builder.txt"
     job_description = _field_str(body, "jobDescription", "job_description")
     requested_provider = _normalize_provider(_field_str(body, "provider", "llmProvider", "llm_provider"))
     requested_provider = "claude" if requested_provider == "anthropic" else requested_provider
-    resume_bytes = None
 
     if not user_id:
         return response(400, {"success": False, "message": "userId is required (or send provider + API key for BYOK)."})
 
-    allowed, ent_err = check_entitlement_or_error(user_id, "ats-scorer")
+    ent_ctx = EntitlementContext(user_id)
+    allowed, ent_err = check_entitlement_or_error(user_id, "ats-scorer", ctx=ent_ctx)
     if not allowed:
         return response(403, {"success": False, "message": ent_err})
 
     if not job_description:
         return response(400, {"success": False, "message": "jobDescription is required"})
-    if b64:
-        try:
-            resume_bytes = base64.b64decode(b64, validate=False)
-            if len(resume_bytes) > 6 * 1024 * 1024:
-                return response(400, {"success": False, "message": "Resume file too large (max ~6MB)."})
-            if not resume_text:
-                resume_text = extract_text_from_bytes(resume_bytes, file_name)
-        except Exception as e:
-            print(f"resume extract error: {e}")
-            return response(400, {"success": False, "message": f"Could not read resume file: {str(e)}"})
-    if not resume_text:
-        return response(400, {"success": False, "message": "Provide resumeText or resumeBase64 + resumeFileName (.pdf / .docx)."})
+    resume_text, resume_bytes, file_name, err = _read_resume(body)
+    if err:
+        return err
 
-    keys, models = get_user_llm_config(user_id)
+    if _scoring_mode(body) == "auto":
+        local = ats_local_scorer.score_locally(resume_text, job_description)
+        if ats_local_scorer.is_decisive(local):
+            return _finish_local_result(body, ent_ctx, local, job_description, file_name, resume_bytes, resume_text)
+
+    keys, models = get_user_llm_config(user_id, user_item=ent_ctx.user_item)
     if not keys:
         return response(403, {"success": False, "message": "No LLM API key found. Add a key in Settings or use provider + API key in the request."})
     models = models or {}
 
     prompt = build_ats_prompt(resume_text, job_description)
-    raw = None
-    last_error = None
-    providers_tried = []
-
-    _all_providers = ("openai", "openrouter", "claude", "gemini")
-    provider_order = (
-        [requested_provider] if requested_provider in _all_providers else ["openai", "claude", "gemini", "openrouter"]
-    )
-    chosen_provider = None
-    for provider in provider_order:
-        api_key = keys.get(provider)
-        if not api_key:
-            continue
-        providers_tried.append(provider)
-        model = models.get(provider)
-        try:
-            if provider == "openai":
-                raw = _call_openai(api_key, prompt, model)
-            elif provider == "openrouter":
-                raw = _call_openrouter(api_key, prompt, model or OPENROUTER_DEFAULT_MODEL)
-            elif provider == "claude":
-                sys_prompt = "You are an ATS scorer for engineering roles. Respond only with valid JSON, no markdown."
-                full_prompt = f"{sys_prompt}\n\n{prompt}"
-                raw = _call_claude(api_key, full_prompt, model)
-            else:
-                raw = _call_gemini(api_key, prompt, model)
-            if raw:
-                chosen_provider = provider
-                break
-        except Exception as e:
-            last_error = str(e)
-            print(f"ATS {provider} error: {e}")
-            continue
-
-    if not raw:
-        error_msg = "Could not get ATS score from any configured LLM."
-        if providers_tried:
-            error_msg += f" Tried: {', '.join(providers_tried)}."
-        if last_error:
-            error_msg += f" Last error: {last_error}"
-        return response(500, {"success": False, "message": error_msg})
+    calls = _stored_provider_calls(keys, models, requested_provider, prompt)
 
     try:
-        result = parse_llm_json(raw)
-    except json.JSONDecodeError:
-        return response(500, {"success": False, "message": "Invalid response from scorer. Please try again."})
+        # First provider whose answer parses wins; a slow one gets a hedged backup
+        won = llm_race.race(calls, validate=parse_llm_json)
+    except llm_race.AllProvidersFailed as e:
+        return response(500, {"success": False, "message": _race_error_message(e)})
+    chosen_provider = won.provider
+    result = won.value
+    print(f"ATS scored by {chosen_provider} in {won.seconds:.1f}s (started: {', '.join(won.started)})")
 
     normalize_ats_result(result)
     refine_keyword_lists(result, resume_text)
-    if chosen_provider == "claude":
-        hist_provider = "anthropic"
-    elif chosen_provider == "openrouter":
-        hist_provider = "openrouter"
-    else:
-        hist_provider = chosen_provider or "openai"
     _maybe_save_ats_history(
-        user_id, hist_provider, result, job_description, file_name, resume_bytes, resume_text
+        user_id, _history_provider(chosen_provider), result, job_description, file_name, resume_bytes, resume_text
     )
     session_id = _field_str(body, "sessionId", "session_id") or str(uuid.uuid4())
-    ok_consume, _, consume_err = consume_feature_use(user_id, "ats-scorer", session_id=session_id)
+    ok_consume, _, consume_err = consume_feature_use(user_id, "ats-scorer", session_id=session_id, ctx=ent_ctx)
     if not ok_consume:
         return response(403, {"success": False, "message": consume_err or "Trial limit reached"})
     return response(200, {"success": True, "atsResult": result})
 
 
+def _batch_jobs(body):
+    """([(jobId, job description)], error message) from body["jobs"] (objects or plain JD strings)."""
+    jobs = body.get("jobs")
+    if not isinstance(jobs, list) or not jobs:
+        return None, "jobs must be a non-empty list of {jobId, jobDescription}"
+    if len(jobs) > ATS_BATCH_MAX_JOBS:
+        return None, f"At most {ATS_BATCH_MAX_JOBS} jobs per batch"
+    out = []
+    for i, job in enumerate(jobs):
+        if isinstance(job, str):
+            job = {"jobDescription": job}
+        if not isinstance(job, dict):
+            return None, f"jobs[{i}] must be an object"
+        job_id = _field_str(job, "jobId", "job_id", "id") or str(i)
+        # JobListings rows (get_jobs_details) carry description / job_title
+        jd = _field_str(job, "jobDescription", "job_description", "description", "full_description")
+        title = _field_str(job, "jobTitle", "job_title", "title")
+        if jd and title and title.lower() not in jd[:300].lower():
+            jd = f"{title}\n{jd}"
+        out.append((job_id, jd))
+    return out, None
+
+
+def _batch_llm_scorer(body, user_id, ent_ctx):
+    """
+    (score, error_response) where score(prompt) -> (provider, parsed result): the request's BYOK
+    key, else the user's stored keys (one Users read for the whole batch, raced per job).
+    """
+    provider, api_key, model = _extract_byok_credentials(body)
+    if provider and api_key:
+        return (lambda prompt: (provider, parse_llm_json(_call_byok(provider, api_key, model, prompt)))), None
+
+    if not user_id:
+        return None, response(400, {"success": False, "message": "userId is required (or send provider + API key for BYOK)."})
+    keys, models = get_user_llm_config(user_id, user_item=ent_ctx.user_item)
+    if not keys:
+        return None, response(403, {"success": False, "message": "No LLM API key found. Add a key in Settings or use provider + API key in the request."})
+    models = models or {}
+    requested_provider = _normalize_provider(_field_str(body, "provider", "llmProvider", "llm_provider"))
+    requested_provider = "claude" if requested_provider == "anthropic" else requested_provider
+
+    def score(prompt):
+        won = llm_race.race(_stored_provider_calls(keys, models, requested_provider, prompt), validate=parse_llm_json)
+        return _history_provider(won.provider), won.value
+
+    return score, None
+
+
+def run_batch(body):
+    """
+    One résumé against many jobs (body["jobs"]): the résumé is read once and entitlement is
+    checked once. All jobs are pre-scored locally in one pass (ats_local_scorer.score_many);
+    with scoringMode=local that is the answer, with auto decisive estimates skip the LLM, and
+    the remaining jobs are scored by the LLM ATS_BATCH_CONCURRENCY at a time.
+
+    Every job that is scored counts as one scan, like a single request: its trial use is
+    consumed (session "<sessionId>#<jobId>") and its report saved to history as soon as it
+    finishes, not after the whole batch. Once the trial runs out, jobs not yet started are
+    cancelled and the rest come back with the trial message. The response lists the results
+    in request order.
+    """
+    jobs, jobs_err = _batch_jobs(body)
+    if jobs_err:
+        return response(400, {"success": False, "message": jobs_err})
+
+    user_id = _field_str(body, "userId", "user_id")
+    ent_ctx = EntitlementContext(user_id) if user_id else None
+    if user_id:
+        allowed, ent_err = check_entitlement_or_error(user_id, "ats-scorer", ctx=ent_ctx)
+        if not allowed:
+            return response(403, {"success": False, "message": ent_err})
+
+    resume_text, resume_bytes, file_name, err = _read_resume(body)
+    if err:
+        return err
+
+    mode = _scoring_mode(body)
+    estimates = ats_local_scorer.score_many(resume_text, [jd for _, jd in jobs])
+    results = [None] * len(jobs)
+    done = []
+    pending = []
+    for i, ((job_id, jd), local) in enumerate(zip(jobs, estimates)):
+        if not jd:
+            done.append((i, {"jobId": job_id, "success": False, "message": "jobDescription is required"}))
+        elif mode == "local" or (mode == "auto" and ats_local_scorer.is_decisive(local)):
+            done.append((i, {"jobId": job_id, "success": True, "provider": "local", "atsResult": local}))
+        else:
+            pending.append(i)
+
+    score = None
+    if pending:
+        score, err = _batch_llm_scorer(body, user_id, ent_ctx)
+        if err:
+            return err
+
+    charge = bool(user_id) and mode != "local"
+    session_id = _field_str(body, "sessionId", "session_id") or f"ats-batch-{uuid.uuid4()}"
+    trial_error = None
+    resume_s3 = None
+
+    def emit(i, result):
+        nonlocal trial_error, resume_s3
+        if charge and result["success"]:
+            if trial_error is None:
+                ok_consume, _, consume_err = consume_feature_use(
+                    user_id, "ats-scorer", session_id=f"{session_id}#{result['jobId']}", ctx=ent_ctx
+                )
+                if not ok_consume:
+                    trial_error = consume_err or "Trial limit reached"
+            if trial_error is not None:
+                result = {"jobId": result["jobId"], "success": False, "message": trial_error}
+            else:
+                resume_s3 = _maybe_save_ats_history(
+                    user_id, result["provider"], result["atsResult"], jobs[i][1], file_name,
+                    resume_bytes, resume_text, resume_s3=resume_s3,
+                )
+        results[i] = result
+
+    for i, result in done:
+        emit(i, result)
+
+    def score_job(i):
+        job_id, jd = jobs[i]
+        try:
+            provider, result = score(build_ats_prompt(resume_text, jd))
+            if not isinstance(result, dict):
+                raise ValueError("scorer did not return a JSON object")
+        except llm_race.AllProvidersFailed as e:
+            return {"jobId": job_id, "success": False, "message": _race_error_message(e)}
+        except json.JSONDecodeError:
+            return {"jobId": job_id, "success": False, "message": "Invalid JSON from scorer. Try again with a different model."}
+        except Exception as e:
+            print(f"ATS batch job {job_id} error: {e}")
+            return {"jobId": job_id, "success": False, "message": str(e)}
+        normalize_ats_result(result)
+        refine_keyword_lists(result, resume_text)
+        return {"jobId": job_id, "success": True, "provider": provider, "atsResult": result}
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(ATS_BATCH_CONCURRENCY, len(pending))) as pool:
+            futures = {pool.submit(score_job, i): i for i in pending}
+            for fut in as_completed(futures):
+                i = futures[fut]
+                if fut.cancelled():
+                    emit(i, {"jobId": jobs[i][0], "success": False, "message": trial_error})
+                    continue
+                emit(i, fut.result())
+                if trial_error is not None:
+                    for other in futures:
+                        other.cancel()
+
+    scored = sum(1 for r in results if r["success"])
+    print(f"ATS batch: {len(jobs)} jobs, {len(pending)} via LLM, {scored} scored (mode={mode})")
+    if trial_error is not None and not scored:
+        return response(403, {"success": False, "message": trial_error})
+    return response(200, {"success": True, "results": results, "scored": scored, "failed": len(jobs) - scored})
+
+
 def lambda_handler(event, context):
     try:
         if _http_method(event) == "OPTIONS":
@@ -1003,6 +1243,12 @@ def lambda_handler(event, context):
 
         body = _parse_request_body(event)
 
+        if "jobs" in body:
+            return run_batch(body)
+
+        if _scoring_mode(body) == "local":
+            return run_local_preview(body)
+
         byok_resp = run_byok_provider(body)
         if byok_resp is not None:
             return byok_resp
@@ -3,8 +3,24 @@
 Backfill / refresh DynamoDB UTM campaign users in Google Sheets.
 
 Usage (from lambda/ with AWS + Google env configured):
-  python backfill_utm_users_to_sheets.py          # append missing users only
-  python backfill_utm_users_to_sheets.py --refresh # replace sheet rows (UTM campaigns only)
+  python backfill_utm_users_to_sheets.py               # append missing users only
+  python backfill_utm_users_to_sheets.py --incremental # only users newer than the saved watermark
+  python backfill_utm_users_to_sheets.py --refresh     # replace sheet rows (UTM campaigns only)
+  options: --segments N (parallel scan segments), --state PATH|s3://bucket/key
+
+Scheduled: the Utm_sheets_backfill Lambda (handler backfill_utm_users_to_sheets.lambda_handler)
+runs --incremental nightly from an EventBridge rule (see deploy_admin_lambdas.sh sheets). It is
+the safety net for signup rows the SQS drainer could not append (google_sheets_sync.py), so
+UTM_BACKFILL_STATE must be an s3:// location there.
+
+The Users scan is a parallel segmented Scan that only returns attributed users and only the
+columns the sheet needs. Every successful run saves a high-water mark (latest createdAt /
+attributionCapturedAt seen, capped at the scan start) to UTM_BACKFILL_STATE; --incremental
+then filters the scan to users past that mark (minus WATERMARK_LOOKBACK_MINUTES for writes
+that were in flight during the previous run) and diffs them against the sheet's userId
+column, so a nightly run transfers, converts and appends only new signups, and skips the
+sheet entirely when there are none. DynamoDB still bills a filtered Scan for every item it
+reads; making the read cost itself proportional would need an index on createdAt.
 """
 from __future__ import annotations
 
@@ -13,10 +29,14 @@ import os
 import sys
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Set
+from functools import reduce
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import boto3
+from boto3.dynamodb.conditions import Attr
 
 from google_sheets_sync import (
     GOOGLE_SHEET_ID,
@@ -27,13 +47,23 @@ from google_sheets_sync import (
     _get_service_account_token,
     _ordered_row_values,
     _put_json,
-    append_user_attribution_row,
+    append_attribution_rows,
     build_attribution_row,
     is_google_sheets_configured,
 )
 
 USERS_TABLE = os.environ.get("USERS_TABLE", "Users")
 REGION = os.environ.get("REGION", "ap-south-2")
+APPEND_CHUNK = 500
+STATE_LOCATION = os.environ.get(
+    "UTM_BACKFILL_STATE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".utm_backfill_state.json"),
+)
+try:
+    SCAN_SEGMENTS = max(1, int(os.environ.get("UTM_BACKFILL_SEGMENTS", "4")))
+except ValueError:
+    SCAN_SEGMENTS = 4
+WATERMARK_LOOKBACK_MINUTES = 60
 
 ATTRIBUTION_KEYS = (
     "utmSource",
@@ -47,6 +77,10 @@ ATTRIBUTION_KEYS = (
     "signupReferrer",
     "attributionCapturedAt",
 )
+# What has_attribution() looks at; login_handler only stores non-empty attribution values
+CAMPAIGN_KEYS = ATTRIBUTION_KEYS[:7]
+# Everything build_attribution_row() reads
+PROJECTED_KEYS = ("userId", "email", "status", "createdBy", "createdAt") + ATTRIBUTION_KEYS
 
 
 def decimal_to_native(obj: Any) -> Any:
@@ -61,15 +95,7 @@ def decimal_to_native(obj: Any) -> Any:
 
 def has_attribution(user: Dict[str, Any]) -> bool:
     """Match admin UI: only real UTM / click-id params."""
-    return any(str(user.get(k) or "").strip() for k in (
-        "utmSource",
-        "utmMedium",
-        "utmCampaign",
-        "utmTerm",
-        "utmContent",
-        "gclid",
-        "fbclid",
-    ))
+    return any(str(user.get(k) or "").strip() for k in CAMPAIGN_KEYS)
 
 
 def signup_method_for(user: Dict[str, Any]) -> str:
@@ -95,10 +121,31 @@ def fetch_existing_user_ids() -> Set[str]:
     return ids
 
 
-def scan_attributed_users() -> List[Dict[str, Any]]:
-    table = boto3.resource("dynamodb", region_name=REGION).Table(USERS_TABLE)
+def _users_table():
+    # boto3 resources are not thread-safe: one session per scan segment
+    return boto3.session.Session().resource("dynamodb", region_name=REGION).Table(USERS_TABLE)
+
+
+def _scan_kwargs(since: Optional[str]) -> Dict[str, Any]:
+    names = {f"#p{i}": key for i, key in enumerate(PROJECTED_KEYS)}
+    condition = reduce(lambda a, b: a | b, (Attr(k).exists() for k in CAMPAIGN_KEYS))
+    if since:
+        condition = condition & (Attr("createdAt").gt(since) | Attr("attributionCapturedAt").gt(since))
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+        "FilterExpression": condition,
+    }
+
+
+def _scan_segment(
+    table_factory: Callable[[], Any], segment: int, total_segments: int, since: Optional[str]
+) -> List[Dict[str, Any]]:
+    table = table_factory()
     users: List[Dict[str, Any]] = []
-    kwargs: Dict[str, Any] = {}
+    kwargs = _scan_kwargs(since)
+    if total_segments > 1:
+        kwargs.update(Segment=segment, TotalSegments=total_segments)
     while True:
         result = table.scan(**kwargs)
         for item in result.get("Items") or []:
@@ -109,10 +156,83 @@ def scan_attributed_users() -> List[Dict[str, Any]]:
         if not last_key:
             break
         kwargs["ExclusiveStartKey"] = last_key
+    return users
+
+
+def scan_attributed_users(
+    since: Optional[str] = None,
+    segments: int = SCAN_SEGMENTS,
+    table_factory: Callable[[], Any] = _users_table,
+) -> List[Dict[str, Any]]:
+    """Attributed users (projected to PROJECTED_KEYS), optionally only those past ``since``."""
+    segments = max(1, segments)
+    with ThreadPoolExecutor(max_workers=segments) as pool:
+        parts = pool.map(lambda seg: _scan_segment(table_factory, seg, segments, since), range(segments))
+        users = [user for part in parts for user in part]
     users.sort(key=lambda u: u.get("createdAt") or "")
     return users
 
 
+def _timestamp(value: Any) -> str:
+    """ISO timestamps cut to seconds ("2026-01-01T00:00:00") so naive and Z-suffixed values compare."""
+    return str(value or "").strip()[:19]
+
+
+def next_watermark(previous: Optional[str], users: List[Dict[str, Any]], started_at: str) -> Optional[str]:
+    """Latest createdAt / attributionCapturedAt among ``users``, never past ``started_at``
+    (attributionCapturedAt comes from the browser and may be in the future)."""
+    stamps = [_timestamp(u.get(k)) for u in users for k in ("createdAt", "attributionCapturedAt")]
+    candidates = [s for s in stamps if s and s <= started_at]
+    if previous:
+        candidates.append(previous)
+    return max(candidates) if candidates else None
+
+
+def scan_since(watermark: str) -> str:
+    """Lower bound for an incremental scan: the watermark minus the in-flight lookback."""
+    try:
+        mark = datetime.fromisoformat(watermark)
+    except ValueError:
+        return watermark
+    return (mark - timedelta(minutes=WATERMARK_LOOKBACK_MINUTES)).isoformat()
+
+
+def _split_s3(location: str):
+    bucket, _, key = location[len("s3://"):].partition("/")
+    return bucket, key
+
+
+def load_watermark(location: str = STATE_LOCATION) -> Optional[str]:
+    try:
+        if location.startswith("s3://"):
+            bucket, key = _split_s3(location)
+            body = boto3.client("s3", region_name=REGION).get_object(Bucket=bucket, Key=key)["Body"].read()
+        else:
+            with open(location, "rb") as f:
+                body = f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        if getattr(exc, "response", {}).get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+            return None
+        raise
+    return json.loads(body.decode("utf-8")).get("watermark") or None
+
+
+def save_watermark(watermark: str, location: str = STATE_LOCATION) -> None:
+    body = json.dumps({"watermark": watermark, "table": USERS_TABLE, "sheet": GOOGLE_SHEET_ID}).encode("utf-8")
+    if location.startswith("s3://"):
+        bucket, key = _split_s3(location)
+        boto3.client("s3", region_name=REGION).put_object(
+            Bucket=bucket, Key=key, Body=body, ContentType="application/json"
+        )
+        return
+    tmp = f"{location}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, location)
+
+
 def dedupe_users(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     by_id: Dict[str, Dict[str, Any]] = {}
     for user in users:
@@ -156,13 +276,33 @@ def refresh_sheet(users: List[Dict[str, Any]]) -> None:
     )
 
 
-def main() -> int:
-    refresh = "--refresh" in sys.argv
+def _arg_value(argv: List[str], flag: str, default: Optional[str] = None) -> Optional[str]:
+    if flag in argv[:-1]:
+        return argv[argv.index(flag) + 1]
+    return default
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    refresh = "--refresh" in argv
+    incremental = "--incremental" in argv and not refresh
+    state = _arg_value(argv, "--state", STATE_LOCATION)
+    try:
+        segments = int(_arg_value(argv, "--segments", str(SCAN_SEGMENTS)))
+    except ValueError:
+        print("--segments must be an integer.")
+        return 1
     if not is_google_sheets_configured():
         print("Google Sheets not configured (GOOGLE_SHEET_ID + service account).")
         return 1
 
-    users = dedupe_users(scan_attributed_users())
+    watermark = load_watermark(state)
+    since = scan_since(watermark) if incremental and watermark else None
+    if incremental and not watermark:
+        print(f"No watermark at {state}; scanning all users.")
+    started_at = _timestamp(datetime.utcnow().isoformat())
+    users = dedupe_users(scan_attributed_users(since=since, segments=segments))
+    new_watermark = next_watermark(watermark, users, started_at)
 
     if refresh:
         print(f"Refreshing sheet with {len(users)} UTM campaign users...")
@@ -173,16 +313,22 @@ def main() -> int:
             return 1
         for user in users:
             print(f"  · {user.get('email')} ({user.get('utmSource')})")
+        if new_watermark:
+            save_watermark(new_watermark, state)
         print(f"Done: sheet updated with {len(users)} rows (+ header).")
         return 0
 
+    if since:
+        print(f"Found {len(users)} attributed users created since {since}.")
+    if not users:
+        print("Done: nothing new, sheet not read.")
+        return 0
+
     existing_ids = fetch_existing_user_ids()
     print(f"Found {len(users)} attributed users in DynamoDB; {len(existing_ids)} already in sheet.")
 
-    appended = 0
+    missing: List[Dict[str, Any]] = []
     skipped = 0
-    failed = 0
-
     for user in users:
         user_id = str(user.get("userId") or "")
         if not user_id:
@@ -190,18 +336,40 @@ def main() -> int:
         if user_id in existing_ids:
             skipped += 1
             continue
-        ok = append_user_attribution_row(user, signup_method_for(user))
-        if ok:
-            appended += 1
-            existing_ids.add(user_id)
+        existing_ids.add(user_id)
+        missing.append(user)
+
+    appended = 0
+    failed = 0
+    # One values:append per APPEND_CHUNK rows instead of token + header + append per user
+    for start in range(0, len(missing), APPEND_CHUNK):
+        chunk = missing[start:start + APPEND_CHUNK]
+        try:
+            append_attribution_rows([build_attribution_row(u, signup_method_for(u)) for u in chunk])
+        except Exception as exc:
+            failed += len(chunk)
+            print(f"  ! failed {len(chunk)} rows: {exc}")
+            continue
+        appended += len(chunk)
+        for user in chunk:
             print(f"  + {user.get('email')} ({user.get('utmSource')})")
-        else:
-            failed += 1
-            print(f"  ! failed {user.get('email')}")
 
-    print(f"Done: appended={appended}, skipped={skipped}, failed={failed}")
+    # Keep the old mark after a failure so the next run picks the failed users up again
+    if failed == 0 and new_watermark:
+        save_watermark(new_watermark, state)
+    print(f"Done: appended={appended}, skipped={skipped}, failed={failed}, watermark={new_watermark}")
     return 0 if failed == 0 else 1
 
 
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """EventBridge schedule: the nightly --incremental run. Raises on failure so the run is retried."""
+    if not STATE_LOCATION.startswith("s3://"):
+        raise RuntimeError("UTM_BACKFILL_STATE must be an s3://bucket/key location on Lambda")
+    code = main(["--incremental"])
+    if code != 0:
+        raise RuntimeError(f"UTM backfill failed (exit {code}); see the log above")
+    return {"ok": True}
+
+
 if __name__ == "__main__":
     sys.exit(main())
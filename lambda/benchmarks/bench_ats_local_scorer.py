@@ -0,0 +1,94 @@
+"""
+Benchmark: deterministic ATS pre-score (ats_local_scorer.score_locally) latency.
+
+Run from lambda/:  python benchmarks/bench_ats_local_scorer.py [--resume FILE.txt] [--jd FILE.txt] [--repeat 200] [--jobs 40]
+
+Without --resume / --jd a synthetic ~900-word résumé and ~250-word JD are generated.
+"cold" clears the shared keyword index first (first score of a résumé), "warm" reuses it
+(scoringMode=local preview followed by auto / re-scoring the same résumé). For comparison,
+the LLM path it replaces for decisive cases takes several seconds per score. "batch" scores
+the résumé against --jobs synthetic JDs: score_locally per job vs one score_many pass.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ats_local_scorer  # noqa: E402
+import keyword_matcher  # noqa: E402
+
+SKILLS = (
+    "Python AWS DynamoDB Kubernetes Docker Terraform React Node.js Java Go SQL PostgreSQL Kafka "
+    "Spark GraphQL CI/CD Linux Git Redis microservices"
+).split()
+FILLER = "built led team service scalable improved latency by the and with using for of to users".split()
+
+
+def synthetic_resume(words: int, rng: random.Random) -> str:
+    lines = ["Jane Doe", "jane@example.com | +1 555 123 4567", "SUMMARY", "Backend engineer.", "EXPERIENCE",
+             "Acme 2017 - present"]
+    body = [rng.choice(SKILLS + FILLER * 3) for _ in range(words)]
+    lines += ["- " + " ".join(body[i:i + 15]) + f" by {rng.randint(5, 60)}%" for i in range(0, words, 15)]
+    lines += ["SKILLS", ", ".join(rng.sample(SKILLS, 10)), "EDUCATION", "B.Tech Computer Science 2013 - 2017"]
+    return "\n".join(lines)
+
+
+def synthetic_jd(words: int, rng: random.Random) -> str:
+    return "Backend Engineer. 5+ years. " + " ".join(rng.choice(SKILLS + FILLER * 4) for _ in range(words)) + "."
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resume", help="plain-text résumé (default: synthetic)")
+    parser.add_argument("--jd", help="plain-text job description (default: synthetic)")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=40, help="JDs for the batch comparison")
+    args = parser.parse_args()
+    rng = random.Random(11)
+    resume = Path(args.resume).read_text(encoding="utf-8") if args.resume else synthetic_resume(900, rng)
+    jd = Path(args.jd).read_text(encoding="utf-8") if args.jd else synthetic_jd(250, rng)
+
+    def cold():
+        keyword_matcher.index_for.cache_clear()
+        return ats_local_scorer.score_locally(resume, jd)
+
+    result = cold()
+    print(f"résumé: {len(resume)} chars, JD: {len(jd)} chars, {result['signals']['jdKeywords']} JD keywords")
+    print(f"score {result['overallScore']} breakdown {result['breakdown']}")
+    print(f"cold: {_median_ms(cold, args.repeat):.2f} ms")
+    print(f"warm: {_median_ms(lambda: ats_local_scorer.score_locally(resume, jd), args.repeat):.2f} ms")
+    print(f"jd keywords only: {_median_ms(lambda: ats_local_scorer.extract_jd_keywords(jd), args.repeat):.2f} ms")
+
+    jds = [synthetic_jd(250, rng) for _ in range(args.jobs)]
+    repeat = max(1, args.repeat // 10)
+
+    def per_job():
+        keyword_matcher.index_for.cache_clear()
+        return [ats_local_scorer.score_locally(resume, j) for j in jds]
+
+    def batched():
+        keyword_matcher.index_for.cache_clear()
+        return ats_local_scorer.score_many(resume, jds)
+
+    assert per_job() == batched()
+    print(f"batch of {args.jobs}: per job {_median_ms(per_job, repeat):.1f} ms, "
+          f"score_many {_median_ms(batched, repeat):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
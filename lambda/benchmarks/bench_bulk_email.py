@@ -0,0 +1,150 @@
+"""
+Benchmark: job digest fan-out, one SMTP connection per email (send_job_digest_email in a loop,
+the old notify_users_of_new_jobs) vs email_service.send_job_digest_bulk (digest rendered once,
+pooled logged-in connections).
+
+Run from lambda/:  python benchmarks/bench_bulk_email.py [--recipients 300] [--rtt-ms 20] [--connections 4]
+
+The SMTP sink is a local threaded server speaking enough ESMTP for smtplib: EHLO, STARTTLS
+(throwaway self-signed certificate, needs the openssl CLI), AUTH PLAIN, MAIL / RCPT / DATA,
+RSET, QUIT. Every reply is delayed by --rtt-ms to stand in for the network round trip to the
+real SMTP server (localhost RTT is ~0); the TLS handshake costs one more. Reported: messages
+delivered to the sink, connections opened, wall time and messages per second.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import socketserver
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import email_service  # noqa: E402
+
+
+def make_cert(workdir: Path) -> tuple[Path, Path]:
+    cert, key = workdir / "sink.crt", workdir / "sink.key"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1", "-keyout", str(key), "-out", str(cert)],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def start_sink(cert: Path, key: Path, rtt_s: float):
+    stats = {"connections": 0, "messages": 0}
+    lock = threading.Lock()
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(cert, key)
+
+    class Handler(socketserver.BaseRequestHandler):
+        def reply(self, *lines: str) -> None:
+            if rtt_s:
+                time.sleep(rtt_s)
+            out = [f"{line[:3]}-{line[4:]}" for line in lines[:-1]] + [lines[-1]]
+            self.sock.sendall(("\r\n".join(out) + "\r\n").encode())
+
+        def handle(self):
+            with lock:
+                stats["connections"] += 1
+            self.sock = self.request
+            rfile = self.sock.makefile("rb")
+            tls = False
+            self.reply("220 sink ESMTP")
+            while True:
+                line = rfile.readline()
+                if not line:
+                    return
+                verb = line[:4].decode("ascii", "replace").upper()
+                if verb in ("EHLO", "HELO"):
+                    exts = ["250 sink", "250 AUTH PLAIN", "250 8BITMIME"] + ([] if tls else ["250 STARTTLS"])
+                    self.reply(*exts, "250 SIZE 35882577")
+                elif verb == "STAR":
+                    self.reply("220 go ahead")
+                    if rtt_s:
+                        time.sleep(rtt_s)  # TLS 1.3 handshake round trip
+                    self.sock = ctx.wrap_socket(self.sock, server_side=True)
+                    rfile = self.sock.makefile("rb")
+                    tls = True
+                elif verb == "AUTH":
+                    self.reply("235 authenticated")
+                elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                    self.reply("250 ok")
+                elif verb == "DATA":
+                    self.reply("354 end with .")
+                    while rfile.readline() not in (b".\r\n", b""):
+                        pass
+                    with lock:
+                        stats["messages"] += 1
+                    self.reply("250 queued")
+                elif verb == "QUIT":
+                    self.reply("221 bye")
+                    return
+                else:
+                    self.reply("502 not implemented")
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats
+
+
+def synthetic_jobs(n: int) -> list:
+    return [
+        {
+            "job_title": f"Backend Engineer {i}",
+            "company": f"Company {i}",
+            "location": "Bengaluru",
+            "job_type": "Full-time",
+            "salary": "₹25-35 LPA",
+            "description": "Build Python services on AWS Lambda and DynamoDB. " * 8,
+            "apply_link": f"https://example.com/jobs/{i}",
+            "company_logo": f"https://example.com/logo/{i}.png",
+        }
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--recipients", type=int, default=300)
+    parser.add_argument("--rtt-ms", type=float, default=20)
+    parser.add_argument("--connections", type=int, default=4, help="bulk sender connections in parallel")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_cert(Path(tmp))
+        os.environ["SSL_CERT_FILE"] = str(cert)  # ssl.create_default_context() trusts the sink
+        server, stats = start_sink(cert, key, args.rtt_ms / 1000)
+        email_service.SMTP_HOST, email_service.SMTP_PORT = "127.0.0.1", server.server_address[1]
+        email_service.SMTP_USER = email_service.SMTP_FROM_EMAIL = "bench@example.com"
+        email_service.SMTP_APP_PASSWORD = "bench-password"
+
+        jobs = synthetic_jobs(5)
+        recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+        print(f"{args.recipients} recipients, digest of {len(jobs)} jobs, RTT {args.rtt_ms:g} ms")
+
+        def report(name: str, fn) -> None:
+            stats["connections"] = stats["messages"] = 0
+            start = time.perf_counter()
+            fn()
+            seconds = time.perf_counter() - start
+            print(f"{name:>16}: {stats['messages']:5d} delivered  {stats['connections']:4d} connections  "
+                  f"{seconds:7.2f} s  {stats['messages'] / seconds:7.1f} msg/s")
+
+        report("per message", lambda: [email_service.send_job_digest_email(r, jobs) for r in recipients])
+        report(f"bulk x{args.connections}", lambda: email_service.send_job_digest_bulk(
+            recipients, jobs, connections=args.connections))
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
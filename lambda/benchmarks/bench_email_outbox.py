@@ -0,0 +1,78 @@
+"""
+Benchmark: time a request handler spends on a transactional email, sending it inline
+(connect + STARTTLS + login + DATA per email, the old login / subscription path) vs
+email_outbox.enqueue onto a queue, and how fast the drainer then delivers the backlog over
+one SMTP session per batch.
+
+Run from lambda/:  python benchmarks/bench_email_outbox.py [--emails 100] [--rtt-ms 20] [--batch 10]
+
+Uses the local ESMTP sink from bench_bulk_email.py (needs the openssl CLI). The queue is
+email_outbox.MemoryQueue, so "enqueue" excludes the SQS SendMessage round trip (typically
+10-30 ms from Lambda in-region); compare against --rtt-ms accordingly.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import email_outbox  # noqa: E402
+import email_service  # noqa: E402
+from bench_bulk_email import make_cert, start_sink  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=100)
+    parser.add_argument("--rtt-ms", type=float, default=20)
+    parser.add_argument("--batch", type=int, default=10, help="drainer batch size (SQS BatchSize)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_cert(Path(tmp))
+        os.environ["SSL_CERT_FILE"] = str(cert)  # ssl.create_default_context() trusts the sink
+        server, stats = start_sink(cert, key, args.rtt_ms / 1000)
+        email_service.SMTP_HOST, email_service.SMTP_PORT = "127.0.0.1", server.server_address[1]
+        email_service.SMTP_USER = email_service.SMTP_FROM_EMAIL = "bench@example.com"
+        email_service.SMTP_APP_PASSWORD = "bench-password"
+        email_outbox.OUTBOX_QUEUE_URL = ""
+        print(f"{args.emails} verification emails, RTT {args.rtt_ms:g} ms")
+
+        def request(queue, i: int) -> float:
+            start = time.perf_counter()
+            email_outbox.enqueue(
+                "email_verification",
+                f"user{i}@example.com",
+                {"code": f"{i:06d}", "verifyLink": f"https://example.com/verify?u={i}"},
+                key=f"bench-{id(queue)}-{i}",
+                queue=queue,
+            )
+            return (time.perf_counter() - start) * 1e3
+
+        inline = [request(None, i) for i in range(args.emails)]
+        print(f"  inline send  handler p50 {statistics.median(inline):8.2f} ms  "
+              f"p95 {sorted(inline)[int(len(inline) * 0.95) - 1]:8.2f} ms  ({stats['connections']} connections)")
+
+        queue = email_outbox.MemoryQueue()
+        queued = [request(queue, i) for i in range(args.emails)]
+        print(f"  enqueue      handler p50 {statistics.median(queued):8.3f} ms  "
+              f"p95 {sorted(queued)[int(len(queued) * 0.95) - 1]:8.3f} ms")
+
+        stats["connections"] = stats["messages"] = 0
+        start = time.perf_counter()
+        result = email_outbox.drain(queue, batch_size=args.batch)
+        seconds = time.perf_counter() - start
+        print(f"  drainer      {result.sent} sent in {seconds:.2f} s ({result.sent / seconds:.1f} msg/s), "
+              f"{stats['connections']} connections for batches of {args.batch}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
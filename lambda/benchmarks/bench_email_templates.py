@@ -0,0 +1,82 @@
+"""
+Benchmark: rendering a job digest for 10k recipients with the compiled branded shell, memoized
+job cards and the shared bulk MIME body (email_service), no SMTP involved.
+
+Run from lambda/:  python benchmarks/bench_email_templates.py [--recipients 10000] [--jobs 5] [--chunk 50]
+
+  html uncached    digest HTML per recipient with the card / footer memos bypassed
+  html memoized    digest HTML per recipient, cards and footer from the memos
+  mime/recipient   digest HTML + MIME serialization per recipient (one send_job_digest_email each)
+  outbox chunks    one render_job_digest + shared MIME body per --chunk recipients (the
+                   email_outbox drainer), per recipient only the To header
+  bulk             everything rendered once, To header per recipient (send_bulk_email)
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import email_service  # noqa: E402
+from bench_bulk_email import synthetic_jobs  # noqa: E402
+
+
+def _run(name: str, fn, recipients: list) -> None:
+    start = time.perf_counter()
+    fn(recipients)
+    seconds = time.perf_counter() - start
+    print(f"{name:>15}: {seconds * 1e3:9.1f} ms total  {seconds / len(recipients) * 1e6:8.2f} µs/recipient")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--recipients", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=5)
+    parser.add_argument("--chunk", type=int, default=50, help="recipients per outbox digest record")
+    args = parser.parse_args()
+    jobs = synthetic_jobs(args.jobs)
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+    print(f"{args.recipients} recipients, digest of {args.jobs} jobs")
+
+    def html_memoized(rcpts: list) -> None:
+        for _ in rcpts:
+            email_service.render_job_digest(jobs)
+
+    def html_uncached(rcpts: list) -> None:
+        card, footer = email_service._job_card_html, email_service._job_digest_footer_note
+        email_service._job_card_html, email_service._job_digest_footer_note = card.__wrapped__, footer.__wrapped__
+        try:
+            html_memoized(rcpts)
+        finally:
+            email_service._job_card_html, email_service._job_digest_footer_note = card, footer
+
+    def mime_per_recipient(rcpts: list) -> None:
+        for rcpt in rcpts:
+            email_service.addressed(rcpt, email_service.render_message(*email_service.render_job_digest(jobs)))
+
+    def outbox_chunks(rcpts: list) -> None:
+        email_service._bulk_message.cache_clear()
+        for i in range(0, len(rcpts), args.chunk):
+            rendered = email_service._bulk_message(*email_service.render_job_digest(jobs), email_service._from_header())
+            for rcpt in rcpts[i:i + args.chunk]:
+                email_service.addressed(rcpt, rendered)
+
+    def bulk(rcpts: list) -> None:
+        rendered = email_service.render_message(*email_service.render_job_digest(jobs))
+        for rcpt in rcpts:
+            email_service.addressed(rcpt, rendered)
+
+    _run("html uncached", html_uncached, recipients)
+    _run("html memoized", html_memoized, recipients)
+    _run("mime/recipient", mime_per_recipient, recipients)
+    _run(f"outbox x{args.chunk}", outbox_chunks, recipients)
+    _run("bulk", bulk, recipients)
+    print(f"job card memo: {email_service._job_card_html.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
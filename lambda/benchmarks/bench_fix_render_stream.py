@@ -0,0 +1,144 @@
+"""
+Benchmark: time to first résumé section, buffered vs streamed AI JSON render
+(resume_fix_engine.render_resume_data_with_llm with and without on_partial).
+
+Run from lambda/:  python benchmarks/bench_fix_render_stream.py [--tokens-per-second 60] [--ttft-ms 400] [--sections 6]
+
+A local HTTP/1.1 stub stands in for the OpenAI chat completions API: it waits --ttft-ms,
+then produces a synthetic résumé JSON at --tokens-per-second (~4 characters per token),
+either as one JSON body or as chunked server-sent events. Outbound requests are redirected
+to the stub; the LLM response cache is cleared before every run.
+"""
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import http_client  # noqa: E402
+import llm_cache  # noqa: E402
+import resume_fix_engine  # noqa: E402
+
+CHARS_PER_TOKEN = 4
+
+
+def synthetic_resume(sections: int) -> str:
+    secs = [{"type": "skills", "title": "Skills", "items": [
+        {"label": "Languages", "value": "Python, Go, TypeScript, SQL"},
+        {"label": "Cloud", "value": "AWS Lambda, DynamoDB, S3, CloudWatch"},
+    ]}]
+    for i in range(1, sections):
+        secs.append({"type": "entries", "title": f"Experience {i}", "items": [{
+            "title": "Senior Engineer", "org": f"Company {i}",
+            "bullets": [f"Cut p95 latency of service {j} by {10 + j}% by batching DynamoDB reads" for j in range(5)],
+        }]})
+    return json.dumps({
+        "name": "Jane Doe",
+        "subtitle": ["Backend Engineer", "Bengaluru"],
+        "contacts": [{"icon": "✉", "label": "jane@example.com", "href": "mailto:jane@example.com"}],
+        "sections": secs,
+    }, indent=2)
+
+
+def start_stub(completion: str, tokens_per_second: float, ttft_s: float):
+    step = CHARS_PER_TOKEN
+    delay = 1.0 / tokens_per_second
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            req = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+            time.sleep(ttft_s)
+            if not req.get("stream"):
+                time.sleep(delay * len(completion) / step)
+                body = json.dumps({"choices": [{"message": {"content": completion}}]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(completion), step):
+                event = {"choices": [{"delta": {"content": completion[i:i + step]}}]}
+                self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+                time.sleep(delay)
+            self._chunk(b"data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _chunk(self, data: bytes):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def redirect_to(base: str) -> None:
+    real = http_client.urlopen
+
+    def urlopen(req, timeout=60, **kwargs):
+        path = urllib.parse.urlsplit(req.full_url).path
+        local = urllib.request.Request(base + path, data=req.data, headers=dict(req.header_items()),
+                                       method=req.get_method())
+        return real(local, timeout=timeout, **kwargs)
+
+    http_client.urlopen = urlopen
+
+
+def run(stream: bool) -> dict:
+    llm_cache.clear_cache()
+    marks: dict = {}
+    start = time.perf_counter()
+
+    def on_partial(ev):
+        if ev["event"] == "section":
+            marks.setdefault("first", time.perf_counter() - start)
+            marks["sections"] = marks.get("sections", 0) + 1
+
+    data, _ = resume_fix_engine.render_resume_data_with_llm(
+        "Jane Doe\njane@example.com\nBackend engineer, Python, Go, AWS.", ["Kubernetes", "Terraform"],
+        {"provider": "openai", "apiKey": "sk-bench"}, on_partial=on_partial if stream else None,
+    )
+    total = time.perf_counter() - start
+    return {"first": marks.get("first", total), "total": total, "sections": len(data["sections"])}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens-per-second", type=float, default=60)
+    parser.add_argument("--ttft-ms", type=float, default=400)
+    parser.add_argument("--sections", type=int, default=6)
+    args = parser.parse_args()
+
+    completion = synthetic_resume(args.sections)
+    server = start_stub(completion, args.tokens_per_second, args.ttft_ms / 1000)
+    redirect_to(f"http://127.0.0.1:{server.server_address[1]}")
+    print(f"completion ~{len(completion) // CHARS_PER_TOKEN} tokens at {args.tokens_per_second:g} tok/s, "
+          f"TTFT {args.ttft_ms:g} ms, {args.sections} sections")
+    for name, stream in (("buffered", False), ("streamed", True)):
+        r = run(stream)
+        print(f"{name:>9}: first section {r['first'] * 1e3:7.0f} ms   complete {r['total'] * 1e3:7.0f} ms"
+              f"   ({r['sections']} sections)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: urllib.request.urlopen (new TCP + TLS connection per call) vs the pooled
+http_client.urlopen (keep-alive per host) against a local HTTPS stub.
+
+Run from lambda/:  python benchmarks/bench_http_client.py [--requests 200] [--rtt-ms 0] [--body-kb 4]
+
+The stub is a threaded HTTP/1.1 server with a throwaway self-signed certificate (needs the
+openssl CLI). It answers POST /v1/chat/completions with a JSON body of --body-kb. --rtt-ms
+adds that delay before every TCP accept completes its first read, approximating the extra
+round trip a real provider handshake costs (localhost RTT is ~0). Reported: median / p95
+per call and connections opened.
+"""
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import http_client  # noqa: E402
+
+
+def make_cert(workdir: Path) -> tuple[Path, Path]:
+    cert, key = workdir / "stub.crt", workdir / "stub.key"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1", "-keyout", str(key), "-out", str(cert)],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def start_stub(cert: Path, key: Path, body: bytes, rtt_s: float):
+    connections = {"count": 0}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; without this, Nagle + delayed ACK adds ~40 ms
+        # per response on a kept-alive connection (real provider front-ends do not do this)
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            connections["count"] += 1
+            if rtt_s:
+                time.sleep(rtt_s)  # first round trip of a new connection
+            super().setup()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(cert, key)
+    server.socket = ctx.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, connections
+
+
+def _run(opener, url: str, payload: bytes, n: int) -> list:
+    samples = []
+    for _ in range(n):
+        req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"}, method="POST")
+        start = time.perf_counter()
+        with opener(req) as resp:
+            json.loads(resp.read())
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    parser.add_argument("--body-kb", type=int, default=4)
+    args = parser.parse_args()
+
+    body = json.dumps({"choices": [{"message": {"content": "x" * (args.body_kb * 1024)}}]}).encode()
+    payload = json.dumps({"model": "stub", "messages": [{"role": "user", "content": "score this"}]}).encode()
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_cert(Path(tmp))
+        server, connections = start_stub(cert, key, body, args.rtt_ms / 1000)
+        url = f"https://localhost:{server.server_address[1]}/v1/chat/completions"
+        client_ctx = ssl.create_default_context(cafile=str(cert))
+
+        print(f"{args.requests} POSTs, {len(body) // 1024} KB responses, simulated RTT {args.rtt_ms:g} ms")
+        for name, opener in (
+            ("urllib (new connection)", lambda r: urllib.request.urlopen(r, timeout=10, context=client_ctx)),
+            ("http_client (pooled)", lambda r: http_client.urlopen(r, timeout=10, context=client_ctx)),
+        ):
+            before = connections["count"]
+            samples = sorted(_run(opener, url, payload, args.requests))
+            opened = connections["count"] - before
+            print(
+                f"{name:>24}: median {statistics.median(samples) * 1e3:6.2f} ms"
+                f"  p95 {samples[int(len(samples) * 0.95) - 1] * 1e3:6.2f} ms  connections {opened}"
+            )
+        print(f"pool: {http_client.pool_stats()}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark: per-keyword résumé scans (legacy refine_keyword_lists / _already_present) vs the
+shared keyword_matcher index, at growing keyword counts.
+
+Run from lambda/:  python benchmarks/bench_keyword_matcher.py [--resume FILE.txt] [--repeat 200]
+
+Without --resume a synthetic ~900-word résumé is generated. Keywords are drawn from a
+tech / soft-skill vocabulary so roughly half are covered. "cold" builds a fresh index per
+call (first scoring of a résumé), "warm" reuses the cached index (re-scoring / batch).
+Every run asserts that both implementations return the same coverage.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import keyword_matcher  # noqa: E402
+
+VOCAB = (
+    "python aws dynamodb kubernetes docker terraform react node.js java golang sql postgres kafka "
+    "spark machine learning data science leadership communication stakeholders agile scrum ci/cd "
+    "git linux rest api graphql microservices analysis collaboration predictive modeling"
+).split()
+EXTRA = "management design testing security pipelines governance optimization tableau excel".split()
+FILLER = "built led team service scalable improved latency by percent the and with using for of to users".split()
+
+
+def synthetic_resume(words: int, rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCAB + FILLER * 3) for _ in range(words))
+
+
+def keywords(n: int, rng: random.Random) -> list:
+    out = []
+    while len(out) < n:
+        kw = rng.choice(VOCAB + EXTRA)
+        if rng.random() < 0.5:
+            kw += " " + rng.choice(VOCAB + EXTRA)
+        out.append(kw)
+    return out
+
+
+def legacy_covers(resume_text: str, phrases: list) -> list:
+    """Mirror of the pre-index refine_keyword_lists._phrase_known loop (stem index per call)."""
+    rlow = resume_text.lower()
+    stems = set()
+    for w in re.findall(r"[a-zA-Z0-9+]{2,}", rlow):
+        stems.add(w.lower())
+        stems.add(keyword_matcher.simple_stem(w))
+    canon_of = {w: grp[0] for grp in keyword_matcher.SYNONYM_GROUPS for w in grp}
+
+    def known(phrase):
+        pl = phrase.lower().strip()
+        if not pl or pl in rlow:
+            return True
+        toks = [t for t in re.split(r"[^\w+]+", pl) if t and len(t) > 1]
+        if not toks:
+            return False
+        for tok in toks:
+            canon = canon_of.get(tok, tok)
+            ok = tok in rlow or keyword_matcher.simple_stem(tok) in stems
+            for syn in keyword_matcher.SYNONYM_GROUPS:
+                if canon in syn or tok in syn:
+                    if any(s in rlow for s in syn):
+                        ok = True
+                        break
+            if not ok:
+                return False
+        return True
+
+    return [known(p) for p in phrases]
+
+
+def legacy_already_present(blob_lower: str, phrases: list) -> list:
+    out = []
+    for phrase in phrases:
+        pl = phrase.strip().lower()
+        toks = [t for t in re.split(r"[^\w+]+", pl) if len(t) > 2]
+        out.append(not pl or pl in blob_lower or (bool(toks) and all(t in blob_lower for t in toks)))
+    return out
+
+
+def index_covers(resume_text: str, phrases: list) -> list:
+    index = keyword_matcher.KeywordIndex(resume_text)
+    return [index.covers(p) for p in phrases]
+
+
+def index_already_present(blob_lower: str, phrases: list) -> list:
+    index = keyword_matcher.KeywordIndex(blob_lower)
+    return [index.has_all_tokens(p) for p in phrases]
+
+
+def _median_us(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resume", help="plain-text résumé (default: synthetic)")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(7)
+    resume = Path(args.resume).read_text(encoding="utf-8") if args.resume else synthetic_resume(900, rng)
+    blob = resume.lower()
+
+    print(f"résumé: {len(resume)} chars")
+    print(f"{'keywords':>8} | {'legacy refine':>13} {'cold':>9} {'warm':>9} | {'legacy present':>14} {'index':>9}")
+    for n in (10, 25, 100, 250, 500):
+        kws = keywords(n, rng)
+        expected = legacy_covers(resume, kws)
+        assert index_covers(resume, kws) == expected
+        assert index_already_present(blob, kws) == legacy_already_present(blob, kws)
+
+        legacy_us = _median_us(lambda: legacy_covers(resume, kws), args.repeat)
+        cold_us = _median_us(lambda: index_covers(resume, kws), args.repeat)
+        warm = keyword_matcher.index_for(resume)
+        warm_us = _median_us(lambda: [warm.covers(k) for k in kws], args.repeat)
+        present_us = _median_us(lambda: legacy_already_present(blob, kws), args.repeat)
+        index_us = _median_us(lambda: index_already_present(blob, kws), args.repeat)
+        print(
+            f"{n:>8} | {legacy_us:11.0f}us {cold_us:7.0f}us {warm_us:7.0f}us"
+            f" | {present_us:12.0f}us {index_us:7.0f}us   ({sum(expected)}/{n} covered)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: "your rank" via full scan + sort (legacy get_leaderboard) vs the
+XP histogram in leaderboard_store.approximate_rank.
+
+Run from lambda/:  python benchmarks/bench_leaderboard_rank.py [--sizes 10000,100000,1000000]
+
+No AWS access needed: synthetic UserProgress items are generated in memory
+with the same shapes DynamoDB returns (Decimal numbers, occasional strings).
+Network time for the scan is not included, so the legacy numbers are a floor.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import leaderboard_store  # noqa: E402
+
+
+def synthetic_progress(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        tests = rng.randint(1, 60)
+        xp = int(rng.gammavariate(2.0, 900))
+        items.append({
+            "userId": f"user-{i:08d}",
+            "testsCompleted": Decimal(tests) if i % 50 else str(tests),
+            "totalXP": Decimal(xp) if i % 50 else str(xp),
+            "avgScore": Decimal("71.5"),
+            "badges": [],
+            "level": Decimal(1),
+        })
+    return items
+
+
+def legacy_rank(progress_items: list, user_id: str):
+    """Mirror of the pre-index get_leaderboard: coerce, sort, linear search."""
+    items = []
+    for progress in progress_items:
+        tests_completed = progress.get("testsCompleted", 0)
+        if isinstance(tests_completed, str):
+            tests_completed = int(tests_completed) if tests_completed.isdigit() else 0
+        if tests_completed > 0:
+            total_xp = progress.get("totalXP", 0)
+            if isinstance(total_xp, str):
+                total_xp = int(total_xp) if total_xp.isdigit() else 0
+            items.append({"userId": progress.get("userId"), "xp": total_xp})
+    items.sort(key=lambda x: x.get("xp", 0), reverse=True)
+    for i, item in enumerate(items, start=1):
+        if item.get("userId") == user_id:
+            return i, len(items)
+    return None, len(items)
+
+
+def build_histogram(progress_items: list) -> dict:
+    buckets = [0] * leaderboard_store.HISTOGRAM_MAX_BUCKETS
+    for progress in progress_items:
+        buckets[leaderboard_store.bucket_for(leaderboard_store._to_int(progress.get("totalXP")))] += 1
+    return {"total": len(progress_items), "buckets": buckets}
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def run(n: int) -> None:
+    items = synthetic_progress(n)
+    rng = random.Random(n)
+    probes = [items[rng.randrange(n)] for _ in range(25)]
+    histogram = build_histogram(items)
+
+    legacy_ms = _time(lambda: legacy_rank(items, probes[0]["userId"]), repeat=3 if n >= 1_000_000 else 5)
+    approx_ms = _time(
+        lambda: [leaderboard_store.approximate_rank(histogram, leaderboard_store._to_int(p["totalXP"])) for p in probes],
+        repeat=20,
+    ) / len(probes)
+
+    errors = []
+    for probe in probes[:5]:
+        exact, _ = legacy_rank(items, probe["userId"])
+        estimate = leaderboard_store.approximate_rank(histogram, leaderboard_store._to_int(probe["totalXP"]))
+        errors.append(abs(estimate["rank"] - exact) / n * 100)
+
+    print(
+        f"{n:>9,} users | full scan+sort {legacy_ms:10.2f} ms | histogram {approx_ms:8.4f} ms"
+        f" | speedup {legacy_ms / max(approx_ms, 1e-9):>10,.0f}x | max rank error {max(errors):.3f}% of M"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    args = parser.parse_args()
+    print(
+        f"bucket width {leaderboard_store.HISTOGRAM_BUCKET_WIDTH} XP, "
+        f"{leaderboard_store.HISTOGRAM_MAX_BUCKETS} buckets"
+    )
+    for size in args.sizes.split(","):
+        run(int(size))
+
+
+if __name__ == "__main__":
+    main()
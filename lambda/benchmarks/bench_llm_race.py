@@ -0,0 +1,121 @@
+"""
+Benchmark: sequential provider fail-over (legacy ATS flow) vs llm_race hedging.
+
+Run from lambda/:  python benchmarks/bench_llm_race.py [--requests 300] [--hedge-delay 0.08]
+
+No network or API keys: fake providers sleep for a latency drawn from a
+log-normal distribution and fail / hang with injected probabilities. Times
+are scaled down (1 unit = 10 ms by default) so a run takes a few seconds.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import llm_race  # noqa: E402
+
+
+class FakeProvider:
+    """Sleeps ~median seconds (log-normal); errors or stalls with the given odds."""
+
+    def __init__(self, name: str, median: float, error_rate: float, stall_rate: float, stall: float, seed: int):
+        self.name = name
+        self.median = median
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            roll = self._rng.random()
+            latency = self.median * self._rng.lognormvariate(0, 0.35)
+        if roll < self.stall_rate:
+            time.sleep(self.stall)
+            raise TimeoutError(f"{self.name} timed out")
+        time.sleep(latency)
+        if roll < self.stall_rate + self.error_rate:
+            raise RuntimeError(f"{self.name} 5xx")
+        return '{"overallScore": 72}'
+
+
+def providers(unit: float) -> list:
+    return [
+        FakeProvider("openai", 4 * unit, error_rate=0.03, stall_rate=0.05, stall=30 * unit, seed=1),
+        FakeProvider("claude", 5 * unit, error_rate=0.02, stall_rate=0.01, stall=30 * unit, seed=2),
+        FakeProvider("gemini", 3 * unit, error_rate=0.10, stall_rate=0.02, stall=25 * unit, seed=3),
+    ]
+
+
+def sequential(fakes: list) -> str:
+    """Mirror of the pre-race loop: try each provider to completion, in fixed order."""
+    for fake in fakes:
+        try:
+            return llm_race._run(fake.name, fake, validate=None)
+        except Exception:
+            continue
+    raise RuntimeError("all failed")
+
+
+def _percentiles(samples: list) -> str:
+    ordered = sorted(samples)
+    p = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000  # noqa: E731
+    return f"p50 {statistics.median(ordered) * 1000:7.1f} ms | p90 {p(0.90):7.1f} ms | p99 {p(0.99):7.1f} ms"
+
+
+def run(label: str, fn, n: int) -> None:
+    samples, failures = [], 0
+    for _ in range(n):
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):  # race() logs each provider failure
+                fn()
+        except Exception:
+            failures += 1
+        samples.append(time.perf_counter() - start)
+    print(f"{label:<28} {_percentiles(samples)} | failed {failures}/{n}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--unit", type=float, default=0.01, help="seconds per simulated latency unit")
+    parser.add_argument("--hedge-delay", type=float, default=None, help="seconds (default 6 units)")
+    args = parser.parse_args()
+    delay = args.hedge_delay if args.hedge_delay is not None else 6 * args.unit
+
+    fakes = providers(args.unit)
+    order = [f.name for f in fakes]
+    by_name = {f.name: f for f in fakes}
+
+    llm_race.reset_stats()
+    run("sequential fail-over", lambda: sequential(fakes), args.requests)
+
+    llm_race.reset_stats()
+    run(
+        f"hedged ({delay * 1000:.0f} ms), fixed order",
+        lambda: llm_race.race([(f.name, f) for f in fakes], hedge_delay=delay),
+        args.requests,
+    )
+
+    llm_race.reset_stats()
+    run(
+        f"hedged ({delay * 1000:.0f} ms), ranked",
+        lambda: llm_race.race([(n, by_name[n]) for n in llm_race.rank(order)], hedge_delay=delay),
+        args.requests,
+    )
+    print("stats after ranked run:", llm_race.provider_stats())
+
+
+if __name__ == "__main__":
+    main()
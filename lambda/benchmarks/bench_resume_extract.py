@@ -0,0 +1,202 @@
+"""
+Benchmark: legacy sequential PDF extraction vs the single-parse, per-page engine in
+resume_text_extract._extract_pdf, plus the portfolio builders' old temp-file path vs
+the shared in-memory extract_clean_text() (cold and cached).
+
+Run from lambda/:  python benchmarks/bench_resume_extract.py [--corpus DIR] [--repeat 5]
+
+--corpus points at a folder of sample PDFs (e.g. anonymised uploads). Without it a
+synthetic corpus is generated with PyMuPDF: clean text résumés, résumés with a
+garbage text-layer page, and fully or partly "scanned" (image-only) résumés.
+
+Textract is never called: OCR is stubbed and the benchmark reports how many pages
+each approach would send, next to the parse time and the text_quality() of the
+whole result. Needs PyPDF2, pdfminer.six, PyMuPDF.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # noqa: E402
+
+import resume_text_extract as rte  # noqa: E402
+
+RESUME_PAGE = """Jane Doe  |  jane@example.com  |  +91 98765 43210
+SUMMARY
+Backend engineer with 5+ years building payment and search services.
+EXPERIENCE
+Senior Software Engineer, Acme Corp (2021-2024)
+- Cut p99 latency of the checkout API by 40% with DynamoDB single-table design
+- Led migration of 30 Lambda functions to Python 3.11
+SKILLS
+Python, Go, AWS, DynamoDB, PostgreSQL, Kafka, Docker, Kubernetes, Terraform
+EDUCATION
+B.Tech Computer Science, 2019"""
+GARBAGE_PAGE = "(cid:12)(cid:44)(cid:3)(cid:9)�� " * 40
+
+
+def _text_pdf(pages: list) -> bytes:
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=10)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _scanned_pdf(pages: int, scanned=None) -> bytes:
+    """Render the given pages (default: all) to images; the other pages keep their text layer."""
+    src = fitz.open(stream=_text_pdf([RESUME_PAGE] * pages), filetype="pdf")
+    out = fitz.open()
+    for i, page in enumerate(src):
+        if scanned is not None and i not in scanned:
+            out.insert_pdf(src, from_page=i, to_page=i)
+            continue
+        pix = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5))
+        out.new_page(width=page.rect.width, height=page.rect.height).insert_image(page.rect, pixmap=pix)
+    data = out.tobytes()
+    src.close()
+    out.close()
+    return data
+
+
+def synthetic_corpus() -> dict:
+    return {
+        "clean-1p": _text_pdf([RESUME_PAGE]),
+        "clean-3p": _text_pdf([RESUME_PAGE] * 3),
+        "garbage-page-2of3": _text_pdf([RESUME_PAGE, GARBAGE_PAGE, RESUME_PAGE]),
+        "scanned-2p": _scanned_pdf(2),
+        "scanned-page-2of3": _scanned_pdf(3, scanned={1}),
+    }
+
+
+def load_corpus(folder: str) -> dict:
+    return {p.name: p.read_bytes() for p in sorted(Path(folder).glob("*.pdf"))}
+
+
+def legacy_extract(data: bytes) -> tuple:
+    """Mirror of the pre-engine extractor: whole-document parses in sequence, judged by length."""
+    text = ""
+    try:
+        import PyPDF2
+        import io
+
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        text = "\n".join(t for t in (p.extract_text() for p in reader.pages) if t).strip()
+    except Exception:
+        text = ""
+    if len(text) < rte.MIN_PDF_TEXT_CHARS:
+        t_min = rte._pdfminer_extract(data)
+        if len(t_min) > len(text):
+            text = t_min
+    if len(text) < rte.MIN_PDF_TEXT_CHARS:
+        doc = fitz.open(stream=data, filetype="pdf")
+        t2 = "\n".join(p.get_text("text") for p in doc).strip()
+        if len(t2) > len(text):
+            text = t2
+        ocr_pages = min(doc.page_count, rte.OCR_MAX_PDF_PAGES) if len(text) < rte.MIN_PDF_TEXT_CHARS else 0
+        doc.close()
+        return text, ocr_pages
+    return text, 0
+
+
+def legacy_portfolio_extract(data: bytes) -> str:
+    """Mirror of the old portfolio path: write a temp file, PyPDF2 from disk, clean, stdlib fallback."""
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, "resume.pdf")
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+        import PyPDF2
+
+        with open(path, "rb") as f:
+            text = rte.clean_resume_text("\n\n".join(p.extract_text() or "" for p in PyPDF2.PdfReader(f).pages))
+        if len(text) <= 200:
+            with open(path, "rb") as f:
+                basic = rte.clean_resume_text(rte._pdf_stdlib_text(f.read()))
+            text = basic if len(basic) > len(text) else text
+        return "" if rte.is_garbage_text(text) else text
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", help="folder of sample PDFs (default: synthetic corpus)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    if not corpus:
+        sys.exit(f"no PDFs found in {args.corpus}")
+
+    ocr_requests = []
+
+    def fake_ocr(doc, page_indexes):
+        ocr_requests.append(len(page_indexes))
+        return {}
+
+    rte._fitz_textract_ocr = fake_ocr
+    rte.ENABLE_TEXTRACT_OCR = True
+
+    print(f"{'file':<22} | {'legacy':>9} {'ocr pg':>6} {'quality':>7} | {'engine':>9} {'ocr pg':>6} {'quality':>7} | extractor")
+    totals = [0.0, 0, 0.0, 0]
+    for name, data in corpus.items():
+        legacy_text, legacy_ocr = legacy_extract(data)
+        legacy_ms = _median_ms(lambda: legacy_extract(data), args.repeat)
+
+        ocr_requests.clear()
+        text, extractor, _ = rte._extract_pdf(data)
+        engine_ocr = sum(ocr_requests)
+        engine_ms = _median_ms(lambda: rte._extract_pdf(data), args.repeat)
+
+        print(
+            f"{name[:22]:<22} | {legacy_ms:7.1f}ms {legacy_ocr:>6} {rte.text_quality(legacy_text):7.2f}"
+            f" | {engine_ms:7.1f}ms {engine_ocr:>6} {rte.text_quality(text):7.2f} | {extractor}"
+        )
+        totals[0] += legacy_ms
+        totals[1] += legacy_ocr
+        totals[2] += engine_ms
+        totals[3] += engine_ocr
+    print(f"{'total':<22} | {totals[0]:7.1f}ms {totals[1]:>6} {'':>7} | {totals[2]:7.1f}ms {totals[3]:>6}")
+
+    def cold(data):
+        rte.clear_extraction_cache()
+        return rte.extract_clean_text(data, "resume.pdf")
+
+    print()
+    print(f"{'portfolio path':<22} | {'temp-file':>9} | {'shared':>9} | {'cached':>9} | chars legacy/shared")
+    for name, data in corpus.items():
+        with contextlib.redirect_stdout(io.StringIO()):  # extract_clean_text logs unreadable files
+            legacy_text = legacy_portfolio_extract(data)
+            legacy_ms = _median_ms(lambda: legacy_portfolio_extract(data), args.repeat)
+            text = cold(data)
+            cold_ms = _median_ms(lambda: cold(data), args.repeat)
+            cached_ms = _median_ms(lambda: rte.extract_clean_text(data, "resume.pdf"), args.repeat)
+        print(
+            f"{name[:22]:<22} | {legacy_ms:7.1f}ms | {cold_ms:7.1f}ms | {cached_ms:7.2f}ms"
+            f" | {len(legacy_text)}/{len(text)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 """
-Build ats_resume_scorer.zip for AWS Lambda: dependencies + ats_resume_scorer.py + resume_text_extract.py.
+Build ats_resume_scorer.zip for AWS Lambda: dependencies + ats_resume_scorer.py + shared modules
+(resume_text_extract.py, feature_entitlement.py, llm_race.py, llm_cache.py, http_client.py,
+llm_stream.py, keyword_matcher.py, ats_local_scorer.py).
 
 Fix My Resume is a separate Lambda — use build_fix_resume_zip.py.
 
@@ -21,6 +23,12 @@ HANDLER = ROOT / "ats_resume_scorer.py"
 SHARED_MODULES = (
     ROOT / "resume_text_extract.py",
     ROOT / "feature_entitlement.py",
+    ROOT / "llm_race.py",
+    ROOT / "llm_cache.py",
+    ROOT / "http_client.py",
+    ROOT / "llm_stream.py",
+    ROOT / "keyword_matcher.py",
+    ROOT / "ats_local_scorer.py",
 )
 OUT = ROOT / "ats_resume_scorer.zip"
 PKG = ROOT / "package"
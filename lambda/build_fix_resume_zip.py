@@ -24,9 +24,15 @@ MODULES = [
     "resume_fix_latex.py",
     "resume_fix_pdf_simple.py",
     "resume_fix_pipeline.py",
+    "keyword_matcher.py",
+    "ats_local_scorer.py",
     # resume_fix_engine imports get_user_llm_config + _call_* from ats_resume_scorer for AI layout/JSON render
     "feature_entitlement.py",
     "ats_resume_scorer.py",
+    "llm_race.py",
+    "llm_cache.py",
+    "http_client.py",
+    "llm_stream.py",
 ]
 TEMPLATE = ROOT / "templates" / "resume_fix_template.tex"
 OUT = ROOT / "fix_resume_lambda.zip"
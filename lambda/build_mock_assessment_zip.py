@@ -16,6 +16,9 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent
 SOURCE = ROOT / "mock_assessment_handler.py"
+SHARED_MODULES = (
+    ROOT / "leaderboard_store.py",
+)
 OUT = ROOT / "mock_assessment.zip"
 # Entry module name must match Lambda handler setting (lambda_function.lambda_handler)
 ZIP_ENTRY = "lambda_function.py"
@@ -28,6 +31,11 @@ def main() -> None:
         OUT.unlink()
     with zipfile.ZipFile(OUT, "w", zipfile.ZIP_DEFLATED) as zf:
         zf.write(SOURCE, ZIP_ENTRY)
+        for mod in SHARED_MODULES:
+            if mod.is_file():
+                zf.write(mod, mod.name)
+            else:
+                print(f"warning: missing {mod.name} — zip may fail at import on Lambda")
     print(f"Wrote {OUT} ({OUT.stat().st_size // 1024} KB)")
     print(f"  {SOURCE.name} -> {ZIP_ENTRY} (handler: lambda_function.lambda_handler)")
 
@@ -2,7 +2,7 @@
 Build subscription_lambda.zip for AWS Lambda UserSubscriptions_handler.
 
 Bundles reportlab + subscription_handler (as lambda_function.py), email_service,
-feature_entitlement, and subscription_invoice.
+email_outbox, feature_entitlement, and subscription_invoice.
 
 Run from lambda/:  python build_subscription_zip.py
 """
@@ -22,6 +22,7 @@ OUT = ROOT / "subscription_lambda.zip"
 PKG = ROOT / "package-subscription"
 SHARED_MODULES = (
     ROOT / "email_service.py",
+    ROOT / "email_outbox.py",
     ROOT / "feature_entitlement.py",
     ROOT / "subscription_invoice.py",
 )
@@ -6,6 +6,11 @@ from decimal import Decimal
 import boto3
 from botocore.config import Config
 
+try:
+    import catalog_cache
+except ImportError:
+    catalog_cache = None  # falls back to a scan per list request
+
 # ================= CONFIG =================
 # Adjust table names and region to match your AWS setup
 REGION = "ap-south-2"
@@ -48,6 +53,11 @@ def to_decimal(value):
     return Decimal(str(value))
 
 
+def _invalidate(table):
+    if catalog_cache is not None:
+        catalog_cache.invalidate(table.name)
+
+
 def parse_body(event):
     try:
         return json.loads(event.get("body", "{}") or "{}")
@@ -142,8 +152,10 @@ def lambda_handler(event, context):
 # ================= ACTION HANDLERS =================
 def handle_list(section: str):
     table = trending_table if section == "trending" else projects_table
-    result = table.scan()
-    items = result.get("Items", [])
+    if catalog_cache is not None:
+        items = catalog_cache.get_table_items(table)
+    else:
+        items = table.scan().get("Items", [])
     # Sort by createdAt desc if present
     items.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
     return response(200, {"success": True, "items": items})
@@ -185,6 +197,7 @@ def handle_put(section: str, items):
     with table.batch_writer() as batch:
         for item_id in to_delete:
             batch.delete_item(Key={"id": item_id})
+    _invalidate(table)
 
     return response(
         200,
@@ -199,6 +212,7 @@ def handle_put(section: str, items):
 def handle_delete(section: str, item_id: str):
     table = trending_table if section == "trending" else projects_table
     table.delete_item(Key={"id": item_id})
+    _invalidate(table)
     return response(200, {"success": True, "message": "Item deleted", "id": item_id})
 
 
@@ -0,0 +1,222 @@
+"""
+Warm-container snapshot cache for read-mostly catalog tables.
+
+Catalog tables (companies, roadmaps, prep content, ...) change only when an
+admin saves, but their list endpoints used to scan the whole table on every
+request. This module keeps a versioned snapshot of each catalog in the warm
+container and re-scans only when the catalog's version changes.
+
+Table: CatalogVersions
+  PK: catalog  (string)  — catalog name; for whole-table catalogs the table name
+  Attributes:
+    version    (number)  — ADD 1 on every admin write
+    updatedAt  (string)
+
+Readers check the version at most every CATALOG_CACHE_CHECK_SECONDS with one
+consistent GetItem (1 RCU) instead of a full scan. Admin write paths call
+invalidate(), which drops the local snapshot and bumps the version so every
+other warm container reloads on its next check.
+
+If CatalogVersions is missing or not readable, snapshots simply expire after
+CATALOG_CACHE_MAX_AGE_SECONDS (reads never fail because of the cache). Edits
+made outside the admin APIs (console, scripts) are picked up within
+CATALOG_CACHE_REFRESH_SECONDS even when the version does not change.
+
+Usage:
+    import catalog_cache
+    items = catalog_cache.get_table_items(table)          # cached full scan
+    items = catalog_cache.get_items("company-compare", loader)
+    ...
+    catalog_cache.invalidate(table.name)                  # after admin writes
+
+Returned lists are fresh shallow copies; treat the item dicts as read-only.
+
+IAM: dynamodb:GetItem and dynamodb:UpdateItem on CatalogVersions.
+Packaging: bundle catalog_cache.py next to the handler; handlers fall back to
+direct scans when it is absent.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+VERSIONS_TABLE = os.environ.get("CATALOG_VERSIONS_TABLE", "CatalogVersions")
+REGION = os.environ.get("CATALOG_VERSIONS_REGION") or os.environ.get("AWS_REGION") or "ap-south-2"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+CHECK_SECONDS = _env_float("CATALOG_CACHE_CHECK_SECONDS", 10)
+MAX_AGE_SECONDS = _env_float("CATALOG_CACHE_MAX_AGE_SECONDS", 60)
+REFRESH_SECONDS = _env_float("CATALOG_CACHE_REFRESH_SECONDS", 900)
+
+_VERSIONS_UNAVAILABLE_CODES = ("ResourceNotFoundException", "AccessDeniedException")
+
+
+@dataclass
+class Snapshot:
+    version: Optional[int]       # None when CatalogVersions is unavailable
+    items: List[Dict[str, Any]]
+    loaded_at: float
+    checked_at: float
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    version_checks: int = 0
+    loads: int = 0
+    invalidations: int = 0
+    by_catalog: Dict[str, int] = field(default_factory=dict)
+
+
+_snapshots: Dict[str, Snapshot] = {}
+_lock = threading.Lock()
+_stats = _Stats()
+_versions_table = None
+_versions_available = True
+
+
+def _table():
+    global _versions_table
+    if _versions_table is None:
+        _versions_table = boto3.resource("dynamodb", region_name=REGION).Table(VERSIONS_TABLE)
+    return _versions_table
+
+
+def set_versions_table(table) -> None:
+    """Point the cache at another versions table (tests / local DynamoDB)."""
+    global _versions_table, _versions_available
+    _versions_table = table
+    _versions_available = True
+
+
+def _read_version(catalog: str) -> Optional[int]:
+    """Current version (0 if never bumped); None if version tracking is unavailable."""
+    global _versions_available
+    if not _versions_available:
+        return None
+    _stats.version_checks += 1
+    try:
+        item = _table().get_item(
+            Key={"catalog": catalog}, ConsistentRead=True, ProjectionExpression="version"
+        ).get("Item")
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if code in _VERSIONS_UNAVAILABLE_CODES:
+            print(f"{VERSIONS_TABLE} unavailable ({code}); catalog snapshots fall back to {MAX_AGE_SECONDS:.0f}s expiry")
+            _versions_available = False
+        else:
+            print(f"{VERSIONS_TABLE} get_item failed for {catalog}: {e}")
+        return None
+    return int((item or {}).get("version", 0))
+
+
+def scan_all(table, **scan_kwargs) -> List[Dict[str, Any]]:
+    """Paginated full scan."""
+    items: List[Dict[str, Any]] = []
+    while True:
+        result = table.scan(**scan_kwargs)
+        items.extend(result.get("Items", []))
+        if "LastEvaluatedKey" not in result:
+            return items
+        scan_kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+
+def get_snapshot(catalog: str, loader: Callable[[], List[Dict[str, Any]]]) -> Snapshot:
+    """
+    Current snapshot for `catalog`, calling loader() only when there is none
+    yet, its version changed, or (without version tracking) it is too old.
+    """
+    now = time.time()
+    with _lock:
+        snap = _snapshots.get(catalog)
+        if snap is not None:
+            if snap.version is None:
+                fresh = now - snap.loaded_at < MAX_AGE_SECONDS
+            else:
+                fresh = now - snap.checked_at < CHECK_SECONDS
+            if fresh:
+                _stats.hits += 1
+                return snap
+
+    # Version first, then load: a write landing in between only costs an extra reload
+    version = _read_version(catalog)
+    if (
+        snap is not None
+        and version is not None
+        and version == snap.version
+        and now - snap.loaded_at < REFRESH_SECONDS
+    ):
+        snap.checked_at = now
+        _stats.hits += 1
+        return snap
+
+    items = loader()
+    snap = Snapshot(version=version, items=items, loaded_at=now, checked_at=now)
+    with _lock:
+        _snapshots[catalog] = snap
+        _stats.loads += 1
+        _stats.by_catalog[catalog] = _stats.by_catalog.get(catalog, 0) + 1
+    return snap
+
+
+def get_items(catalog: str, loader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return list(get_snapshot(catalog, loader).items)
+
+
+def get_table_items(table) -> List[Dict[str, Any]]:
+    """Cached full scan of a whole table (catalog name = table name)."""
+    return get_items(table.name, lambda: scan_all(table))
+
+
+def invalidate(catalog: str) -> None:
+    """Call after an admin write: drop the local copy and bump the shared version."""
+    with _lock:
+        _snapshots.pop(catalog, None)
+        _stats.invalidations += 1
+    if not _versions_available:
+        return
+    try:
+        _table().update_item(
+            Key={"catalog": catalog},
+            UpdateExpression="ADD version :one SET updatedAt = :now",
+            ExpressionAttributeValues={
+                ":one": 1,
+                ":now": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            },
+        )
+    except ClientError as e:
+        # Other containers still converge within REFRESH_SECONDS
+        print(f"{VERSIONS_TABLE} bump failed for {catalog}: {e}")
+
+
+def clear() -> None:
+    global _stats, _versions_available
+    with _lock:
+        _snapshots.clear()
+        _stats = _Stats()
+    _versions_available = True
+
+
+def stats() -> Dict[str, Any]:
+    return {
+        "hits": _stats.hits,
+        "versionChecks": _stats.version_checks,
+        "loads": _stats.loads,
+        "invalidations": _stats.invalidations,
+        "loadsByCatalog": dict(_stats.by_catalog),
+        "versioned": _versions_available,
+    }
@@ -30,6 +30,11 @@ import boto3
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
+try:
+    import catalog_cache
+except ImportError:
+    catalog_cache = None  # falls back to a ByStream query per list request
+
 CORS_HEADERS = {
     "Content-Type": "application/json",
     "Access-Control-Allow-Origin": "*",
@@ -538,7 +543,7 @@ def _matches_filters(company, query):
     return True
 
 
-def _load_all_companies(table):
+def _query_all_companies(table):
     items = []
     kwargs = {
         "IndexName": STREAM_INDEX,
@@ -554,6 +559,18 @@ def _load_all_companies(table):
     return items
 
 
+def _load_all_companies(table):
+    """Sorted companies from the warm-container snapshot (admin writes invalidate it)."""
+    if catalog_cache is None:
+        return _query_all_companies(table)
+    return catalog_cache.get_items(table.name, lambda: _query_all_companies(table))
+
+
+def _invalidate_companies(table):
+    if catalog_cache is not None:
+        catalog_cache.invalidate(table.name)
+
+
 def handle_list(table, query):
     all_items = _load_all_companies(table)
     filtered = [_to_public_company(c) for c in all_items if _matches_filters(c, query)]
@@ -601,7 +618,7 @@ def handle_admin_sync(body, table, event):
     now = now_iso()
     written = 0
 
-    existing = _load_all_companies(table)
+    existing = _query_all_companies(table)
     existing_by_id = {c["companyId"]: c for c in existing}
     best_raw_by_id = {}
     best_item_by_id = {}
@@ -659,6 +676,9 @@ def handle_admin_sync(body, table, event):
         )
     except ClientError as e:
         return response(500, {"error": "Database error", "message": str(e)})
+    finally:
+        # Partial batches still changed the table
+        _invalidate_companies(table)
 
 
 def handle_admin_upsert(body, table, event):
@@ -680,6 +700,7 @@ def handle_admin_upsert(body, table, event):
 
     try:
         table.put_item(Item=_decimalize(item))
+        _invalidate_companies(table)
         return response(200, {"success": True, "companyId": cid, "company": _to_public_company(item)})
     except ClientError as e:
         return response(500, {"error": "Database error", "message": str(e)})
@@ -695,6 +716,7 @@ def handle_admin_delete(company_id, table, event):
 
     try:
         table.delete_item(Key={"companyId": company_id})
+        _invalidate_companies(table)
         return response(200, {"success": True, "companyId": company_id})
     except ClientError as e:
         return response(500, {"error": "Database error", "message": str(e)})
@@ -2,7 +2,10 @@
 set -euo pipefail
 
 # Deploy admin auth Lambdas (ap-south-2).
-# Usage: ./deploy_admin_lambdas.sh [admin|login|all]
+# Usage: ./deploy_admin_lambdas.sh [admin|login|sheets|all]
+# "sheets" (not part of "all") updates the UTM Google Sheets drainer and nightly backfill
+# Lambdas and (re)applies the backfill schedule; create both functions once first
+# (docs/GOOGLE_SHEETS_SETUP.md).
 
 REGION="${AWS_REGION:-ap-south-2}"
 ROOT="$(cd "$(dirname "$0")" && pwd)"
@@ -13,9 +16,10 @@ deploy_admin_users() {
   build_dir="$(mktemp -d)"
   cp "$ROOT/get_all_users_for_admin.py" "$build_dir/lambda_function.py"
   cp "$ROOT/admin_password_crypto.py" "$build_dir/"
+  cp "$ROOT/freelancer_search_index.py" "$build_dir/"
   (
     cd "$build_dir"
-    zip -q deploy.zip lambda_function.py admin_password_crypto.py
+    zip -q deploy.zip lambda_function.py admin_password_crypto.py freelancer_search_index.py
   )
   aws lambda update-function-code \
     --region "$REGION" \
@@ -29,7 +33,7 @@ deploy_login() {
   local build_dir
   build_dir="$(mktemp -d)"
   cp "$ROOT/login_handler.py" "$build_dir/lambda_function.py"
-  for f in admin_password_crypto.py email_service.py rate_limiter.py google_sheets_sync.py; do
+  for f in admin_password_crypto.py email_service.py email_outbox.py rate_limiter.py google_sheets_sync.py http_client.py; do
     if [[ -f "$ROOT/$f" ]]; then
       cp "$ROOT/$f" "$build_dir/"
     fi
@@ -46,15 +50,47 @@ deploy_login() {
   echo "Deployed User_login_signup in $REGION"
 }
 
+deploy_sheets() {
+  local build_dir fn backfill_arn rule_arn
+  build_dir="$(mktemp -d)"
+  cp "$ROOT/google_sheets_sync.py" "$ROOT/backfill_utm_users_to_sheets.py" "$ROOT/http_client.py" "$build_dir/"
+  (
+    cd "$build_dir"
+    zip -q deploy.zip ./*.py
+  )
+  # Utm_sheets_sync: handler google_sheets_sync.lambda_handler, SQS trigger on GOOGLE_SHEETS_QUEUE_URL
+  # Utm_sheets_backfill: handler backfill_utm_users_to_sheets.lambda_handler, nightly schedule below
+  for fn in Utm_sheets_sync Utm_sheets_backfill; do
+    aws lambda update-function-code \
+      --region "$REGION" \
+      --function-name "$fn" \
+      --zip-file "fileb://$build_dir/deploy.zip"
+  done
+  rm -rf "$build_dir"
+
+  backfill_arn="$(aws lambda get-function --region "$REGION" --function-name Utm_sheets_backfill \
+    --query Configuration.FunctionArn --output text)"
+  # 20:30 UTC = 02:00 IST
+  rule_arn="$(aws events put-rule --region "$REGION" --name utm-sheets-backfill-nightly \
+    --schedule-expression "cron(30 20 * * ? *)" --query RuleArn --output text)"
+  aws lambda add-permission --region "$REGION" --function-name Utm_sheets_backfill \
+    --statement-id utm-sheets-backfill-nightly --action lambda:InvokeFunction \
+    --principal events.amazonaws.com --source-arn "$rule_arn" >/dev/null 2>&1 || true
+  aws events put-targets --region "$REGION" --rule utm-sheets-backfill-nightly \
+    --targets "Id=backfill,Arn=$backfill_arn" >/dev/null
+  echo "Deployed Utm_sheets_sync and Utm_sheets_backfill (nightly) in $REGION"
+}
+
 case "$TARGET" in
   admin) deploy_admin_users ;;
   login) deploy_login ;;
+  sheets) deploy_sheets ;;
   all)
     deploy_admin_users
     deploy_login
     ;;
   *)
-    echo "Usage: $0 [admin|login|all]" >&2
+    echo "Usage: $0 [admin|login|sheets|all]" >&2
     exit 1
     ;;
 esac
@@ -0,0 +1,546 @@
+"""
+Email outbox: request handlers enqueue a compact record and return; a drainer Lambda renders
+and delivers the emails in batches, with retries and idempotency keys.
+
+  login / subscription / fetch-jobs handler --enqueue()--> SQS (EMAIL_OUTBOX_QUEUE_URL)
+  SQS --batch--> email_outbox.lambda_handler --one SmtpSession per batch--> SMTP
+
+A record only carries what the template needs, never rendered HTML or attachments:
+  {"v": 1, "key": "<idempotency key>", "kind": "...", "to": ..., "params": {...}, "attempt": 1}
+
+  email_verification    to: address   params: code, verifyLink
+  password_reset        to: address   params: code, resetLink
+  subscription_receipt  to: address   params: planName, priceInr, invoiceNumber, paymentId,
+                                              isUpgrade, upgradeFromPlan, invoiceS3Key (PDF
+                                              fetched from S3 by the drainer)
+  job_digest            to: [addresses] (EMAIL_OUTBOX_DIGEST_CHUNK per record)
+                                      params: jobs, jobHuntUrl
+
+Idempotency: before sending, the drainer claims the record's key in the delivery log and
+marks it sent afterwards, so a redelivered SQS message or a duplicate enqueue (e.g. a
+retried payment webhook) does not email twice. A claim left by a drainer that died mid-send
+is taken over after EMAIL_OUTBOX_CLAIM_SECONDS.
+
+Retries: a failed delivery is acknowledged and re-enqueued with attempt + 1 and a growing
+SQS delay (30 s, 60 s, ... capped at 15 min); after EMAIL_OUTBOX_MAX_ATTEMPTS it is logged
+and dropped. For digests only the recipients that failed are re-enqueued. Messages the
+drainer cannot take (key claimed by another drainer, delivery log or queue unreachable,
+SMTP not configured) are returned in batchItemFailures, so SQS redelivers them after the
+visibility timeout; give the queue a redrive policy / DLQ for anything that keeps failing.
+
+Without EMAIL_OUTBOX_QUEUE_URL, enqueue() delivers inline (the old synchronous behaviour)
+and raises on failure, so handlers work unchanged until the queue is provisioned.
+
+Env:
+  EMAIL_OUTBOX_QUEUE_URL      — SQS queue (standard); unset = deliver inline
+  EMAIL_OUTBOX_TABLE          — DynamoDB delivery log (partition key idempotencyKey: S;
+                                enable TTL on expiresAt); unset = per-container memory only
+  EMAIL_OUTBOX_MAX_ATTEMPTS   — default 5
+  EMAIL_OUTBOX_CLAIM_SECONDS  — default 300
+  EMAIL_OUTBOX_DEDUP_SECONDS  — how long a sent key is remembered (default 7 days)
+  EMAIL_OUTBOX_DIGEST_CHUNK   — digest recipients per record (default 50)
+  SMTP_* / APP_BASE_URL       — as in email_service
+
+Drainer deployment: handler email_outbox.lambda_handler, package with email_service.py and
+subscription_invoice.py, SQS trigger with "Report batch item failures" enabled (batch size
+10-100; the Lambda timeout must stay below the queue's visibility timeout).
+
+Local runs and tests: MemoryQueue stands in for SQS and drain(queue, connect=...) plays the
+drainer against any SMTP connection factory (see benchmarks/bench_email_outbox.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import smtplib
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import email_service
+from email_service import SmtpConnectError, SmtpSession, addressed, clean_address, render_message
+
+# Optional AWS dependency (local dev may not have boto3 installed).
+try:
+    import boto3  # type: ignore
+except Exception:  # pragma: no cover
+    boto3 = None  # type: ignore
+
+RECORD_VERSION = 1
+KINDS = ("email_verification", "password_reset", "subscription_receipt", "job_digest")
+
+OUTBOX_QUEUE_URL = (os.environ.get("EMAIL_OUTBOX_QUEUE_URL") or "").strip()
+OUTBOX_TABLE = (os.environ.get("EMAIL_OUTBOX_TABLE") or "").strip()
+try:
+    MAX_ATTEMPTS = max(1, int(os.environ.get("EMAIL_OUTBOX_MAX_ATTEMPTS", "5")))
+except ValueError:
+    MAX_ATTEMPTS = 5
+try:
+    CLAIM_SECONDS = max(30, int(os.environ.get("EMAIL_OUTBOX_CLAIM_SECONDS", "300")))
+except ValueError:
+    CLAIM_SECONDS = 300
+try:
+    DEDUP_SECONDS = max(3600, int(os.environ.get("EMAIL_OUTBOX_DEDUP_SECONDS", str(7 * 24 * 3600))))
+except ValueError:
+    DEDUP_SECONDS = 7 * 24 * 3600
+try:
+    DIGEST_CHUNK = max(1, int(os.environ.get("EMAIL_OUTBOX_DIGEST_CHUNK", "50")))
+except ValueError:
+    DIGEST_CHUNK = 50
+
+_RETRY_BASE_SECONDS = 30
+_MAX_SQS_DELAY_SECONDS = 900
+# Only the fields the digest template reads; description one past the 300 it shows, so the "…" still appears
+_DIGEST_JOB_FIELDS = ("job_title", "company", "location", "job_type", "salary", "apply_link", "company_logo")
+_DIGEST_DESCRIPTION_CHARS = 301
+
+
+# ---------- queues ----------
+
+class MemoryQueue:
+    """In-process stand-in for the SQS queue (local runs, tests). Delays are recorded, not waited."""
+
+    def __init__(self) -> None:
+        self._messages: "deque[Tuple[str, str]]" = deque()
+        self._lock = threading.Lock()
+        self.delays: List[int] = []
+
+    def send(self, body: str, delay_seconds: int = 0) -> None:
+        with self._lock:
+            self._messages.append((uuid.uuid4().hex, body))
+            if delay_seconds:
+                self.delays.append(delay_seconds)
+
+    def receive(self, max_messages: int = 10) -> List[Tuple[str, str]]:
+        with self._lock:
+            return [self._messages.popleft() for _ in range(min(max_messages, len(self._messages)))]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+
+class SqsQueue:
+    def __init__(self, queue_url: str, client: Any = None) -> None:
+        self.queue_url = queue_url
+        self._client = client
+
+    def _sqs(self) -> Any:
+        if self._client is None:
+            if boto3 is None:
+                raise RuntimeError("boto3 is not available")
+            region = (os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "ap-south-2").strip()
+            self._client = boto3.client("sqs", region_name=region)
+        return self._client
+
+    def send(self, body: str, delay_seconds: int = 0) -> None:
+        kwargs: Dict[str, Any] = {"QueueUrl": self.queue_url, "MessageBody": body}
+        if delay_seconds:
+            kwargs["DelaySeconds"] = min(int(delay_seconds), _MAX_SQS_DELAY_SECONDS)
+        self._sqs().send_message(**kwargs)
+
+
+_default_queue: Optional[SqsQueue] = None
+
+
+def _get_queue() -> Optional[SqsQueue]:
+    global _default_queue
+    if _default_queue is None and OUTBOX_QUEUE_URL:
+        _default_queue = SqsQueue(OUTBOX_QUEUE_URL)
+    return _default_queue
+
+
+def outbox_enabled() -> bool:
+    """True when emails go through the SQS outbox rather than being sent inline."""
+    return bool(OUTBOX_QUEUE_URL)
+
+
+# ---------- delivery log (idempotency) ----------
+
+class MemoryDeliveryLog:
+    """Idempotency keys seen by this container: key -> ("sending", claimed_at) | ("sent", expires_at)."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.clock = clock
+
+    def claim(self, key: str) -> bool:
+        now = self.clock()
+        with self._lock:
+            state, at = self._entries.get(key, ("", 0.0))
+            if state == "sent" and at > now:
+                return False
+            if state == "sending" and at > now - CLAIM_SECONDS:
+                return False
+            self._entries[key] = ("sending", now)
+            return True
+
+    def is_sent(self, key: str) -> bool:
+        with self._lock:
+            state, at = self._entries.get(key, ("", 0.0))
+        return state == "sent" and at > self.clock()
+
+    def mark_sent(self, key: str) -> None:
+        with self._lock:
+            self._entries[key] = ("sent", self.clock() + DEDUP_SECONDS)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            if self._entries.get(key, ("",))[0] == "sending":
+                del self._entries[key]
+
+
+def _is_condition_failure(exc: Exception) -> bool:
+    response = getattr(exc, "response", None) or {}
+    return response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
+class DynamoDeliveryLog:
+    """Delivery log shared by all drainer containers; the claim is one conditional put."""
+
+    def __init__(self, table: Any, clock: Callable[[], float] = time.time) -> None:
+        self.table = table
+        self.clock = clock
+
+    def claim(self, key: str) -> bool:
+        now = int(self.clock())
+        try:
+            self.table.put_item(
+                Item={"idempotencyKey": key, "state": "sending", "claimedAt": now, "expiresAt": now + DEDUP_SECONDS},
+                ConditionExpression="attribute_not_exists(idempotencyKey) OR (#s = :sending AND claimedAt < :stale)",
+                ExpressionAttributeNames={"#s": "state"},
+                ExpressionAttributeValues={":sending": "sending", ":stale": now - CLAIM_SECONDS},
+            )
+            return True
+        except Exception as exc:
+            if _is_condition_failure(exc):
+                return False
+            raise
+
+    def is_sent(self, key: str) -> bool:
+        item = self.table.get_item(Key={"idempotencyKey": key}, ConsistentRead=True).get("Item")
+        return bool(item) and item.get("state") == "sent"
+
+    def mark_sent(self, key: str) -> None:
+        self.table.update_item(
+            Key={"idempotencyKey": key},
+            UpdateExpression="SET #s = :sent, sentAt = :now",
+            ExpressionAttributeNames={"#s": "state"},
+            ExpressionAttributeValues={":sent": "sent", ":now": int(self.clock())},
+        )
+
+    def release(self, key: str) -> None:
+        try:
+            self.table.delete_item(
+                Key={"idempotencyKey": key},
+                ConditionExpression="#s = :sending",
+                ExpressionAttributeNames={"#s": "state"},
+                ExpressionAttributeValues={":sending": "sending"},
+            )
+        except Exception as exc:
+            if not _is_condition_failure(exc):
+                print(f"email_outbox: could not release {key}: {exc}")
+
+
+_default_log: Any = None
+
+
+def _get_log() -> Any:
+    global _default_log
+    if _default_log is None:
+        if OUTBOX_TABLE and boto3 is not None:
+            region = (os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "ap-south-2").strip()
+            _default_log = DynamoDeliveryLog(boto3.resource("dynamodb", region_name=region).Table(OUTBOX_TABLE))
+        else:
+            _default_log = MemoryDeliveryLog()
+    return _default_log
+
+
+# ---------- records ----------
+
+def idempotency_key(kind: str, *parts: Any) -> str:
+    """Stable key for one logical email, e.g. idempotency_key("subscription_receipt", subscription_id)."""
+    material = json.dumps([kind, *[str(p) for p in parts]], ensure_ascii=False)
+    return f"{kind}:{hashlib.sha256(material.encode('utf-8')).hexdigest()[:32]}"
+
+
+def make_record(kind: str, to: Any, params: Dict[str, Any], key: str, attempt: int = 1) -> Dict[str, Any]:
+    if kind not in KINDS:
+        raise ValueError(f"unknown email kind: {kind}")
+    return {"v": RECORD_VERSION, "key": key, "kind": kind, "to": to, "params": params, "attempt": attempt}
+
+
+def _digest_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    out = {k: job[k] for k in _DIGEST_JOB_FIELDS if job.get(k)}
+    logo = job.get("company_logo") or job.get("company_logo_url")
+    if logo:
+        out["company_logo"] = logo
+    if job.get("description"):
+        out["description"] = str(job["description"])[:_DIGEST_DESCRIPTION_CHARS]
+    return out
+
+
+def _render(record: Dict[str, Any]) -> Tuple[str, str, str]:
+    kind, p = record["kind"], record["params"]
+    if kind == "email_verification":
+        return email_service.render_email_verification(p["code"], p["verifyLink"])
+    if kind == "password_reset":
+        return email_service.render_password_reset(p["code"], p["resetLink"])
+    if kind == "subscription_receipt":
+        return email_service.render_subscription_receipt(
+            plan_name=p["planName"],
+            price_inr=int(p["priceInr"]),
+            invoice_number=p["invoiceNumber"],
+            payment_id=p.get("paymentId"),
+            is_upgrade=bool(p.get("isUpgrade")),
+            upgrade_from_plan=p.get("upgradeFromPlan"),
+        )
+    raise ValueError(f"cannot render kind {kind}")
+
+
+def _attachment(record: Dict[str, Any]) -> Optional[Tuple[bytes, str, str]]:
+    p = record["params"]
+    if record["kind"] != "subscription_receipt" or not p.get("invoiceS3Key"):
+        return None
+    from subscription_invoice import download_invoice_pdf
+
+    return (
+        download_invoice_pdf(p["invoiceS3Key"]),
+        email_service.invoice_attachment_filename(p["invoiceNumber"]),
+        "application/pdf",
+    )
+
+
+def _deliver_one(record: Dict[str, Any], session: SmtpSession) -> None:
+    to = clean_address(record["to"])
+    if to is None:
+        raise ValueError(f"invalid address: {record['to']!r}")
+    payload = render_message(*_render(record), attachment=_attachment(record))
+    session.send(to, addressed(to, payload))
+
+
+# ---------- enqueue ----------
+
+def enqueue(
+    kind: str,
+    to: str,
+    params: Dict[str, Any],
+    *,
+    key: str,
+    queue: Any = None,
+) -> str:
+    """
+    Queue one transactional email and return "queued"; without an outbox queue it is
+    delivered right away and "sent" is returned. Raises if it could be neither queued nor sent.
+    """
+    record = make_record(kind, to, params, key)
+    queue = queue if queue is not None else _get_queue()
+    if queue is None:
+        if not email_service.is_smtp_configured():
+            raise RuntimeError("SMTP is not configured (set SMTP_USER and SMTP_APP_PASSWORD)")
+        with SmtpSession() as session:
+            _deliver_one(record, session)
+        return "sent"
+    queue.send(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    return "queued"
+
+
+def enqueue_job_digest(
+    recipients: Iterable[str],
+    jobs: List[Dict[str, Any]],
+    job_hunt_url: Optional[str] = None,
+    *,
+    key: Optional[str] = None,
+    queue: Any = None,
+) -> int:
+    """
+    Queue a job digest for many subscribers as records of EMAIL_OUTBOX_DIGEST_CHUNK recipients
+    each; returns the number of records. `key` defaults to one derived from the jobs, so
+    re-running the fetch with the same new jobs does not send the digest twice.
+    """
+    queue = queue if queue is not None else _get_queue()
+    if queue is None:
+        raise RuntimeError("EMAIL_OUTBOX_QUEUE_URL is not configured")
+    recipients = list(dict.fromkeys(r for r in recipients if isinstance(r, str) and r))
+    if not recipients or not jobs:
+        return 0
+    digest_jobs = [_digest_job(job) for job in jobs]
+    base = key or idempotency_key("job_digest", *sorted(j.get("apply_link") or j.get("job_title") or "" for j in jobs))
+    params = {"jobs": digest_jobs, "jobHuntUrl": job_hunt_url}
+    chunks = [recipients[i:i + DIGEST_CHUNK] for i in range(0, len(recipients), DIGEST_CHUNK)]
+    for index, chunk in enumerate(chunks):
+        record = make_record("job_digest", chunk, params, f"{base}/{index}")
+        queue.send(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    return len(chunks)
+
+
+# ---------- drainer ----------
+
+@dataclass
+class DrainResult:
+    sent: int = 0
+    duplicates: int = 0                                         # keys already delivered
+    retried: int = 0                                            # records re-enqueued for later
+    dropped: List[Tuple[str, str]] = field(default_factory=list)  # (key, error): out of attempts / unreadable
+    failed_ids: List[str] = field(default_factory=list)           # messages handed back to the queue
+
+
+def _retry_delay(attempt: int) -> int:
+    return min(_RETRY_BASE_SECONDS * 2 ** (attempt - 1), _MAX_SQS_DELAY_SECONDS)
+
+
+def _retry_or_drop(record: Dict[str, Any], to: Any, error: str, queue: Any, result: DrainResult, key: str) -> None:
+    attempt = int(record.get("attempt") or 1)
+    if attempt >= MAX_ATTEMPTS:
+        print(f"email_outbox: giving up on {key} ({record['kind']}) after {attempt} attempts: {error}")
+        result.dropped.append((key, error))
+        return
+    retry = dict(record, to=to, key=key, attempt=attempt + 1)
+    queue.send(json.dumps(retry, ensure_ascii=False, separators=(",", ":")), delay_seconds=_retry_delay(attempt))
+    result.retried += 1
+
+
+def _process_digest(record: Dict[str, Any], queue: Any, result: DrainResult, session: SmtpSession) -> None:
+    """Send one digest chunk over the batch's session: rendered and serialized once, To header per recipient."""
+    p = record["params"]
+    payload = email_service._bulk_message(
+        *email_service.render_job_digest(p["jobs"], p.get("jobHuntUrl")), email_service._from_header()
+    )
+    recipients = list(record["to"])
+    failed: List[Tuple[str, str]] = []
+    for index, rcpt in enumerate(recipients):
+        addr = clean_address(rcpt)
+        if addr is None:
+            failed.append((str(rcpt), "invalid address"))
+            continue
+        try:
+            session.send(addr, addressed(addr, payload))
+        except UnicodeEncodeError:
+            failed.append((addr, "non-ASCII address"))
+            continue
+        except SmtpConnectError as exc:
+            # no connection for anyone left in the chunk: retry them all later
+            failed.extend((str(r), str(exc)) for r in recipients[index:])
+            break
+        except (smtplib.SMTPException, OSError) as exc:
+            failed.append((addr, str(exc)))
+            continue
+        result.sent += 1
+    retryable = [addr for addr, err in failed if err not in ("invalid address", "non-ASCII address")]
+    if retryable:
+        # a new key: the failed recipients are a different delivery from the chunk that was just marked sent
+        errors = "; ".join(sorted({err for _, err in failed}))[:500]
+        retry_key = f"{record['key']}/a{int(record.get('attempt') or 1) + 1}"
+        try:
+            _retry_or_drop(record, retryable, errors, queue, result, retry_key)
+        except Exception as exc:
+            # raising would re-enqueue the whole chunk and repeat the digest for everyone already sent
+            print(f"email_outbox: could not re-enqueue {len(retryable)} digest recipients of {record['key']}: {exc}")
+            result.dropped.append((retry_key, f"re-enqueue failed: {exc}"))
+
+
+def process_messages(
+    messages: List[Tuple[str, str]],
+    queue: Any,
+    *,
+    connect: Optional[Callable[[], smtplib.SMTP]] = None,
+    log: Any = None,
+) -> DrainResult:
+    """Deliver a batch of (message_id, body) records; one SMTP session serves the whole batch."""
+    result = DrainResult()
+    if connect is None and not email_service.is_smtp_configured():
+        print("email_outbox: SMTP is not configured; leaving the batch on the queue")
+        result.failed_ids = [message_id for message_id, _ in messages]
+        return result
+    log = log if log is not None else _get_log()
+
+    with SmtpSession(connect) as session:
+        for message_id, body in messages:
+            try:
+                record = json.loads(body)
+                key, kind = record["key"], record["kind"]
+                if kind not in KINDS:
+                    raise ValueError(f"unknown email kind: {kind}")
+            except (ValueError, KeyError, TypeError) as exc:
+                print(f"email_outbox: dropping unreadable message {message_id}: {exc}")
+                result.dropped.append((message_id, str(exc)))
+                continue
+
+            try:
+                if not log.claim(key):
+                    if log.is_sent(key):
+                        result.duplicates += 1
+                    else:
+                        result.failed_ids.append(message_id)  # another drainer is on it; look again later
+                    continue
+            except Exception as exc:
+                print(f"email_outbox: delivery log unavailable for {key}: {exc}")
+                result.failed_ids.append(message_id)
+                continue
+
+            try:
+                if kind == "job_digest":
+                    _process_digest(record, queue, result, session)
+                else:
+                    _deliver_one(record, session)
+                    result.sent += 1
+            except Exception as exc:
+                log.release(key)
+                try:
+                    _retry_or_drop(record, record["to"], str(exc), queue, result, key)
+                except Exception as queue_exc:
+                    print(f"email_outbox: could not re-enqueue {key}: {queue_exc}")
+                    result.failed_ids.append(message_id)
+                continue
+
+            try:
+                log.mark_sent(key)
+            except Exception as exc:
+                # already delivered: a redelivery may repeat it, but retrying now certainly would
+                print(f"email_outbox: could not mark {key} sent: {exc}")
+    return result
+
+
+def drain(
+    queue: MemoryQueue,
+    *,
+    connect: Optional[Callable[[], smtplib.SMTP]] = None,
+    log: Any = None,
+    batch_size: int = 10,
+) -> DrainResult:
+    """Local drainer: process `queue` until it is empty or a batch makes no progress."""
+    log = log if log is not None else MemoryDeliveryLog()
+    total = DrainResult()
+    while len(queue):
+        messages = queue.receive(batch_size)
+        bodies = dict(messages)
+        result = process_messages(messages, queue, connect=connect, log=log)
+        total.sent += result.sent
+        total.duplicates += result.duplicates
+        total.retried += result.retried
+        total.dropped += result.dropped
+        total.failed_ids += result.failed_ids
+        for message_id in result.failed_ids:
+            queue.send(bodies[message_id])
+        if len(result.failed_ids) == len(messages):
+            break
+    return total
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """SQS trigger (ReportBatchItemFailures)."""
+    messages = [(r["messageId"], r.get("body") or "") for r in (event.get("Records") or [])]
+    queue = _get_queue()
+    if queue is None:
+        raise RuntimeError("EMAIL_OUTBOX_QUEUE_URL is not configured (retries are re-enqueued there)")
+    result = process_messages(messages, queue)
+    print(
+        f"email_outbox: batch={len(messages)} sent={result.sent} duplicates={result.duplicates} "
+        f"retried={result.retried} dropped={len(result.dropped)} returned={len(result.failed_ids)}"
+    )
+    return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in result.failed_ids]}
@@ -11,18 +11,41 @@ Lambda environment:
   ALLOWED_ORIGIN     — CORS fallback origin (default https://codexcareer.com)
   APP_BASE_URL       — public site URL for logo + email links (default ALLOWED_ORIGIN)
   JOB_HUNT_URL       — browse CTA link (default {APP_BASE_URL}/dashboard)
+  SMTP_BULK_CONNECTIONS        — bulk sends: authenticated connections in parallel (default 4)
+  SMTP_MESSAGES_PER_CONNECTION — bulk sends: messages before a connection is recycled (default 100)
+
+Bulk sends (job digests to every subscriber) go through send_bulk_email: the MIME body is
+rendered once and only the To header changes per recipient, and each worker keeps one
+logged-in connection for many messages instead of paying connect + STARTTLS + login per
+email. Benchmark against a local SMTP sink: python benchmarks/bench_bulk_email.py
+
+Each email type also has a render_* function returning (subject, text, html), so the
+email_outbox drainer can build the same messages from a queued record; render_message,
+addressed and SmtpSession are the pieces send_bulk_email and the drainer share.
+
+Templates: the branded shell is compiled once per container into static segments and a few
+slots, job cards are memoized per job, and a bulk MIME body is serialized once and reused by
+every send of the same content (outbox digest chunks). Benchmark for a 10k-recipient digest:
+python benchmarks/bench_email_templates.py
 """
 
 from __future__ import annotations
 
 import html
 import os
+import queue
 import smtplib
+import socket
 import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 SMTP_HOST = os.environ.get("SMTP_HOST", "smtp.gmail.com").strip()
 SMTP_PORT = int(os.environ.get("SMTP_PORT", "587"))
@@ -34,6 +57,17 @@ ALLOWED_ORIGIN = os.environ.get("ALLOWED_ORIGIN", "https://codexcareer.com").str
 SITE_URL = os.environ.get("APP_BASE_URL", ALLOWED_ORIGIN).rstrip("/")
 JOB_HUNT_URL = os.environ.get("JOB_HUNT_URL", f"{SITE_URL}/dashboard").rstrip("/")
 SETTINGS_URL = f"{SITE_URL}/dashboard"
+try:
+    SMTP_BULK_CONNECTIONS = max(1, int(os.environ.get("SMTP_BULK_CONNECTIONS", "4")))
+except ValueError:
+    SMTP_BULK_CONNECTIONS = 4
+try:
+    SMTP_MESSAGES_PER_CONNECTION = max(1, int(os.environ.get("SMTP_MESSAGES_PER_CONNECTION", "100")))
+except ValueError:
+    SMTP_MESSAGES_PER_CONNECTION = 100
+
+# Rendered job cards kept per container (see _build_job_card_html)
+_JOB_CARD_CACHE_SIZE = 1024
 
 BRAND_NAME = "CodeXCareer"
 BRAND_TAGLINE = "CODE • LEARN • LAUNCH"
@@ -69,31 +103,36 @@ def _pill_button(href: str, label: str) -> str:
     return f'<a href="{_escape_html(href)}" style="{_PILL_BUTTON_STYLE}">{_escape_html(label)}</a>'
 
 
-def _build_branded_shell(
-    *,
-    page_title: str,
-    hero_title: str,
-    hero_subtitle: str,
-    body_html: str,
-    footer_note_html: Optional[str] = None,
-) -> str:
-    year = datetime.utcnow().year
-    footer_note_section = ""
-    if footer_note_html:
-        footer_note_section = f"""
-                <tr>
-                  <td style="padding:0 32px 28px 32px;">
-                    {footer_note_html}
-                  </td>
-                </tr>
-        """
+_SLOT_MARK = "\x00"
+
+
+class _CompiledTemplate:
+    """HTML split once at its _slot() markers; render() only joins the static pieces and values."""
+
+    def __init__(self, source: str) -> None:
+        parts = source.split(_SLOT_MARK)
+        self._static = parts[0::2]
+        self._slots = parts[1::2]
 
-    return f"""<!DOCTYPE html>
+    def render(self, **values: str) -> str:
+        out = [self._static[0]]
+        for slot, static in zip(self._slots, self._static[1:]):
+            out.append(values[slot])
+            out.append(static)
+        return "".join(out)
+
+
+def _slot(name: str) -> str:
+    return f"{_SLOT_MARK}{name}{_SLOT_MARK}"
+
+
+# Compiled once per container: only the titles, body, footer note and year vary per email
+_BRANDED_SHELL = _CompiledTemplate(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-  <title>{_escape_html(page_title)}</title>
+  <title>{_slot("page_title")}</title>
 </head>
 <body style="margin:0;padding:0;background:#f7f8fb;font-family:Arial,Helvetica,sans-serif;color:#1f2937;">
   <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background:linear-gradient(180deg,#fff7f0 0%,#f7f8fb 100%);padding:32px 12px;">
@@ -113,16 +152,16 @@ def _build_branded_shell(
               <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
                 <tr>
                   <td style="background:linear-gradient(90deg,#ff7a1a 0%,{BRAND_ORANGE} 100%);padding:28px 32px;text-align:center;">
-                    <h1 style="margin:0;font-size:28px;line-height:1.2;color:#ffffff;font-weight:700;">{_escape_html(hero_title)}</h1>
-                    <p style="margin:10px 0 0 0;font-size:15px;line-height:1.5;color:#fff4eb;">{_escape_html(hero_subtitle)}</p>
+                    <h1 style="margin:0;font-size:28px;line-height:1.2;color:#ffffff;font-weight:700;">{_slot("hero_title")}</h1>
+                    <p style="margin:10px 0 0 0;font-size:15px;line-height:1.5;color:#fff4eb;">{_slot("hero_subtitle")}</p>
                   </td>
                 </tr>
                 <tr>
                   <td style="padding:32px 32px 12px 32px;">
-                    {body_html}
+                    {_slot("body_html")}
                   </td>
                 </tr>
-                {footer_note_section}
+                {_slot("footer_note_section")}
                 <tr>
                   <td style="background:#fff7f0;border-top:1px solid #ffe4cc;padding:20px 32px;text-align:center;">
                     <p style="margin:0;font-size:12px;line-height:1.6;color:#6b7280;">This is an automated message. Please do not reply.</p>
@@ -136,7 +175,7 @@ def _build_branded_shell(
           </tr>
           <tr>
             <td align="center" style="padding:20px 12px 8px 12px;">
-              <p style="margin:0;font-size:11px;line-height:1.6;color:#9ca3af;">© {year} {BRAND_NAME}. All rights reserved.</p>
+              <p style="margin:0;font-size:11px;line-height:1.6;color:#9ca3af;">© {_slot("year")} {BRAND_NAME}. All rights reserved.</p>
               <p style="margin:6px 0 0 0;font-size:11px;line-height:1.6;color:#9ca3af;">
                 <a href="{SITE_URL}" style="color:#9ca3af;text-decoration:none;">{SITE_URL.replace('https://', '')}</a>
               </p>
@@ -147,7 +186,35 @@ def _build_branded_shell(
     </tr>
   </table>
 </body>
-</html>"""
+</html>""")
+
+
+def _build_branded_shell(
+    *,
+    page_title: str,
+    hero_title: str,
+    hero_subtitle: str,
+    body_html: str,
+    footer_note_html: Optional[str] = None,
+) -> str:
+    footer_note_section = ""
+    if footer_note_html:
+        footer_note_section = f"""
+                <tr>
+                  <td style="padding:0 32px 28px 32px;">
+                    {footer_note_html}
+                  </td>
+                </tr>
+        """
+
+    return _BRANDED_SHELL.render(
+        page_title=_escape_html(page_title),
+        hero_title=_escape_html(hero_title),
+        hero_subtitle=_escape_html(hero_subtitle),
+        body_html=body_html,
+        footer_note_section=footer_note_section,
+        year=str(datetime.utcnow().year),
+    )
 
 
 def _peach_callout(title: str, message: str) -> str:
@@ -211,6 +278,26 @@ def _build_verification_email_html(code: str, verify_link: str) -> str:
     )
 
 
+def open_smtp_connection(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    context: Optional[ssl.SSLContext] = None,
+) -> smtplib.SMTP:
+    """Connected, STARTTLS-upgraded and logged-in SMTP session (caller closes it)."""
+    server = smtplib.SMTP(host or SMTP_HOST, port or SMTP_PORT, timeout=30)
+    try:
+        # The message body's last partial segment otherwise waits for the server's delayed ACK
+        server.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        server.ehlo()
+        server.starttls(context=context or ssl.create_default_context())
+        server.ehlo()
+        server.login(SMTP_USER, SMTP_APP_PASSWORD)
+    except BaseException:
+        server.close()
+        raise
+    return server
+
+
 def send_email(
     to_email: str,
     subject: str,
@@ -231,20 +318,227 @@ def send_email(
     if html_body:
         msg.attach(MIMEText(html_body, "html", "utf-8"))
 
-    context = ssl.create_default_context()
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30) as server:
-        server.ehlo()
-        server.starttls(context=context)
-        server.ehlo()
-        server.login(SMTP_USER, SMTP_APP_PASSWORD)
+    with open_smtp_connection() as server:
         server.sendmail(SMTP_FROM_EMAIL or SMTP_USER, [to_email], msg.as_string())
 
 
-def send_email_verification(
-    to_email: str,
-    code: str,
-    verify_link: str,
-) -> None:
+@dataclass
+class BulkSendResult:
+    sent: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)  # (recipient, error)
+    connections: int = 0
+    seconds: float = 0.0
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.sent / self.seconds if self.seconds > 0 else 0.0
+
+
+def _permanent_smtp_error(exc: BaseException) -> bool:
+    """Refused recipient or 5xx reply: a new connection would not help."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(exc, smtplib.SMTPResponseException) and exc.smtp_code >= 500
+
+
+def _quit_quietly(server: Optional[smtplib.SMTP]) -> None:
+    if server is None:
+        return
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def render_message(
+    subject: str,
+    text_body: str,
+    html_body: Optional[str] = None,
+    attachment: Optional[Tuple[bytes, str, str]] = None,
+) -> bytes:
+    """
+    MIME message without a To header, serialized with CRLF line endings so it can go to
+    sendmail() as is; add the recipient with addressed(). `attachment` is
+    (bytes, filename, mime type).
+    """
+    alt = MIMEMultipart("alternative")
+    alt.attach(MIMEText(text_body, "plain", "utf-8"))
+    if html_body:
+        alt.attach(MIMEText(html_body, "html", "utf-8"))
+    if attachment:
+        from email.mime.application import MIMEApplication
+
+        data, filename, mime = attachment
+        msg = MIMEMultipart("mixed")
+        msg.attach(alt)
+        part = MIMEApplication(data, _subtype=mime.split("/")[-1])
+        part.add_header("Content-Disposition", "attachment", filename=filename)
+        msg.attach(part)
+    else:
+        msg = alt
+    msg["Subject"] = subject
+    msg["From"] = _from_header()
+    return msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+
+
+@lru_cache(maxsize=8)
+def _bulk_message(subject: str, text_body: str, html_body: Optional[str], from_header: str) -> bytes:
+    """render_message for content sent to many recipients: outbox digest chunks serialize it once."""
+    return render_message(subject, text_body, html_body)
+
+
+def clean_address(value: Any) -> Optional[str]:
+    """Stripped address, or None when it cannot safely go into a To header."""
+    addr = value.strip() if isinstance(value, str) else ""
+    if not addr or "@" not in addr or any(c in addr for c in "\r\n<>,"):
+        return None
+    return addr
+
+
+def addressed(to_email: str, rendered: bytes) -> bytes:
+    """render_message() output with its To header (raises UnicodeEncodeError for non-ASCII)."""
+    return b"To: " + to_email.encode("ascii") + b"\r\n" + rendered
+
+
+class SmtpConnectError(Exception):
+    """SmtpSession could not open or log in to a connection."""
+
+
+class SmtpSession:
+    """
+    One logged-in SMTP connection reused for many messages. It is opened on first use,
+    recycled after `messages_per_connection` messages, and reopened once when a send hits a
+    dropped connection or a temporary (4xx) error. Not thread-safe: one per worker.
+    """
+
+    def __init__(
+        self,
+        connect: Optional[Callable[[], smtplib.SMTP]] = None,
+        messages_per_connection: Optional[int] = None,
+    ) -> None:
+        self._connect = connect or open_smtp_connection
+        self._per_connection = messages_per_connection or SMTP_MESSAGES_PER_CONNECTION
+        self._server: Optional[smtplib.SMTP] = None
+        self._on_connection = 0
+        self.connections = 0
+
+    def send(self, to_email: str, payload: bytes) -> None:
+        """Send `payload` (see addressed()) to one recipient; SMTP errors propagate."""
+        for attempt in (1, 2):
+            if self._server is None or self._on_connection >= self._per_connection:
+                self.close()
+                try:
+                    self._server = self._connect()
+                except (smtplib.SMTPException, OSError) as exc:
+                    raise SmtpConnectError(str(exc)) from exc
+                self.connections += 1
+            try:
+                self._server.sendmail(SMTP_FROM_EMAIL or SMTP_USER, [to_email], payload)
+                self._on_connection += 1
+                return
+            except (smtplib.SMTPException, OSError) as exc:
+                if _permanent_smtp_error(exc) or attempt == 2:
+                    raise
+                self.close()
+
+    def close(self) -> None:
+        _quit_quietly(self._server)
+        self._server, self._on_connection = None, 0
+
+    def __enter__(self) -> "SmtpSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def send_bulk_email(
+    recipients: Iterable[str],
+    subject: str,
+    text_body: str,
+    html_body: Optional[str] = None,
+    *,
+    connections: Optional[int] = None,
+    messages_per_connection: Optional[int] = None,
+    connect: Optional[Callable[[], smtplib.SMTP]] = None,
+) -> BulkSendResult:
+    """
+    Send one message to many recipients, one SMTP transaction each (recipients do not see each
+    other). The MIME body is serialized once; each recipient gets it with its own To header.
+    Up to `connections` workers (SMTP_BULK_CONNECTIONS) each keep one logged-in connection and
+    recycle it after `messages_per_connection` messages. A dropped connection or a temporary
+    (4xx) error is retried once on a new connection; a recipient the server refuses is recorded
+    in result.failed. A worker that cannot log in stops, and recipients nobody could send to
+    are reported as failed.
+    """
+    if connect is None and not is_smtp_configured():
+        raise RuntimeError(
+            "SMTP is not configured (set SMTP_USER and SMTP_APP_PASSWORD)"
+        )
+    workers = connections or SMTP_BULK_CONNECTIONS
+    rendered = _bulk_message(subject, text_body, html_body, _from_header())
+
+    todo: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+    seen = set()
+    result = BulkSendResult()
+    for rcpt in recipients:
+        addr = clean_address(rcpt)
+        if addr is None:
+            result.failed.append((str(rcpt), "invalid address"))
+        elif addr.lower() not in seen:
+            seen.add(addr.lower())
+            todo.put(addr)
+    lock = threading.Lock()
+
+    def worker() -> None:
+        session = SmtpSession(connect, messages_per_connection)
+        try:
+            while True:
+                try:
+                    addr = todo.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    session.send(addr, addressed(addr, rendered))
+                except UnicodeEncodeError:
+                    with lock:
+                        result.failed.append((addr, "non-ASCII address"))
+                except SmtpConnectError as exc:
+                    # could not (re)connect / log in: give the recipient back, stop this worker
+                    todo.put(addr)
+                    print(f"send_bulk_email: connection failed: {exc}")
+                    return
+                except (smtplib.SMTPException, OSError) as exc:
+                    with lock:
+                        result.failed.append((addr, str(exc)))
+                else:
+                    with lock:
+                        result.sent += 1
+        finally:
+            session.close()
+            with lock:
+                result.connections += session.connections
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in range(workers):
+            pool.submit(worker)
+    while True:
+        try:
+            addr = todo.get_nowait()
+        except queue.Empty:
+            break
+        result.failed.append((addr, "no SMTP connection available"))
+    result.seconds = time.perf_counter() - start
+    print(
+        f"send_bulk_email: sent={result.sent} failed={len(result.failed)} connections={result.connections} "
+        f"in {result.seconds:.1f}s ({result.messages_per_second:.1f} msg/s)"
+    )
+    return result
+
+
+def render_email_verification(code: str, verify_link: str) -> Tuple[str, str, str]:
+    """(subject, text_body, html_body) for the sign-up verification email."""
     subject = f"Verify your email — {BRAND_NAME}"
     text_body = (
         f"Verify your email for {BRAND_NAME}\n\n"
@@ -255,8 +549,15 @@ def send_email_verification(
         f"Need help? {SUPPORT_EMAIL}\n"
         f"{BRAND_TAGLINE}\n"
     )
-    html_body = _build_verification_email_html(code, verify_link)
-    send_email(to_email, subject, text_body, html_body)
+    return subject, text_body, _build_verification_email_html(code, verify_link)
+
+
+def send_email_verification(
+    to_email: str,
+    code: str,
+    verify_link: str,
+) -> None:
+    send_email(to_email, *render_email_verification(code, verify_link))
 
 
 def _build_password_reset_email_html(code: str, reset_link: str) -> str:
@@ -289,11 +590,8 @@ def _build_password_reset_email_html(code: str, reset_link: str) -> str:
     )
 
 
-def send_password_reset(
-    to_email: str,
-    code: str,
-    reset_link: str,
-) -> None:
+def render_password_reset(code: str, reset_link: str) -> Tuple[str, str, str]:
+    """(subject, text_body, html_body) for the password reset email."""
     subject = f"Reset your password — {BRAND_NAME}"
     text_body = (
         f"Reset your {BRAND_NAME} password\n\n"
@@ -304,19 +602,47 @@ def send_password_reset(
         f"Need help? {SUPPORT_EMAIL}\n"
         f"{BRAND_TAGLINE}\n"
     )
-    html_body = _build_password_reset_email_html(code, reset_link)
-    send_email(to_email, subject, text_body, html_body)
+    return subject, text_body, _build_password_reset_email_html(code, reset_link)
+
+
+def send_password_reset(
+    to_email: str,
+    code: str,
+    reset_link: str,
+) -> None:
+    send_email(to_email, *render_password_reset(code, reset_link))
 
 
 def _build_job_card_html(job: Dict[str, Any]) -> str:
-    title = job.get("job_title") or "New Job"
-    company = job.get("company") or "Unknown Company"
-    location = job.get("location") or ""
-    salary = job.get("salary") or ""
-    job_type = job.get("job_type") or ""
-    description = (job.get("description") or "")[:300]
-    apply_link = job.get("apply_link") or JOB_HUNT_URL
-    logo = job.get("company_logo") or job.get("company_logo_url") or ""
+    """
+    Cards are memoized per job on the fields they read (description up to the 300 shown plus
+    one, to know whether to add "…"), so every digest and outbox chunk that lists the job
+    reuses one render, and an edited job renders afresh.
+    """
+    return _job_card_html(
+        str(job.get("job_title") or "New Job"),
+        str(job.get("company") or "Unknown Company"),
+        str(job.get("location") or ""),
+        str(job.get("salary") or ""),
+        str(job.get("job_type") or ""),
+        str(job.get("description") or "")[:301],
+        str(job.get("apply_link") or JOB_HUNT_URL),
+        str(job.get("company_logo") or job.get("company_logo_url") or ""),
+    )
+
+
+@lru_cache(maxsize=_JOB_CARD_CACHE_SIZE)
+def _job_card_html(
+    title: str,
+    company: str,
+    location: str,
+    salary: str,
+    job_type: str,
+    full_description: str,
+    apply_link: str,
+    logo: str,
+) -> str:
+    description = full_description[:300]
 
     meta_parts = [p for p in [location, job_type, salary] if p]
     meta_html = " &nbsp;|&nbsp; ".join(_escape_html(p) for p in meta_parts)
@@ -332,7 +658,7 @@ def _build_job_card_html(job: Dict[str, Any]) -> str:
 
     description_html = ""
     if description:
-        truncated = len(job.get("description") or "") > 300
+        truncated = len(full_description) > 300
         description_html = f"""
         <p style="margin:0 0 16px;font-size:14px;line-height:1.6;color:#4b5563;">
           {_escape_html(description)}{"…" if truncated else ""}
@@ -385,7 +711,18 @@ def _build_job_digest_email_html(
     </div>
     """
 
-    footer_note = _peach_callout(
+    return _build_branded_shell(
+        page_title=f"New jobs on {BRAND_NAME} Job Hunt",
+        hero_title="New Jobs on Job Hunt",
+        hero_subtitle=f"Fresh listings scraped for your {BRAND_NAME} dashboard",
+        body_html=body_html,
+        footer_note_html=_job_digest_footer_note(),
+    )
+
+
+@lru_cache(maxsize=None)
+def _job_digest_footer_note() -> str:
+    return _peach_callout(
         "Manage email notifications",
         (
             f'You received this because you enabled job email notifications on {BRAND_NAME}. '
@@ -394,14 +731,6 @@ def _build_job_digest_email_html(
         ),
     )
 
-    return _build_branded_shell(
-        page_title=f"New jobs on {BRAND_NAME} Job Hunt",
-        hero_title="New Jobs on Job Hunt",
-        hero_subtitle=f"Fresh listings scraped for your {BRAND_NAME} dashboard",
-        body_html=body_html,
-        footer_note_html=footer_note,
-    )
-
 
 def _build_job_digest_text(
     jobs: List[Dict[str, Any]],
@@ -437,6 +766,17 @@ def _build_job_digest_text(
     return "\n".join(lines)
 
 
+def render_job_digest(
+    jobs: List[Dict[str, Any]],
+    job_hunt_url: Optional[str] = None,
+) -> Tuple[str, str, str]:
+    """(subject, text_body, html_body) for a job digest; the same for every subscriber."""
+    count = len(jobs)
+    job_word = "job" if count == 1 else "jobs"
+    subject = f"{count} new {job_word} on {BRAND_NAME} Job Hunt"
+    return subject, _build_job_digest_text(jobs, job_hunt_url), _build_job_digest_email_html(jobs, job_hunt_url)
+
+
 def send_job_digest_email(
     to_email: str,
     jobs: List[Dict[str, Any]],
@@ -446,19 +786,29 @@ def send_job_digest_email(
     if not jobs or not is_smtp_configured():
         return False
 
-    count = len(jobs)
-    job_word = "job" if count == 1 else "jobs"
-    subject = f"{count} new {job_word} on {BRAND_NAME} Job Hunt"
-    text_body = _build_job_digest_text(jobs, job_hunt_url)
-    html_body = _build_job_digest_email_html(jobs, job_hunt_url)
-
     try:
-        send_email(to_email, subject, text_body, html_body)
+        send_email(to_email, *render_job_digest(jobs, job_hunt_url))
         return True
     except Exception:
         return False
 
 
+def send_job_digest_bulk(
+    recipients: Iterable[str],
+    jobs: List[Dict[str, Any]],
+    job_hunt_url: Optional[str] = None,
+    **bulk_options: Any,
+) -> BulkSendResult:
+    """send_job_digest_email for many subscribers: the digest is rendered once (see send_bulk_email)."""
+    recipients = list(recipients)
+    if not jobs or not is_smtp_configured():
+        result = BulkSendResult()
+        result.failed = [(r, "SMTP is not configured or digest is empty") for r in recipients]
+        return result
+
+    return send_bulk_email(recipients, *render_job_digest(jobs, job_hunt_url), **bulk_options)
+
+
 def send_email_with_attachment(
     to_email: str,
     subject: str,
@@ -492,12 +842,7 @@ def send_email_with_attachment(
     part.add_header("Content-Disposition", "attachment", filename=attachment_filename)
     msg.attach(part)
 
-    context = ssl.create_default_context()
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30) as server:
-        server.ehlo()
-        server.starttls(context=context)
-        server.ehlo()
-        server.login(SMTP_USER, SMTP_APP_PASSWORD)
+    with open_smtp_connection() as server:
         server.sendmail(SMTP_FROM_EMAIL or SMTP_USER, [to_email], msg.as_string())
 
 
@@ -567,21 +912,16 @@ def _build_subscription_receipt_email_html(
     )
 
 
-def send_subscription_receipt_email(
-    to_email: str,
+def render_subscription_receipt(
     *,
     plan_name: str,
     price_inr: int,
     invoice_number: str,
     payment_id: Optional[str],
-    pdf_bytes: Optional[bytes],
     is_upgrade: bool = False,
     upgrade_from_plan: Optional[str] = None,
-) -> bool:
-    """Send thank-you email with optional invoice PDF attachment."""
-    if not is_smtp_configured():
-        return False
-
+) -> Tuple[str, str, str]:
+    """(subject, text_body, html_body) for the subscription thank-you / receipt email."""
     subject = (
         f"Thank you for upgrading to {plan_name} — {BRAND_NAME}"
         if is_upgrade
@@ -604,6 +944,36 @@ def send_subscription_receipt_email(
         is_upgrade=is_upgrade,
         upgrade_from_plan=upgrade_from_plan,
     )
+    return subject, text_body, html_body
+
+
+def invoice_attachment_filename(invoice_number: str) -> str:
+    return f"CodeXCareer-Invoice-{invoice_number}.pdf"
+
+
+def send_subscription_receipt_email(
+    to_email: str,
+    *,
+    plan_name: str,
+    price_inr: int,
+    invoice_number: str,
+    payment_id: Optional[str],
+    pdf_bytes: Optional[bytes],
+    is_upgrade: bool = False,
+    upgrade_from_plan: Optional[str] = None,
+) -> bool:
+    """Send thank-you email with optional invoice PDF attachment."""
+    if not is_smtp_configured():
+        return False
+
+    subject, text_body, html_body = render_subscription_receipt(
+        plan_name=plan_name,
+        price_inr=price_inr,
+        invoice_number=invoice_number,
+        payment_id=payment_id,
+        is_upgrade=is_upgrade,
+        upgrade_from_plan=upgrade_from_plan,
+    )
 
     try:
         if pdf_bytes:
@@ -613,7 +983,7 @@ def send_subscription_receipt_email(
                 text_body,
                 html_body,
                 pdf_bytes,
-                f"CodeXCareer-Invoice-{invoice_number}.pdf",
+                invoice_attachment_filename(invoice_number),
             )
         else:
             send_email(to_email, subject, text_body, html_body)
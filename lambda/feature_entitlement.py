@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 
 REGION = os.environ.get("REGION", "ap-south-2")
@@ -41,6 +42,7 @@ TRIAL_GATED_FEATURES: Set[str] = {
 _dynamodb = boto3.resource("dynamodb", region_name=REGION)
 _users_table = _dynamodb.Table(USERS_TABLE)
 _subscriptions_table = _dynamodb.Table(SUBSCRIPTIONS_TABLE)
+_deserializer = TypeDeserializer()
 
 
 def _now_iso() -> str:
@@ -115,25 +117,22 @@ def get_trial_limit(
     return FREE_USE_LIMIT
 
 
+def _usage_from_item(item: Dict[str, Any]) -> Dict[str, int]:
+    raw = (item or {}).get("featureUsage") or {}
+    return {k: _int_val(v) for k, v in raw.items()}
+
+
 def get_user_feature_usage(user_id: str) -> Dict[str, int]:
     try:
         resp = _users_table.get_item(Key={"userId": user_id})
     except ClientError as e:
         print(f"get_item Users for featureUsage failed: {e}")
         raise
-    item = resp.get("Item") or {}
-    raw = item.get("featureUsage") or {}
-    return {k: _int_val(v) for k, v in raw.items()}
+    return _usage_from_item(resp.get("Item") or {})
 
 
-def resolve_entitlement(
-    user_id: str,
-    feature_id: str,
-    *,
-    plan_features: Optional[List[str]] = None,
-    usage_map: Optional[Dict[str, int]] = None,
-) -> Dict[str, Any]:
-    feature_id = (feature_id or "").strip()
+def _static_entitlement(feature_id: str) -> Optional[Dict[str, Any]]:
+    """Entitlement for features that never depend on plan or usage."""
     if feature_id in ALWAYS_FREE_FEATURES:
         return {
             "featureId": feature_id,
@@ -152,15 +151,19 @@ def resolve_entitlement(
             "allowed": False,
             "source": "exhausted",
         }
+    return None
 
-    plan_item = get_active_subscription_item(user_id)
-    if plan_features is None:
-        plan_features = list((plan_item or {}).get("enabledFeatures") or [])
-    if usage_map is None:
-        usage_map = get_user_feature_usage(user_id)
 
+def _compute_entitlement(
+    user_id: str,
+    feature_id: str,
+    plan_item: Optional[Dict[str, Any]],
+    plan_features: List[str],
+    usage_map: Dict[str, int],
+) -> Dict[str, Any]:
+    # {} rather than None: "no active plan" is already known, don't re-query
     trial_limit = get_trial_limit(
-        user_id, feature_id, plan_item=plan_item, plan_features=plan_features
+        user_id, feature_id, plan_item=plan_item or {}, plan_features=plan_features
     )
 
     if feature_id in plan_features:
@@ -195,19 +198,100 @@ def resolve_entitlement(
     }
 
 
+class EntitlementContext:
+    """
+    Plan and usage for one user, read at most once per request.
+
+    Create one per request and pass it through check -> consume -> response:
+
+        ctx = EntitlementContext(user_id)
+        allowed, err = check_entitlement_or_error(user_id, "ats-scorer", ctx=ctx)
+        ...
+        ok, ent, err = consume_feature_use(user_id, "ats-scorer", session_id, ctx=ctx)
+
+    The subscription query and the Users get_item run lazily on first use;
+    consume refreshes the cached Users item from the update's return values,
+    so the final entitlement needs no further reads. `user_item` is the full
+    Users row and can be reused by the caller (e.g. for llmApiKeys).
+    """
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self._plan_loaded = False
+        self._plan_item: Optional[Dict[str, Any]] = None
+        self._user_loaded = False
+        self._user_item: Dict[str, Any] = {}
+
+    @property
+    def plan_item(self) -> Optional[Dict[str, Any]]:
+        if not self._plan_loaded:
+            self._plan_item = get_active_subscription_item(self.user_id)
+            self._plan_loaded = True
+        return self._plan_item
+
+    @property
+    def plan_features(self) -> List[str]:
+        return list((self.plan_item or {}).get("enabledFeatures") or [])
+
+    @property
+    def user_item(self) -> Dict[str, Any]:
+        if not self._user_loaded:
+            try:
+                resp = _users_table.get_item(Key={"userId": self.user_id})
+            except ClientError as e:
+                print(f"get_item Users for featureUsage failed: {e}")
+                raise
+            self._user_item = resp.get("Item") or {}
+            self._user_loaded = True
+        return self._user_item
+
+    @user_item.setter
+    def user_item(self, item: Dict[str, Any]) -> None:
+        self._user_item = item or {}
+        self._user_loaded = True
+
+    @property
+    def usage_map(self) -> Dict[str, int]:
+        return _usage_from_item(self.user_item)
+
+    def resolve(self, feature_id: str) -> Dict[str, Any]:
+        feature_id = (feature_id or "").strip()
+        static = _static_entitlement(feature_id)
+        if static is not None:
+            return static
+        return _compute_entitlement(
+            self.user_id, feature_id, self.plan_item, self.plan_features, self.usage_map
+        )
+
+
+def resolve_entitlement(
+    user_id: str,
+    feature_id: str,
+    *,
+    plan_features: Optional[List[str]] = None,
+    usage_map: Optional[Dict[str, int]] = None,
+    ctx: Optional[EntitlementContext] = None,
+) -> Dict[str, Any]:
+    feature_id = (feature_id or "").strip()
+    static = _static_entitlement(feature_id)
+    if static is not None:
+        return static
+
+    ctx = ctx or EntitlementContext(user_id)
+    if plan_features is None:
+        plan_features = ctx.plan_features
+    if usage_map is None:
+        usage_map = ctx.usage_map
+    return _compute_entitlement(user_id, feature_id, ctx.plan_item, plan_features, usage_map)
+
+
 def is_entitled(user_id: str, feature_id: str) -> bool:
     return resolve_entitlement(user_id, feature_id)["allowed"]
 
 
 def get_all_entitlements(user_id: str) -> Dict[str, Dict[str, Any]]:
-    plan_features = get_user_plan_features(user_id)
-    usage_map = get_user_feature_usage(user_id)
-    result: Dict[str, Dict[str, Any]] = {}
-    for fid in sorted(TRIAL_GATED_FEATURES):
-        result[fid] = resolve_entitlement(
-            user_id, fid, plan_features=plan_features, usage_map=usage_map
-        )
-    return result
+    ctx = EntitlementContext(user_id)
+    return {fid: ctx.resolve(fid) for fid in sorted(TRIAL_GATED_FEATURES)}
 
 
 def _session_already_consumed(
@@ -218,95 +302,134 @@ def _session_already_consumed(
     return bool(feature_sessions.get(session_id))
 
 
+def _consume_update_args(
+    user_item: Dict[str, Any],
+    feature_id: str,
+    trial_limit: int,
+    session_id: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Build one UpdateItem that increments usage (and records the session)
+    only while under the limit. DynamoDB cannot SET a nested path whose
+    parent map is missing, so the expression creates whichever maps the
+    cached row lacks and conditions on that shape.
+    """
+    names = {"#fu": "featureUsage"}
+    values: Dict[str, Any] = {":now": _now_iso()}
+    conditions = ["attribute_exists(userId)"]
+
+    if isinstance(user_item.get("featureUsage"), dict):
+        sets = ["#fu.#fid = if_not_exists(#fu.#fid, :zero) + :one"]
+        names["#fid"] = feature_id
+        values.update({":zero": 0, ":one": 1, ":limit": trial_limit})
+        conditions.append("(attribute_not_exists(#fu.#fid) OR #fu.#fid < :limit)")
+    else:
+        sets = ["#fu = :fu"]
+        values[":fu"] = {feature_id: 1}
+        conditions.append("attribute_not_exists(#fu)")
+    sets.append("updatedAt = :now")
+
+    if session_id:
+        names["#fus"] = "featureUsageSessions"
+        sessions = user_item.get("featureUsageSessions")
+        if not isinstance(sessions, dict):
+            sets.append("#fus = :fus")
+            values[":fus"] = {feature_id: {session_id: True}}
+            conditions.append("attribute_not_exists(#fus)")
+        elif not isinstance(sessions.get(feature_id), dict):
+            sets.append("#fus.#fid = :fus")
+            names["#fid"] = feature_id
+            values[":fus"] = {session_id: True}
+            conditions.append("attribute_not_exists(#fus.#fid)")
+        else:
+            sets.append("#fus.#fid.#sid = :true")
+            names.update({"#fid": feature_id, "#sid": session_id})
+            values[":true"] = True
+            conditions.append("attribute_not_exists(#fus.#fid.#sid)")
+
+    return {
+        "Key": {"userId": user_item.get("userId")},
+        "UpdateExpression": "SET " + ", ".join(sets),
+        "ConditionExpression": " AND ".join(conditions),
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values,
+        "ReturnValues": "ALL_NEW",
+        "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+    }
+
+
 def consume_feature_use(
     user_id: str,
     feature_id: str,
     session_id: Optional[str] = None,
+    ctx: Optional[EntitlementContext] = None,
 ) -> Tuple[bool, Dict[str, Any], Optional[str]]:
     """
     Increment trial usage for feature_id if user is on trial (not plan / always-free).
     Returns (ok, entitlement_dict, error_message).
+
+    Pass the request's EntitlementContext to reuse the plan/usage already
+    loaded by check_entitlement_or_error; the increment itself is a single
+    conditional update (limit + session idempotency enforced by DynamoDB).
     """
     feature_id = (feature_id or "").strip()
     if not user_id:
         return False, {}, "userId is required"
     if feature_id in ALWAYS_FREE_FEATURES:
-        ent = resolve_entitlement(user_id, feature_id)
-        return True, ent, None
+        return True, _static_entitlement(feature_id), None
     if feature_id not in TRIAL_GATED_FEATURES:
         return False, {}, f"Feature {feature_id} is not trial-gated"
 
-    ent = resolve_entitlement(user_id, feature_id)
-    if ent["source"] == "plan":
-        return True, ent, None
-    if not ent["allowed"]:
-        return False, ent, "Free trial uses exhausted for this feature"
-
+    ctx = ctx or EntitlementContext(user_id)
     try:
-        user_resp = _users_table.get_item(Key={"userId": user_id})
-    except ClientError as e:
-        print(f"consume get_item failed: {e}")
+        user_item = ctx.user_item
+    except ClientError:
         return False, {}, "Could not verify user"
-
-    user_item = user_resp.get("Item")
     if not user_item:
         return False, {}, "User not found"
 
-    if session_id and _session_already_consumed(user_item, feature_id, session_id):
-        return True, ent, None
-
-    ent = resolve_entitlement(user_id, feature_id)
-    if ent["source"] == "plan":
-        return True, ent, None
-
-    used = ent["used"]
-    trial_limit = _int_val(ent.get("limit")) or FREE_USE_LIMIT
-    if used >= trial_limit:
-        return False, ent, "Free trial uses exhausted for this feature"
-
-    expr_names = {"#fid": feature_id, "#fu": "featureUsage"}
-    expr_values: Dict[str, Any] = {
-        ":zero": 0,
-        ":one": 1,
-        ":limit": trial_limit,
-        ":now": _now_iso(),
-    }
-    update_expr = (
-        "SET #fu.#fid = if_not_exists(#fu.#fid, :zero) + :one, updatedAt = :now"
-    )
-
-    if session_id:
-        expr_names["#fus"] = "featureUsageSessions"
-        expr_names["#sid"] = session_id
-        expr_values[":true"] = True
-        update_expr += ", #fus.#fid.#sid = :true"
-
-    try:
-        _users_table.update_item(
-            Key={"userId": user_id},
-            UpdateExpression=update_expr,
-            ConditionExpression=(
-                "attribute_not_exists(#fu.#fid) OR #fu.#fid < :limit"
-            ),
-            ExpressionAttributeNames=expr_names,
-            ExpressionAttributeValues=expr_values,
-        )
-    except ClientError as e:
-        if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
-            refreshed = resolve_entitlement(user_id, feature_id)
-            return False, refreshed, "Free trial uses exhausted for this feature"
-        print(f"consume update_item failed: {e}")
-        return False, {}, "Could not record feature use"
-
-    updated = resolve_entitlement(user_id, feature_id)
-    return True, updated, None
-
-
-def check_entitlement_or_error(user_id: str, feature_id: str) -> Tuple[bool, Optional[str]]:
+    # The second attempt only happens when another request changed the row's
+    # shape (e.g. created featureUsageSessions) between our read and write.
+    for _ in range(2):
+        if session_id and _session_already_consumed(ctx.user_item, feature_id, session_id):
+            return True, ctx.resolve(feature_id), None
+
+        ent = ctx.resolve(feature_id)
+        if ent["source"] == "plan":
+            return True, ent, None
+        if not ent["allowed"]:
+            return False, ent, "Free trial uses exhausted for this feature"
+
+        trial_limit = _int_val(ent.get("limit")) or FREE_USE_LIMIT
+        try:
+            result = _users_table.update_item(
+                **_consume_update_args(ctx.user_item, feature_id, trial_limit, session_id)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                print(f"consume update_item failed: {e}")
+                return False, {}, "Could not record feature use"
+            old = {k: _deserializer.deserialize(v) for k, v in (e.response.get("Item") or {}).items()}
+            if not old:
+                return False, {}, "User not found"
+            ctx.user_item = old
+            continue
+
+        ctx.user_item = result.get("Attributes") or {}
+        return True, ctx.resolve(feature_id), None
+
+    return False, ctx.resolve(feature_id), "Free trial uses exhausted for this feature"
+
+
+def check_entitlement_or_error(
+    user_id: str,
+    feature_id: str,
+    ctx: Optional[EntitlementContext] = None,
+) -> Tuple[bool, Optional[str]]:
     """For server enforcement before expensive operations."""
     if not user_id:
         return False, "userId is required"
-    ent = resolve_entitlement(user_id, feature_id)
+    ent = resolve_entitlement(user_id, feature_id, ctx=ctx)
     if ent["allowed"]:
         return True, None
     return False, "Free trial uses exhausted. Upgrade your plan to continue."
@@ -21,8 +21,12 @@ Env:
   APP_BASE_URL (default https://codexcareer.com) — logo + links in branded emails
   JOB_HUNT_URL (default {APP_BASE_URL}/dashboard)
   SMTP_USER, SMTP_APP_PASSWORD — Gmail SMTP for job digest emails (same as login Lambda)
+  SMTP_BULK_CONNECTIONS (default 4), SMTP_MESSAGES_PER_CONNECTION (default 100) — digest fan-out
 
-Deploy package must include email_service.py alongside this file.
+  EMAIL_OUTBOX_QUEUE_URL (optional) — queue the digest for the email_outbox drainer instead of
+    sending it from this run (EMAIL_OUTBOX_DIGEST_CHUNK recipients per queued record)
+
+Deploy package must include email_service.py and email_outbox.py alongside this file.
 
 Event (optional):
   { "prompt": "..." }  — one-off prompt override (else env or default)
@@ -44,7 +48,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import boto3
 from botocore.exceptions import ClientError
 
-from email_service import send_job_digest_email
+from email_outbox import enqueue_job_digest, outbox_enabled
+from email_service import send_job_digest_bulk
 
 logger = logging.getLogger(__name__)
 _LOG_LEVEL = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
@@ -56,6 +61,8 @@ logger.setLevel(_LOG_LEVEL)
 FIRECRAWL_API_KEY = os.environ.get("FIRECRAWL_API_KEY", "")
 TABLE_NAME = os.environ.get("JOBS_TABLE", "JobListings")
 JOBS_PARTITION_KEY = os.environ.get("JOBS_PARTITION_KEY", "id").strip() or "id"
+# Partition value of the feed-scraped_at-index GSI read by get_jobs_details
+JOBS_FEED_PARTITION = "jobs"
 AGENT_URL = os.environ.get("FIRECRAWL_AGENT_URL", "https://api.firecrawl.dev/v2/agent").rstrip("/")
 FIRECRAWL_MODEL = os.environ.get("FIRECRAWL_MODEL", "spark-1-pro")
 
@@ -67,7 +74,7 @@ SOCKET_SERVER_URL = os.environ.get("SOCKET_SERVER_URL", "https://projectbazaarso
 INTERNAL_SECRET = os.environ.get("INTERNAL_SECRET", "")
 JOB_EMAIL_DIGEST_LIMIT = max(1, int(os.environ.get("JOB_EMAIL_DIGEST_LIMIT", "5")))
 
-# Firecrawl fills job_listings[]; partition key, created_at, scraped_at, and raw are set in normalize_item().
+# Firecrawl fills job_listings[]; partition key, created_at, scraped_at, feed, and raw are set in normalize_item().
 DEFAULT_PROMPT = (
     "PRIORITY: Finish within ~10 minutes and use well under ~2000 Firecrawl credits (free tier is ~2500 total—stay frugal). "
     "Minimize pages, clicks, and follow-up extractions. One search or listing surface is enough; do not deep-crawl or paginate "
@@ -240,6 +247,7 @@ def normalize_item(job: Dict[str, Any]) -> Dict[str, Any]:
         JOBS_PARTITION_KEY: generate_pk(job),
         "created_at": int(time.time()),
         "scraped_at": int(time.time()),
+        "feed": JOBS_FEED_PARTITION,
         "job_title": job.get("job_title") or job.get("title"),
         "company": job.get("company"),
         # Canonical image URL for UI (same value mirrored for any consumer expecting *_url)
@@ -640,24 +648,34 @@ def notify_users_of_new_jobs(new_jobs: List[Dict[str, Any]]) -> None:
 
     digest_jobs = new_jobs[:JOB_EMAIL_DIGEST_LIMIT]
     highlight = digest_jobs[0]
-    emails_sent = 0
-    emails_failed = 0
-    for user in users:
-        email = user.get("email", "")
-        if not email or not isinstance(email, str):
-            continue
-        if send_job_digest_email(email, digest_jobs):
-            emails_sent += 1
-        else:
-            emails_failed += 1
-            logger.error("Job digest email failed to=%s", email)
+    recipients = [u.get("email") for u in users if isinstance(u.get("email"), str) and u.get("email")]
+    if outbox_enabled():
+        records = enqueue_job_digest(recipients, digest_jobs)
+        logger.info(
+            "Job digest queued recipients=%s records=%s digest_size=%s total_new_jobs=%s",
+            len(recipients),
+            records,
+            len(digest_jobs),
+            len(new_jobs),
+        )
+        send_socket_notification(highlight)
+        return
+
+    # One rendered digest, sent over a few reused SMTP connections (see email_service.send_bulk_email)
+    result = send_job_digest_bulk(recipients, digest_jobs)
+    for email, error in result.failed:
+        logger.error("Job digest email failed to=%s error=%s", email, error)
 
     logger.info(
-        "Job digest emails sent=%s failed=%s digest_size=%s total_new_jobs=%s",
-        emails_sent,
-        emails_failed,
+        "Job digest emails sent=%s failed=%s digest_size=%s total_new_jobs=%s connections=%s "
+        "seconds=%.1f rate=%.1f/s",
+        result.sent,
+        len(result.failed),
         len(digest_jobs),
         len(new_jobs),
+        result.connections,
+        result.seconds,
+        result.messages_per_second,
     )
 
     send_socket_notification(highlight)
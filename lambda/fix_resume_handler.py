@@ -10,6 +10,9 @@ POST JSON body:
 Response: addedKeywords, previewText, pdfUrl | pdfBase64, pdfAvailable, pdfError?, improvedResume (structured JSON
 for in-app template preview when serial size ≤ ~480KB; set FIX_RESUME_RETURN_IMPROVED_JSON=1 to always attach even
 if larger).
+
+API Gateway buffers the response, so the Lambda always answers with one JSON body. Servers that can
+stream (local_fix_resume_server.py) pass on_partial to relay AI render sections as they complete.
 """
 
 from __future__ import annotations
@@ -68,7 +71,7 @@ def _parse_request_body(event):
     return {}
 
 
-def lambda_handler(event, context):
+def lambda_handler(event, context, on_partial=None):
     try:
         if _http_method(event) == "OPTIONS":
             return response(200, {})
@@ -78,7 +81,9 @@ def lambda_handler(event, context):
         from resume_text_extract import extract_text_from_bytes
 
         body = _parse_request_body(event)
-        result = run_fix_resume_pipeline(body, extract_text_from_bytes=extract_text_from_bytes)
+        result = run_fix_resume_pipeline(
+            body, extract_text_from_bytes=extract_text_from_bytes, on_partial=on_partial
+        )
         if not result.get("success"):
             return response(400, result)
         return response(200, result)
@@ -221,15 +221,28 @@ def handle_add_review(body):
     
     try:
         interactions_table.put_item(Item=item)
-        return response(201, {
-            "success": True, 
-            "message": "Review added successfully",
-            "data": item
-        })
     except Exception as e:
         print(f"Error adding review: {str(e)}")
         return response(500, {"success": False, "error": {"code": "DATABASE_ERROR", "message": "Failed to add review"}})
 
+    # Denormalized counters on the freelancer's Users row: browse / search rank by them
+    # without querying every candidate's reviews (see freelancers_handler.review_stats_from_user)
+    try:
+        users_table.update_item(
+            Key={'userId': body['freelancerId']},
+            UpdateExpression='ADD reviewCount :one, reviewRatingSum :rating',
+            ConditionExpression='attribute_exists(userId)',
+            ExpressionAttributeValues={':one': 1, ':rating': item['rating']}
+        )
+    except Exception as e:
+        print(f"Error updating review counters: {str(e)}")
+
+    return response(201, {
+        "success": True, 
+        "message": "Review added successfully",
+        "data": item
+    })
+
 
 # ---------- GET FREELANCER REVIEWS ----------
 def handle_get_freelancer_reviews(body):
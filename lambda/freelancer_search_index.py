@@ -0,0 +1,327 @@
+"""
+Persistent inverted index for freelancer discovery.
+
+Table: FreelancerSearchIndex
+  PK: term (string)
+  SK: sk   (string)
+
+  term                     sk                      meaning
+  ----------------------   ---------------------   -----------------------------------
+  "all"                    userId                  one doc per indexed freelancer
+  "tok#<prefix>"           userId                  name/username/skill/location token prefix
+  "skill#<skill>"          userId                  exact skill facet (lowercase)
+  "country#<country>"      userId                  country facet (lowercase)
+  "rate"                   "<cents:012d>#userId"   hourly rate, sorted for range filters
+
+The "all" doc carries everything search needs to filter and rank without
+reading Users: the posting terms it owns (for incremental re-indexing), the
+hourly rate and the cached rating / successRate used for ordering.
+
+Writers:
+    update_userdetails_in_settings.handle_update_settings -> index_user(...)
+    get_all_users_for_admin.handle_update_user (status) -> index_user(...)
+Readers:
+    freelancers_handler.handle_search_freelancers -> search(...)
+
+Rebuild from scratch (first deploy, or after tokenizer changes):
+    python freelancer_search_index.py
+"""
+from __future__ import annotations
+
+import os
+import re
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+SEARCH_INDEX_TABLE = os.environ.get("FREELANCER_SEARCH_INDEX_TABLE", "FreelancerSearchIndex")
+MIN_PREFIX_LEN = 2
+MAX_PREFIX_LEN = 20
+MAX_SKILLS = 10
+FREELANCER_ROLES = ("seller", "freelancer")
+HIDDEN_STATUSES = ("blocked", "deleted")
+DEFAULT_HOURLY_RATE = 20
+DEFAULT_COUNTRY = "India"
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+_dynamodb = boto3.resource("dynamodb")
+index_table = _dynamodb.Table(SEARCH_INDEX_TABLE)
+
+
+def is_listed_freelancer(user: Dict[str, Any]) -> bool:
+    """Same eligibility the browse/search scans use."""
+    if user.get("status", "active") in HIDDEN_STATUSES:
+        return False
+    return (
+        user.get("isFreelancer") in (True, "true")
+        or user.get("role") in FREELANCER_ROLES
+    )
+
+
+def profile_fields(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Searchable fields, parsed the same way format_freelancer parses them."""
+    email = user.get("email") or ""
+    skills = user.get("skills", [])
+    if isinstance(skills, str):
+        skills = [s.strip() for s in skills.split(",") if s.strip()]
+    skills = [str(s) for s in skills if isinstance(s, (str, int, float)) and str(s).strip()]
+
+    location = user.get("location")
+    if isinstance(location, dict):
+        city = location.get("city", user.get("city", ""))
+        country = location.get("country", user.get("country", DEFAULT_COUNTRY))
+    elif isinstance(location, str) and location.strip():
+        parts = [p.strip() for p in location.split(",")]
+        if len(parts) >= 2:
+            city, country = parts[0], parts[1]
+        else:
+            city, country = location, user.get("country", DEFAULT_COUNTRY)
+    else:
+        city = user.get("city", "")
+        country = user.get("country", DEFAULT_COUNTRY)
+
+    rate = user.get("hourlyRate", user.get("hourly_rate", DEFAULT_HOURLY_RATE))
+    try:
+        rate = float(rate)
+    except (TypeError, ValueError):
+        rate = float(DEFAULT_HOURLY_RATE)
+
+    return {
+        "name": user.get("fullName", email.split("@")[0]) or "",
+        "username": user.get("username", email.split("@")[0].lower()) or "",
+        "skills": skills[:MAX_SKILLS],
+        "city": city or "",
+        "country": country or "",
+        "hourlyRate": rate,
+    }
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(str(text or "").lower())
+
+
+def _prefixes(token: str) -> Iterable[str]:
+    if len(token) < MIN_PREFIX_LEN:
+        yield token
+        return
+    for end in range(MIN_PREFIX_LEN, min(len(token), MAX_PREFIX_LEN) + 1):
+        yield token[:end]
+
+
+def rate_key(rate: float, user_id: str) -> str:
+    return f"{int(round(max(rate, 0) * 100)):012d}#{user_id}"
+
+
+def _rate_from_key(sk: str) -> float:
+    return int(sk.split("#", 1)[0]) / 100.0
+
+
+def posting_terms(fields: Dict[str, Any]) -> Set[str]:
+    """Every posting term a profile should appear under (excluding "all"/"rate")."""
+    terms: Set[str] = set()
+    for text in (fields["name"], fields["username"], fields["city"], fields["country"], *fields["skills"]):
+        for token in tokenize(text):
+            terms.update(f"tok#{p}" for p in _prefixes(token))
+    terms.update(f"skill#{s.strip().lower()}" for s in fields["skills"] if s.strip())
+    if fields["country"].strip():
+        terms.add(f"country#{fields['country'].strip().lower()}")
+    return terms
+
+
+def _number(val: Any) -> Decimal:
+    return Decimal(str(round(float(val or 0), 2)))
+
+
+def index_user(
+    user: Dict[str, Any],
+    previous_doc: Optional[Dict[str, Any]] = None,
+    rank_fields: Optional[Dict[str, Any]] = None,
+    table=None,
+) -> None:
+    """
+    Bring one user's postings in line with their current profile. Only the
+    difference from the stored doc is written, so a typical settings save costs
+    a GetItem plus one or two BatchWriteItem calls.
+    """
+    table = table or index_table
+    user_id = user.get("userId")
+    if not user_id:
+        return
+    if previous_doc is None:
+        previous_doc = table.get_item(Key={"term": "all", "sk": user_id}).get("Item") or {}
+
+    old_terms = set(previous_doc.get("terms") or [])
+    old_rate_sk = previous_doc.get("rateKey")
+
+    if not is_listed_freelancer(user):
+        if not previous_doc:
+            return
+        with table.batch_writer() as batch:
+            for term in old_terms:
+                batch.delete_item(Key={"term": term, "sk": user_id})
+            if old_rate_sk:
+                batch.delete_item(Key={"term": "rate", "sk": old_rate_sk})
+            batch.delete_item(Key={"term": "all", "sk": user_id})
+        return
+
+    fields = profile_fields(user)
+    new_terms = posting_terms(fields)
+    new_rate_sk = rate_key(fields["hourlyRate"], user_id)
+    rank = rank_fields or {}
+
+    with table.batch_writer() as batch:
+        for term in old_terms - new_terms:
+            batch.delete_item(Key={"term": term, "sk": user_id})
+        for term in new_terms - old_terms:
+            batch.put_item(Item={"term": term, "sk": user_id})
+        if old_rate_sk and old_rate_sk != new_rate_sk:
+            batch.delete_item(Key={"term": "rate", "sk": old_rate_sk})
+        if old_rate_sk != new_rate_sk:
+            batch.put_item(Item={"term": "rate", "sk": new_rate_sk})
+        batch.put_item(Item={
+            "term": "all",
+            "sk": user_id,
+            "terms": sorted(new_terms),
+            "rateKey": new_rate_sk,
+            "hourlyRate": _number(fields["hourlyRate"]),
+            "rating": _number(rank.get("rating", previous_doc.get("rating", 0))),
+            "successRate": _number(rank.get("successRate", previous_doc.get("successRate", 0))),
+        })
+
+
+def update_rank_fields(user_id: str, rating: Any, success_rate: Any, table=None) -> None:
+    """Refresh the cached ordering fields on an existing doc (no-op if missing)."""
+    table = table or index_table
+    try:
+        table.update_item(
+            Key={"term": "all", "sk": user_id},
+            UpdateExpression="SET rating = :r, successRate = :s",
+            ConditionExpression="attribute_exists(sk)",
+            ExpressionAttributeValues={":r": _number(rating), ":s": _number(success_rate)},
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        pass
+
+
+def _query_all(table, **kwargs) -> List[Dict[str, Any]]:
+    result = table.query(**kwargs)
+    items = result.get("Items", [])
+    while "LastEvaluatedKey" in result:
+        result = table.query(ExclusiveStartKey=result["LastEvaluatedKey"], **kwargs)
+        items.extend(result.get("Items", []))
+    return items
+
+
+def _posting_ids(table, term: str) -> Set[str]:
+    return {
+        item["sk"]
+        for item in _query_all(table, KeyConditionExpression=Key("term").eq(term), ProjectionExpression="sk")
+    }
+
+
+def max_hourly_rate(table=None) -> Optional[float]:
+    """Highest indexed hourly rate (one single-item query)."""
+    table = table or index_table
+    result = table.query(
+        KeyConditionExpression=Key("term").eq("rate"),
+        ScanIndexForward=False,
+        Limit=1,
+        ProjectionExpression="sk",
+    )
+    items = result.get("Items", [])
+    return _rate_from_key(items[0]["sk"]) if items else None
+
+
+def _batch_get_docs(table, user_ids: List[str]) -> List[Dict[str, Any]]:
+    docs: List[Dict[str, Any]] = []
+    client = table.meta.client
+    for start in range(0, len(user_ids), 100):
+        request = {table.name: {"Keys": [{"term": "all", "sk": uid} for uid in user_ids[start:start + 100]]}}
+        while request:
+            result = client.batch_get_item(RequestItems=request)
+            docs.extend((result.get("Responses") or {}).get(table.name, []))
+            request = result.get("UnprocessedKeys") or None
+    return docs
+
+
+def search(
+    query: str = "",
+    skills: Optional[List[str]] = None,
+    country: str = "",
+    min_rate: float = 0,
+    max_rate: float = 1000,
+    table=None,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Return [(userId, doc)] matching every criterion, ordered by
+    (rating, successRate) descending. Reads only index items.
+
+    - every query token must prefix-match some indexed token (AND)
+    - skills match if the freelancer has any of them (OR)
+    - country is an exact, case-insensitive match
+    """
+    table = table or index_table
+    candidates: Optional[Set[str]] = None
+
+    def narrow(ids: Set[str]) -> None:
+        nonlocal candidates
+        candidates = ids if candidates is None else candidates & ids
+
+    for token in tokenize(query)[:8]:
+        narrow(_posting_ids(table, f"tok#{token[:MAX_PREFIX_LEN]}"))
+        if not candidates:
+            return []
+
+    if skills:
+        wanted: Set[str] = set()
+        for skill in skills:
+            if str(skill).strip():
+                wanted |= _posting_ids(table, f"skill#{str(skill).strip().lower()}")
+        narrow(wanted)
+        if not candidates:
+            return []
+
+    if country:
+        narrow(_posting_ids(table, f"country#{country.strip().lower()}"))
+        if not candidates:
+            return []
+
+    rate_items = _query_all(
+        table,
+        KeyConditionExpression=Key("term").eq("rate") & Key("sk").between(
+            f"{int(round(max(float(min_rate), 0) * 100)):012d}#",
+            f"{int(round(max(float(max_rate), 0) * 100)):012d}#\uffff",
+        ),
+        ProjectionExpression="sk",
+    )
+    narrow({item["sk"].split("#", 1)[1] for item in rate_items})
+
+    if not candidates:
+        return []
+    docs = _batch_get_docs(table, sorted(candidates))
+    docs.sort(key=lambda d: (float(d.get("rating", 0)), float(d.get("successRate", 0))), reverse=True)
+    return [(d["sk"], d) for d in docs]
+
+
+def rebuild(users_table, table=None) -> int:
+    """Index every listed freelancer from a full Users scan (migration / repair)."""
+    table = table or index_table
+    indexed = 0
+    kwargs: Dict[str, Any] = {}
+    while True:
+        result = users_table.scan(**kwargs)
+        for user in result.get("Items", []):
+            if is_listed_freelancer(user):
+                index_user(user, table=table)
+                indexed += 1
+        if "LastEvaluatedKey" not in result:
+            return indexed
+        kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+
+if __name__ == "__main__":
+    count = rebuild(_dynamodb.Table("Users"))
+    print(f"Indexed {count} freelancers into {SEARCH_INDEX_TABLE}")
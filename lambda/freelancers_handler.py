@@ -10,6 +10,10 @@ Actions:
 - GET_FREELANCER_BY_ID: Get a specific freelancer's profile
 - GET_TOP_FREELANCERS: Get top-rated freelancers (for homepage)
 - SEARCH_FREELANCERS: Search freelancers by skills, name, location
+
+Review stats come from reviewCount / reviewRatingSum on the Users row (kept by
+freelancer_interactions_handler). Set them once for existing reviews (from lambda/):
+    python freelancers_handler.py --backfill-review-counters
 """
 
 import json
@@ -18,6 +22,8 @@ from datetime import datetime
 from boto3.dynamodb.conditions import Key, Attr
 from decimal import Decimal
 
+import freelancer_search_index
+
 # Initialize DynamoDB
 dynamodb = boto3.resource('dynamodb')
 users_table = dynamodb.Table('Users')
@@ -52,8 +58,187 @@ def response(status_code, body):
     }
 
 
+# Per-invocation memo of seller/review stats, filled in one pass by
+# prefetch_freelancer_stats() and cleared at the start of every lambda_handler call
+_seller_stats_memo = {}
+_review_stats_memo = {}
+
+EMPTY_SELLER_STATS = {
+    'projectsCount': 0,
+    'totalSales': 0,
+    'totalRevenue': 0,
+    'totalViews': 0,
+    'totalLikes': 0
+}
+EMPTY_REVIEW_STATS = {'count': 0, 'averageRating': 0}
+# Denormalized on the Users row by freelancer_interactions_handler.handle_add_review
+REVIEW_COUNT_ATTR = 'reviewCount'
+REVIEW_SUM_ATTR = 'reviewRatingSum'
+
+
+def reset_stats_memo():
+    _seller_stats_memo.clear()
+    _review_stats_memo.clear()
+
+
+def _scan_all(table, **kwargs):
+    """Paginated scan returning every matching item"""
+    result = table.scan(**kwargs)
+    items = result.get('Items', [])
+    while 'LastEvaluatedKey' in result:
+        result = table.scan(ExclusiveStartKey=result['LastEvaluatedKey'], **kwargs)
+        items.extend(result.get('Items', []))
+    return items
+
+
+def _query_all(table, **kwargs):
+    """Paginated query returning every matching item"""
+    result = table.query(**kwargs)
+    items = result.get('Items', [])
+    while 'LastEvaluatedKey' in result:
+        result = table.query(ExclusiveStartKey=result['LastEvaluatedKey'], **kwargs)
+        items.extend(result.get('Items', []))
+    return items
+
+
+def review_stats_from_user(user):
+    """
+    Review stats from the counters freelancer_interactions_handler keeps on the
+    Users row (ADD on every review), or None if the row has none yet.
+    """
+    if REVIEW_COUNT_ATTR not in user:
+        return None
+    count = int(user.get(REVIEW_COUNT_ATTR) or 0)
+    if count <= 0:
+        return dict(EMPTY_REVIEW_STATS)
+    return {'count': count, 'averageRating': float(user.get(REVIEW_SUM_ATTR) or 0) / count}
+
+
+def _query_review_stats(freelancer_id):
+    """One projected targetId-index query (paginated) for a single freelancer."""
+    reviews = _query_all(
+        interactions_table,
+        IndexName='targetId-index',
+        KeyConditionExpression=Key('targetId').eq(freelancer_id),
+        FilterExpression=Attr('type').eq('review'),
+        ProjectionExpression='rating'
+    )
+    values = [float(r.get('rating', 0)) for r in reviews]
+    if not values:
+        return dict(EMPTY_REVIEW_STATS)
+    return {'count': len(values), 'averageRating': sum(values) / len(values)}
+
+
+def prefetch_freelancer_stats(users, query_uncounted=True):
+    """
+    Compute seller and review stats for a list of Users rows: one projected
+    Projects scan instead of one Projects scan per freelancer, and review stats
+    from the counters on each row. Rows without counters (not reviewed since the
+    counters shipped and not backfilled) get a targetId-index query when
+    query_uncounted is set; callers with more candidates than a page pass False,
+    sort them as unreviewed and call fill_uncounted_review_stats() on the page.
+    Returns the ids still without accurate review stats.
+    """
+    wanted = {u.get('userId') for u in users if u.get('userId')}
+    if not wanted:
+        return set()
+
+    seller_stats = {uid: dict(EMPTY_SELLER_STATS) for uid in wanted}
+    try:
+        projects = _scan_all(
+            projects_table,
+            ProjectionExpression='sellerId, purchasesCount, price, viewsCount, likesCount'
+        )
+        for project in projects:
+            stats = seller_stats.get(project.get('sellerId'))
+            if stats is None:
+                continue
+            purchases = project.get('purchasesCount', 0) or 0
+            price = project.get('price', 0) or 0
+            stats['projectsCount'] += 1
+            stats['totalSales'] += purchases
+            stats['totalRevenue'] += purchases * float(price)
+            stats['totalViews'] += project.get('viewsCount', 0) or 0
+            stats['totalLikes'] += project.get('likesCount', 0) or 0
+    except Exception as e:
+        print(f"Error batch-loading seller stats: {str(e)}")
+    _seller_stats_memo.update(seller_stats)
+
+    uncounted = set()
+    for user in users:
+        uid = user.get('userId')
+        if not uid:
+            continue
+        stats = review_stats_from_user(user)
+        if stats is None:
+            uncounted.add(uid)
+            if query_uncounted:
+                continue  # get_freelancer_reviews_stats() queries it
+            stats = dict(EMPTY_REVIEW_STATS)
+        _review_stats_memo[uid] = stats
+    return set() if query_uncounted else uncounted
+
+
+def fill_uncounted_review_stats(freelancers, uncounted):
+    """Query review stats for the formatted freelancers on this page that had no counters."""
+    for freelancer in freelancers:
+        if freelancer['id'] not in uncounted:
+            continue
+        try:
+            stats = _query_review_stats(freelancer['id'])
+        except Exception as e:
+            print(f"Error getting freelancer reviews: {str(e)}")
+            continue
+        _review_stats_memo[freelancer['id']] = stats
+        freelancer['rating'] = round(stats['averageRating'], 1) if stats['count'] > 0 else 0
+        freelancer['reviewsCount'] = stats['count']
+
+
+def backfill_review_counters(users=None, interactions=None):
+    """
+    One-off migration: set the review counters on every freelancer (and every
+    reviewed user) from the interactions table. Re-running recomputes them; run
+    it while reviews are quiet, a review added mid-run may be counted twice.
+    """
+    users = users or users_table
+    interactions = interactions or interactions_table
+    totals = {}
+    for review in _scan_all(
+        interactions,
+        FilterExpression=Attr('type').eq('review'),
+        ProjectionExpression='targetId, rating'
+    ):
+        count, rating_sum = totals.get(review.get('targetId'), (0, Decimal('0')))
+        totals[review.get('targetId')] = (count + 1, rating_sum + Decimal(str(review.get('rating', 0))))
+    freelancer_ids = {
+        u['userId'] for u in _scan_all(
+            users,
+            FilterExpression=Attr('isFreelancer').eq(True) | Attr('isFreelancer').eq('true') | Attr('role').is_in(['seller', 'freelancer']),
+            ProjectionExpression='userId'
+        )
+    }
+    written = 0
+    for uid in freelancer_ids | {t for t in totals if t}:
+        count, rating_sum = totals.get(uid, (0, Decimal('0')))
+        try:
+            users.update_item(
+                Key={'userId': uid},
+                UpdateExpression=f'SET {REVIEW_COUNT_ATTR} = :count, {REVIEW_SUM_ATTR} = :sum',
+                ConditionExpression='attribute_exists(userId)',
+                ExpressionAttributeValues={':count': count, ':sum': rating_sum}
+            )
+            written += 1
+        except Exception as e:
+            if getattr(e, 'response', {}).get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                raise
+            # reviewed user that no longer exists
+    return written
+
+
 def get_seller_stats(seller_id):
     """Get stats for a seller (projects sold, earnings, etc.)"""
+    if seller_id in _seller_stats_memo:
+        return _seller_stats_memo[seller_id]
     try:
         # Query projects by this seller
         result = projects_table.scan(
@@ -78,25 +263,23 @@ def get_seller_stats(seller_id):
             total_views += views
             total_likes += likes
         
-        return {
+        stats = {
             'projectsCount': len(projects),
             'totalSales': total_sales,
             'totalRevenue': total_revenue,
             'totalViews': total_views,
             'totalLikes': total_likes
         }
+        _seller_stats_memo[seller_id] = stats
+        return stats
     except Exception as e:
         print(f"Error getting seller stats: {str(e)}")
-        return {
-            'projectsCount': 0,
-            'totalSales': 0,
-            'totalRevenue': 0,
-            'totalViews': 0,
-            'totalLikes': 0
-        }
+        return dict(EMPTY_SELLER_STATS)
 
 def get_freelancer_reviews_stats(freelancer_id):
     """Get real review statistics for a freelancer from the interactions table"""
+    if freelancer_id in _review_stats_memo:
+        return _review_stats_memo[freelancer_id]
     try:
         try:
             result = interactions_table.query(
@@ -112,13 +295,15 @@ def get_freelancer_reviews_stats(freelancer_id):
         reviews = result.get('Items', [])
         
         if not reviews:
-            return {'count': 0, 'averageRating': 0}
-            
-        total_rating = sum(float(r.get('rating', 0)) for r in reviews)
-        return {
-            'count': len(reviews),
-            'averageRating': total_rating / len(reviews)
-        }
+            stats = dict(EMPTY_REVIEW_STATS)
+        else:
+            total_rating = sum(float(r.get('rating', 0)) for r in reviews)
+            stats = {
+                'count': len(reviews),
+                'averageRating': total_rating / len(reviews)
+            }
+        _review_stats_memo[freelancer_id] = stats
+        return stats
     except Exception as e:
         print(f"Error getting freelancer reviews: {str(e)}")
         return {'count': 0, 'averageRating': 0}
@@ -241,7 +426,8 @@ def handle_get_all_freelancers(body):
         # Filter out blocked/deleted users
         users = [u for u in users if u.get('status', 'active') not in ['blocked', 'deleted']]
         
-        # Format freelancers
+        # Format freelancers (stats for the whole list are loaded in one pass)
+        uncounted = prefetch_freelancer_stats(users, query_uncounted=False)
         freelancers = [format_freelancer(user) for user in users]
         
         # Calculate max hourly rate for dynamic filters
@@ -253,6 +439,7 @@ def handle_get_all_freelancers(body):
         # Apply pagination
         total_count = len(freelancers)
         paginated_freelancers = freelancers[offset:offset + limit]
+        fill_uncounted_review_stats(paginated_freelancers, uncounted)
         
         return response(200, {
             "success": True,
@@ -359,7 +546,8 @@ def handle_get_top_freelancers(body):
         
         users = result.get('Items', [])
         
-        # Format and calculate stats
+        # Format and calculate stats (one batched pass for all candidates)
+        uncounted = prefetch_freelancer_stats(users, query_uncounted=False)
         freelancers = []
         for user in users:
             freelancer = format_freelancer(user, include_stats=True)
@@ -380,6 +568,7 @@ def handle_get_top_freelancers(body):
         # Remove internal score field
         for f in top_freelancers:
             f.pop('score', None)
+        fill_uncounted_review_stats(top_freelancers, uncounted)
         
         return response(200, {
             "success": True,
@@ -400,32 +589,126 @@ def handle_get_top_freelancers(body):
 
 
 # ---------- SEARCH FREELANCERS ----------
-def handle_search_freelancers(body):
-    """Search freelancers by various criteria"""
-    query = body.get('query', '').lower()
+def _parse_search_filters(body):
     skills_filter = body.get('skills', [])
-    country_filter = body.get('country', '')
-    min_rate = body.get('minHourlyRate', 0)
-    max_rate = body.get('maxHourlyRate', 1000)
-    limit = int(body.get('limit', 50))
-    offset = int(body.get('offset', 0))
+    if isinstance(skills_filter, str):
+        skills_filter = [s.strip() for s in skills_filter.split(',') if s.strip()]
+    return {
+        'query': (body.get('query') or '').lower(),
+        'skills': skills_filter or [],
+        'country': body.get('country', '') or '',
+        'min_rate': float(body.get('minHourlyRate', 0) or 0),
+        'max_rate': float(body.get('maxHourlyRate', 1000) or 1000),
+        'limit': int(body.get('limit', 50)),
+        'offset': int(body.get('offset', 0)),
+    }
+
+
+def _batch_get_users(user_ids):
+    """BatchGetItem Users rows, returned in the order of user_ids"""
+    found = {}
+    client = users_table.meta.client
+    for start in range(0, len(user_ids), 100):
+        request = {users_table.name: {'Keys': [{'userId': uid} for uid in user_ids[start:start + 100]]}}
+        while request:
+            result = client.batch_get_item(RequestItems=request)
+            for item in (result.get('Responses') or {}).get(users_table.name, []):
+                found[item.get('userId')] = item
+            request = result.get('UnprocessedKeys') or None
+    return [found[uid] for uid in user_ids if uid in found]
+
+
+def handle_search_freelancers(body):
+    """Search freelancers via the inverted index; only the final page touches Users"""
+    filters = _parse_search_filters(body)
+    limit = filters['limit']
+    offset = filters['offset']
+
+    try:
+        available_max_rate = freelancer_search_index.max_hourly_rate()
+        if available_max_rate is None:
+            # Index not built yet (see freelancer_search_index.py)
+            return _search_freelancers_by_scan(filters)
+        hits = freelancer_search_index.search(
+            query=filters['query'],
+            skills=filters['skills'],
+            country=filters['country'],
+            min_rate=filters['min_rate'],
+            max_rate=filters['max_rate'],
+        )
+    except Exception as e:
+        print(f"Search index unavailable, falling back to scan: {str(e)}")
+        return _search_freelancers_by_scan(filters)
+
+    try:
+        total_count = len(hits)
+        page_hits = hits[offset:offset + limit]
+        page_ids = [uid for uid, _ in page_hits]
+        users = [
+            u for u in _batch_get_users(page_ids)
+            if u.get('status', 'active') not in ['blocked', 'deleted']
+        ]
+
+        prefetch_freelancer_stats(users)
+        paginated = [format_freelancer(user) for user in users]
+
+        # Keep the index's cached ordering fields close to the live stats
+        docs = dict(page_hits)
+        for f in paginated:
+            doc = docs.get(f['id']) or {}
+            if (float(doc.get('rating', 0)), float(doc.get('successRate', 0))) != (float(f['rating']), float(f['successRate'])):
+                try:
+                    freelancer_search_index.update_rank_fields(f['id'], f['rating'], f['successRate'])
+                except Exception as e:
+                    print(f"Error refreshing search index rank fields: {str(e)}")
+
+        return response(200, {
+            "success": True,
+            "data": {
+                "freelancers": paginated,
+                "count": len(paginated),
+                "totalCount": total_count,
+                "maxHourlyRate": available_max_rate,
+                "hasMore": offset + limit < total_count
+            }
+        })
+    except Exception as e:
+        print(f"Error searching freelancers: {str(e)}")
+        return response(500, {
+            "success": False,
+            "error": {
+                "code": "DATABASE_ERROR",
+                "message": "Failed to search freelancers"
+            }
+        })
+
+
+def _search_freelancers_by_scan(filters):
+    """Legacy search: scan every freelancer and filter in Python"""
+    query = filters['query']
+    skills_filter = filters['skills']
+    country_filter = filters['country']
+    min_rate = filters['min_rate']
+    max_rate = filters['max_rate']
+    limit = filters['limit']
+    offset = filters['offset']
     
     try:
         # Get all potential freelancers
-        result = users_table.scan(
+        users = _scan_all(
+            users_table,
             FilterExpression=(Attr('isFreelancer').eq(True) | Attr('isFreelancer').eq('true') | Attr('role').is_in(['seller', 'freelancer'])) & (
                 Attr('status').eq('active') | 
                 Attr('status').not_exists()
             )
         )
         
-        users = result.get('Items', [])
-        
-        # Format freelancers
+        # Format freelancers (stats for the whole list are loaded in one pass)
+        uncounted = prefetch_freelancer_stats(users, query_uncounted=False)
         freelancers = [format_freelancer(user) for user in users]
         
         # Calculate max hourly rate for dynamic filters (from all potential freelancers, not just filtered)
-        max_rate = max([f['hourlyRate'] for f in freelancers]) if freelancers else 500
+        available_max_rate = max([f['hourlyRate'] for f in freelancers]) if freelancers else 500
         
         # Apply filters
         filtered = []
@@ -442,8 +725,6 @@ def handle_search_freelancers(body):
             
             # Skills filter
             if skills_filter:
-                if isinstance(skills_filter, str):
-                    skills_filter = [s.strip() for s in skills_filter.split(',')]
                 freelancer_skills_lower = [s.lower() for s in f['skills']]
                 if not any(skill.lower() in freelancer_skills_lower for skill in skills_filter):
                     continue
@@ -465,6 +746,7 @@ def handle_search_freelancers(body):
         # Apply pagination
         total_count = len(filtered)
         paginated = filtered[offset:offset + limit]
+        fill_uncounted_review_stats(paginated, uncounted)
         
         return response(200, {
             "success": True,
@@ -472,7 +754,7 @@ def handle_search_freelancers(body):
                 "freelancers": paginated,
                 "count": len(paginated),
                 "totalCount": total_count,
-                "maxHourlyRate": max_rate,
+                "maxHourlyRate": available_max_rate,
                 "hasMore": offset + limit < total_count
             }
         })
@@ -502,6 +784,7 @@ def handle_seed_freelancers(body):
 # ---------- LAMBDA HANDLER ----------
 def lambda_handler(event, context):
     """Main Lambda handler - routes requests to appropriate functions"""
+    reset_stats_memo()
     try:
         # Handle CORS preflight OPTIONS request
         if event.get('httpMethod') == 'OPTIONS':
@@ -571,3 +854,10 @@ def lambda_handler(event, context):
                 "message": "An error occurred processing your request"
             }
         })
+
+
+if __name__ == '__main__':
+    import sys
+
+    if '--backfill-review-counters' in sys.argv:
+        print(f"Set review counters on {backfill_review_counters()} users")
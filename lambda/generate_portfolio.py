@@ -2,7 +2,7 @@
 Lambda Function: Portfolio Generator
 ------------------------------------
 1. Receive resume (PDF/DOCX) as base64
-2. Extract text using pdfplumber (primary) / PyPDF2 (fallback)
+2. Extract text with the shared resume_text_extract library (PyMuPDF / PyPDF2 / pdfminer, in memory)
 3. Parse resume text with regex patterns to extract portfolio data
 4. Generate portfolio with selectable templates
 5. Deploy to Vercel
@@ -22,9 +22,6 @@ import json
 import base64
 import os
 import re
-import tempfile
-import shutil
-import zipfile
 import urllib.request
 import urllib.error
 import uuid
@@ -43,7 +40,8 @@ except ImportError:
     DYNAMODB_ENABLED = False
     PORTFOLIO_TABLE = None
 
-from feature_entitlement import check_entitlement_or_error, consume_feature_use
+from feature_entitlement import EntitlementContext, check_entitlement_or_error, consume_feature_use
+from resume_text_extract import extract_clean_text
 
 # Import templates module
 try:
@@ -205,8 +203,10 @@ def handle_preview_portfolio(body: Dict[str, Any], headers: Dict[str, str]) -> D
 def handle_generate_portfolio(body: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
     """Full portfolio generation: parse resume, generate HTML, deploy to Vercel."""
     user_id = body.get("userId", f"user_{int(datetime.now().timestamp())}")
+    ent_ctx = None
     if user_id and not str(user_id).startswith("user_"):
-        allowed, ent_err = check_entitlement_or_error(str(user_id).strip(), "portfolio")
+        ent_ctx = EntitlementContext(str(user_id).strip())
+        allowed, ent_err = check_entitlement_or_error(str(user_id).strip(), "portfolio", ctx=ent_ctx)
         if not allowed:
             return error_response(ent_err or "Trial limit reached", headers)
     user_email = body.get("userEmail", "")
@@ -262,7 +262,7 @@ def handle_generate_portfolio(body: Dict[str, Any], headers: Dict[str, str]) ->
 
     if user_id and not str(user_id).startswith("user_"):
         ok_consume, _, consume_err = consume_feature_use(
-            str(user_id).strip(), "portfolio", session_id=portfolio_id
+            str(user_id).strip(), "portfolio", session_id=portfolio_id, ctx=ent_ctx
         )
         if not ok_consume:
             return error_response(consume_err or "Trial limit reached", headers)
@@ -438,381 +438,17 @@ def delete_portfolio_from_history(user_id: str, portfolio_id: str) -> bool:
 
 
 # =========================
-# RESUME EXTRACTION (Smart Pipeline)
+# RESUME EXTRACTION (shared resume_text_extract library)
 # =========================
 def extract_text_from_resume(content: bytes, file_type: str, file_name: str) -> str:
     """
-    Extract text from resume files (PDF/DOCX).
-    Uses PyPDF2 (primary) with pdfplumber + OCR fallback for PDFs.
+    Extract text from resume files (PDF/DOCX) in memory.
+    Returns "" when the file is unreadable (e.g. scanned PDF) or the text is garbage.
     """
-    temp_dir = tempfile.mkdtemp()
-    path = os.path.join(temp_dir, file_name)
-
-    try:
-        # Save file to temp directory
-        with open(path, "wb") as f:
-            f.write(content)
-
-        if file_name.lower().endswith(".pdf"):
-            # Use smart PDF extraction
-            text = extract_pdf_text_smart(path)
-            
-            # Check if extraction produced garbage or failed
-            if is_garbage_text(text):
-                print("PDF extraction produced unreadable text")
-                return ""
-            
-            print(f"PDF extraction successful: {len(text)} characters")
-            return text
-            
-        if file_name.lower().endswith((".docx", ".doc")):
-            return extract_docx_text(path)
-
-        return content.decode("utf-8", errors="ignore")
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def extract_pdf_text_smart(pdf_path: str) -> str:
-    """
-    Smart PDF text extraction with 3-step strategy:
-    1. pdfplumber (primary - more accurate for complex layouts)
-    2. PyPDF2 (fallback) - works in Lambda without extra dependencies
-    3. Basic regex extraction (no dependencies) - fallback using zlib decompression
-    """
-    
-    # Step 1: Try pdfplumber first (more accurate for complex layouts)
-    try:
-        import pdfplumber
-        
-        print("Attempting PDF extraction with pdfplumber...")
-        all_text = []
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                try:
-                    # Try simple extraction first (most compatible)
-                    page_text = page.extract_text()
-                    
-                    # If simple extraction fails, try with tolerances
-                    if not page_text:
-                        page_text = page.extract_text(
-                            x_tolerance=3,
-                            y_tolerance=3
-                        )
-                    
-                    if page_text:
-                        all_text.append(page_text)
-                        print(f"  Page {page_num + 1}: extracted {len(page_text)} chars")
-                except Exception as e:
-                    print(f"pdfplumber error on page {page_num + 1}: {e}")
-                    continue
-        
-        combined_text = "\n\n".join(all_text)
-        cleaned_text = clean_resume_text(combined_text)
-        
-        # If we got substantial text, return it
-        if len(cleaned_text) > 200:
-            print(f"pdfplumber extraction successful: {len(cleaned_text)} chars")
-            return cleaned_text
-        else:
-            print(f"pdfplumber extracted only {len(cleaned_text)} chars, trying PyPDF2...")
-            
-    except ImportError:
-        print("pdfplumber not available, trying PyPDF2...")
-    except Exception as e:
-        print(f"pdfplumber failed: {e}, trying PyPDF2...")
-    
-    # Step 2: Try PyPDF2 as fallback
-    try:
-        import PyPDF2
-        
-        print("Attempting PDF extraction with PyPDF2...")
-        all_text = []
-        
-        with open(pdf_path, 'rb') as pdf_file:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        all_text.append(page_text)
-                except Exception as e:
-                    print(f"PyPDF2 error on page {page_num + 1}: {e}")
-                    continue
-        
-        combined_text = "\n\n".join(all_text)
-        cleaned_text = clean_resume_text(combined_text)
-        
-        if len(cleaned_text) > 200:
-            print(f"PyPDF2 extraction successful: {len(cleaned_text)} chars")
-            return cleaned_text
-        else:
-            print(f"PyPDF2 extracted only {len(cleaned_text)} chars, trying basic extraction...")
-            
-    except ImportError:
-        print("PyPDF2 not available, trying basic extraction...")
-    except Exception as e:
-        print(f"PyPDF2 failed: {e}, trying basic extraction...")
-    
-    # Step 3: Basic text extraction from PDF bytes (no dependencies needed)
-    try:
-        print("Attempting basic PDF text extraction (no dependencies)...")
-        text = extract_pdf_text_basic(pdf_path)
-        if len(text) > 100:
-            print(f"Basic extraction successful: {len(text)} chars")
-            return text
-        else:
-            print(f"Basic extraction got only {len(text)} chars")
-    except Exception as e:
-        print(f"Basic extraction failed: {e}")
-    
-    # If all methods fail, return empty string
-    print("All PDF extraction methods failed - PDF may be scanned/image-based")
-    return ""
-
-
-def extract_pdf_text_basic(pdf_path: str) -> str:
-    """
-    Basic PDF text extraction using regex on raw PDF content.
-    Works without any external dependencies (uses standard library zlib).
-    This is a fallback for when PyPDF2/pdfplumber aren't available.
-    """
-    import zlib
-    
-    with open(pdf_path, 'rb') as f:
-        pdf_bytes = f.read()
-    
-    text_parts = []
-    
-    # First, try to decompress FlateDecode streams (most modern PDFs use compression)
-    # Find all stream objects
-    stream_pattern = re.compile(rb'stream\s*\n(.*?)\nendstream', re.DOTALL)
-    
-    for match in stream_pattern.finditer(pdf_bytes):
-        stream_data = match.group(1)
-        
-        # Try to decompress with zlib (FlateDecode)
-        try:
-            decompressed = zlib.decompress(stream_data)
-            # Decode to string
-            try:
-                content = decompressed.decode('utf-8', errors='ignore')
-            except:
-                content = decompressed.decode('latin-1', errors='ignore')
-            
-            # Extract text from decompressed content
-            extracted = extract_text_from_pdf_content(content)
-            if extracted:
-                text_parts.append(extracted)
-        except zlib.error:
-            # Not compressed or different compression, try raw
-            pass
-        except Exception as e:
-            continue
-    
-    # Also try uncompressed content (older PDFs)
-    try:
-        pdf_content = pdf_bytes.decode('latin-1')
-        extracted = extract_text_from_pdf_content(pdf_content)
-        if extracted and len(extracted) > len(' '.join(text_parts)):
-            text_parts = [extracted]
-    except:
-        pass
-    
-    # Join and clean the text
-    raw_text = ' '.join(text_parts)
-    cleaned = clean_resume_text(raw_text)
-    
-    return cleaned
-
-
-def extract_text_from_pdf_content(content: str) -> str:
-    """Extract text strings from PDF content stream."""
-    text_parts = []
-    
-    # Pattern 1: Simple text strings - (text) Tj
-    pattern1 = re.compile(r'\(([^)]*)\)\s*Tj', re.DOTALL)
-    for match in pattern1.finditer(content):
-        text = decode_pdf_string(match.group(1))
-        if text.strip() and len(text) > 0:
-            text_parts.append(text)
-    
-    # Pattern 2: Text arrays - [(text) -100 (more)] TJ
-    pattern2 = re.compile(r'\[(.*?)\]\s*TJ', re.DOTALL)
-    for match in pattern2.finditer(content):
-        array_content = match.group(1)
-        strings = re.findall(r'\(([^)]*)\)', array_content)
-        line_parts = []
-        for s in strings:
-            text = decode_pdf_string(s)
-            if text:
-                line_parts.append(text)
-        if line_parts:
-            text_parts.append(''.join(line_parts))
-    
-    # Pattern 3: Hex strings - <48656C6C6F> Tj
-    pattern3 = re.compile(r'<([0-9A-Fa-f]+)>\s*Tj', re.DOTALL)
-    for match in pattern3.finditer(content):
-        hex_str = match.group(1)
-        try:
-            text = bytes.fromhex(hex_str).decode('utf-8', errors='ignore')
-            if text.strip():
-                text_parts.append(text)
-        except:
-            pass
-    
-    # Pattern 4: Look for BT...ET blocks and extract all text
-    pattern4 = re.compile(r'BT\s*(.*?)\s*ET', re.DOTALL)
-    for match in pattern4.finditer(content):
-        block = match.group(1)
-        # Get all strings in the block
-        strings = re.findall(r'\(([^)]+)\)', block)
-        block_text = []
-        for s in strings:
-            text = decode_pdf_string(s)
-            if text and len(text) > 0:
-                block_text.append(text)
-        if block_text:
-            text_parts.append(' '.join(block_text))
-    
-    # Join with spaces and newlines where appropriate
-    result = ' '.join(text_parts)
-    
-    # Try to restore some structure - add newlines after common patterns
-    result = re.sub(r'([.!?])\s+([A-Z])', r'\1\n\2', result)
-    
-    return result
-
-
-def decode_pdf_string(s: str) -> str:
-    """Decode PDF escape sequences in a string."""
-    # Common PDF escape sequences
-    s = s.replace('\\n', '\n')
-    s = s.replace('\\r', '\r')
-    s = s.replace('\\t', '\t')
-    s = s.replace('\\(', '(')
-    s = s.replace('\\)', ')')
-    s = s.replace('\\\\', '\\')
-    
-    # Decode octal sequences like \050 for '('
-    def octal_replace(match):
-        try:
-            return chr(int(match.group(1), 8))
-        except:
-            return match.group(0)
-    
-    s = re.sub(r'\\([0-7]{1,3})', octal_replace, s)
-    
-    # Remove non-printable characters except newlines/tabs
-    s = ''.join(c for c in s if c.isprintable() or c in '\n\t')
-    
-    return s
-
-
-def clean_resume_text(text: str) -> str:
-    """
-    Clean and normalize extracted resume text.
-    Removes artifacts and fixes common extraction issues.
-    """
-    if not text:
-        return ""
-    
-    # Remove FontAwesome / CID artifacts like (cid:123)
-    text = re.sub(r'\(cid:\d+\)', '', text)
-    text = re.sub(r'cid:\d+', '', text)
-    
-    # Remove other common PDF artifacts (Unicode private use area)
-    # Use actual Unicode characters, not raw string escapes
-    text = re.sub('[\uf000-\uf0ff]', '', text)  # FontAwesome icons range
-    text = re.sub('[\ue000-\uf8ff]', '', text)  # Full private use area
-    
-    # Normalize various bullet point styles to simple dash
-    bullet_patterns = ['•', '●', '○', '▪', '▫', '►', '▸', '◆', '◇', '■', '□', '★', '☆', '➤', '➢', '→', '»']
-    for bullet in bullet_patterns:
-        text = text.replace(bullet, '-')
-    
-    # Fix broken email addresses (user @ gmail . com -> user@gmail.com)
-    text = re.sub(r'(\w+)\s*@\s*(\w+)\s*\.\s*(\w+)', r'\1@\2.\3', text)
-    
-    # Fix broken URLs
-    text = re.sub(r'(https?)\s*:\s*/\s*/\s*', r'\1://', text)
-    
-    # Fix broken phone numbers with excessive spaces
-    text = re.sub(r'(\+?\d)\s+(\d)\s+(\d)\s+(\d)', r'\1\2\3\4', text)
-    
-    # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # Collapse multiple newlines to max 2
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # Collapse multiple spaces to single space
-    text = re.sub(r'[ \t]+', ' ', text)
-    
-    # Remove lines that are just whitespace
-    lines = [line.strip() for line in text.split('\n')]
-    lines = [line for line in lines if line]
-    
-    # Rejoin with newlines
-    text = '\n'.join(lines)
-    
-    # Remove any remaining non-printable characters except newlines/tabs
-    text = ''.join(c for c in text if c.isprintable() or c in '\n\t')
-    
-    return text.strip()
-
-
-def is_garbage_text(text: str) -> bool:
-    """Check if extracted text is garbage/unreadable."""
-    if not text or len(text) < 50:
-        return True
-    
-    # Check for CID artifacts (common in failed PDF extraction)
-    cid_count = len(re.findall(r'\(cid:\d+\)', text)) + len(re.findall(r'cid:\d+', text))
-    if cid_count > 10:
-        print(f"Found {cid_count} CID artifacts - likely garbage")
-        return True
-    
-    # Count readable ASCII characters (letters, numbers, common punctuation)
-    readable = sum(1 for c in text if c.isalnum() or c in ' .,;:!?@#$%&*()-_+=\n\t\'"/:')
-    ratio = readable / len(text) if text else 0
-    
-    # If less than 60% readable characters, it's likely garbage
-    if ratio < 0.6:
-        print(f"Readable ratio {ratio:.2f} < 0.6 - likely garbage")
-        return True
-    
-    # Check for common words that should appear in a resume
-    common_words = [
-        'experience', 'education', 'skills', 'work', 'project', 'email', 
-        'phone', 'address', 'university', 'degree', 'company', 'developer',
-        'engineer', 'manager', 'bachelor', 'master', 'year', 'resume', 'cv',
-        'summary', 'objective', 'professional', 'technical', 'software',
-        'programming', 'languages', 'certifications', 'achievements'
-    ]
-    text_lower = text.lower()
-    found_words = sum(1 for word in common_words if word in text_lower)
-    
-    # If very few common resume words found, likely garbage
-    if found_words < 2:
-        print(f"Found only {found_words} common resume words - likely garbage")
-        return True
-    
-    return False
-
-
-def extract_docx_text(path: str) -> str:
-    """Extract text from DOCX files."""
-    try:
-        with zipfile.ZipFile(path) as z:
-            xml = z.read("word/document.xml").decode("utf-8")
-        text = re.sub("<[^<]+?>", " ", xml)
-        text = re.sub(r"\s+", " ", text)
-        return clean_resume_text(text)
-    except Exception as e:
-        print(f"DOCX extraction error: {e}")
-        return ""
+    text = extract_clean_text(content, file_name, file_type)
+    if text:
+        print(f"Resume extraction successful: {len(text)} characters")
+    return text
 
 # =========================
 # RESUME PARSER (Regex-based)
@@ -24,6 +24,11 @@ import boto3
 
 from admin_password_crypto import decrypt_password_for_admin, encrypt_password_for_admin
 
+try:
+    import freelancer_search_index
+except ImportError:  # not bundled: blocked / deleted users stay in search until the next rebuild
+    freelancer_search_index = None
+
 USERS_TABLE = os.environ.get("USERS_TABLE", "Users")
 ALLOWED_ORIGIN = os.environ.get("ALLOWED_ORIGIN", "https://codexcareer.com")
 
@@ -129,7 +134,17 @@ def handle_update_user(body):
     if names:
         kwargs["ExpressionAttributeNames"] = names
 
-    table.update_item(**kwargs)
+    status_changed = "#s" in names
+    if status_changed:
+        kwargs["ReturnValues"] = "ALL_NEW"
+    result = table.update_item(**kwargs)
+
+    # Blocking / deleting drops the user's freelancer search postings, reactivating restores them
+    if status_changed and freelancer_search_index is not None:
+        try:
+            freelancer_search_index.index_user(result["Attributes"])
+        except Exception as e:
+            print(f"Freelancer search index update failed (non-fatal): {e}")
     return response(200, {"success": True, "message": "User updated", "userId": user_id})
 
 
@@ -3,7 +3,8 @@ Paginated read API for JobListings + optional per-user saved jobs (DynamoDB).
 
 GET query params:
   limit, offset — pagination (default limit 12)
-  all=1 — return full sorted list (cap with care)
+  cursor — opaque next_cursor from the previous page; preferred over offset
+  all=1 — return the full newest-first list (capped at JOBS_ALL_MAX, next_cursor if truncated)
   userId=<id> — when set, each job includes saved: true/false for that user
   saved_only=1 — only jobs this user saved (requires userId)
 
@@ -13,8 +14,22 @@ POST JSON body:
 
 Env:
   JOBS_TABLE (default JobListings)
+  JOBS_PARTITION_KEY (default id) — same as fetch_jobs_firecrawl
+  JOBS_FEED_INDEX (default feed-scraped_at-index)
   SAVED_JOBS_TABLE (default JobHuntSavedJobs) — partition key userId (String), sort key jobId (String)
 
+Feed index (GSI on JOBS_TABLE, projection ALL):
+  PK: feed       (string, always "jobs"; set by fetch_jobs_firecrawl.normalize_item)
+  SK: scraped_at (number)
+A page is one Query (newest first) of limit + 1 items, so page N costs O(limit)
+instead of a full scan + sort. next_cursor encodes the last item's key; offset
+without a cursor skips through the index keys. If the index does not exist yet
+the handler falls back to the scan path.
+
+Migration (run from lambda/):
+  python get_jobs_details.py           # dry run: index status + rows missing feed/scraped_at
+  python get_jobs_details.py --apply   # create the GSI and stamp existing rows
+
 API Gateway: enable GET, POST, OPTIONS on the same integration (or proxy all to this Lambda).
 """
 
@@ -28,12 +43,18 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional, Set
 
 import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
 
 TABLE_NAME = os.environ.get("JOBS_TABLE", "JobListings")
+JOBS_PARTITION_KEY = os.environ.get("JOBS_PARTITION_KEY", "id").strip() or "id"
+FEED_INDEX = os.environ.get("JOBS_FEED_INDEX", "feed-scraped_at-index")
+FEED_PARTITION = "jobs"  # keep in sync with fetch_jobs_firecrawl.JOBS_FEED_PARTITION
 SAVED_JOBS_TABLE_NAME = os.environ.get("SAVED_JOBS_TABLE", "JobHuntSavedJobs")
 DEFAULT_LIMIT = 12
 MAX_LIMIT = 100
+ALL_MAX_ITEMS = max(1, int(os.environ.get("JOBS_ALL_MAX", "1000")))
+TOTAL_CACHE_SECONDS = 300
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(TABLE_NAME)
@@ -123,6 +144,137 @@ def scan_all_job_items() -> List[Dict[str, Any]]:
     return items
 
 
+class CursorError(ValueError):
+    pass
+
+
+def _feed_key(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        JOBS_PARTITION_KEY: item[JOBS_PARTITION_KEY],
+        "feed": FEED_PARTITION,
+        "scraped_at": int(item["scraped_at"]),
+    }
+
+
+def encode_cursor(key: Dict[str, Any]) -> str:
+    raw = json.dumps(decimal_to_native(key), separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception as e:
+        raise CursorError("Invalid cursor") from e
+    if (
+        not isinstance(key, dict)
+        or set(key) != {JOBS_PARTITION_KEY, "feed", "scraped_at"}
+        or key.get("feed") != FEED_PARTITION
+        or not isinstance(key.get("scraped_at"), int)
+        or not isinstance(key.get(JOBS_PARTITION_KEY), str)
+    ):
+        raise CursorError("Invalid cursor")
+    return key
+
+
+def _is_missing_index_error(exc: ClientError) -> bool:
+    err = exc.response.get("Error", {})
+    return err.get("Code") in ("ValidationException", "ResourceNotFoundException") and "index" in (
+        err.get("Message") or ""
+    ).lower()
+
+
+def query_feed(
+    limit: int,
+    start_key: Optional[Dict[str, Any]] = None,
+    keys_only: bool = False,
+) -> tuple:
+    """
+    Up to `limit` jobs newest-first from the feed index, starting after
+    start_key. Returns (items, next_key); next_key is None at the end of the
+    feed. Reads limit + 1 items so has-more is exact.
+    """
+    items: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {
+        "IndexName": FEED_INDEX,
+        "KeyConditionExpression": Key("feed").eq(FEED_PARTITION),
+        "ScanIndexForward": False,
+    }
+    if keys_only:
+        kwargs["ProjectionExpression"] = "#pk, feed, scraped_at"
+        kwargs["ExpressionAttributeNames"] = {"#pk": JOBS_PARTITION_KEY}
+    if start_key:
+        kwargs["ExclusiveStartKey"] = start_key
+    while len(items) <= limit:
+        kwargs["Limit"] = limit + 1 - len(items)
+        res = table.query(**kwargs)
+        items.extend(res.get("Items", []))
+        lek = res.get("LastEvaluatedKey")
+        if not lek:
+            break
+        kwargs["ExclusiveStartKey"] = lek
+    if len(items) > limit:
+        items = items[:limit]
+        return items, _feed_key(items[-1])
+    return items, None
+
+
+def skip_feed(offset: int) -> tuple:
+    """
+    Key to resume after the first `offset` feed items (keys-only reads, no
+    sorting). Returns (start_key, exhausted).
+    """
+    start_key = None
+    remaining = offset
+    while remaining > 0:
+        batch, next_key = query_feed(min(remaining, 1000), start_key, keys_only=True)
+        remaining -= len(batch)
+        if remaining > 0 and next_key is None:
+            return None, True
+        start_key = next_key if remaining > 0 else _feed_key(batch[-1])
+    return start_key, False
+
+
+_total_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+
+
+def feed_total() -> Optional[int]:
+    """
+    Approximate feed size from DescribeTable (DynamoDB refreshes ItemCount
+    roughly every six hours), cached per container.
+    """
+    now = time.time()
+    if _total_cache["expires"] > now:
+        return _total_cache["value"]
+    value = None
+    try:
+        desc = table.meta.client.describe_table(TableName=table.name)["Table"]
+        for gsi in desc.get("GlobalSecondaryIndexes") or []:
+            if gsi.get("IndexName") == FEED_INDEX:
+                value = int(gsi.get("ItemCount") or 0)
+        if value is None:
+            value = int(desc.get("ItemCount") or 0)
+    except Exception as e:
+        print(f"describe_table for job total failed: {e}")
+    _total_cache.update(value=value, expires=now + TOTAL_CACHE_SECONDS)
+    return value
+
+
+def batch_get_jobs(job_ids: List[str]) -> List[Dict[str, Any]]:
+    """Fetch jobs by id with BatchGetItem (100 keys per call); missing ids are skipped."""
+    jobs: List[Dict[str, Any]] = []
+    for start in range(0, len(job_ids), 100):
+        request: Optional[Dict[str, Any]] = {
+            TABLE_NAME: {"Keys": [{JOBS_PARTITION_KEY: jid} for jid in job_ids[start:start + 100]]}
+        }
+        while request:
+            res = dynamodb.batch_get_item(RequestItems=request)
+            jobs.extend((res.get("Responses") or {}).get(TABLE_NAME, []))
+            request = res.get("UnprocessedKeys") or None
+    return jobs
+
+
 def fetch_saved_job_ids(user_id: str) -> Set[str]:
     out: Set[str] = set()
     kwargs: Dict[str, Any] = {
@@ -171,6 +323,78 @@ def handle_post(body: Dict[str, Any]) -> Dict[str, Any]:
     return response(200, {"success": True, "saved": False, "userId": user_id, "jobId": job_id})
 
 
+def _truthy(val: Any) -> bool:
+    return str(val or "").lower() in {"1", "true", "yes"}
+
+
+def _saved_only_page(
+    saved_ids: Set[str], limit: int, offset: int, fetch_all: bool
+) -> Dict[str, Any]:
+    """Saved jobs are a short per-user list: batch-get just those ids, newest first."""
+    saved = decimal_to_native(batch_get_jobs(sorted(saved_ids)))
+    saved.sort(key=sort_key_item, reverse=True)
+    total = len(saved)
+    page = saved if fetch_all else saved[offset : offset + limit]
+    for j in page:
+        j["saved"] = True
+    next_offset = offset + len(page)
+    return {
+        "jobs": page,
+        "total": total,
+        "limit": len(page) if fetch_all else limit,
+        "offset": 0 if fetch_all else offset,
+        "has_more": not fetch_all and next_offset < total,
+        "saved_count": len(saved_ids),
+    }
+
+
+def _feed_page(
+    limit: int, offset: int, cursor_key: Optional[Dict[str, Any]], fetch_all: bool
+) -> Dict[str, Any]:
+    if fetch_all:
+        page, next_key = query_feed(ALL_MAX_ITEMS)
+        offset = 0
+    else:
+        start_key = cursor_key
+        exhausted = False
+        if start_key is None and offset:
+            start_key, exhausted = skip_feed(offset)
+        page, next_key = ([], None) if exhausted else query_feed(limit, start_key)
+
+    has_more = next_key is not None
+    total = feed_total()
+    if not has_more and (cursor_key is None or offset):
+        # Last page reached by offset: the exact count is known
+        total = offset + len(page)
+    elif total is None or total < offset + len(page) + (1 if has_more else 0):
+        total = offset + len(page) + (1 if has_more else 0)
+    return {
+        "jobs": decimal_to_native(page),
+        "total": total,
+        "limit": len(page) if fetch_all else limit,
+        "offset": offset,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(next_key) if next_key else None,
+    }
+
+
+def _scan_page(limit: int, offset: int, fetch_all: bool) -> Dict[str, Any]:
+    """Legacy path (feed index not created yet): full scan + sort + slice."""
+    all_items = decimal_to_native(scan_all_job_items())
+    all_items.sort(key=sort_key_item, reverse=True)
+    total = len(all_items)
+    if fetch_all:
+        return {"jobs": all_items, "total": total, "limit": total, "offset": 0, "has_more": False}
+    page = all_items[offset : offset + limit]
+    return {
+        "jobs": page,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "has_more": offset + len(page) < total,
+    }
+
+
 def handle_get(params: Dict[str, str]) -> Dict[str, Any]:
     try:
         limit = int(params.get("limit", DEFAULT_LIMIT))
@@ -182,15 +406,20 @@ def handle_get(params: Dict[str, str]) -> Dict[str, Any]:
     except (TypeError, ValueError):
         offset = 0
     offset = max(0, offset)
-    fetch_all = str(params.get("all", "")).lower() in {"1", "true", "yes"}
+    fetch_all = _truthy(params.get("all"))
     user_id = str(params.get("userId") or "").strip()
-    saved_only = str(params.get("saved_only", "")).lower() in {"1", "true", "yes"}
+    saved_only = _truthy(params.get("saved_only"))
+    cursor = str(params.get("cursor") or "").strip()
 
     if saved_only and not user_id:
         return response(400, {"success": False, "error": "saved_only=1 requires userId"})
 
-    all_items = decimal_to_native(scan_all_job_items())
-    all_items.sort(key=sort_key_item, reverse=True)
+    cursor_key = None
+    if cursor and not saved_only and not fetch_all:
+        try:
+            cursor_key = decode_cursor(cursor)
+        except CursorError as e:
+            return response(400, {"success": False, "error": str(e)})
 
     saved_ids: Set[str] = set()
     if user_id:
@@ -206,70 +435,20 @@ def handle_get(params: Dict[str, str]) -> Dict[str, Any]:
             )
 
     if saved_only:
-        filtered = [j for j in all_items if job_listing_id(j) in saved_ids]
-        total = len(filtered)
-        if fetch_all:
-            page = filtered
-        else:
-            page = filtered[offset : offset + limit]
-        for j in page:
-            j["saved"] = True
-        next_offset = offset + len(page)
-        has_more = not fetch_all and next_offset < total
-        return response(
-            200,
-            {
-                "success": True,
-                "data": {
-                    "jobs": page,
-                    "total": total,
-                    "limit": len(page) if fetch_all else limit,
-                    "offset": 0 if fetch_all else offset,
-                    "has_more": has_more,
-                    "saved_count": len(saved_ids),
-                },
-            },
-        )
+        return response(200, {"success": True, "data": _saved_only_page(saved_ids, limit, offset, fetch_all)})
 
-    total = len(all_items)
-    if fetch_all:
-        page = all_items
-        if user_id:
-            attach_saved_flags(page, saved_ids)
-        return response(
-            200,
-            {
-                "success": True,
-                "data": {
-                    "jobs": page,
-                    "total": total,
-                    "limit": total,
-                    "offset": 0,
-                    "has_more": False,
-                    "saved_count": len(saved_ids) if user_id else None,
-                },
-            },
-        )
+    try:
+        data = _feed_page(limit, offset, cursor_key, fetch_all)
+    except ClientError as e:
+        if not _is_missing_index_error(e):
+            raise
+        print(f"Jobs feed index {FEED_INDEX} missing; falling back to scan (run get_jobs_details.py --apply)")
+        data = _scan_page(limit, offset, fetch_all)
 
-    page = all_items[offset : offset + limit]
     if user_id:
-        attach_saved_flags(page, saved_ids)
-    next_offset = offset + len(page)
-    has_more = next_offset < total
-    return response(
-        200,
-        {
-            "success": True,
-            "data": {
-                "jobs": page,
-                "total": total,
-                "limit": limit,
-                "offset": offset,
-                "has_more": has_more,
-                "saved_count": len(saved_ids) if user_id else None,
-            },
-        },
-    )
+        attach_saved_flags(data["jobs"], saved_ids)
+    data["saved_count"] = len(saved_ids) if user_id else None
+    return response(200, {"success": True, "data": data})
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -288,3 +467,65 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return response(405, {"success": False, "error": f"Method {method} not allowed"})
     except Exception as exc:
         return response(500, {"success": False, "error": str(exc)})
+
+
+# ---------- MIGRATION ----------
+def ensure_feed_index(apply: bool = False) -> str:
+    client = table.meta.client
+    desc = client.describe_table(TableName=table.name)["Table"]
+    for gsi in desc.get("GlobalSecondaryIndexes") or []:
+        if gsi["IndexName"] == FEED_INDEX:
+            return gsi.get("IndexStatus", "") + (" (backfilling)" if gsi.get("Backfilling") else "")
+    if not apply:
+        return "MISSING"
+    create: Dict[str, Any] = {
+        "IndexName": FEED_INDEX,
+        "KeySchema": [
+            {"AttributeName": "feed", "KeyType": "HASH"},
+            {"AttributeName": "scraped_at", "KeyType": "RANGE"},
+        ],
+        "Projection": {"ProjectionType": "ALL"},
+    }
+    if (desc.get("BillingModeSummary") or {}).get("BillingMode") != "PAY_PER_REQUEST":
+        create["ProvisionedThroughput"] = {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5}
+    client.update_table(
+        TableName=table.name,
+        AttributeDefinitions=[
+            {"AttributeName": "feed", "AttributeType": "S"},
+            {"AttributeName": "scraped_at", "AttributeType": "N"},
+        ],
+        GlobalSecondaryIndexUpdates=[{"Create": create}],
+    )
+    return "CREATING"
+
+
+def stamp_feed_attributes(apply: bool = False) -> int:
+    """Set feed (and scraped_at from created_at when missing) on rows written before the index."""
+    pending = 0
+    kwargs: Dict[str, Any] = {
+        "FilterExpression": Attr("feed").not_exists() | Attr("scraped_at").not_exists(),
+    }
+    while True:
+        res = table.scan(**kwargs)
+        for item in res.get("Items", []):
+            pending += 1
+            if apply:
+                table.update_item(
+                    Key={JOBS_PARTITION_KEY: item[JOBS_PARTITION_KEY]},
+                    UpdateExpression="SET feed = :feed, scraped_at = if_not_exists(scraped_at, :ts)",
+                    ExpressionAttributeValues={":feed": FEED_PARTITION, ":ts": sort_key_item(item)},
+                )
+        if not res.get("LastEvaluatedKey"):
+            return pending
+        kwargs["ExclusiveStartKey"] = res["LastEvaluatedKey"]
+
+
+if __name__ == "__main__":
+    import sys
+
+    apply_changes = "--apply" in sys.argv
+    print(f"{FEED_INDEX}: {ensure_feed_index(apply=apply_changes)}")
+    print(f"Rows missing feed/scraped_at: {stamp_feed_attributes(apply=apply_changes)}"
+          + (" (updated)" if apply_changes else ""))
+    if not apply_changes:
+        print("Dry run only. Re-run with --apply to make changes.")
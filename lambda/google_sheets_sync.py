@@ -16,23 +16,72 @@ Supports two integration modes (use one):
 
 Optional:
   GOOGLE_SHEET_TAB=UTM Signups
+  GOOGLE_SHEETS_QUEUE_URL — SQS queue (standard) for signup rows; unset = append inline
+  GOOGLE_SHEETS_FLUSH_SECONDS (default 0) — long-running processes only: buffer rows in a
+    SheetsSyncEngine thread and append them at most this long after the signup
+  GOOGLE_SHEETS_BATCH_SIZE (default 50) — engine: flush early once this many rows are buffered
+  GOOGLE_SHEETS_MAX_BUFFERED (default 1000) — engine: oldest rows are dropped beyond this
+    while Google is unreachable
+
+Signups call append_user_attribution_row. With GOOGLE_SHEETS_QUEUE_URL the row is sent to
+SQS (one SendMessage, so signup latency no longer includes Google) and lambda_handler, the
+queue's drainer, appends each SQS batch with one values:append call. A batch that fails is
+reported in batchItemFailures and redelivered by SQS; give the queue a DLQ. Without a queue
+the row is appended inside the request, as before.
+
+Do not set GOOGLE_SHEETS_FLUSH_SECONDS on Lambda: the engine thread is frozen when the
+handler returns and atexit never runs when a container is recycled, so buffered rows can be
+lost, or appended twice when a frozen append times out after the thaw.
+
+The service-account access token is cached until shortly before it expires (refreshed once
+on a 401) and the header row is checked once per container, so an append is one round trip
+instead of token + header + append. The nightly Utm_sheets_backfill Lambda
+(backfill_utm_users_to_sheets.lambda_handler, scheduled by deploy_admin_lambdas.sh) appends
+any attributed user still missing from the sheet, e.g. rows that ended up in the DLQ.
 """
+import atexit
 import json
 import os
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Any, Dict, Optional, Tuple
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     import jwt  # PyJWT — already used by login_handler
 except ImportError:
     jwt = None  # type: ignore
 
+# Optional AWS dependency (local dev may not have boto3 installed).
+try:
+    import boto3  # type: ignore
+except Exception:  # pragma: no cover
+    boto3 = None  # type: ignore
+
+try:
+    from http_client import urlopen as _urlopen  # keep-alive connections to Google
+except ImportError:
+    from urllib.request import urlopen as _urlopen
+
 GOOGLE_SHEETS_WEBAPP_URL = os.environ.get("GOOGLE_SHEETS_WEBAPP_URL", "").strip()
 GOOGLE_SHEET_ID = os.environ.get("GOOGLE_SHEET_ID", "").strip()
 GOOGLE_SHEET_TAB = os.environ.get("GOOGLE_SHEET_TAB", "Sheet1").strip()
+GOOGLE_SHEETS_QUEUE_URL = os.environ.get("GOOGLE_SHEETS_QUEUE_URL", "").strip()
+try:
+    FLUSH_SECONDS = max(0.0, float(os.environ.get("GOOGLE_SHEETS_FLUSH_SECONDS", "0")))
+except ValueError:
+    FLUSH_SECONDS = 0.0
+try:
+    BATCH_SIZE = max(1, int(os.environ.get("GOOGLE_SHEETS_BATCH_SIZE", "50")))
+except ValueError:
+    BATCH_SIZE = 50
+try:
+    MAX_BUFFERED = max(1, int(os.environ.get("GOOGLE_SHEETS_MAX_BUFFERED", "1000")))
+except ValueError:
+    MAX_BUFFERED = 1000
 
 SHEET_HEADER_ROW = [
     "Synced At",
@@ -80,6 +129,22 @@ GOOGLE_SERVICE_ACCOUNT_EMAIL, GOOGLE_SERVICE_ACCOUNT_PRIVATE_KEY = _load_service
 SHEETS_SCOPE = "https://www.googleapis.com/auth/spreadsheets"
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 SHEETS_API = "https://sheets.googleapis.com/v4/spreadsheets"
+# Tokens live 3600 s; refresh a little early so a flush never races the expiry
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+
+class GoogleSheetsHTTPError(RuntimeError):
+    def __init__(self, status: int, detail: str) -> None:
+        super().__init__(f"Google Sheets HTTP {status}: {detail}")
+        self.status = status
+
+
+class PartialAppendError(RuntimeError):
+    """The first `written` rows were appended before the write failed; retry only the rest."""
+
+    def __init__(self, written: int, cause: Exception) -> None:
+        super().__init__(f"{written} rows appended before: {cause}")
+        self.written = written
 
 
 def is_google_sheets_configured() -> bool:
@@ -126,14 +191,14 @@ def build_attribution_row(user: Dict[str, Any], signup_method: str) -> Dict[str,
 def _get_json(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     req = urllib.request.Request(url, headers=headers or {}, method="GET")
     try:
-        with urllib.request.urlopen(req, timeout=12) as resp:
+        with _urlopen(req, timeout=12) as resp:
             raw = resp.read().decode("utf-8")
             if not raw:
                 return {}
             return json.loads(raw)
     except urllib.error.HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"Google Sheets HTTP {exc.code}: {detail}") from exc
+        raise GoogleSheetsHTTPError(exc.code, detail) from exc
 
 
 def _put_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -148,14 +213,14 @@ def _put_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str
         method="PUT",
     )
     try:
-        with urllib.request.urlopen(req, timeout=12) as resp:
+        with _urlopen(req, timeout=12) as resp:
             raw = resp.read().decode("utf-8")
             if not raw:
                 return {"success": True}
             return json.loads(raw)
     except urllib.error.HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"Google Sheets HTTP {exc.code}: {detail}") from exc
+        raise GoogleSheetsHTTPError(exc.code, detail) from exc
 
 
 def _post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -170,115 +235,326 @@ def _post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, st
         method="POST",
     )
     try:
-        with urllib.request.urlopen(req, timeout=12) as resp:
+        with _urlopen(req, timeout=12) as resp:
             raw = resp.read().decode("utf-8")
             if not raw:
                 return {"success": True}
             return json.loads(raw)
     except urllib.error.HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"Google Sheets HTTP {exc.code}: {detail}") from exc
+        raise GoogleSheetsHTTPError(exc.code, detail) from exc
+
 
+_token_lock = threading.Lock()
+_cached_token: Optional[Tuple[str, float]] = None  # (access token, refresh after epoch seconds)
 
-def _get_service_account_token() -> str:
+
+def _get_service_account_token(force_refresh: bool = False) -> str:
+    """Access token for the service account, minted once and reused until near expiry."""
+    global _cached_token
     if jwt is None:
         raise RuntimeError("PyJWT is required for service-account Google Sheets sync")
 
-    now = int(time.time())
-    assertion = jwt.encode(
-        {
-            "iss": GOOGLE_SERVICE_ACCOUNT_EMAIL,
-            "scope": SHEETS_SCOPE,
-            "aud": TOKEN_URL,
-            "iat": now,
-            "exp": now + 3600,
-        },
-        GOOGLE_SERVICE_ACCOUNT_PRIVATE_KEY,
-        algorithm="RS256",
-    )
-
-    form = urllib.parse.urlencode(
-        {
-            "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
-            "assertion": assertion,
-        }
-    ).encode("utf-8")
+    with _token_lock:
+        if not force_refresh and _cached_token and _cached_token[1] > time.time():
+            return _cached_token[0]
+
+        now = int(time.time())
+        assertion = jwt.encode(
+            {
+                "iss": GOOGLE_SERVICE_ACCOUNT_EMAIL,
+                "scope": SHEETS_SCOPE,
+                "aud": TOKEN_URL,
+                "iat": now,
+                "exp": now + 3600,
+            },
+            GOOGLE_SERVICE_ACCOUNT_PRIVATE_KEY,
+            algorithm="RS256",
+        )
 
-    req = urllib.request.Request(
-        TOKEN_URL,
-        data=form,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=12) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
-    token = data.get("access_token")
-    if not token:
-        raise RuntimeError(f"Could not obtain Google access token: {data}")
-    return token
+        form = urllib.parse.urlencode(
+            {
+                "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                "assertion": assertion,
+            }
+        ).encode("utf-8")
+
+        req = urllib.request.Request(
+            TOKEN_URL,
+            data=form,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            method="POST",
+        )
+        with _urlopen(req, timeout=12) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+        token = data.get("access_token")
+        if not token:
+            raise RuntimeError(f"Could not obtain Google access token: {data}")
+        expires_in = int(data.get("expires_in") or 3600)
+        _cached_token = (token, now + max(60, expires_in - TOKEN_REFRESH_MARGIN_SECONDS))
+        return token
+
+
+# build_attribution_row keys in SHEET_HEADER_ROW column order
+_ROW_KEYS = (
+    "syncedAt",
+    "userId",
+    "email",
+    "signupMethod",
+    "status",
+    "createdBy",
+    "createdAt",
+    "utmSource",
+    "utmMedium",
+    "utmCampaign",
+    "utmTerm",
+    "utmContent",
+    "gclid",
+    "fbclid",
+    "landingPage",
+    "signupReferrer",
+    "attributionCapturedAt",
+)
 
 
 def _ordered_row_values(row: Dict[str, str]) -> list:
-    return [
-        row["syncedAt"],
-        row["userId"],
-        row["email"],
-        row["signupMethod"],
-        row["status"],
-        row["createdBy"],
-        row["createdAt"],
-        row["utmSource"],
-        row["utmMedium"],
-        row["utmCampaign"],
-        row["utmTerm"],
-        row["utmContent"],
-        row["gclid"],
-        row["fbclid"],
-        row["landingPage"],
-        row["signupReferrer"],
-        row["attributionCapturedAt"],
-    ]
+    return [row[key] for key in _ROW_KEYS]
+
+
+_header_verified: Optional[Tuple[str, str]] = None  # (sheet id, tab) whose header row is known good
 
 
 def _ensure_header_row(token: str) -> None:
+    global _header_verified
+    if _header_verified == (GOOGLE_SHEET_ID, GOOGLE_SHEET_TAB):
+        return
     header_range = urllib.parse.quote(f"{GOOGLE_SHEET_TAB}!A1:Q1")
     read_url = f"{SHEETS_API}/{GOOGLE_SHEET_ID}/values/{header_range}"
     data = _get_json(read_url, headers={"Authorization": f"Bearer {token}"})
     existing = (data.get("values") or [[]])[0] if data.get("values") else []
-    if existing[: len(SHEET_HEADER_ROW)] == SHEET_HEADER_ROW:
-        return
-    write_url = (
-        f"{SHEETS_API}/{GOOGLE_SHEET_ID}/values/{header_range}"
-        "?valueInputOption=USER_ENTERED"
-    )
-    _put_json(
-        write_url,
-        {"values": [SHEET_HEADER_ROW]},
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    if existing[: len(SHEET_HEADER_ROW)] != SHEET_HEADER_ROW:
+        write_url = (
+            f"{SHEETS_API}/{GOOGLE_SHEET_ID}/values/{header_range}"
+            "?valueInputOption=USER_ENTERED"
+        )
+        _put_json(
+            write_url,
+            {"values": [SHEET_HEADER_ROW]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    _header_verified = (GOOGLE_SHEET_ID, GOOGLE_SHEET_TAB)
 
 
-def _append_via_service_account(row: Dict[str, str]) -> None:
-    token = _get_service_account_token()
-    _ensure_header_row(token)
+def _append_via_service_account(rows: List[Dict[str, str]]) -> None:
+    """One values:append call for all rows; a rejected (expired / revoked) token is refreshed once."""
     range_name = urllib.parse.quote(f"{GOOGLE_SHEET_TAB}!A:Z")
     url = f"{SHEETS_API}/{GOOGLE_SHEET_ID}/values/{range_name}:append?valueInputOption=USER_ENTERED"
-
-    _post_json(
-        url,
-        {"values": [_ordered_row_values(row)]},
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    payload = {"values": [_ordered_row_values(row) for row in rows]}
+    for attempt in (1, 2):
+        token = _get_service_account_token(force_refresh=attempt == 2)
+        try:
+            _ensure_header_row(token)
+            _post_json(url, payload, headers={"Authorization": f"Bearer {token}"})
+            return
+        except GoogleSheetsHTTPError as exc:
+            if exc.status != 401 or attempt == 2:
+                raise
 
 
 def _append_via_webapp(row: Dict[str, str]) -> None:
     _post_json(GOOGLE_SHEETS_WEBAPP_URL, row)
 
 
+def append_attribution_rows(rows: List[Dict[str, str]]) -> None:
+    """
+    Write rows (build_attribution_row) now: one batched append, or one POST each for the web
+    app. When a web-app POST fails after earlier rows went through, PartialAppendError says
+    how many were written so callers do not append them again.
+    """
+    if not rows:
+        return
+    if GOOGLE_SHEETS_WEBAPP_URL:
+        for written, row in enumerate(rows):
+            try:
+                _append_via_webapp(row)
+            except Exception as exc:
+                if not written:
+                    raise
+                raise PartialAppendError(written, exc) from exc
+    else:
+        _append_via_service_account(rows)
+
+
+class SheetsSyncEngine:
+    """
+    Buffers attribution rows and appends them from a daemon thread: a flush happens once
+    `batch_size` rows are waiting or the oldest has waited `flush_seconds`. A failed flush
+    keeps the rows for the next attempt (backing off to at most a minute); beyond
+    `max_buffered` rows the oldest are dropped. For long-running processes only; Lambda
+    uses the SQS queue (see the module docstring).
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Dict[str, str]]], None] = append_attribution_rows,
+        *,
+        flush_seconds: float = FLUSH_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        max_buffered: int = MAX_BUFFERED,
+    ) -> None:
+        self._write = write
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self._rows: "deque[Tuple[float, Dict[str, str]]]" = deque(maxlen=max_buffered)
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._retry_at = 0.0
+        self._failures = 0
+        self.stats = {"buffered": 0, "written": 0, "flushes": 0, "failedFlushes": 0, "dropped": 0}
+
+    def submit(self, row: Dict[str, str]) -> None:
+        with self._cond:
+            if len(self._rows) == self._rows.maxlen:
+                self.stats["dropped"] += 1
+                print(f"google_sheets_sync: buffer full, dropping row for {self._rows[0][1].get('email')}")
+            self._rows.append((time.monotonic(), row))
+            self.stats["buffered"] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sheets-sync", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._rows)
+
+    def flush(self) -> bool:
+        """Write everything buffered now; True when nothing is left pending."""
+        with self._flush_lock:
+            with self._cond:
+                batch = list(self._rows)
+            if not batch:
+                return True
+            rows = [row for _, row in batch]
+            try:
+                self._write(rows)
+            except Exception as exc:
+                self._discard(batch[:getattr(exc, "written", 0)])
+                self._failures += 1
+                self.stats["failedFlushes"] += 1
+                self._retry_at = time.monotonic() + min(60.0, self.flush_seconds * 2 ** self._failures)
+                print(f"google_sheets_sync: flush of {len(rows)} rows failed: {exc}")
+                return False
+            self._discard(batch)
+            self._failures = 0
+            self._retry_at = 0.0
+            self.stats["flushes"] += 1
+            print(f"google_sheets_sync: appended {len(rows)} rows")
+            return self.pending() == 0
+
+    def _discard(self, written: "List[Tuple[float, Dict[str, str]]]") -> None:
+        """Remove rows that reached the sheet so a retry does not append them again."""
+        ids = {id(entry) for entry in written}
+        with self._cond:
+            # submit() only appends, so the written rows are still at the front (unless a full buffer dropped them)
+            while self._rows and id(self._rows[0]) in ids:
+                self._rows.popleft()
+        self.stats["written"] += len(written)
+
+    def _due_in(self) -> Optional[float]:
+        """Seconds until the next flush is due (<= 0: now), None when the buffer is empty."""
+        if not self._rows:
+            return None
+        now = time.monotonic()
+        due = self._rows[0][0] + self.flush_seconds
+        if len(self._rows) >= self.batch_size:
+            due = now
+        return max(due, self._retry_at) - now
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                wait = self._due_in()
+                while wait is None or wait > 0:
+                    self._cond.wait(timeout=wait)
+                    wait = self._due_in()
+            self.flush()
+
+
+_engine: Optional[SheetsSyncEngine] = None
+_engine_lock = threading.Lock()
+
+
+def _get_engine() -> SheetsSyncEngine:
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = SheetsSyncEngine()
+            atexit.register(_engine.flush)
+        return _engine
+
+
+_sqs_client: Any = None
+
+
+def _get_sqs() -> Any:
+    global _sqs_client
+    if _sqs_client is None:
+        if boto3 is None:
+            raise RuntimeError("boto3 is not available")
+        region = (os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "ap-south-2").strip()
+        _sqs_client = boto3.client("sqs", region_name=region)
+    return _sqs_client
+
+
+def enqueue_attribution_row(row: Dict[str, str]) -> None:
+    """Send one row (build_attribution_row) to GOOGLE_SHEETS_QUEUE_URL for the drainer."""
+    _get_sqs().send_message(QueueUrl=GOOGLE_SHEETS_QUEUE_URL, MessageBody=json.dumps(row))
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    SQS trigger (ReportBatchItemFailures): one values:append for the whole batch. When the
+    append fails the messages not yet written are returned so SQS redelivers them (all of
+    them for the Sheets API; those after the last successful POST for the web app).
+    Unreadable bodies are dropped.
+    """
+    message_ids: List[str] = []
+    rows: List[Dict[str, str]] = []
+    for record in event.get("Records") or []:
+        try:
+            row = json.loads(record.get("body") or "")
+        except json.JSONDecodeError:
+            print(f"google_sheets_sync: dropping unreadable message {record.get('messageId')}")
+            continue
+        if not isinstance(row, dict) or not row.get("userId"):
+            print(f"google_sheets_sync: dropping message {record.get('messageId')} without a row")
+            continue
+        message_ids.append(record["messageId"])
+        rows.append({key: str(row.get(key) or "") for key in _ROW_KEYS})
+    try:
+        append_attribution_rows(rows)
+    except Exception as exc:
+        unwritten = message_ids[getattr(exc, "written", 0):]
+        print(f"google_sheets_sync: append of {len(rows)} rows failed, returning {len(unwritten)} to SQS: {exc}")
+        return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in unwritten]}
+    print(f"google_sheets_sync: appended {len(rows)} rows")
+    return {"batchItemFailures": []}
+
+
+def flush_attribution_rows() -> bool:
+    """Append buffered rows now (scripts, tests); True when none are left pending."""
+    return _engine.flush() if _engine is not None else True
+
+
 def append_user_attribution_row(user: Dict[str, Any], signup_method: str) -> bool:
     """
-    Append one attribution row to Google Sheets.
-    Returns True on success, False if not configured or on non-fatal failure.
+    Send one attribution row to Google Sheets: through the SQS queue when
+    GOOGLE_SHEETS_QUEUE_URL is set (inline if SendMessage fails), buffered when
+    GOOGLE_SHEETS_FLUSH_SECONDS > 0, otherwise appended inline. Returns True when the row was
+    accepted (queued, buffered or written), False if not configured, the user has no
+    attribution, or the write failed.
     """
     if not is_google_sheets_configured():
         print("google_sheets_sync: not configured, skipping")
@@ -302,11 +578,17 @@ def append_user_attribution_row(user: Dict[str, Any], signup_method: str) -> boo
 
     row = build_attribution_row(user, signup_method)
 
+    if GOOGLE_SHEETS_QUEUE_URL:
+        try:
+            enqueue_attribution_row(row)
+            return True
+        except Exception as exc:
+            print(f"google_sheets_sync: enqueue failed, appending inline: {exc}")
+    elif FLUSH_SECONDS > 0:
+        _get_engine().submit(row)
+        return True
     try:
-        if GOOGLE_SHEETS_WEBAPP_URL:
-            _append_via_webapp(row)
-        else:
-            _append_via_service_account(row)
+        append_attribution_rows([row])
         print(f"google_sheets_sync: appended row for {row.get('email')}")
         return True
     except Exception as exc:
@@ -0,0 +1,365 @@
+"""
+Shared outbound HTTP(S) client for LLM / provider calls: per-host keep-alive connection
+pools, timeouts, retry with jitter and streamed responses, on the standard library only
+(http.client), so no extra dependency ships in the Lambda zips.
+
+urllib.request.urlopen opens a new TCP + TLS connection for every request. A warm
+container scoring résumés talks to the same few hosts (api.openai.com, openrouter.ai,
+api.anthropic.com, generativelanguage.googleapis.com, api.groq.com), so reusing one
+connection per host saves a handshake (one or two round trips plus TLS crypto) per call.
+
+urlopen(req, timeout=...) is a drop-in for urllib.request.urlopen with a Request object:
+- returns a context-managed response with .status, .headers, .read(amt), .read1(amt), .iter_lines()
+- raises urllib.error.HTTPError for non-2xx (with the body readable via .read()), and
+  urllib.error.URLError for connection failures, like urllib does
+- the connection goes back to its host pool once the body has been read to the end
+
+Retries:
+- idle pooled connections the server already closed are dropped at checkout; one that
+  fails while the request is being sent is retried at once on a fresh connection
+- connection failures before the request was sent (connect errors, a socket that dies on
+  send) and HTTP 429 / 502 / 503 / 504 are retried up to HTTP_RETRIES times with
+  exponential backoff and full jitter (Retry-After honoured), never sleeping past
+  HTTP_RETRY_MAX_SLEEP_SECONDS in total; these mean the request was not processed, so
+  POST is retried too
+- a connection lost after the request was sent (reset / disconnect while waiting for the
+  response) is retried only for idempotent methods: the provider may already have run a
+  POST completion, and retrying it would bill it twice
+- read timeouts are not retried
+
+Env (optional):
+- HTTP_POOL_MAX_IDLE_PER_HOST (default 4): idle connections kept per host
+- HTTP_POOL_IDLE_SECONDS (default 50): idle connections older than this are dropped
+  (providers close idle keep-alives after about 60 s)
+- HTTP_RETRIES (default 2), HTTP_RETRY_BASE_SECONDS (default 0.5),
+  HTTP_RETRY_MAX_SLEEP_SECONDS (default 4)
+"""
+
+from __future__ import annotations
+
+import email.message
+import http.client
+import io
+import os
+import random
+import select
+import socket
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+try:
+    MAX_IDLE_PER_HOST = max(0, int(os.environ.get("HTTP_POOL_MAX_IDLE_PER_HOST", "4")))
+except ValueError:
+    MAX_IDLE_PER_HOST = 4
+try:
+    POOL_IDLE_SECONDS = max(1.0, float(os.environ.get("HTTP_POOL_IDLE_SECONDS", "50")))
+except ValueError:
+    POOL_IDLE_SECONDS = 50.0
+try:
+    RETRIES = max(0, min(5, int(os.environ.get("HTTP_RETRIES", "2"))))
+except ValueError:
+    RETRIES = 2
+try:
+    RETRY_BASE_SECONDS = max(0.0, float(os.environ.get("HTTP_RETRY_BASE_SECONDS", "0.5")))
+except ValueError:
+    RETRY_BASE_SECONDS = 0.5
+try:
+    RETRY_MAX_SLEEP_SECONDS = max(0.0, float(os.environ.get("HTTP_RETRY_MAX_SLEEP_SECONDS", "4")))
+except ValueError:
+    RETRY_MAX_SLEEP_SECONDS = 4.0
+
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+# Unread bodies up to this size are drained on close() so the connection can be reused
+_DRAIN_MAX_BYTES = 256 * 1024
+
+_default_ssl_context: ssl.SSLContext | None = None
+_pools: dict[tuple, list] = {}  # (scheme, host, port, id(ssl ctx)) -> [(conn, idle_since), ...]
+_pools_lock = threading.Lock()
+_stats = {"requests": 0, "newConnections": 0, "reusedConnections": 0, "retries": 0}
+
+
+def _ssl_context() -> ssl.SSLContext:
+    global _default_ssl_context
+    if _default_ssl_context is None:
+        _default_ssl_context = ssl.create_default_context()
+    return _default_ssl_context
+
+
+def _pool_key(scheme: str, host: str, port: int, context) -> tuple:
+    return (scheme, host, port, id(context) if scheme == "https" else None)
+
+
+def _is_dropped(conn) -> bool:
+    """An idle keep-alive socket that is readable has been closed by the server (or is out of sync)."""
+    if conn.sock is None:
+        return False  # http.client reconnects on the next request
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _checkout(key: tuple):
+    now = time.monotonic()
+    with _pools_lock:
+        idle = _pools.get(key) or []
+        while idle:
+            conn, since = idle.pop()
+            if now - since <= POOL_IDLE_SECONDS and not _is_dropped(conn):
+                return conn
+            conn.close()
+    return None
+
+
+def _checkin(key: tuple, conn) -> None:
+    with _pools_lock:
+        idle = _pools.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
+def _new_connection(scheme: str, host: str, port: int, timeout: float, context):
+    with _pools_lock:
+        _stats["newConnections"] += 1
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout, context=context or _ssl_context())
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+class PooledResponse:
+    """Response on a pooled connection; returns the connection when the body is consumed or closed."""
+
+    def __init__(self, resp: http.client.HTTPResponse, conn, pool_key: tuple, url: str):
+        self._resp = resp
+        self._conn = conn
+        self._pool_key = pool_key
+        self.url = url
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.headers
+
+    # urllib.response compatibility
+    @property
+    def code(self) -> int:
+        return self.status
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def read(self, amt: int | None = None) -> bytes:
+        if self._resp is None:
+            return b""
+        try:
+            data = self._resp.read() if amt is None else self._resp.read(amt)
+        except BaseException:
+            self._release(reuse=False)
+            raise
+        if amt is None or self._resp.isclosed():
+            self._release(reuse=True)
+        return data
+
+    def read1(self, amt: int = 8192) -> bytes:
+        """Whatever is available (at most amt bytes) without waiting for more; b"" at the end."""
+        if self._resp is None:
+            return b""
+        try:
+            data = self._resp.read1(amt)
+        except BaseException:
+            self._release(reuse=False)
+            raise
+        if not data or self._resp.length == 0:
+            # read1 leaves a fully read Content-Length body open; read() completes the response
+            self._resp.read()
+        if self._resp.isclosed():
+            self._release(reuse=True)
+        return data
+
+    def iter_lines(self, chunk_size: int = 8192):
+        """Yield body lines (bytes, without line endings) as they arrive, e.g. for SSE streams."""
+        buf = b""
+        while True:
+            # read1: read(amt) would block until amt bytes arrived, holding back streamed events
+            chunk = self.read1(chunk_size)
+            if not chunk:
+                break
+            buf += chunk
+            *lines, buf = buf.split(b"\n")
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if buf:
+            yield buf.rstrip(b"\r")
+
+    def _release(self, reuse: bool) -> None:
+        resp, conn = self._resp, self._conn
+        self._resp = self._conn = None
+        if conn is None:
+            return
+        if reuse and resp is not None and resp.isclosed() and not resp.will_close:
+            _checkin(self._pool_key, conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        resp = self._resp
+        if resp is not None and not resp.isclosed() and resp.length is not None and resp.length <= _DRAIN_MAX_BYTES:
+            try:
+                resp.read()
+            except Exception:
+                pass
+        # A body left unread would desync the next request on this connection: drop it instead
+        self._release(reuse=resp is not None and resp.isclosed())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _retry_after_seconds(headers) -> float | None:
+    value = headers.get("Retry-After") if headers is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _backoff(attempt: int, retry_after: float | None, slept: float) -> float:
+    """Full-jitter exponential backoff, never past the remaining sleep budget."""
+    delay = retry_after if retry_after is not None else random.uniform(0, RETRY_BASE_SECONDS * (2 ** attempt))
+    return max(0.0, min(delay, RETRY_MAX_SLEEP_SECONDS - slept))
+
+
+def _http_error(url: str, resp: http.client.HTTPResponse, body: bytes) -> urllib.error.HTTPError:
+    hdrs = email.message.Message()
+    for k, v in resp.getheaders():
+        hdrs[k] = v
+    return urllib.error.HTTPError(url, resp.status, resp.reason, hdrs, io.BytesIO(body))
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    data: bytes | None = None,
+    headers: dict | None = None,
+    timeout: float = 60,
+    retries: int | None = None,
+    context: ssl.SSLContext | None = None,
+) -> PooledResponse:
+    """
+    One HTTP request over a pooled keep-alive connection (see module docstring).
+    Non-2xx raises urllib.error.HTTPError after retries; the caller reads / closes the response.
+    """
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        raise urllib.error.URLError(f"unsupported URL scheme: {scheme}")
+    host = parts.hostname or ""
+    port = parts.port or (443 if scheme == "https" else 80)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    key = _pool_key(scheme, host, port, context)
+    hdrs = {"Host": parts.netloc, "Accept-Encoding": "identity", "Connection": "keep-alive", **(headers or {})}
+    if data is not None:
+        hdrs.setdefault("Content-Length", str(len(data)))
+    max_retries = RETRIES if retries is None else retries
+
+    attempt = 0
+    slept = 0.0
+    with _pools_lock:
+        _stats["requests"] += 1
+    while True:
+        conn = _checkout(key)
+        reused = conn is not None
+        if conn is None:
+            conn = _new_connection(scheme, host, port, timeout, context)
+        else:
+            with _pools_lock:
+                _stats["reusedConnections"] += 1
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        sent = False
+        try:
+            conn.request(method, path, body=data, headers=hdrs)
+            sent = True
+            resp = conn.getresponse()
+        except (socket.timeout, TimeoutError) as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        except ssl.SSLCertVerificationError as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        except OSError as e:
+            conn.close()
+            if sent and method.upper() not in IDEMPOTENT_METHODS:
+                # Lost after the request went out: the server may already have processed it
+                raise urllib.error.URLError(e) from e
+            if reused:
+                # Stale keep-alive closed by the server: retry right away on a fresh connection
+                continue
+            if attempt >= max_retries:
+                raise urllib.error.URLError(e) from e
+            error: Exception = e
+            retry_after = None
+        else:
+            pooled = PooledResponse(resp, conn, key, url)
+            if 200 <= resp.status < 300:
+                return pooled
+            body = pooled.read()
+            if resp.status not in RETRY_STATUSES or attempt >= max_retries or slept >= RETRY_MAX_SLEEP_SECONDS:
+                raise _http_error(url, resp, body)
+            error = _http_error(url, resp, body)
+            retry_after = _retry_after_seconds(resp.headers)
+
+        delay = _backoff(attempt, retry_after, slept)
+        attempt += 1
+        with _pools_lock:
+            _stats["retries"] += 1
+        print(f"http_client: retry {attempt}/{max_retries} {host} after {delay:.2f}s ({error})")
+        time.sleep(delay)
+        slept += delay
+
+
+def urlopen(req, timeout: float = 60, *, retries: int | None = None, context: ssl.SSLContext | None = None):
+    """Drop-in for urllib.request.urlopen(Request | str, timeout=...) on pooled connections."""
+    if isinstance(req, str):
+        req = urllib.request.Request(req)
+    return request(
+        req.get_method(),
+        req.full_url,
+        data=req.data,
+        headers=dict(req.header_items()),
+        timeout=timeout,
+        retries=retries,
+        context=context,
+    )
+
+
+def pool_stats() -> dict:
+    with _pools_lock:
+        return {**_stats, "idle": sum(len(v) for v in _pools.values())}
+
+
+def close_all() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        for k in _stats:
+            _stats[k] = 0
+    for idle in pools:
+        for conn, _ in idle:
+            conn.close()
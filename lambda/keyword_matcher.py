@@ -0,0 +1,147 @@
+"""
+Keyword matching against résumé text, shared by the ATS scorer (refine_keyword_lists) and
+the Fix Resume engine (_already_present, JD relevance ranking).
+
+A KeywordIndex is built once per text: the lower-cased text and (on first use) its
+distinct word tokens and their stems. Keyword checks then cost set lookups plus memoised substring tests: a token
+shared by many keywords ("data", "management", ...) is searched once, and each synonym
+group is checked against the text at most once, instead of re-tokenising the résumé and
+scanning every synonym group per keyword token.
+
+Matching semantics are unchanged from the per-keyword code it replaces: phrase and token
+tests are substring tests on the lower-cased text, so "java" is covered by "javascript".
+A pure-Python character automaton (Aho-Corasick) over all keywords was measured slower
+than CPython's substring search for résumé-sized texts, so the index batches and memoises
+those searches instead.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+
+SYNONYM_GROUPS = (
+    ("communication", "communicating", "communicate", "communications"),
+    ("stakeholder", "stakeholders"),
+    ("analyze", "analytical", "analysis"),
+    ("machine learning", "ml"),
+    ("data science", "data scientist"),
+    ("predict", "predictive"),
+    ("collaborate", "collaboration", "collaborative"),
+)
+
+# word -> indexes of the synonym groups it belongs to
+_GROUPS_BY_WORD: dict[str, tuple[int, ...]] = {}
+for _i, _grp in enumerate(SYNONYM_GROUPS):
+    for _w in _grp:
+        _GROUPS_BY_WORD[_w] = _GROUPS_BY_WORD.get(_w, ()) + (_i,)
+
+_WORD_RE = re.compile(r"[a-z0-9+]{2,}")
+_PHRASE_SPLIT_RE = re.compile(r"[^\w+]+")
+_RELEVANCE_TOKEN_RE = re.compile(r"[a-z0-9+#.]{3,}")
+
+try:
+    INDEX_CACHE_ENTRIES = max(1, int(os.environ.get("KEYWORD_INDEX_CACHE_ENTRIES", "32")))
+except ValueError:
+    INDEX_CACHE_ENTRIES = 32
+
+
+def simple_stem(word: str) -> str:
+    w = word.lower()
+    if len(w) < 4:
+        return w
+    for suf in ("ing", "ed", "es", "tion", "sions", "ness"):
+        if w.endswith(suf) and len(w) > len(suf) + 2:
+            return w[: -len(suf)]
+    if w.endswith("s") and len(w) > 4:
+        return w[:-1]
+    return w
+
+
+def phrase_tokens(phrase: str, min_len: int = 2) -> list[str]:
+    return [t for t in _PHRASE_SPLIT_RE.split(phrase.lower()) if len(t) >= min_len]
+
+
+class KeywordIndex:
+    """Token / stem index of one text with memoised substring and synonym-group tests."""
+
+    __slots__ = ("text", "_stems", "_found", "_groups")
+
+    def __init__(self, text: str):
+        self.text = (text or "").lower()
+        self._stems: frozenset | None = None
+        self._found: dict = {}  # fragment or (check, phrase, ...) -> bool
+        self._groups: dict[int, bool] = {}
+
+    @property
+    def stems(self) -> frozenset:
+        """Distinct word tokens plus their simple_stem(); built on first use."""
+        if self._stems is None:
+            words = set(_WORD_RE.findall(self.text))
+            self._stems = frozenset(words | {simple_stem(w) for w in words})
+        return self._stems
+
+    def contains(self, fragment: str) -> bool:
+        """Substring test on the lower-cased text (fragment must already be lower-case)."""
+        hit = self._found.get(fragment)
+        if hit is None:
+            hit = self._found[fragment] = fragment in self.text
+        return hit
+
+    def _synonym_present(self, token: str) -> bool:
+        for gi in _GROUPS_BY_WORD.get(token, ()):
+            present = self._groups.get(gi)
+            if present is None:
+                present = self._groups[gi] = any(self.contains(s) for s in SYNONYM_GROUPS[gi])
+            if present:
+                return True
+        return False
+
+    def covers(self, phrase: str) -> bool:
+        """
+        True when the text covers the phrase: the whole phrase appears, or every token
+        (2+ chars) appears as written, by stem, or through its synonym group.
+        """
+        memo_key = ("covers", phrase)
+        hit = self._found.get(memo_key)
+        if hit is not None:
+            return hit
+        pl = phrase.lower().strip()
+        if not pl or self.contains(pl):
+            hit = True
+        else:
+            toks = phrase_tokens(pl)
+            hit = bool(toks) and all(
+                self.contains(tok) or simple_stem(tok) in self.stems or self._synonym_present(tok)
+                for tok in toks
+            )
+        self._found[memo_key] = hit
+        return hit
+
+    def has_all_tokens(self, phrase: str, min_len: int = 3) -> bool:
+        """True when the whole phrase, or every token of at least min_len chars, appears."""
+        memo_key = ("all", phrase, min_len)
+        hit = self._found.get(memo_key)
+        if hit is not None:
+            return hit
+        pl = phrase.strip().lower()
+        if not pl or self.contains(pl):
+            hit = True
+        else:
+            toks = phrase_tokens(pl, min_len)
+            hit = bool(toks) and all(self.contains(t) for t in toks)
+        self._found[memo_key] = hit
+        return hit
+
+
+@lru_cache(maxsize=INDEX_CACHE_ENTRIES)
+def index_for(text: str) -> KeywordIndex:
+    """Shared index per text (re-scoring the same résumé reuses it)."""
+    return KeywordIndex(text)
+
+
+@lru_cache(maxsize=512)
+def relevance_tokens(text: str) -> frozenset:
+    """Distinct 3+ char tokens ([a-z0-9+#.]) of the lower-cased text, for JD relevance overlap."""
+    return frozenset(_RELEVANCE_TOKEN_RE.findall((text or "").lower()))
@@ -0,0 +1,363 @@
+"""
+Sharded, XP-ordered leaderboard kept up to date on every progress write.
+
+Table: Leaderboard
+  PK: timeframe (string)  — e.g. "all"
+  SK: userId    (string)
+  Attributes:
+    lbShard  (string)  — "<timeframe>#<n>", spreads writes across N GSI partitions
+    xp       (number)  — total XP, GSI sort key
+    name, avatar, profilePicture, testsCompleted, avgScore, badges, level, updatedAt
+
+  GSI: lbShard-xp-index
+    PK: lbShard (string)
+    SK: xp      (number)
+
+Per-shard member counters live in the same table under userId "__count__#<n>".
+They carry no lbShard attribute, so they never appear in the (sparse) GSI.
+The same items hold a fixed-width XP histogram: attribute "b<i>" counts the
+shard's users whose XP falls in [i * width, (i + 1) * width). The last bucket
+is open-ended.
+
+backfill_from_progress() finishes by rebuilding the counters from the rows and
+writing the marker row userId "__backfill__".
+Until it exists the index only holds users whose progress changed since deploy, so
+read_histogram() reports backfilled=False and readers fall back to UserProgress.
+
+Page reads query the top `offset + limit` entries of every shard and k-way merge
+them, so a page costs O(shards * page) keys regardless of how many users exist.
+A user's exact rank is 1 + the number of entries with strictly more XP, answered
+with COUNT queries against the GSI instead of a full UserProgress scan + sort.
+For users outside the visible page, approximate_rank() answers "rank ~ N of M"
+and the percentile from the histogram in constant time.
+
+Usage in a handler:
+    from leaderboard_store import put_entry, read_page, rank_of
+    put_entry(leaderboard_table, user_id, progress)
+    entries = read_page(leaderboard_table, offset=0, limit=100)
+"""
+from __future__ import annotations
+
+import heapq
+import os
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from boto3.dynamodb.conditions import Key
+
+LEADERBOARD_SHARDS = max(1, int(os.environ.get("LEADERBOARD_SHARDS", "8")))
+LEADERBOARD_INDEX = os.environ.get("LEADERBOARD_INDEX", "lbShard-xp-index")
+DEFAULT_TIMEFRAME = "all"
+COUNTER_PREFIX = "__count__#"
+BACKFILL_MARKER = "__backfill__"
+HISTOGRAM_BUCKET_WIDTH = max(1, int(os.environ.get("LEADERBOARD_BUCKET_WIDTH", "100")))
+HISTOGRAM_MAX_BUCKETS = max(1, int(os.environ.get("LEADERBOARD_MAX_BUCKETS", "1000")))
+
+
+def _to_int(val: Any) -> int:
+    if isinstance(val, Decimal):
+        return int(val)
+    if isinstance(val, str):
+        return int(val) if val.isdigit() else 0
+    try:
+        return int(val or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(val: Any) -> float:
+    try:
+        return float(val or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def shard_for(user_id: str, shards: int = LEADERBOARD_SHARDS) -> int:
+    """Stable shard number for a user (crc32, so it survives container restarts)."""
+    return zlib.crc32(str(user_id).encode("utf-8")) % shards
+
+
+def shard_key(timeframe: str, shard: int) -> str:
+    return f"{timeframe}#{shard}"
+
+
+def bucket_for(xp: int) -> int:
+    return min(max(0, int(xp)) // HISTOGRAM_BUCKET_WIDTH, HISTOGRAM_MAX_BUCKETS - 1)
+
+
+def build_entry(user_id: str, progress: Dict[str, Any], timeframe: str = DEFAULT_TIMEFRAME) -> Dict[str, Any]:
+    """Convert a UserProgress item into a Leaderboard item (numbers normalised)."""
+    badges = progress.get("badges") or []
+    return {
+        "timeframe": timeframe,
+        "userId": user_id,
+        "lbShard": shard_key(timeframe, shard_for(user_id)),
+        "name": progress.get("name") or f"User {user_id[:8]}",
+        "avatar": progress.get("avatar") or "👤",
+        "profilePicture": progress.get("profilePicture"),
+        "xp": _to_int(progress.get("totalXP", 0)),
+        "testsCompleted": _to_int(progress.get("testsCompleted", 0)),
+        "avgScore": Decimal(str(round(_to_float(progress.get("avgScore", 0)), 2))),
+        "badges": len([b for b in badges if isinstance(b, dict) and b.get("earned", False)]),
+        "level": _to_int(progress.get("level", 1)) or 1,
+        "updatedAt": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def format_entry(item: Dict[str, Any], rank: int) -> Dict[str, Any]:
+    """Shape a Leaderboard item for the get_leaderboard response."""
+    return {
+        "rank": rank,
+        "userId": item.get("userId"),
+        "name": item.get("name", "User"),
+        "avatar": item.get("avatar", "👤"),
+        "profilePicture": item.get("profilePicture"),
+        "xp": _to_int(item.get("xp", 0)),
+        "testsCompleted": _to_int(item.get("testsCompleted", 0)),
+        "avgScore": _to_float(item.get("avgScore", 0)),
+        "badges": _to_int(item.get("badges", 0)),
+        "level": _to_int(item.get("level", 1)) or 1,
+    }
+
+
+def put_entry(table, user_id: str, progress: Dict[str, Any], timeframe: str = DEFAULT_TIMEFRAME) -> Dict[str, Any]:
+    """
+    Upsert the user's leaderboard row, then move the user between histogram
+    buckets (and bump the shard's member counter when the row is new) in a
+    single update so totals and approximate ranks never require a scan.
+    """
+    entry = build_entry(user_id, progress, timeframe)
+    if entry["testsCompleted"] <= 0:
+        return entry
+    entry = {k: v for k, v in entry.items() if v is not None}
+    result = table.put_item(Item=entry, ReturnValues="ALL_OLD")
+    old = result.get("Attributes")
+    new_bucket = bucket_for(entry["xp"])
+    values: Dict[str, Decimal] = {":one": Decimal("1")}
+    if not old:
+        expression = f"ADD members :one, b{new_bucket} :one"
+    else:
+        old_bucket = bucket_for(_to_int(old.get("xp", 0)))
+        if old_bucket == new_bucket:
+            return entry
+        expression = f"ADD b{new_bucket} :one, b{old_bucket} :minus"
+        values[":minus"] = Decimal("-1")
+    table.update_item(
+        Key={"timeframe": timeframe, "userId": f"{COUNTER_PREFIX}{shard_for(user_id)}"},
+        UpdateExpression=expression,
+        ExpressionAttributeValues=values,
+    )
+    return entry
+
+
+def _query_shard(table, timeframe: str, shard: int, limit: int) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    kwargs = {
+        "IndexName": LEADERBOARD_INDEX,
+        "KeyConditionExpression": Key("lbShard").eq(shard_key(timeframe, shard)),
+        "ScanIndexForward": False,
+        "Limit": limit,
+    }
+    while len(items) < limit:
+        result = table.query(**kwargs)
+        items.extend(result.get("Items", []))
+        last = result.get("LastEvaluatedKey")
+        if not last:
+            break
+        kwargs["ExclusiveStartKey"] = last
+        kwargs["Limit"] = limit - len(items)
+    return items[:limit]
+
+
+def read_page(table, offset: int = 0, limit: int = 100, timeframe: str = DEFAULT_TIMEFRAME) -> List[Dict[str, Any]]:
+    """Return ranked entries [offset, offset + limit) in XP-descending order."""
+    offset = max(0, int(offset))
+    limit = max(0, int(limit))
+    if limit == 0:
+        return []
+    depth = offset + limit
+    shard_lists = [
+        _query_shard(table, timeframe, shard, depth)
+        for shard in range(LEADERBOARD_SHARDS)
+    ]
+    merged = heapq.merge(*shard_lists, key=lambda item: -_to_int(item.get("xp", 0)))
+    page: List[Dict[str, Any]] = []
+    for i, item in enumerate(merged):
+        if i >= depth:
+            break
+        if i >= offset:
+            page.append(format_entry(item, i + 1))
+    return page
+
+
+def _read_counters(table, timeframe: str, with_marker: bool = False) -> List[Dict[str, Any]]:
+    keys = [
+        {"timeframe": timeframe, "userId": f"{COUNTER_PREFIX}{shard}"}
+        for shard in range(LEADERBOARD_SHARDS)
+    ]
+    if with_marker:
+        keys.append({"timeframe": timeframe, "userId": BACKFILL_MARKER})
+    result = table.meta.client.batch_get_item(RequestItems={table.name: {"Keys": keys}})
+    return (result.get("Responses") or {}).get(table.name, [])
+
+
+def read_histogram(table, timeframe: str = DEFAULT_TIMEFRAME) -> Dict[str, Any]:
+    """
+    Merge every shard's counters (one BatchGetItem, which also reads the backfill
+    marker) into {"total": M, "buckets": [count per bucket], "backfilled": bool}.
+    """
+    buckets = [0] * HISTOGRAM_MAX_BUCKETS
+    total = 0
+    backfilled = False
+    for row in _read_counters(table, timeframe, with_marker=True):
+        if row.get("userId") == BACKFILL_MARKER:
+            backfilled = True
+            continue
+        total += _to_int(row.get("members", 0))
+        for name, count in row.items():
+            if name.startswith("b") and name[1:].isdigit():
+                idx = int(name[1:])
+                if idx < HISTOGRAM_MAX_BUCKETS:
+                    buckets[idx] += _to_int(count)
+    return {"total": total, "buckets": buckets, "backfilled": backfilled}
+
+
+def total_members(table, timeframe: str = DEFAULT_TIMEFRAME) -> int:
+    """Sum the per-shard member counters (one BatchGetItem)."""
+    return sum(_to_int(r.get("members", 0)) for r in _read_counters(table, timeframe))
+
+
+def approximate_rank(histogram: Dict[str, Any], xp: int) -> Dict[str, Any]:
+    """
+    Estimate rank and percentile from the XP histogram. Users in higher buckets
+    are counted exactly; users sharing the bucket are assumed evenly spread, so
+    the error is bounded by that bucket's population.
+    """
+    buckets = histogram.get("buckets") or []
+    total = max(_to_int(histogram.get("total", 0)), 1)
+    idx = bucket_for(xp)
+    above = sum(buckets[idx + 1:])
+    in_bucket = buckets[idx] if idx < len(buckets) else 0
+    if idx < HISTOGRAM_MAX_BUCKETS - 1:
+        top = (idx + 1) * HISTOGRAM_BUCKET_WIDTH
+        fraction = min(1.0, max(0.0, (top - xp) / HISTOGRAM_BUCKET_WIDTH))
+    else:
+        fraction = 0.5
+    rank = min(total, 1 + above + int(max(0, in_bucket - 1) * fraction))
+    percentile = round(100.0 * (total - rank) / total, 1)
+    return {"rank": rank, "total": total, "percentile": percentile}
+
+
+def get_entry(table, user_id: str, timeframe: str = DEFAULT_TIMEFRAME) -> Optional[Dict[str, Any]]:
+    result = table.get_item(Key={"timeframe": timeframe, "userId": user_id})
+    return result.get("Item")
+
+
+def _count_above(table, timeframe: str, shard: int, xp: int) -> int:
+    count = 0
+    kwargs = {
+        "IndexName": LEADERBOARD_INDEX,
+        "KeyConditionExpression": Key("lbShard").eq(shard_key(timeframe, shard)) & Key("xp").gt(xp),
+        "Select": "COUNT",
+    }
+    while True:
+        result = table.query(**kwargs)
+        count += _to_int(result.get("Count", 0))
+        last = result.get("LastEvaluatedKey")
+        if not last:
+            return count
+        kwargs["ExclusiveStartKey"] = last
+
+
+def rank_of(table, user_id: str, timeframe: str = DEFAULT_TIMEFRAME) -> Optional[int]:
+    """
+    Competition rank (1 + users with strictly more XP). Reads only the keys above
+    the user in each shard's XP index; returns None if the user has no entry.
+    """
+    item = get_entry(table, user_id, timeframe)
+    if not item:
+        return None
+    xp = _to_int(item.get("xp", 0))
+    return 1 + sum(_count_above(table, timeframe, shard, xp) for shard in range(LEADERBOARD_SHARDS))
+
+
+def backfill_from_progress(progress_table, table, timeframe: str = DEFAULT_TIMEFRAME) -> int:
+    """
+    One-off migration: copy every UserProgress row with tests into the sharded
+    leaderboard, recompute the counters from the rows, then write the backfill
+    marker. Rows written by the legacy update_leaderboard() already exist, so
+    put_entry() would not count them; rebuild_counters() makes every row count
+    exactly once. Safe to re-run.
+    """
+    written = 0
+    kwargs: Dict[str, Any] = {}
+    while True:
+        result = progress_table.scan(**kwargs)
+        for progress in result.get("Items", []):
+            user_id = progress.get("userId")
+            if not user_id or _to_int(progress.get("testsCompleted", 0)) <= 0:
+                continue
+            put_entry(table, user_id, progress, timeframe)
+            written += 1
+        last = result.get("LastEvaluatedKey")
+        if not last:
+            rebuild_counters(table, timeframe)
+            mark_backfilled(table, timeframe)
+            return written
+        kwargs["ExclusiveStartKey"] = last
+
+
+def mark_backfilled(table, timeframe: str = DEFAULT_TIMEFRAME) -> None:
+    """Record that every UserProgress row has been copied; readers stop falling back."""
+    table.put_item(Item={
+        "timeframe": timeframe,
+        "userId": BACKFILL_MARKER,
+        "completedAt": datetime.utcnow().isoformat(),
+    })
+
+
+def rebuild_counters(table, timeframe: str = DEFAULT_TIMEFRAME) -> int:
+    """
+    Recompute member counters and histograms from the leaderboard rows and
+    overwrite the counter items. Run after changing the bucket width.
+    """
+    rows: Dict[int, Dict[str, Any]] = {}
+    kwargs: Dict[str, Any] = {"KeyConditionExpression": Key("timeframe").eq(timeframe)}
+    while True:
+        result = table.query(**kwargs)
+        for item in result.get("Items", []):
+            user_id = str(item.get("userId") or "")
+            if not user_id or user_id.startswith(COUNTER_PREFIX) or user_id == BACKFILL_MARKER:
+                continue
+            row = rows.setdefault(shard_for(user_id), {"members": 0})
+            row["members"] += 1
+            name = f"b{bucket_for(_to_int(item.get('xp', 0)))}"
+            row[name] = row.get(name, 0) + 1
+        last = result.get("LastEvaluatedKey")
+        if not last:
+            break
+        kwargs["ExclusiveStartKey"] = last
+    for shard in range(LEADERBOARD_SHARDS):
+        counts = rows.get(shard, {"members": 0})
+        table.put_item(Item={
+            "timeframe": timeframe,
+            "userId": f"{COUNTER_PREFIX}{shard}",
+            **{k: Decimal(v) for k, v in counts.items()},
+        })
+    return sum(r["members"] for r in rows.values())
+
+
+if __name__ == "__main__":
+    import sys
+    import boto3
+
+    region = os.environ.get("AWS_REGION") or os.environ.get("REGION") or "ap-south-2"
+    dynamodb = boto3.resource("dynamodb", region_name=region)
+    leaderboard = dynamodb.Table("Leaderboard")
+    if "--rebuild-counters" in sys.argv:
+        print(f"Rebuilt counters for {rebuild_counters(leaderboard)} leaderboard entries")
+    else:
+        count = backfill_from_progress(dynamodb.Table("UserProgress"), leaderboard)
+        print(f"Backfilled {count} leaderboard entries")
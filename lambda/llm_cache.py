@@ -0,0 +1,242 @@
+"""
+Response cache for LLM calls (ATS scoring, Fix Resume rendering / enhancement, portfolio
+enrichment). Re-submitting the same résumé and JD (double-clicks, retries, re-opened
+tabs) sends byte-identical prompts; those are answered from the cache instead of paying
+for and waiting on another completion.
+
+Key: SHA-256 of provider + model + call variant (system prompt / generation settings) +
+normalized prompt + a fingerprint of the API key, so one user's generated content is never
+served to another key. Normalization only drops formatting noise (CRLF, trailing spaces,
+runs of blank lines, outer whitespace), never words.
+
+Tiers: an in-container LRU with TTL, then an optional DynamoDB table shared by all
+containers. Only accepted responses are stored: non-empty, and passing the caller's
+accept() check (e.g. "parses as the JSON we asked for") so a malformed answer is retried
+on the next request instead of being replayed.
+
+Env (optional):
+- LLM_CACHE_ENTRIES (default 128): in-container entries (0 disables the memory tier)
+- LLM_CACHE_TTL_SECONDS (default 3600): lifetime of an entry in both tiers (0 disables caching)
+- LLM_CACHE_TABLE: DynamoDB table (partition key cacheKey: S; enable TTL on expiresAt).
+  Items hold generated résumé content, so keep the table private to these Lambdas.
+
+cache_stats() reports hits per tier, misses, hit rate and estimated saved tokens
+(~4 characters per token); every hit is also logged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+# Optional AWS dependency (local dev may not have boto3 installed).
+try:
+    import boto3  # type: ignore
+except Exception:  # pragma: no cover
+    boto3 = None  # type: ignore
+
+CACHE_VERSION = "1"
+try:
+    LLM_CACHE_ENTRIES = max(0, int(os.environ.get("LLM_CACHE_ENTRIES", "128")))
+except ValueError:
+    LLM_CACHE_ENTRIES = 128
+try:
+    LLM_CACHE_TTL_SECONDS = max(0, int(os.environ.get("LLM_CACHE_TTL_SECONDS", "3600")))
+except ValueError:
+    LLM_CACHE_TTL_SECONDS = 3600
+LLM_CACHE_TABLE = (os.environ.get("LLM_CACHE_TABLE") or "").strip()
+
+# DynamoDB items are capped at 400 KB; larger completions stay memory-only
+_MAX_DYNAMO_RESPONSE_BYTES = 350_000
+_CHARS_PER_TOKEN = 4
+
+_cache: "OrderedDict[str, dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {
+    "hits": 0,
+    "dynamoHits": 0,
+    "misses": 0,
+    "rejected": 0,
+    "dynamoErrors": 0,
+    "savedPromptTokens": 0,
+    "savedCompletionTokens": 0,
+}
+_table = None
+
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+\n")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def normalize_prompt(prompt: str) -> str:
+    text = (prompt or "").replace("\r\n", "\n").replace("\r", "\n")
+    text = _TRAILING_SPACE_RE.sub("\n", text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def cache_key(provider: str, model: str, prompt: str, variant: str = "", api_key: str = "") -> str:
+    key_fp = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+    material = json.dumps(
+        [CACHE_VERSION, (provider or "").lower(), model or "", variant or "", key_fp, normalize_prompt(prompt)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _estimate_tokens(text: str) -> int:
+    return (len(text or "") + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _get_table():
+    global _table
+    if _table is None and boto3 is not None and LLM_CACHE_TABLE:
+        region = (os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "ap-south-2").strip()
+        _table = boto3.resource("dynamodb", region_name=region).Table(LLM_CACHE_TABLE)
+    return _table
+
+
+def _dynamo_get(key: str) -> dict | None:
+    table = _get_table()
+    if table is None:
+        return None
+    try:
+        item = table.get_item(Key={"cacheKey": key}).get("Item")
+    except Exception as e:
+        _cache_stats["dynamoErrors"] += 1
+        print(f"LLM cache DynamoDB get failed: {e}")
+        return None
+    # TTL deletion is lazy, so expired items can still be returned for a while
+    if not item or int(item.get("expiresAt") or 0) <= time.time() or not isinstance(item.get("response"), str):
+        return None
+    return {"response": item["response"], "promptTokens": int(item.get("promptTokens") or 0),
+            "expiresAt": float(item["expiresAt"])}
+
+
+def _dynamo_put(key: str, entry: dict, provider: str, model: str) -> None:
+    table = _get_table()
+    if table is None or len(entry["response"].encode("utf-8")) > _MAX_DYNAMO_RESPONSE_BYTES:
+        return
+    try:
+        table.put_item(Item={
+            "cacheKey": key,
+            "response": entry["response"],
+            "promptTokens": entry["promptTokens"],
+            "provider": provider,
+            "model": model or "",
+            "expiresAt": int(entry["expiresAt"]),
+        })
+    except Exception as e:
+        _cache_stats["dynamoErrors"] += 1
+        print(f"LLM cache DynamoDB put failed: {e}")
+
+
+def _remember(key: str, entry: dict) -> None:
+    if LLM_CACHE_ENTRIES <= 0:
+        return
+    with _cache_lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > LLM_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _record_hit(tier: str, provider: str, entry: dict) -> None:
+    with _cache_lock:
+        _cache_stats["hits" if tier == "memory" else "dynamoHits"] += 1
+        _cache_stats["savedPromptTokens"] += entry["promptTokens"]
+        _cache_stats["savedCompletionTokens"] += _estimate_tokens(entry["response"])
+        stats = _stats_locked()
+    print(
+        f"LLM cache hit ({tier}) provider={provider}: saved ~{entry['promptTokens']}+"
+        f"{_estimate_tokens(entry['response'])} tokens; hit rate {stats['hitRate']:.0%} "
+        f"({stats['hits'] + stats['dynamoHits']}/{stats['lookups']})"
+    )
+
+
+def cached_completion(
+    provider: str,
+    model: str,
+    prompt: str,
+    call: Callable[[], str],
+    *,
+    variant: str = "",
+    api_key: str = "",
+    accept: Callable[[str], object] | None = None,
+) -> str:
+    """
+    Return call()'s completion for this prompt, from the cache when an identical request
+    was answered within LLM_CACHE_TTL_SECONDS. variant distinguishes call sites that send
+    the same prompt with different system prompts / generation settings. accept(response)
+    must return truthy (and not raise) for the response to be stored. Exceptions from
+    call() propagate and are never cached.
+    """
+    if LLM_CACHE_TTL_SECONDS <= 0 or (LLM_CACHE_ENTRIES <= 0 and not LLM_CACHE_TABLE):
+        return call()
+
+    key = cache_key(provider, model, prompt, variant, api_key)
+    now = time.time()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry["expiresAt"] <= now:
+            del _cache[key]
+            entry = None
+        if entry is not None:
+            _cache.move_to_end(key)
+    if entry is not None:
+        _record_hit("memory", provider, entry)
+        return entry["response"]
+
+    entry = _dynamo_get(key)
+    if entry is not None:
+        _remember(key, entry)
+        _record_hit("dynamodb", provider, entry)
+        return entry["response"]
+
+    with _cache_lock:
+        _cache_stats["misses"] += 1
+    response = call()
+    try:
+        ok = bool(response and response.strip()) and (accept is None or bool(accept(response)))
+    except Exception:
+        ok = False
+    if not ok:
+        with _cache_lock:
+            _cache_stats["rejected"] += 1
+        return response
+
+    entry = {
+        "response": response,
+        "promptTokens": _estimate_tokens(prompt),
+        "expiresAt": now + LLM_CACHE_TTL_SECONDS,
+    }
+    _remember(key, entry)
+    _dynamo_put(key, entry, provider, model)
+    return response
+
+
+def _stats_locked() -> dict:
+    hits = _cache_stats["hits"] + _cache_stats["dynamoHits"]
+    lookups = hits + _cache_stats["misses"]
+    return {
+        **_cache_stats,
+        "entries": len(_cache),
+        "lookups": lookups,
+        "hitRate": (hits / lookups) if lookups else 0.0,
+    }
+
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return _stats_locked()
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+        for k in _cache_stats:
+            _cache_stats[k] = 0
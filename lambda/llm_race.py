@@ -0,0 +1,209 @@
+"""
+Hedged execution across LLM providers.
+
+The ATS scorer used to try providers strictly one after another, so a slow
+or hanging first provider added its whole timeout (up to 90 s) to the
+request. race() starts the preferred provider, fires the next one if no
+valid answer arrived after HEDGE_DELAY_SECONDS, and returns the first answer
+that passes validate() (e.g. parses as JSON). A provider that fails starts
+its replacement immediately instead of waiting for the hedge delay.
+
+Per-provider latency and error rates are tracked in the warm container
+(EWMA) and drive rank(): providers that have been slow or failing lately
+move behind the ones that have been answering.
+
+Env:
+  LLM_HEDGE_DELAY_SECONDS   seconds before the backup fires (default 8);
+                            "off" / negative = strictly sequential fail-over
+  LLM_RACE_MAX_IN_FLIGHT    providers allowed to run at once (default 2)
+
+Hedging spends tokens on the user's backup key only when the first provider
+has not answered within the delay. Losing calls are not cancelled (urllib
+cannot be interrupted); they finish in the background and still feed the
+stats.
+
+Usage:
+    import llm_race
+    order = llm_race.rank(["openai", "claude", "gemini"])
+    result = llm_race.race([(name, lambda n=name: call(n)) for n in order], validate=json.loads)
+    result.provider, result.value
+
+Local benchmark with fake providers: python benchmarks/bench_llm_race.py
+"""
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def _env_delay(name: str, default: float) -> float:
+    raw = (os.environ.get(name) or "").strip().lower()
+    if not raw:
+        return default
+    if raw in ("off", "none", "inf"):
+        return math.inf
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return math.inf if value < 0 else value
+
+
+HEDGE_DELAY_SECONDS = _env_delay("LLM_HEDGE_DELAY_SECONDS", 8.0)
+try:
+    MAX_IN_FLIGHT = max(1, int(os.environ.get("LLM_RACE_MAX_IN_FLIGHT", "2")))
+except ValueError:
+    MAX_IN_FLIGHT = 2
+
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.3
+# Expected latency for a provider with no samples yet; keeps untried providers
+# behind ones known to be fast but ahead of ones known to be slow
+PRIOR_LATENCY_SECONDS = 10.0
+# A provider that errors half the time ranks as if it were (1 + 0.5 * N)x slower
+ERROR_PENALTY = 4.0
+
+
+@dataclass
+class ProviderStats:
+    calls: int = 0
+    errors: int = 0
+    latency: Optional[float] = None   # EWMA seconds over successful calls
+    error_rate: float = 0.0           # EWMA over all calls
+
+    def expected_seconds(self) -> float:
+        base = PRIOR_LATENCY_SECONDS if self.latency is None else self.latency
+        return base * (1.0 + ERROR_PENALTY * self.error_rate)
+
+
+@dataclass
+class RaceResult:
+    provider: str
+    value: Any
+    seconds: float
+    started: List[str] = field(default_factory=list)
+
+
+class AllProvidersFailed(Exception):
+    """Every provider errored or returned an invalid answer."""
+
+    def __init__(self, tried: List[str], errors: Dict[str, BaseException]):
+        self.tried = tried
+        self.errors = errors
+        self.last_error = list(errors.values())[-1] if errors else None
+        super().__init__(f"all providers failed: {', '.join(tried) or 'none'}")
+
+
+_stats: Dict[str, ProviderStats] = {}
+_stats_lock = threading.Lock()
+
+
+def record(provider: str, seconds: float, ok: bool) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(provider, ProviderStats())
+        stats.calls += 1
+        stats.error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - stats.error_rate)
+        if not ok:
+            stats.errors += 1
+        elif stats.latency is None:
+            stats.latency = seconds
+        else:
+            stats.latency += EWMA_ALPHA * (seconds - stats.latency)
+
+
+def rank(providers: Sequence[str]) -> List[str]:
+    """Providers ordered by expected time to a valid answer (ties keep the given order)."""
+    with _stats_lock:
+        expected = {p: (_stats.get(p) or ProviderStats()).expected_seconds() for p in providers}
+    return sorted(providers, key=lambda p: expected[p])
+
+
+def provider_stats() -> Dict[str, Dict[str, Any]]:
+    with _stats_lock:
+        return {
+            name: {
+                "calls": s.calls,
+                "errors": s.errors,
+                "latencySeconds": None if s.latency is None else round(s.latency, 3),
+                "errorRate": round(s.error_rate, 3),
+            }
+            for name, s in _stats.items()
+        }
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def _run(provider: str, fn: Callable[[], Any], validate: Optional[Callable[[Any], Any]]) -> Any:
+    start = time.perf_counter()
+    try:
+        value = fn()
+        if validate is not None:
+            value = validate(value)
+    except BaseException:
+        record(provider, time.perf_counter() - start, ok=False)
+        raise
+    record(provider, time.perf_counter() - start, ok=True)
+    return value
+
+
+def race(
+    calls: Sequence[Tuple[str, Callable[[], Any]]],
+    validate: Optional[Callable[[Any], Any]] = None,
+    hedge_delay: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
+) -> RaceResult:
+    """
+    Run calls in order with hedging and return the first validated answer.
+
+    validate(raw) returns the value to hand back or raises to reject the
+    answer, which then counts as that provider's error. Raises
+    AllProvidersFailed when no call produced a valid answer.
+    """
+    delay = HEDGE_DELAY_SECONDS if hedge_delay is None else hedge_delay
+    limit = MAX_IN_FLIGHT if max_in_flight is None else max(1, max_in_flight)
+    pending = list(calls)
+    started: List[str] = []
+    errors: Dict[str, BaseException] = {}
+    in_flight: Dict[Any, str] = {}
+    t0 = time.perf_counter()
+    if not pending:
+        raise AllProvidersFailed(started, errors)
+
+    executor = ThreadPoolExecutor(max_workers=min(limit, len(pending)))
+
+    def launch() -> None:
+        name, fn = pending.pop(0)
+        started.append(name)
+        in_flight[executor.submit(_run, name, fn, validate)] = name
+
+    try:
+        launch()
+        while in_flight:
+            can_hedge = bool(pending) and len(in_flight) < limit and math.isfinite(delay)
+            done, _ = wait(list(in_flight), timeout=delay if can_hedge else None, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+            for fut in done:
+                name = in_flight.pop(fut)
+                try:
+                    value = fut.result()
+                except Exception as e:
+                    errors[name] = e
+                    print(f"LLM race: {name} failed: {e}")
+                    continue
+                return RaceResult(provider=name, value=value, seconds=time.perf_counter() - t0, started=started)
+            # Fail over immediately rather than waiting out the hedge delay
+            while pending and len(in_flight) < limit:
+                launch()
+        raise AllProvidersFailed(started, errors)
+    finally:
+        executor.shutdown(wait=False)
@@ -0,0 +1,249 @@
+"""
+Incremental handling of streamed LLM completions (Fix Resume AI render).
+
+Providers stream completions as server-sent events; read_sse_text() turns the SSE body of
+an http_client response into the completion text, passing every text delta to on_delta as
+it arrives. The per-provider extractors (openai_text, anthropic_text, gemini_text) pull the
+delta out of one event and raise RuntimeError for in-stream errors.
+
+Two incremental parsers turn the growing completion into pieces that are complete and can
+be validated / shown before the model has finished:
+- JsonMemberStream: top-level members of a JSON object (e.g. "name", "contacts") and each
+  element of selected top-level arrays (e.g. every entry of "sections")
+- MarkupSplitter: markup split at boundary tags (e.g. each <div class="section-title">)
+
+Both tolerate arbitrary chunking (a delta may end mid-string, mid-escape or mid-tag) and
+text around the payload (code fences, preamble).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Callable, Iterator
+
+
+def iter_sse_data(resp) -> Iterator[str]:
+    """Yield the data payload of each SSE event (multi-line data joined); stops at [DONE]."""
+    data: list[str] = []
+    for raw in resp.iter_lines():
+        line = raw.decode("utf-8", errors="replace")
+        if not line:
+            if data:
+                payload = "\n".join(data)
+                data = []
+                if payload.strip() == "[DONE]":
+                    return
+                yield payload
+            continue
+        if line.startswith(":"):
+            continue  # comment / keep-alive (OpenRouter sends ": OPENROUTER PROCESSING")
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data and "\n".join(data).strip() != "[DONE]":
+        yield "\n".join(data)
+
+
+def _error_message(err) -> str:
+    return err.get("message", str(err)) if isinstance(err, dict) else str(err)
+
+
+def openai_text(event: dict) -> str:
+    """OpenAI / OpenRouter chat.completion.chunk."""
+    if event.get("error"):
+        raise RuntimeError(f"LLM stream error: {_error_message(event['error'])}")
+    choices = event.get("choices") or [{}]
+    return ((choices[0] or {}).get("delta") or {}).get("content") or ""
+
+
+def anthropic_text(event: dict) -> str:
+    """Anthropic Messages stream (content_block_delta events carry the text)."""
+    if event.get("type") == "error":
+        raise RuntimeError(f"Anthropic stream error: {_error_message(event.get('error'))}")
+    if event.get("type") == "content_block_delta":
+        return (event.get("delta") or {}).get("text") or ""
+    return ""
+
+
+def gemini_text(event: dict) -> str:
+    """Gemini streamGenerateContent?alt=sse (each event is a partial GenerateContentResponse)."""
+    if event.get("error"):
+        raise RuntimeError(f"Gemini API: {_error_message(event['error'])}")
+    cands = event.get("candidates") or []
+    if not cands:
+        br = (event.get("promptFeedback") or {}).get("blockReason")
+        if br:
+            raise RuntimeError(
+                f"Gemini returned no output (blocked or safety). blockReason={br}. "
+                "Try shorter JD/resume or another model."
+            )
+        return ""
+    return "".join(p.get("text") or "" for p in (cands[0].get("content") or {}).get("parts") or [])
+
+
+def read_sse_text(resp, extract: Callable[[dict], str], on_delta: Callable[[str], None]) -> str:
+    """Read a streamed completion to the end; returns the full text."""
+    parts: list[str] = []
+    for payload in iter_sse_data(resp):
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        text = extract(event)
+        if text:
+            parts.append(text)
+            on_delta(text)
+    return "".join(parts)
+
+
+class JsonMemberStream:
+    """
+    Incremental scanner for one streamed JSON object. feed() returns, in order:
+    - ("item", key, index, value) for each completed element of a top-level array in item_keys
+    - ("member", key, value) for each completed top-level member (arrays in item_keys included)
+    Values that fail to parse are skipped; the final document is still parsed as a whole by the caller.
+    """
+
+    def __init__(self, item_keys: tuple[str, ...] = ()):
+        self._item_keys = frozenset(item_keys)
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._started = False
+        self._done = False
+        self._in_str = False
+        self._esc = False
+        self._str_start = -1
+        self._last_str: str | None = None
+        self._key: str | None = None
+        self._value_start = -1
+        self._item_start = -1
+        self._expect_item = False
+        self._item_index = 0
+
+    def feed(self, text: str) -> list[tuple]:
+        self._buf += text
+        out: list[tuple] = []
+        buf = self._buf
+        i = self._pos
+        n = len(buf)
+        while i < n and not self._done:
+            ch = buf[i]
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                i += 1
+                continue
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+                    if self._depth == 1 and self._value_start < 0:
+                        try:
+                            self._last_str = json.loads(buf[self._str_start:i + 1])
+                        except ValueError:
+                            self._last_str = None
+                i += 1
+                continue
+            if ch == '"':
+                self._start_item(i)
+                self._in_str = True
+                self._str_start = i
+            elif ch in "{[":
+                self._start_item(i)
+                self._depth += 1
+                if self._depth == 2 and ch == "[" and self._key in self._item_keys:
+                    self._expect_item = True
+                    self._item_index = 0
+            elif ch in "}]":
+                if self._depth == 2:
+                    if self._item_start >= 0:
+                        self._emit_item(buf[self._item_start:i], out)
+                    self._expect_item = False
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit_member(buf[self._value_start:i], out)
+                    self._done = True
+            elif ch == ":" and self._depth == 1:
+                self._key = self._last_str
+                self._value_start = i + 1
+            elif ch == ",":
+                if self._depth == 1:
+                    self._emit_member(buf[self._value_start:i], out)
+                elif self._depth == 2 and self._key in self._item_keys:
+                    if self._item_start >= 0:
+                        self._emit_item(buf[self._item_start:i], out)
+                    self._expect_item = True
+            elif not ch.isspace():
+                self._start_item(i)
+            i += 1
+        self._pos = i
+        return out
+
+    def _start_item(self, i: int) -> None:
+        if self._expect_item and self._depth == 2:
+            self._item_start = i
+            self._expect_item = False
+
+    def _emit_item(self, raw: str, out: list) -> None:
+        self._item_start = -1
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = None
+        if value is not None:
+            out.append(("item", self._key, self._item_index, value))
+        self._item_index += 1
+
+    def _emit_member(self, raw: str, out: list) -> None:
+        key = self._key
+        self._key = None
+        self._value_start = -1
+        self._last_str = None
+        if key is None:
+            return
+        try:
+            out.append(("member", key, json.loads(raw)))
+        except ValueError:
+            pass
+
+
+class MarkupSplitter:
+    """
+    Splits streamed markup at boundary tags. feed() returns the chunks completed so far:
+    the prelude before the first boundary, then each boundary-to-next-boundary chunk.
+    close() returns the last (open) chunk once the stream has ended.
+    """
+
+    def __init__(self, boundary: re.Pattern):
+        self._boundary = boundary
+        self._buf = ""
+        self._chunk_start = 0
+        self._scan = 0
+        self._prelude_done = False
+
+    def feed(self, text: str) -> list[str]:
+        self._buf += text
+        out: list[str] = []
+        while True:
+            m = self._boundary.search(self._buf, self._scan)
+            if not m:
+                break
+            if m.start() > self._chunk_start or not self._prelude_done:
+                out.append(self._buf[self._chunk_start:m.start()])
+            self._prelude_done = True
+            self._chunk_start = m.start()
+            self._scan = m.end()
+        return out
+
+    def close(self) -> str:
+        tail = self._buf[self._chunk_start:]
+        self._chunk_start = len(self._buf)
+        return tail
@@ -8,6 +8,10 @@ Usage:
   python local_fix_resume_server.py
 
 Then set Vite proxy /dev-api/fix-resume -> http://localhost:9000
+
+Requests sent with "Accept: text/event-stream" get a server-sent event stream instead of one
+JSON body: an `event: partial` per AI render section as the LLM streams it (see
+resume_fix_engine on_partial), then `event: result` carrying the usual response body.
 """
 
 from __future__ import annotations
@@ -46,12 +50,43 @@ class Handler(BaseHTTPRequestHandler):
         out = lambda_handler(_event("OPTIONS", ""), None)
         self._send(int(out.get("statusCode") or 200), out.get("body") or "{}")
 
+    def _send_event(self, name: str, data: str) -> None:
+        self.wfile.write(f"event: {name}\ndata: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _stream(self, body_text: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Accel-Buffering", "no")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        def on_partial(ev: dict[str, Any]) -> None:
+            try:
+                self._send_event("partial", json.dumps(ev, ensure_ascii=False, default=str))
+            except OSError:
+                pass  # client went away; keep going so the result is still computed / cached
+
+        out = lambda_handler(_event("POST", body_text), None, on_partial=on_partial)
+        body = out.get("body") or "{}"
+        if not isinstance(body, str):
+            body = json.dumps(body, ensure_ascii=False, default=str)
+        try:
+            self._send_event("result", body)
+        except OSError:
+            pass
+
     def do_POST(self) -> None:  # noqa: N802
         # Accept /default/fix_resume_handler (matches Vite rewrite) and /fix
         length = int(self.headers.get("Content-Length") or "0")
         raw = self.rfile.read(length) if length > 0 else b""
         body_text = raw.decode("utf-8", errors="replace")
 
+        if "text/event-stream" in (self.headers.get("Accept") or ""):
+            self._stream(body_text)
+            return
+
         out = lambda_handler(_event("POST", body_text), None)
         status = int(out.get("statusCode") or 200)
         body = out.get("body") or "{}"
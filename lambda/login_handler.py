@@ -15,12 +15,22 @@ HTTP POST JSON body must include "action":
 Environment (this Lambda only):
   GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, ALLOWED_ORIGIN, ALLOWED_ORIGINS
   SMTP_USER, SMTP_APP_PASSWORD (Gmail App Password); optional SMTP_HOST, SMTP_PORT
+  EMAIL_OUTBOX_QUEUE_URL (optional) — verification / reset emails are queued for the
+    email_outbox drainer instead of being sent inside the request (see email_outbox.py)
+  GOOGLE_SHEET_ID + service account or GOOGLE_SHEETS_WEBAPP_URL (optional) — signup UTM
+    rows for Google Sheets; with GOOGLE_SHEETS_QUEUE_URL they are queued for the
+    Utm_sheets_sync drainer instead of appended inside the request (see google_sheets_sync.py)
 
 Also handles API Gateway custom authorizer invocations (event.type == "TOKEN") using the same
 GOOGLE_CLIENT_ID to validate Google ID tokens (Bearer).
 
 For best performance, include PyJWT + cryptography in the deployment package.
 If unavailable, verification falls back to Google's tokeninfo endpoint.
+
+Bundle user_lookup.py so email / Google lookups use the Users email-index and
+googleSub-index GSIs instead of table scans (create them once with
+`python user_lookup.py --apply`). Optional env: USERS_EMAIL_INDEX,
+USERS_GOOGLE_SUB_INDEX, USER_LOOKUP_CACHE_TTL.
 """
 import json
 import re
@@ -38,16 +48,17 @@ from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
 try:
-    from email_service import is_smtp_configured, send_email_verification, send_password_reset
+    from email_service import is_smtp_configured
+    from email_outbox import enqueue as enqueue_email, idempotency_key
 except ImportError:
     def is_smtp_configured():
         return False
 
-    def send_email_verification(*_args, **_kwargs):
-        raise RuntimeError("email_service module not available")
+    def enqueue_email(*_args, **_kwargs):
+        raise RuntimeError("email_service / email_outbox modules not available")
 
-    def send_password_reset(*_args, **_kwargs):
-        raise RuntimeError("email_service module not available")
+    def idempotency_key(kind, *parts):
+        return ":".join([kind, *[str(p) for p in parts]])
 from boto3.dynamodb.conditions import Key, Attr
 from decimal import Decimal
 
@@ -57,6 +68,11 @@ except ImportError:
     def check_rate_limit(*args, **kwargs):
         return None
 
+try:
+    import user_lookup
+except ImportError:
+    user_lookup = None  # falls back to Users scans
+
 try:
     from google_sheets_sync import append_user_attribution_row
 except ImportError:
@@ -253,13 +269,37 @@ def _build_reset_password_link(user_id: str, token: str) -> str:
     return f"{APP_BASE_URL}/reset-password?{query}"
 
 
+def _scan_user_by(attr: str, value: str):
+    """Legacy lookup when user_lookup.py is not bundled (paginates the scan)."""
+    kwargs = {"FilterExpression": Attr(attr).eq(value)}
+    while True:
+        result = table.scan(**kwargs)
+        if result.get("Items"):
+            return result["Items"][0]
+        if "LastEvaluatedKey" not in result:
+            return None
+        kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+
 def _get_user_by_email(email: str):
     if not email:
         return None
-    result = table.scan(FilterExpression=Attr("email").eq(email))
-    if result.get("Count", 0) > 0:
-        return result["Items"][0]
-    return None
+    if user_lookup is not None:
+        return user_lookup.get_user_by_email(table, email)
+    return _scan_user_by("email", email)
+
+
+def _get_user_by_google_sub(google_sub: str):
+    if not google_sub:
+        return None
+    if user_lookup is not None:
+        return user_lookup.get_user_by_google_sub(table, google_sub)
+    return _scan_user_by("googleSub", google_sub)
+
+
+def _remember_user(user_item: dict) -> None:
+    if user_lookup is not None:
+        user_lookup.remember(user_item)
 
 
 def _get_user_by_id(user_id: str):
@@ -302,7 +342,12 @@ def _issue_and_send_email_verification(user: dict) -> Tuple[bool, Optional[str]]
 
     verify_link = _build_verify_email_link(user["userId"], token)
     try:
-        send_email_verification(email, code, verify_link)
+        enqueue_email(
+            "email_verification",
+            email,
+            {"code": code, "verifyLink": verify_link},
+            key=idempotency_key("email_verification", user["userId"], token),
+        )
     except Exception as exc:
         print("send_email_verification failed:", str(exc))
         traceback.print_exc()
@@ -506,7 +551,12 @@ def _issue_and_send_password_reset(user: dict) -> Tuple[bool, Optional[str]]:
 
     reset_link = _build_reset_password_link(user["userId"], token)
     try:
-        send_password_reset(email, code, reset_link)
+        enqueue_email(
+            "password_reset",
+            email,
+            {"code": code, "resetLink": reset_link},
+            key=idempotency_key("password_reset", user["userId"], token),
+        )
     except Exception as exc:
         print("send_password_reset failed:", str(exc))
         traceback.print_exc()
@@ -906,6 +956,7 @@ def handle_signup(body):
         }
         _apply_attribution_to_user_item(user_item, _extract_attribution_from_body(body))
         table.put_item(Item=user_item)
+        _remember_user(user_item)
         _sync_attribution_to_google_sheets(user_item, "email")
 
     email_sent = False
@@ -947,11 +998,9 @@ def handle_login(body):
             }
         })
 
-    result = table.scan(
-        FilterExpression=Attr("email").eq(email)
-    )
+    user = _get_user_by_email(email)
 
-    if result["Count"] == 0:
+    if not user:
         return response(404, {
             "success": False,
             "error": {
@@ -960,8 +1009,6 @@ def handle_login(body):
             }
         })
 
-    user = result["Items"][0]
-
     if user.get("status") == "pending_verification":
         return response(403, {
             "success": False,
@@ -1207,13 +1254,7 @@ def _google_exchange_code(code: str, redirect_uri: str, code_verifier: str) -> d
 
 
 def _find_user_by_email_or_google_sub(email: str, google_sub: str):
-    r = table.scan(FilterExpression=Attr("email").eq(email))
-    if r.get("Count", 0) > 0:
-        return r["Items"][0]
-    r2 = table.scan(FilterExpression=Attr("googleSub").eq(google_sub))
-    if r2.get("Count", 0) > 0:
-        return r2["Items"][0]
-    return None
+    return _get_user_by_email(email) or _get_user_by_google_sub(google_sub)
 
 
 def handle_google_oauth_exchange(body):
@@ -1407,6 +1448,7 @@ def handle_google_oauth_exchange(body):
         }
         _apply_attribution_to_user_item(google_user_item, _extract_attribution_from_body(body))
         table.put_item(Item=google_user_item)
+        _remember_user(google_user_item)
         _sync_attribution_to_google_sheets(google_user_item, "google")
     except Exception as e:
         return response(500, {
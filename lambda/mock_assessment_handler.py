@@ -9,6 +9,8 @@ from decimal import Decimal
 import uuid
 import math
 
+import leaderboard_store
+
 # Initialize DynamoDB (explicit region for ap-south-2)
 REGION = os.environ.get('AWS_REGION') or os.environ.get('REGION') or 'ap-south-2'
 dynamodb = boto3.resource('dynamodb', region_name=REGION)
@@ -499,35 +501,9 @@ def submit_test_result(body):
 # UPDATE LEADERBOARD
 # ========================================
 def update_leaderboard(user_id, progress):
-    """Update leaderboard entries for user."""
+    """Update the sharded leaderboard entry for user."""
     try:
-        # Get user name (you might need to fetch from Users table)
-        user_name = f"User {user_id[:8]}"  # Placeholder
-        avatar = "👤"  # Placeholder
-        
-        xp = progress.get('totalXP', 0)
-        tests_completed = progress.get('testsCompleted', 0)
-        avg_score = progress.get('avgScore', 0)
-        badges_count = len([b for b in progress.get('badges', []) if b.get('earned', False)])
-        level = progress.get('level', 1)
-        
-        # Update for 'all' timeframe
-        leaderboard_item = {
-            'timeframe': 'all',
-            'userId': user_id,
-            'name': user_name,
-            'avatar': avatar,
-            'xp': xp,
-            'testsCompleted': tests_completed,
-            'avgScore': round(avg_score, 2),
-            'badges': badges_count,
-            'level': level,
-            'updatedAt': datetime.utcnow().isoformat() + 'Z'
-        }
-        
-        # Note: Rank will be calculated when querying
-        leaderboard_table.put_item(Item=leaderboard_item)
-        
+        leaderboard_store.put_entry(leaderboard_table, user_id, progress)
     except Exception as e:
         print(f"Error updating leaderboard: {str(e)}")
         # Don't fail the request if leaderboard update fails
@@ -713,12 +689,82 @@ def get_user_progress(body):
 # GET LEADERBOARD
 # ========================================
 def get_leaderboard(body):
-    """Get global leaderboard entries from all users."""
+    """Get global leaderboard entries from the sharded XP index."""
     try:
-        limit = body.get('limit', 100)
-        offset = body.get('offset', 0)
+        limit = int(body.get('limit', 100))
+        offset = int(body.get('offset', 0))
         user_id = body.get('userId')  # Optional, to highlight user's rank
-        
+        exact_rank = bool(body.get('exactRank'))  # Opt in to the O(rank) COUNT path
+
+        try:
+            histogram = leaderboard_store.read_histogram(leaderboard_table)
+        except Exception as e:
+            # Index table not provisioned yet: fall back to the full scan
+            print(f"Leaderboard index read failed, falling back to UserProgress scan: {str(e)}")
+            return _get_leaderboard_from_progress_scan(limit, offset, user_id)
+        if not histogram.get('backfilled'):
+            # Provisioned but the backfill has not finished: the index only has recently active users
+            print("Leaderboard index not backfilled yet, falling back to UserProgress scan")
+            return _get_leaderboard_from_progress_scan(limit, offset, user_id)
+        total = histogram['total']
+        try:
+            leaderboard = leaderboard_store.read_page(leaderboard_table, offset=offset, limit=limit)
+        except Exception as e:
+            # GSI missing or still building: fall back to the full scan
+            print(f"Leaderboard index read failed, falling back to UserProgress scan: {str(e)}")
+            return _get_leaderboard_from_progress_scan(limit, offset, user_id)
+
+        user_rank = None
+        user_percentile = None
+        rank_is_approximate = False
+        if user_id:
+            for entry in leaderboard:
+                if entry.get('userId') == user_id:
+                    user_rank = entry['rank']
+                    break
+            if user_rank is None:
+                try:
+                    if exact_rank:
+                        user_rank = leaderboard_store.rank_of(leaderboard_table, user_id)
+                    else:
+                        user_entry = leaderboard_store.get_entry(leaderboard_table, user_id)
+                        if user_entry:
+                            estimate = leaderboard_store.approximate_rank(histogram, user_entry.get('xp', 0))
+                            user_rank = estimate['rank']
+                            user_percentile = estimate['percentile']
+                            rank_is_approximate = True
+                except Exception as e:
+                    print(f"Error getting user rank: {str(e)}")
+            if user_rank is not None and user_percentile is None and total:
+                user_percentile = round(100.0 * (total - user_rank) / total, 1)
+
+        response_data = {
+            "leaderboard": leaderboard,
+            "total": total
+        }
+
+        if user_rank is not None:
+            response_data["userRank"] = user_rank
+            response_data["userRankApproximate"] = rank_is_approximate
+        if user_percentile is not None:
+            response_data["userPercentile"] = user_percentile
+
+        return response(200, {
+            "success": True,
+            "data": response_data
+        })
+
+    except Exception as e:
+        print(f"Error getting leaderboard: {str(e)}")
+        return response(500, {
+            "success": False,
+            "error": {"code": "INTERNAL_SERVER_ERROR", "message": "Failed to get leaderboard"}
+        })
+
+
+def _get_leaderboard_from_progress_scan(limit, offset, user_id):
+    """Legacy path: scan all UserProgress rows and rank them in memory."""
+    try:
         items = []
         
         # Always scan UserProgress table to get ALL users who have completed tests
@@ -769,7 +815,6 @@ def get_leaderboard(body):
                         'badges': len([b for b in progress.get('badges', []) if b.get('earned', False)]),
                         'level': progress.get('level', 1)
                     })
-                    print(f"Added user {progress.get('userId')[:8]} with {total_xp} XP")
         except Exception as e:
             print(f"UserProgress scan failed: {str(e)}")
             import traceback
@@ -1431,12 +1476,14 @@ AWS SETUP INSTRUCTIONS
    Table 2: UserProgress
    - Partition Key: userId (String)
    
-   Table 3: Leaderboard
+   Table 3: Leaderboard (see leaderboard_store.py)
    - Partition Key: timeframe (String)
-   - Sort Key: rank (Number)
-   - GSI1: userId-index
-     - Partition Key: userId (String)
+   - Sort Key: userId (String)
+   - GSI1: lbShard-xp-index
+     - Partition Key: lbShard (String)
      - Sort Key: xp (Number)
+   - Backfill once from UserProgress: python leaderboard_store.py
+     (get_leaderboard scans UserProgress until the backfill has written its marker row)
    
    Table 4: DailyChallenges
    - Partition Key: date (String, YYYY-MM-DD)
@@ -1477,7 +1524,8 @@ AWS SETUP INSTRUCTIONS
                    "dynamodb:PutItem",
                    "dynamodb:UpdateItem",
                    "dynamodb:Query",
-                   "dynamodb:Scan"
+                   "dynamodb:Scan",
+                   "dynamodb:BatchGetItem"
                ],
                "Resource": [
                    "arn:aws:dynamodb:REGION:ACCOUNT_ID:table/TestResults",
@@ -1544,8 +1592,12 @@ AWS SETUP INSTRUCTIONS
    Body: {
      "action": "get_leaderboard",
      "limit": 100,
-     "timeframe": "all"
+     "timeframe": "all",
+     "userId": "user123",
+     "exactRank": false
    }
+   -> off-page userRank comes from the XP histogram (userRankApproximate: true)
+      unless exactRank is set
    
    POST /mock-assessment
    Body: {
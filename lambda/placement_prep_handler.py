@@ -5,6 +5,11 @@ from decimal import Decimal
 import boto3
 from botocore.exceptions import ClientError
 
+try:
+    import catalog_cache
+except ImportError:
+    catalog_cache = None  # falls back to a scan per list request
+
 # ================= CONFIG =================
 REGION = "ap-south-2"
 PLACEMENT_PREP_TABLE = "PlacementPrep"
@@ -54,6 +59,11 @@ def parse_body(event):
         return {}
 
 
+def _invalidate():
+    if catalog_cache is not None:
+        catalog_cache.invalidate(placement_table.name)
+
+
 def get_path_parameter(event, param_name):
     """Get path parameter from event"""
     path_params = event.get("pathParameters") or {}
@@ -119,8 +129,10 @@ def handle_get_all():
     try:
         # Scan table and filter by type="phase" (optional, if table is shared)
         # For now assuming table is dedicated or we just return everything that looks like a phase
-        result = placement_table.scan()
-        items = result.get("Items", [])
+        if catalog_cache is not None:
+            items = catalog_cache.get_table_items(placement_table)
+        else:
+            items = placement_table.scan().get("Items", [])
         
         # Filter for phases if necessary (based on presence of 'year' or 'type')
         phases = [item for item in items if item.get("type") == "phase" or "year" in item]
@@ -183,6 +195,7 @@ def handle_bulk_put(phases: list):
             for item in existing_phases:
                 if item["id"] not in incoming_ids:
                     batch.delete_item(Key={"id": item["id"]})
+        _invalidate()
 
         return response(200, {
             "success": True,
@@ -199,6 +212,7 @@ def handle_bulk_put(phases: list):
 def handle_delete(item_id: str):
     try:
         placement_table.delete_item(Key={"id": item_id})
+        _invalidate()
         return response(200, {"success": True, "message": "Deleted successfully"})
     except Exception as e:
         return response(500, {"success": False, "error": str(e)})
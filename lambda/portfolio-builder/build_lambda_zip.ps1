@@ -11,9 +11,9 @@ if (Test-Path $Pkg) { Remove-Item $Pkg -Recurse -Force }
 New-Item -ItemType Directory -Path $Pkg | Out-Null
 
 Write-Host "Installing PDF libs for Lambda Python 3.12 (Linux x86_64)..."
-# PyPDF2 + pdfminer.six only (boto3 is in the Lambda runtime; skip pdfplumber/Pillow to keep zip small)
+# requirements.txt: PyPDF2 + pdfminer.six only (boto3 is in the Lambda runtime; PyMuPDF is optional and large)
 python -m pip install `
-  PyPDF2 pdfminer.six `
+  -r (Join-Path $PSScriptRoot "requirements.txt") `
   -t $Pkg `
   --platform manylinux2014_x86_64 `
   --python-version 3.12 `
@@ -31,7 +31,9 @@ foreach ($f in $files) {
   Copy-Item (Join-Path $PSScriptRoot $f) $Pkg
 }
 Copy-Item (Join-Path $Root "feature_entitlement.py") $Pkg
-Copy-Item (Join-Path $Root "resume_text_extract.py") $Pkg -ErrorAction SilentlyContinue
+Copy-Item (Join-Path $Root "resume_text_extract.py") $Pkg
+Copy-Item (Join-Path $Root "llm_cache.py") $Pkg
+Copy-Item (Join-Path $Root "http_client.py") $Pkg
 Copy-Item (Join-Path $PSScriptRoot "templates") (Join-Path $Pkg "templates") -Recurse
 
 Write-Host "Creating zip..."
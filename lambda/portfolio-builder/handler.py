@@ -18,7 +18,7 @@ from typing import Any, Dict
 # Parent lambda/ for shared feature_entitlement
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from feature_entitlement import check_entitlement_or_error, consume_feature_use
+from feature_entitlement import EntitlementContext, check_entitlement_or_error, consume_feature_use
 
 from history import delete_portfolio_from_history, get_portfolio_history, save_portfolio_to_history
 from llm_enrich import enrich_resume_to_portfolio
@@ -165,8 +165,10 @@ def handle_preview(body: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, A
 
 def handle_deploy(body: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
     user_id = body.get("userId", f"user_{int(datetime.now().timestamp())}")
+    ent_ctx = None
     if user_id and not str(user_id).startswith("user_"):
-        allowed, ent_err = check_entitlement_or_error(str(user_id).strip(), "portfolio")
+        ent_ctx = EntitlementContext(str(user_id).strip())
+        allowed, ent_err = check_entitlement_or_error(str(user_id).strip(), "portfolio", ctx=ent_ctx)
         if not allowed:
             return _err(headers, ent_err or "Trial limit reached")
 
@@ -196,7 +198,7 @@ def handle_deploy(body: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, An
     )
 
     if user_id and not str(user_id).startswith("user_"):
-        consume_feature_use(str(user_id).strip(), "portfolio")
+        consume_feature_use(str(user_id).strip(), "portfolio", ctx=ent_ctx)
 
     return _ok(
         headers,
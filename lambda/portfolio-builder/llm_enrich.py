@@ -9,6 +9,8 @@ import urllib.error
 import urllib.request
 from typing import Any, Dict, Optional, Tuple
 
+import http_client
+import llm_cache
 from regex_fallback import extract_portfolio_data
 
 OPENROUTER_DEFAULT_MODEL = (os.environ.get("OPENROUTER_DEFAULT_MODEL") or "openai/gpt-4o-mini").strip()
@@ -175,6 +177,14 @@ def _normalize_portfolio_data(data: Dict[str, Any], user_email: str) -> Dict[str
 
 
 def _call_llm(provider: str, api_key: str, prompt: str, model: str) -> str:
+    """Provider call through the shared LLM response cache (only parseable portfolio JSON is cached)."""
+    return llm_cache.cached_completion(
+        provider, model, prompt, lambda: _request_llm(provider, api_key, prompt, model),
+        variant="portfolio", api_key=api_key, accept=_parse_llm_json,
+    )
+
+
+def _request_llm(provider: str, api_key: str, prompt: str, model: str) -> str:
     if provider == "openai":
         return _call_openai(api_key, prompt, model or "gpt-4o-mini")
     if provider == "openrouter":
@@ -282,7 +292,7 @@ def _post_json(url: str, payload: dict, headers: dict, extract, timeout: int = 9
         headers=headers,
         method="POST",
     )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
+    with http_client.urlopen(req, timeout=timeout) as resp:
         out = json.loads(resp.read().decode("utf-8"))
     err = out.get("error")
     if err:
@@ -1,258 +0,0 @@
-_std_encoding = [
-    "\x00",
-    "\x01",
-    "\x02",
-    "\x03",
-    "\x04",
-    "\x05",
-    "\x06",
-    "\x07",
-    "\x08",
-    "\t",
-    "\n",
-    "\x0b",
-    "\x0c",
-    "\r",
-    "\x0e",
-    "\x0f",
-    "\x10",
-    "\x11",
-    "\x12",
-    "\x13",
-    "\x14",
-    "\x15",
-    "\x16",
-    "\x17",
-    "\x18",
-    "\x19",
-    "\x1a",
-    "\x1b",
-    "\x1c",
-    "\x1d",
-    "\x1e",
-    "\x1f",
-    " ",
-    "!",
-    '"',
-    "#",
-    "$",
-    "%",
-    "&",
-    "’",
-    "(",
-    ")",
-    "*",
-    "+",
-    ",",
-    "-",
-    ".",
-    "/",
-    "0",
-    "1",
-    "2",
-    "3",
-    "4",
-    "5",
-    "6",
-    "7",
-    "8",
-    "9",
-    ":",
-    ";",
-    "<",
-    "=",
-    ">",
-    "?",
-    "@",
-    "A",
-    "B",
-    "C",
-    "D",
-    "E",
-    "F",
-    "G",
-    "H",
-    "I",
-    "J",
-    "K",
-    "L",
-    "M",
-    "N",
-    "O",
-    "P",
-    "Q",
-    "R",
-    "S",
-    "T",
-    "U",
-    "V",
-    "W",
-    "X",
-    "Y",
-    "Z",
-    "[",
-    "\\",
-    "]",
-    "^",
-    "_",
-    "‘",
-    "a",
-    "b",
-    "c",
-    "d",
-    "e",
-    "f",
-    "g",
-    "h",
-    "i",
-    "j",
-    "k",
-    "l",
-    "m",
-    "n",
-    "o",
-    "p",
-    "q",
-    "r",
-    "s",
-    "t",
-    "u",
-    "v",
-    "w",
-    "x",
-    "y",
-    "z",
-    "{",
-    "|",
-    "}",
-    "~",
-    "\x7f",
-    "\x80",
-    "\x81",
-    "\x82",
-    "\x83",
-    "\x84",
-    "\x85",
-    "\x86",
-    "\x87",
-    "\x88",
-    "\x89",
-    "\x8a",
-    "\x8b",
-    "\x8c",
-    "\x8d",
-    "\x8e",
-    "\x8f",
-    "\x90",
-    "\x91",
-    "\x92",
-    "\x93",
-    "\x94",
-    "\x95",
-    "\x96",
-    "\x97",
-    "\x98",
-    "\x99",
-    "\x9a",
-    "\x9b",
-    "\x9c",
-    "\x9d",
-    "\x9e",
-    "\x9f",
-    "\xa0",
-    "¡",
-    "¢",
-    "£",
-    "⁄",
-    "¥",
-    "ƒ",
-    "§",
-    "¤",
-    "'",
-    "“",
-    "«",
-    "‹",
-    "›",
-    "ﬁ",
-    "ﬂ",
-    "°",
-    "–",
-    "†",
-    "‡",
-    "·",
-    "µ",
-    "¶",
-    "•",
-    "‚",
-    "„",
-    "”",
-    "»",
-    "…",
-    "‰",
-    "¾",
-    "¿",
-    "À",
-    "`",
-    "´",
-    "ˆ",
-    "˜",
-    "¯",
-    "˘",
-    "˙",
-    "¨",
-    "É",
-    "˚",
-    "¸",
-    "Ì",
-    "˝",
-    "˛",
-    "ˇ",
-    "—",
-    "Ñ",
-    "Ò",
-    "Ó",
-    "Ô",
-    "Õ",
-    "Ö",
-    "×",
-    "Ø",
-    "Ù",
-    "Ú",
-    "Û",
-    "Ü",
-    "Ý",
-    "Þ",
-    "ß",
-    "à",
-    "Æ",
-    "â",
-    "ª",
-    "ä",
-    "å",
-    "æ",
-    "ç",
-    "Ł",
-    "Ø",
-    "Œ",
-    "º",
-    "ì",
-    "í",
-    "î",
-    "ï",
-    "ð",
-    "æ",
-    "ò",
-    "ó",
-    "ô",
-    "ı",
-    "ö",
-    "÷",
-    "ł",
-    "ø",
-    "œ",
-    "ß",
-    "ü",
-    "ý",
-    "þ",
-    "ÿ",
-]
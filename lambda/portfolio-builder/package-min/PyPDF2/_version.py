@@ -1 +0,0 @@
-__version__ = "3.0.1"
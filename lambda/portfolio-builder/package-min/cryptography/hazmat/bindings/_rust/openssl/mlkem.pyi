@@ -1,18 +0,0 @@
-# This file is dual licensed under the terms of the Apache License, Version
-# 2.0, and the BSD License. See the LICENSE file in the root of this repository
-# for complete details.
-
-from cryptography.hazmat.primitives.asymmetric import mlkem
-from cryptography.utils import Buffer
-
-class MLKEM768PrivateKey: ...
-class MLKEM768PublicKey: ...
-class MLKEM1024PrivateKey: ...
-class MLKEM1024PublicKey: ...
-
-def generate_mlkem768_key() -> mlkem.MLKEM768PrivateKey: ...
-def from_mlkem768_seed_bytes(data: Buffer) -> mlkem.MLKEM768PrivateKey: ...
-def from_mlkem768_public_bytes(data: Buffer) -> mlkem.MLKEM768PublicKey: ...
-def generate_mlkem1024_key() -> mlkem.MLKEM1024PrivateKey: ...
-def from_mlkem1024_seed_bytes(data: Buffer) -> mlkem.MLKEM1024PrivateKey: ...
-def from_mlkem1024_public_bytes(data: Buffer) -> mlkem.MLKEM1024PublicKey: ...
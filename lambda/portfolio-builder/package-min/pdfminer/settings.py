@@ -1 +0,0 @@
-STRICT = False
@@ -1,3 +0,0 @@
-from .metadata import TEMPLATE_IDS, generate_portfolio_html, get_template_list
-
-__all__ = ["TEMPLATE_IDS", "generate_portfolio_html", "get_template_list"]
\ No newline at end of file
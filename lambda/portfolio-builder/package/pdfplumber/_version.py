@@ -1,2 +0,0 @@
-version_info = (0, 11, 10)
-__version__ = ".".join(map(str, version_info))
@@ -1,43 +0,0 @@
-from .clustering import cluster_list, cluster_objects, make_cluster_dict  # noqa: F401
-from .generic import to_list  # noqa: F401
-from .geometry import (  # noqa: F401
-    bbox_to_rect,
-    calculate_area,
-    clip_obj,
-    crop_to_bbox,
-    curve_to_edges,
-    filter_edges,
-    get_bbox_overlap,
-    intersects_bbox,
-    line_to_edge,
-    merge_bboxes,
-    move_object,
-    obj_to_bbox,
-    obj_to_edges,
-    objects_to_bbox,
-    objects_to_rect,
-    outside_bbox,
-    rect_to_edges,
-    resize_object,
-    snap_objects,
-    within_bbox,
-)
-from .pdfinternals import (  # noqa: F401
-    decode_psl_list,
-    decode_text,
-    resolve,
-    resolve_all,
-    resolve_and_decode,
-)
-from .text import (  # noqa: F401
-    DEFAULT_X_DENSITY,
-    DEFAULT_X_TOLERANCE,
-    DEFAULT_Y_DENSITY,
-    DEFAULT_Y_TOLERANCE,
-    chars_to_textmap,
-    collate_line,
-    dedupe_chars,
-    extract_text,
-    extract_text_simple,
-    extract_words,
-)
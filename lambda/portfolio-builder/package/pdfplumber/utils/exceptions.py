@@ -1,6 +0,0 @@
-class MalformedPDFException(Exception):
-    pass
-
-
-class PdfminerException(Exception):
-    pass
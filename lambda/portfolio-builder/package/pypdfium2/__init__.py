@@ -1,7 +0,0 @@
-# SPDX-FileCopyrightText: 2026 geisserml <geisserml@gmail.com>
-# SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
-
-import pypdfium2._library_scope
-from pypdfium2.version import *
-from pypdfium2._helpers import *
-from pypdfium2 import raw, internal
@@ -1,13 +0,0 @@
-# SPDX-FileCopyrightText: 2026 geisserml <geisserml@gmail.com>
-# SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
-
-from pypdfium2._helpers.unsupported import *
-from pypdfium2._helpers.misc import *
-from pypdfium2._helpers.matrix import *
-from pypdfium2._helpers.bitmap import *
-from pypdfium2._helpers.document import *
-from pypdfium2._helpers.attachment import *
-from pypdfium2._helpers.page import *
-from pypdfium2._helpers.pageobjects import *
-from pypdfium2._helpers.textpage import *
-from pypdfium2._helpers.sysfontinfo import *
@@ -1,6 +0,0 @@
-# SPDX-FileCopyrightText: 2026 geisserml <geisserml@gmail.com>
-# SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
-
-from pypdfium2.internal.bases import *
-from pypdfium2.internal.consts import *
-from pypdfium2.internal.utils import *
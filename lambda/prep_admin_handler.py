@@ -11,6 +11,11 @@ import boto3
 from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
 
+try:
+    import catalog_cache
+except ImportError:
+    catalog_cache = None  # user list endpoints then scan on every request
+
 # ========================== CONFIG ==========================
 REGION = "ap-south-2"
 S3_REGION = "ap-south-2"
@@ -70,6 +75,12 @@ def get_table(table_name: str):
     return _tables[table_name]
 
 
+def invalidate_content_cache(table_name: str) -> None:
+    """Drop warm-container snapshots of a content table after an admin write."""
+    if catalog_cache is not None:
+        catalog_cache.invalidate(table_name)
+
+
 # ========================== HELPERS ==========================
 def api_response(status: int, body: Any) -> Dict[str, Any]:
     return {
@@ -593,6 +604,9 @@ def handle_put_content(content_type: str, items: list) -> dict:
         })
     except ClientError as e:
         return api_response(500, {"success": False, "message": "Database error", "error": str(e)})
+    finally:
+        # Partial batches still changed the table
+        invalidate_content_cache(table_name)
 
 
 def handle_put_content_single(content_type: str, raw: dict) -> dict:
@@ -609,6 +623,7 @@ def handle_put_content_single(content_type: str, raw: dict) -> dict:
     try:
         normalized = normalizer(raw, now)
         table.put_item(Item=normalized)
+        invalidate_content_cache(table_name)
         return api_response(200, {"success": True, "item": normalized})
     except ClientError as e:
         return api_response(500, {"success": False, "message": "Database error", "error": str(e)})
@@ -626,6 +641,7 @@ def handle_delete_content(content_type: str, item_id: str) -> dict:
         return api_response(400, {"success": False, "message": "Missing item id"})
     try:
         table.delete_item(Key={"id": key_id})
+        invalidate_content_cache(table_name)
         return api_response(200, {"success": True, "message": "Deleted", "id": item_id})
     except ClientError as e:
         return api_response(500, {"success": False, "message": "Database error", "error": str(e)})
@@ -645,6 +661,8 @@ def handle_bulk_delete_content(content_type: str, ids: list) -> dict:
         return api_response(200, {"success": True, "message": f"Deleted {len(ids)} items"})
     except ClientError as e:
         return api_response(500, {"success": False, "message": "Database error", "error": str(e)})
+    finally:
+        invalidate_content_cache(table_name)
 
 
 def handle_full_sync_content(content_type: str, items: list) -> dict:
@@ -687,6 +705,8 @@ def handle_full_sync_content(content_type: str, items: list) -> dict:
         })
     except ClientError as e:
         return api_response(500, {"success": False, "message": "Database error", "error": str(e)})
+    finally:
+        invalidate_content_cache(table_name)
 
 
 # ======================================================================
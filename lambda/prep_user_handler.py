@@ -10,6 +10,11 @@ import boto3
 from boto3.dynamodb.conditions import Key, Attr
 from botocore.exceptions import ClientError
 
+try:
+    import catalog_cache
+except ImportError:
+    catalog_cache = None  # falls back to a filtered scan per list request
+
 # ========================== CONFIG ==========================
 REGION = "ap-south-2"
 S3_REGION = "ap-south-2"
@@ -167,25 +172,33 @@ def handle_list_content(content_type: str, query_params: dict) -> dict:
                         "companyId", "roleId", "subType", "designType", "contentKind", "subject", "slug", "scope"]
 
     try:
-        filter_expressions = []
+        filters = {}
         for attr in FILTERABLE_ATTRS:
             val = query_params.get(attr)
             if val and val != "all":
-                filter_expressions.append(Attr(attr).eq(val))
-
-        scan_kwargs = {}
-        if filter_expressions:
-            combined = filter_expressions[0]
-            for expr in filter_expressions[1:]:
-                combined = combined & expr
-            scan_kwargs["FilterExpression"] = combined
+                filters[attr] = val
+
+        if catalog_cache is not None:
+            # Whole catalog from the warm-container snapshot; filters match the old Attr.eq scan
+            items = [
+                i for i in catalog_cache.get_table_items(table)
+                if all(i.get(attr) == val for attr, val in filters.items())
+            ]
+        else:
+            scan_kwargs = {}
+            if filters:
+                expressions = [Attr(attr).eq(val) for attr, val in filters.items()]
+                combined = expressions[0]
+                for expr in expressions[1:]:
+                    combined = combined & expr
+                scan_kwargs["FilterExpression"] = combined
 
-        result = table.scan(**scan_kwargs)
-        items = result.get("Items", [])
-        while "LastEvaluatedKey" in result:
-            scan_kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
             result = table.scan(**scan_kwargs)
-            items.extend(result.get("Items", []))
+            items = result.get("Items", [])
+            while "LastEvaluatedKey" in result:
+                scan_kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+                result = table.scan(**scan_kwargs)
+                items.extend(result.get("Items", []))
 
         if search:
             searchable = ["question", "title", "name", "description", "content", "role"]
@@ -1,35 +1,66 @@
 """
-Sliding-window rate limiter backed by DynamoDB.
+Atomic rate limiter backed by DynamoDB.
+
+Every allow/deny decision is made by one conditional UpdateItem, so concurrent
+Lambdas can never push a key past its limit (the old get_item + update/put
+pair raced and cost two round trips).
 
 Table: RateLimits
-  PK: pk  (string)  — composite key, e.g. "login:<ip>" or "signup:<ip>"
-  Attributes:
-    hits       (number)  — request count in current window
-    windowStart (string) — ISO timestamp of window start
-    ttl        (number)  — epoch seconds for DynamoDB TTL auto-deletion
+  PK: pk  (string)  — composite key, e.g. "login:<ip>#w<window>" or "login:<ip>#tb"
+  Attributes (by mode):
+    fixed         hits (number)            — requests in this fixed window; one item per window
+    token_bucket  tat  (number, epoch ms)  — GCRA "theoretical arrival time"
+    sliding_log   s0..s<N-1> (epoch ms)    — timestamps of the last N allowed requests
+    ttl           (number)                 — epoch seconds for DynamoDB TTL auto-deletion
 
 DynamoDB TTL must be enabled on the `ttl` attribute so stale records
 are automatically cleaned up.
 
+Modes:
+  fixed (default)  One ADD with `hits < max` condition on a per-window key.
+                   Always exactly one round trip.
+  token_bucket     GCRA: allows bursts of max_requests, refilling one request
+                   every window_seconds / max_requests.
+  sliding_log      Exact "at most N in any window_seconds" using N timestamp slots.
+
+  token_bucket and sliding_log guess the right conditional write from the last
+  state this container saw. A wrong guess fails its condition and DynamoDB
+  returns the stored item (ReturnValuesOnConditionCheckFailure), which either
+  decides the request (deny) or picks the correct write for one retry.
+
+In-process pre-filter: once a key is denied, this container remembers until
+when it stays blocked and rejects it without calling DynamoDB. That is always
+safe because other containers can only have added hits.
+
 Usage in a handler:
     from rate_limiter import check_rate_limit
     blocked = check_rate_limit(event, action="login", max_requests=5, window_seconds=300)
     if blocked:
         return blocked   # returns a 429 response dict
+
+Local testing: point DYNAMODB_ENDPOINT_URL at DynamoDB Local, or pass any
+Table-like object to RateLimiter(table=...).
 """
 
 import json
+import math
 import os
 import time
 import boto3
-from datetime import datetime
 from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
 
 RATE_LIMIT_TABLE = "RateLimits"
+MODES = ("fixed", "token_bucket", "sliding_log")
+MAX_ATTEMPTS = 3
+PREFILTER_MAX_KEYS = 10000
 
-dynamodb = boto3.resource("dynamodb")
+dynamodb = boto3.resource("dynamodb", endpoint_url=os.environ.get("DYNAMODB_ENDPOINT_URL") or None)
 rate_table = dynamodb.Table(RATE_LIMIT_TABLE)
 
+_deserializer = TypeDeserializer()
+
 
 def _get_client_ip(event: dict) -> str:
     """Extract client IP from API Gateway event."""
@@ -51,7 +82,7 @@ def _get_client_ip(event: dict) -> str:
     return "unknown"
 
 
-def _rate_limit_response():
+def _rate_limit_response(retry_after: int = 60):
     return {
         "statusCode": 429,
         "headers": {
@@ -61,7 +92,7 @@ def _rate_limit_response():
             ),
             "Access-Control-Allow-Headers": "Content-Type",
             "Access-Control-Allow-Methods": "POST,OPTIONS",
-            "Retry-After": "60",
+            "Retry-After": str(max(1, int(retry_after))),
         },
         "body": json.dumps({
             "success": False,
@@ -73,11 +104,200 @@ def _rate_limit_response():
     }
 
 
+def _old_item(exc: ClientError) -> dict:
+    """Stored item returned with a failed condition, converted to Python types."""
+    raw = exc.response.get("Item") or {}
+    return {k: _deserializer.deserialize(v) for k, v in raw.items()}
+
+
+def _is_condition_failure(exc: ClientError) -> bool:
+    return exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
+class RateLimiter:
+    """
+    Decides allow/deny for (key, max_requests, window_seconds) with one
+    conditional write in the common case. `clock` returns epoch seconds.
+    """
+
+    def __init__(self, table=None, clock=time.time):
+        self.table = table if table is not None else rate_table
+        self.clock = clock
+        self._blocked_until = {}   # key -> epoch seconds
+        self._hints = {}           # key -> last item state seen by this container
+
+    # ---------- pre-filter ----------
+    def _prefilter_retry_after(self, key: str, now: float):
+        until = self._blocked_until.get(key)
+        if until is None:
+            return None
+        if until <= now:
+            self._blocked_until.pop(key, None)
+            return None
+        return until - now
+
+    def _block(self, key: str, until: float) -> float:
+        if len(self._blocked_until) >= PREFILTER_MAX_KEYS:
+            now = self.clock()
+            self._blocked_until = {k: v for k, v in self._blocked_until.items() if v > now}
+            if len(self._blocked_until) >= PREFILTER_MAX_KEYS:
+                self._blocked_until.clear()
+        self._blocked_until[key] = until
+        return until
+
+    def _update(self, **kwargs):
+        return self.table.update_item(ReturnValuesOnConditionCheckFailure="ALL_OLD", **kwargs)
+
+    # ---------- fixed window ----------
+    def _fixed(self, key: str, max_requests: int, window_seconds: int, now: float):
+        window = int(now // window_seconds)
+        window_end = (window + 1) * window_seconds
+        try:
+            self._update(
+                Key={"pk": f"{key}#w{window}"},
+                UpdateExpression="ADD hits :one SET #ttl = if_not_exists(#ttl, :ttl)",
+                ConditionExpression="attribute_not_exists(hits) OR hits < :max",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues={
+                    ":one": Decimal(1),
+                    ":max": Decimal(max_requests),
+                    ":ttl": Decimal(int(window_end + window_seconds)),
+                },
+            )
+            return True, 0
+        except ClientError as e:
+            if not _is_condition_failure(e):
+                raise
+            return False, self._block(key, window_end) - now
+
+    # ---------- token bucket (GCRA) ----------
+    def _token_bucket(self, key: str, max_requests: int, window_seconds: int, now: float):
+        pk = f"{key}#tb"
+        now_ms = int(now * 1000)
+        interval = int(math.ceil(window_seconds * 1000 / max_requests))
+        tolerance = window_seconds * 1000 - interval
+        limit = now_ms + tolerance
+        ttl = Decimal(int(now + window_seconds * 2))
+        hint = self._hints.get(pk)
+        active = hint is not None and hint >= now_ms
+
+        for _ in range(MAX_ATTEMPTS):
+            try:
+                if active:
+                    # Bucket still draining: tat >= now, so max(tat, now) == tat
+                    result = self._update(
+                        Key={"pk": pk},
+                        UpdateExpression="SET tat = tat + :interval, #ttl = :ttl",
+                        ConditionExpression="tat BETWEEN :now AND :limit",
+                        ExpressionAttributeNames={"#ttl": "ttl"},
+                        ExpressionAttributeValues={
+                            ":interval": Decimal(interval),
+                            ":now": Decimal(now_ms),
+                            ":limit": Decimal(limit),
+                            ":ttl": ttl,
+                        },
+                        ReturnValues="UPDATED_NEW",
+                    )
+                else:
+                    # Bucket full (idle or new key): restart from now
+                    result = self._update(
+                        Key={"pk": pk},
+                        UpdateExpression="SET tat = :next, #ttl = :ttl",
+                        ConditionExpression="attribute_not_exists(tat) OR tat < :now",
+                        ExpressionAttributeNames={"#ttl": "ttl"},
+                        ExpressionAttributeValues={
+                            ":next": Decimal(now_ms + interval),
+                            ":now": Decimal(now_ms),
+                            ":ttl": ttl,
+                        },
+                        ReturnValues="UPDATED_NEW",
+                    )
+                self._hints[pk] = int(result.get("Attributes", {}).get("tat", now_ms + interval))
+                return True, 0
+            except ClientError as e:
+                if not _is_condition_failure(e):
+                    raise
+                tat = _old_item(e).get("tat")
+                if tat is None:
+                    active = False
+                    continue
+                tat = int(tat)
+                self._hints[pk] = tat
+                if tat > limit:
+                    until = (tat - tolerance) / 1000.0
+                    return False, self._block(key, until) - now
+                active = tat >= now_ms
+        return False, 1
+
+    # ---------- sliding log ----------
+    def _sliding_log(self, key: str, max_requests: int, window_seconds: int, now: float):
+        pk = f"{key}#log"
+        now_ms = int(now * 1000)
+        cutoff = now_ms - window_seconds * 1000
+        slots = [f"s{i}" for i in range(max_requests)]
+
+        def pick(state):
+            # An empty slot, else the oldest one (only usable if outside the window)
+            for name in slots:
+                if name not in state:
+                    return name
+            return min(slots, key=lambda name: int(state[name]))
+
+        slot = pick(self._hints.get(pk, {}))
+        for _ in range(MAX_ATTEMPTS):
+            try:
+                result = self._update(
+                    Key={"pk": pk},
+                    UpdateExpression="SET #slot = :now, #ttl = :ttl",
+                    ConditionExpression="attribute_not_exists(#slot) OR #slot <= :cutoff",
+                    ExpressionAttributeNames={"#slot": slot, "#ttl": "ttl"},
+                    ExpressionAttributeValues={
+                        ":now": Decimal(now_ms),
+                        ":cutoff": Decimal(cutoff),
+                        ":ttl": Decimal(int(now + window_seconds * 2)),
+                    },
+                    ReturnValues="ALL_NEW",
+                )
+                self._hints[pk] = {k: v for k, v in result.get("Attributes", {}).items() if k in slots}
+                return True, 0
+            except ClientError as e:
+                if not _is_condition_failure(e):
+                    raise
+                state = {k: v for k, v in _old_item(e).items() if k in slots}
+                self._hints[pk] = state
+                slot = pick(state)
+                if slot in state and int(state[slot]) > cutoff:
+                    until = (int(state[slot]) + window_seconds * 1000) / 1000.0
+                    return False, self._block(key, until) - now
+        return False, 1
+
+    def hit(self, key: str, max_requests: int = 5, window_seconds: int = 300, mode: str = "fixed"):
+        """
+        Record one request for `key`. Returns (allowed, retry_after_seconds).
+        Raises ValueError for an unknown mode; DynamoDB errors propagate.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown rate limit mode: {mode}")
+        now = self.clock()
+        retry_after = self._prefilter_retry_after(key, now)
+        if retry_after is not None:
+            return False, retry_after
+        if mode == "token_bucket":
+            return self._token_bucket(key, max_requests, window_seconds, now)
+        if mode == "sliding_log":
+            return self._sliding_log(key, max_requests, window_seconds, now)
+        return self._fixed(key, max_requests, window_seconds, now)
+
+
+_limiter = RateLimiter()
+
+
 def check_rate_limit(
     event: dict,
     action: str,
     max_requests: int = 5,
     window_seconds: int = 300,
+    mode: str = "fixed",
 ):
     """
     Returns None if request is allowed, or a 429 response dict if blocked.
@@ -87,42 +307,19 @@ def check_rate_limit(
         action          – logical name (e.g. "login", "signup")
         max_requests    – maximum hits allowed per window
         window_seconds  – window duration in seconds
+        mode            – "fixed", "token_bucket" or "sliding_log"
     """
-    ip = _get_client_ip(event)
-    pk = f"{action}:{ip}"
-    now = time.time()
-    now_iso = datetime.utcnow().isoformat()
+    if mode not in MODES:
+        raise ValueError(f"Unknown rate limit mode: {mode}")
+    pk = f"{action}:{_get_client_ip(event)}"
 
     try:
-        resp = rate_table.get_item(Key={"pk": pk})
-        item = resp.get("Item")
-
-        if item:
-            window_start_epoch = float(item.get("windowStartEpoch", 0))
-            hits = int(item.get("hits", 0))
-
-            if now - window_start_epoch < window_seconds:
-                if hits >= max_requests:
-                    return _rate_limit_response()
-
-                rate_table.update_item(
-                    Key={"pk": pk},
-                    UpdateExpression="SET hits = hits + :one",
-                    ExpressionAttributeValues={":one": Decimal("1")},
-                )
-                return None
-            # Window expired — reset
-        # New record or expired window
-        rate_table.put_item(Item={
-            "pk": pk,
-            "hits": Decimal("1"),
-            "windowStart": now_iso,
-            "windowStartEpoch": Decimal(str(int(now))),
-            "ttl": Decimal(str(int(now + window_seconds * 2))),
-        })
-        return None
-
+        allowed, retry_after = _limiter.hit(pk, max_requests, window_seconds, mode)
     except Exception:
         # If rate-limit infra fails, allow the request through
         # (fail-open to avoid locking out all users)
         return None
+
+    if allowed:
+        return None
+    return _rate_limit_response(math.ceil(retry_after))
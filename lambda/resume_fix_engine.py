@@ -4,6 +4,8 @@ Deterministic keyword injection for ATS fixes.
 Rules: do not remove content, avoid full rewrites, cap injections to reduce stuffing.
 Places tools/languages/stack phrases in SKILLS; competency/outcome phrases in projects/experience/summary.
 Optional single LLM pass for minimal sentence enhancement (disabled unless caller passes credentials).
+AI HTML / JSON render can stream: with on_partial, the provider response is streamed and each résumé
+section is validated and emitted as soon as it is complete (see llm_stream.py).
 """
 from __future__ import annotations
 
@@ -12,7 +14,12 @@ import json
 import os
 import re
 import urllib.request
-from typing import Any
+from typing import Any, Callable
+
+import http_client
+import keyword_matcher
+import llm_cache
+import llm_stream
 
 
 # Keep in sync with ProjectBazaar/components/fix-resume/garamondResumeStyles.ts
@@ -124,10 +131,13 @@ def render_resume_html_with_llm(
     llm_config: dict[str, Any] | None,
     *,
     user_id: str | None = None,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
 ) -> str:
     """
     Generate a full HTML document for the Garamond resume template using an LLM.
     Fail-hard: raise RuntimeError on any invalid output.
+    on_partial: optional sink; the completion is streamed and the header / each section is
+    emitted as soon as it is complete (see _StreamedHtmlSections). The return value is unchanged.
     """
     provider = _norm_provider(str((llm_config or {}).get("provider") or ""))
     api_key = str((llm_config or {}).get("apiKey") or "").strip()
@@ -298,17 +308,26 @@ def render_resume_html_with_llm(
         _call_gemini,
     )
 
+    sink = _StreamedHtmlSections(on_partial) if on_partial is not None else None
     if provider == "openai":
-        raw = _call_openai(api_key, prompt, model)
+        raw = _call_openai(api_key, prompt, model, accept=_validated_llm_html, on_delta=sink)
     elif provider == "openrouter":
-        raw = _call_openrouter(api_key, prompt, model)
+        raw = _call_openrouter(api_key, prompt, model, accept=_validated_llm_html, on_delta=sink)
     elif provider == "anthropic":
-        raw = _call_claude(api_key, prompt, model)
+        raw = _call_claude(api_key, prompt, model, accept=_validated_llm_html, on_delta=sink)
     elif provider == "gemini":
-        raw = _call_gemini(api_key, prompt, model)
+        raw = _call_gemini(api_key, prompt, model, accept=_validated_llm_html, on_delta=sink)
     else:
         raise RuntimeError(f"Unsupported provider for HTML rendering: {provider}")
 
+    html = _validated_llm_html(raw)
+    if sink is not None:
+        sink.close()
+    return html
+
+
+def _validated_llm_html(raw: str) -> str:
+    """Sanitized template HTML from the model; raises when it is unusable (also gates the LLM cache)."""
     html = _sanitize_llm_html(raw)
     if len(html.encode("utf-8")) > 450_000:
         raise RuntimeError("Rendered HTML too large.")
@@ -321,6 +340,69 @@ def render_resume_html_with_llm(
     return html
 
 
+# Streamed HTML is split before #r-sections and before every section bar
+_HTML_SECTION_BOUNDARY_RE = re.compile(
+    r"""(?is)<\s*div\b[^>]*\b(?:class\s*=\s*["']section-title["']|id\s*=\s*["']r-sections["'])[^>]*>"""
+)
+_HTML_SECTION_TITLE_RE = re.compile(
+    r"""(?is)^\s*<\s*div\b[^>]*\bclass\s*=\s*["']section-title["'][^>]*>(.*?)<\s*/\s*div\s*>"""
+)
+_HTML_HEADER_START_RE = re.compile(r"""(?is)<\s*div\b[^>]*\bclass\s*=\s*["']header["']""")
+_HTML_BODY_END_RE = re.compile(r"(?is)<\s*/\s*body\s*>")
+_HTML_TRAILING_DIV_CLOSE_RE = re.compile(r"(?is)<\s*/\s*div\s*>\s*$")
+
+
+def _balanced_html_fragment(html: str) -> str:
+    """Drop trailing </div>s that close containers opened outside the fragment (#r-sections, .page, root)."""
+    extra = len(re.findall(r"(?is)<\s*/\s*div\s*>", html)) - len(re.findall(r"(?is)<\s*div\b", html))
+    html = html.rstrip()
+    while extra > 0 and _HTML_TRAILING_DIV_CLOSE_RE.search(html):
+        html = _HTML_TRAILING_DIV_CLOSE_RE.sub("", html).rstrip()
+        extra -= 1
+    return html
+
+
+class _StreamedHtmlSections:
+    """
+    on_delta sink for a streamed HTML render. Emits {"event": "header", "html"} once the header is
+    complete and {"event": "section", "index", "title", "html"} for each completed section bar +
+    content, sanitized like the final document. close() emits the last section.
+    """
+
+    def __init__(self, on_partial: Callable[[dict[str, Any]], None]):
+        self._on_partial = on_partial
+        self._splitter = llm_stream.MarkupSplitter(_HTML_SECTION_BOUNDARY_RE)
+        self._prelude = True
+        self._index = 0
+
+    def __call__(self, text: str) -> None:
+        for chunk in self._splitter.feed(text):
+            self._emit(chunk)
+
+    def close(self) -> None:
+        tail = self._splitter.close()
+        end = _HTML_BODY_END_RE.search(tail)
+        self._emit(tail[:end.start()] if end else tail)
+
+    def _emit(self, chunk: str) -> None:
+        if self._prelude:
+            self._prelude = False
+            header = _HTML_HEADER_START_RE.search(chunk)
+            if header:
+                self._on_partial({"event": "header", "html": _sanitize_llm_html(chunk[header.start():])})
+            return
+        title = _HTML_SECTION_TITLE_RE.match(chunk)
+        if not title:
+            return  # the #r-sections opening tag
+        self._on_partial({
+            "event": "section",
+            "index": self._index,
+            "title": _strip_html_text(title.group(1)),
+            "html": _sanitize_llm_html(_balanced_html_fragment(chunk)),
+        })
+        self._index += 1
+
+
 def _tel_dedup_key(digits: str) -> str:
     """
     Same physical line (e.g. +91-7981833625 vs 7981833625) must share one key so the UI
@@ -539,6 +621,131 @@ def _resolve_llm_credentials(
     return provider, api_key, model
 
 
+def _normalize_preview_contacts(contacts: Any) -> list[dict[str, str]]:
+    """LLM `contacts[]` → clean {icon, label, href} rows (before merging contacts found in the résumé text)."""
+    if not isinstance(contacts, list):
+        return []
+    c_out: list[dict[str, str]] = []
+    for c in contacts:
+        if not isinstance(c, dict):
+            continue
+        icon = str(c.get("icon") or "").strip()
+        label = str(c.get("label") or "").strip()
+        href = str(c.get("href") or "").strip()
+
+        low_label = label.lower()
+        low_icon = icon.lower()
+        if href.startswith("mailto:"):
+            email = href.split(":", 1)[1].strip()
+            if low_label in ("email", "e-mail", "mail") or (not label and email):
+                label = email
+            if low_icon in ("email", "mail", ""):
+                icon = "✉"
+        elif href.startswith("tel:"):
+            phone = href.split(":", 1)[1].strip()
+            if low_label in ("phone", "mobile", "contact") or (not label and phone):
+                label = phone
+            if low_icon in ("phone", "mobile", ""):
+                icon = "📞"
+        elif "linkedin.com" in href:
+            if low_label in ("linkedin", "link", "profile") or not label:
+                label = href.replace("https://", "").replace("http://", "")
+            if low_icon in ("linkedin", "in", ""):
+                icon = "in"
+        elif "github.com" in href:
+            if low_label in ("github", "git", "") or not label:
+                label = href.replace("https://", "").replace("http://", "")
+            if low_icon in ("github", "git", ""):
+                icon = "⌥"
+
+        if label.strip().lower() in ("email", "phone", "location", "github", "linkedin"):
+            continue
+        if label and href:
+            c_out.append({"icon": icon, "label": label, "href": href})
+        if len(c_out) >= 12:
+            break
+    return c_out
+
+
+def _normalize_preview_section(sec: Any) -> dict[str, Any] | None:
+    """One LLM `sections[]` entry → validated template section, or None when unusable."""
+    if not isinstance(sec, dict):
+        return None
+    t = str(sec.get("type") or "").strip()
+    title = str(sec.get("title") or "").strip()
+    if t not in ("table", "skills", "entries", "list") or not title:
+        return None
+    s2: dict[str, Any] = {"type": t, "title": title}
+    if t == "table":
+        headers = sec.get("headers")
+        rows = sec.get("rows")
+        s2["headers"] = [str(h).strip() for h in headers] if isinstance(headers, list) else []
+        if isinstance(rows, list):
+            clean_rows = []
+            for r in rows[:30]:
+                if isinstance(r, list):
+                    clean_rows.append([str(c).strip() for c in r][:10])
+            s2["rows"] = clean_rows
+        else:
+            s2["rows"] = []
+    elif t == "skills":
+        items = sec.get("items")
+        it_out = []
+        if isinstance(items, list):
+            for it in items[:40]:
+                if isinstance(it, dict):
+                    label = str(it.get("label") or "").strip()
+                    value = str(it.get("value") or "").strip()
+                    if value:
+                        it_out.append({"label": label, "value": value})
+        s2["items"] = it_out
+    elif t == "entries":
+        items = sec.get("items")
+        ent_out = []
+        if isinstance(items, list):
+            for it in items[:40]:
+                if not isinstance(it, dict):
+                    continue
+                et = str(it.get("title") or "").strip()
+                org = str(it.get("org") or "").strip()
+                bullets = it.get("bullets")
+                b_out = []
+                if isinstance(bullets, list):
+                    for b in bullets[:8]:
+                        bs = str(b).strip()
+                        if bs:
+                            b_out.append(bs)
+                if et and b_out:
+                    e = {"title": et, "bullets": b_out}
+                    if org:
+                        e["org"] = org
+                    ent_out.append(e)
+        s2["items"] = ent_out
+    else:
+        items = sec.get("items")
+        list_out: list[Any] = []
+        if isinstance(items, list):
+            for it in items[:60]:
+                if isinstance(it, str):
+                    s = it.strip()
+                    if s:
+                        list_out.append(s)
+                elif isinstance(it, dict):
+                    text = str(it.get("text") or "").strip()
+                    if not text:
+                        continue
+                    x: dict[str, Any] = {"text": text}
+                    meta = it.get("meta")
+                    desc = it.get("desc")
+                    if isinstance(meta, str) and meta.strip():
+                        x["meta"] = meta.strip()
+                    if isinstance(desc, str) and desc.strip():
+                        x["desc"] = desc.strip()
+                    list_out.append(x)
+        s2["items"] = list_out
+    return s2
+
+
 def _finalize_resume_preview_from_llm(
     obj: dict[str, Any],
     contact_source_text: str,
@@ -552,131 +759,16 @@ def _finalize_resume_preview_from_llm(
     out["name"] = str(obj.get("name") or "").strip()
     subtitle = obj.get("subtitle")
     out["subtitle"] = [str(x).strip() for x in subtitle] if isinstance(subtitle, list) else []
-    contacts = obj.get("contacts")
-    if isinstance(contacts, list):
-        c_out = []
-        for c in contacts:
-            if not isinstance(c, dict):
-                continue
-            icon = str(c.get("icon") or "").strip()
-            label = str(c.get("label") or "").strip()
-            href = str(c.get("href") or "").strip()
-
-            low_label = label.lower()
-            low_icon = icon.lower()
-            if href.startswith("mailto:"):
-                email = href.split(":", 1)[1].strip()
-                if low_label in ("email", "e-mail", "mail") or (not label and email):
-                    label = email
-                if low_icon in ("email", "mail", ""):
-                    icon = "✉"
-            elif href.startswith("tel:"):
-                phone = href.split(":", 1)[1].strip()
-                if low_label in ("phone", "mobile", "contact") or (not label and phone):
-                    label = phone
-                if low_icon in ("phone", "mobile", ""):
-                    icon = "📞"
-            elif "linkedin.com" in href:
-                if low_label in ("linkedin", "link", "profile") or not label:
-                    label = href.replace("https://", "").replace("http://", "")
-                if low_icon in ("linkedin", "in", ""):
-                    icon = "in"
-            elif "github.com" in href:
-                if low_label in ("github", "git", "") or not label:
-                    label = href.replace("https://", "").replace("http://", "")
-                if low_icon in ("github", "git", ""):
-                    icon = "⌥"
-
-            if label.strip().lower() in ("email", "phone", "location", "github", "linkedin"):
-                continue
-            if label and href:
-                c_out.append({"icon": icon, "label": label, "href": href})
-            if len(c_out) >= 12:
-                break
-        out["contacts"] = _merge_contacts_from_resume_text(rt, c_out)
-    else:
-        out["contacts"] = _merge_contacts_from_resume_text(rt, [])
+    out["contacts"] = _merge_contacts_from_resume_text(rt, _normalize_preview_contacts(obj.get("contacts")))
 
     sections = obj.get("sections")
     if not isinstance(sections, list):
         raise RuntimeError("resume.sections must be an array.")
     out_secs = []
     for sec in sections[:30]:
-        if not isinstance(sec, dict):
-            continue
-        t = str(sec.get("type") or "").strip()
-        title = str(sec.get("title") or "").strip()
-        if t not in ("table", "skills", "entries", "list") or not title:
-            continue
-        s2: dict[str, Any] = {"type": t, "title": title}
-        if t == "table":
-            headers = sec.get("headers")
-            rows = sec.get("rows")
-            s2["headers"] = [str(h).strip() for h in headers] if isinstance(headers, list) else []
-            if isinstance(rows, list):
-                clean_rows = []
-                for r in rows[:30]:
-                    if isinstance(r, list):
-                        clean_rows.append([str(c).strip() for c in r][:10])
-                s2["rows"] = clean_rows
-            else:
-                s2["rows"] = []
-        elif t == "skills":
-            items = sec.get("items")
-            it_out = []
-            if isinstance(items, list):
-                for it in items[:40]:
-                    if isinstance(it, dict):
-                        label = str(it.get("label") or "").strip()
-                        value = str(it.get("value") or "").strip()
-                        if value:
-                            it_out.append({"label": label, "value": value})
-            s2["items"] = it_out
-        elif t == "entries":
-            items = sec.get("items")
-            ent_out = []
-            if isinstance(items, list):
-                for it in items[:40]:
-                    if not isinstance(it, dict):
-                        continue
-                    et = str(it.get("title") or "").strip()
-                    org = str(it.get("org") or "").strip()
-                    bullets = it.get("bullets")
-                    b_out = []
-                    if isinstance(bullets, list):
-                        for b in bullets[:8]:
-                            bs = str(b).strip()
-                            if bs:
-                                b_out.append(bs)
-                    if et and b_out:
-                        e = {"title": et, "bullets": b_out}
-                        if org:
-                            e["org"] = org
-                        ent_out.append(e)
-            s2["items"] = ent_out
-        else:
-            items = sec.get("items")
-            list_out: list[Any] = []
-            if isinstance(items, list):
-                for it in items[:60]:
-                    if isinstance(it, str):
-                        s = it.strip()
-                        if s:
-                            list_out.append(s)
-                    elif isinstance(it, dict):
-                        text = str(it.get("text") or "").strip()
-                        if not text:
-                            continue
-                        x: dict[str, Any] = {"text": text}
-                        meta = it.get("meta")
-                        desc = it.get("desc")
-                        if isinstance(meta, str) and meta.strip():
-                            x["meta"] = meta.strip()
-                        if isinstance(desc, str) and desc.strip():
-                            x["desc"] = desc.strip()
-                        list_out.append(x)
-            s2["items"] = list_out
-        out_secs.append(s2)
+        s2 = _normalize_preview_section(sec)
+        if s2:
+            out_secs.append(s2)
     out["sections"] = out_secs
 
     if not out["name"] and not out_secs:
@@ -685,6 +777,39 @@ def _finalize_resume_preview_from_llm(
     return out, added_kw
 
 
+class _StreamedResumeSections:
+    """
+    on_delta sink for a streamed resume JSON render. Emits {"event": "field", "key", "value"} for
+    name / subtitle / contacts and {"event": "section", "index", "section"} for each completed
+    section, validated like the final object (keyword injection only happens on the final object).
+    """
+
+    def __init__(self, on_partial: Callable[[dict[str, Any]], None], contact_source_text: str):
+        self._on_partial = on_partial
+        self._contact_source_text = contact_source_text
+        self._stream = llm_stream.JsonMemberStream(item_keys=("sections",))
+        self._index = 0
+
+    def __call__(self, text: str) -> None:
+        for ev in self._stream.feed(text):
+            if ev[0] == "item":
+                s2 = _normalize_preview_section(ev[3]) if ev[2] < 30 else None
+                if s2:
+                    self._on_partial({"event": "section", "index": self._index, "section": s2})
+                    self._index += 1
+                continue
+            key, value = ev[1], ev[2]
+            if key == "name":
+                value = str(value or "").strip()
+            elif key == "subtitle":
+                value = [str(x).strip() for x in value] if isinstance(value, list) else []
+            elif key == "contacts":
+                value = _merge_contacts_from_resume_text(self._contact_source_text, _normalize_preview_contacts(value))
+            else:
+                continue
+            self._on_partial({"event": "field", "key": key, "value": value})
+
+
 def _profile_dict_to_source_text(profile: dict[str, Any]) -> str:
     """Plain-text résumé from saved profile JSON (mirrors frontend buildResumeTextFromInfo)."""
     lines: list[str] = []
@@ -826,16 +951,13 @@ def _text_to_bullets(raw: str, *, max_bullets: int = 8) -> list[str]:
 
 
 def _jd_relevance_tokens(job_description: str) -> set[str]:
-    jd = (job_description or "").lower()
-    tokens = {t for t in re.findall(r"[a-z0-9+#.]{3,}", jd) if t not in _JD_RELEVANCE_STOP}
-    return tokens
+    return set(keyword_matcher.relevance_tokens(job_description or "")) - _JD_RELEVANCE_STOP
 
 
 def _relevance_score(text: str, jd_tokens: set[str]) -> int:
     if not text or not jd_tokens:
         return 0
-    words = set(re.findall(r"[a-z0-9+#.]{3,}", text.lower()))
-    return len(words & jd_tokens)
+    return len(keyword_matcher.relevance_tokens(text) & jd_tokens)
 
 
 _DEMO_EMAILS = frozenset({"james.carter@example.com"})
@@ -1194,6 +1316,7 @@ def render_resume_data_with_llm(
     llm_config: dict[str, Any] | None,
     *,
     user_id: str | None = None,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
 ) -> tuple[dict[str, Any], list[str]]:
     """
     Generate the `resume_preview.html` data object (the `const resume = {...}` JSON) via LLM,
@@ -1201,6 +1324,8 @@ def render_resume_data_with_llm(
 
     Returns (resume_data, added_keywords_in_order).
     Fail-hard: raises on invalid JSON/output.
+    on_partial: optional sink; the completion is streamed and name / subtitle / contacts and each
+    section are emitted as soon as they are complete (see _StreamedResumeSections).
     """
     provider = _norm_provider(str((llm_config or {}).get("provider") or ""))
     api_key = str((llm_config or {}).get("apiKey") or "").strip()
@@ -1288,14 +1413,15 @@ def render_resume_data_with_llm(
         _call_gemini,
     )
 
+    sink = _StreamedResumeSections(on_partial, rt) if on_partial is not None else None
     if provider == "openai":
-        raw = _call_openai(api_key, prompt, model)
+        raw = _call_openai(api_key, prompt, model, accept=_parse_possible_json, on_delta=sink)
     elif provider == "openrouter":
-        raw = _call_openrouter(api_key, prompt, model)
+        raw = _call_openrouter(api_key, prompt, model, accept=_parse_possible_json, on_delta=sink)
     elif provider == "anthropic":
-        raw = _call_claude(api_key, prompt, model)
+        raw = _call_claude(api_key, prompt, model, accept=_parse_possible_json, on_delta=sink)
     elif provider == "gemini":
-        raw = _call_gemini(api_key, prompt, model)
+        raw = _call_gemini(api_key, prompt, model, accept=_parse_possible_json, on_delta=sink)
     else:
         raise RuntimeError(f"Unsupported provider for resume JSON: {provider}")
 
@@ -1559,15 +1685,7 @@ def _resume_blob(data: dict[str, Any]) -> str:
 
 
 def _already_present(blob_lower: str, phrase: str) -> bool:
-    pl = phrase.strip().lower()
-    if not pl:
-        return True
-    if pl in blob_lower:
-        return True
-    toks = [t for t in re.split(r"[^\w+]+", pl) if len(t) > 2]
-    if not toks:
-        return False
-    return all(t.lower() in blob_lower for t in toks)
+    return keyword_matcher.index_for(blob_lower).has_all_tokens(phrase)
 
 
 _NARRATIVE_CONNECTORS = (
@@ -1738,8 +1856,11 @@ def apply_missing_keywords(
     proj_idx = 0
     narrative_i = 0
 
+    # Rebuild the blob only after a keyword was placed (every edit below records it in `added`).
+    blob, blob_added = _resume_blob(data), len(added)
     for kw in remaining:
-        blob = _resume_blob(data)
+        if len(added) != blob_added:
+            blob, blob_added = _resume_blob(data), len(added)
         if _already_present(blob, kw):
             continue
 
@@ -1901,6 +2022,7 @@ def apply_missing_keywords_to_resume_preview_data(
         data["sections"] = []
         sections = data["sections"]
 
+    blob = _resume_preview_data_blob(data)
     candidates: list[str] = []
     seen: set[str] = set()
     for raw in missing_keywords or []:
@@ -1913,7 +2035,6 @@ def apply_missing_keywords_to_resume_preview_data(
         if low in seen:
             continue
         seen.add(low)
-        blob = _resume_preview_data_blob(data)
         if _already_present(blob, k):
             continue
         candidates.append(k)
@@ -1969,8 +2090,10 @@ def apply_missing_keywords_to_resume_preview_data(
     )
     narr_tpl_i = 0
 
+    blob_added = 0
     for kw in candidates:
-        blob = _resume_preview_data_blob(data)
+        if len(added) != blob_added:
+            blob, blob_added = _resume_preview_data_blob(data), len(added)
         if _already_present(blob, kw):
             continue
         if _should_append_keyword_to_skills_list(kw):
@@ -2061,9 +2184,20 @@ def structured_to_preview_text(data: dict[str, Any]) -> str:
     return "\n".join(lines).strip()
 
 
+_ENHANCE_LABEL_RE = re.compile(r"(?ms)^\s*\[([^\]]+)\]\s*\n(.*?)(?=^\s*\[|\Z)")
+
+
 def _call_openai_mini(api_key: str, user_prompt: str, model: str) -> str:
+    model = model or "gpt-4o-mini"
+    return llm_cache.cached_completion(
+        "openai", model, user_prompt, lambda: _request_openai_mini(api_key, user_prompt, model),
+        variant="fix-enhance", api_key=api_key, accept=_ENHANCE_LABEL_RE.search,
+    )
+
+
+def _request_openai_mini(api_key: str, user_prompt: str, model: str) -> str:
     payload = json.dumps({
-        "model": model or "gpt-4o-mini",
+        "model": model,
         "messages": [
             {
                 "role": "system",
@@ -2085,7 +2219,44 @@ def _call_openai_mini(api_key: str, user_prompt: str, model: str) -> str:
         headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
         method="POST",
     )
-    with urllib.request.urlopen(req, timeout=60) as resp:
+    with http_client.urlopen(req, timeout=60) as resp:
+        out = json.loads(resp.read().decode("utf-8"))
+    return (out.get("choices") or [{}])[0].get("message", {}).get("content") or ""
+
+
+def _call_openrouter_mini(api_key: str, user_prompt: str, model: str) -> str:
+    return llm_cache.cached_completion(
+        "openrouter", model, user_prompt, lambda: _request_openrouter_mini(api_key, user_prompt, model),
+        variant="fix-enhance", api_key=api_key, accept=_ENHANCE_LABEL_RE.search,
+    )
+
+
+def _request_openrouter_mini(api_key: str, user_prompt: str, model: str) -> str:
+    payload = json.dumps({
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": (
+                    "Do not rewrite, only minimally enhance and insert keywords. "
+                    "Keep the user's tone. Do not remove facts. Plain text only."
+                ),
+            },
+            {"role": "user", "content": user_prompt},
+        ],
+        "temperature": 0.2,
+        "max_tokens": 1200,
+    }).encode("utf-8")
+    req = urllib.request.Request(
+        "https://openrouter.ai/api/v1/chat/completions",
+        data=payload,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        method="POST",
+    )
+    with http_client.urlopen(req, timeout=60) as resp:
         out = json.loads(resp.read().decode("utf-8"))
     return (out.get("choices") or [{}])[0].get("message", {}).get("content") or ""
 
@@ -2134,33 +2305,7 @@ def maybe_llm_enhance(
 
     try:
         if provider == "openrouter":
-            payload = json.dumps({
-                "model": model or "openai/gpt-4o-mini",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "Do not rewrite, only minimally enhance and insert keywords. "
-                            "Keep the user's tone. Do not remove facts. Plain text only."
-                        ),
-                    },
-                    {"role": "user", "content": user_prompt},
-                ],
-                "temperature": 0.2,
-                "max_tokens": 1200,
-            }).encode("utf-8")
-            req = urllib.request.Request(
-                "https://openrouter.ai/api/v1/chat/completions",
-                data=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                method="POST",
-            )
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                out = json.loads(resp.read().decode("utf-8"))
-            raw = (out.get("choices") or [{}])[0].get("message", {}).get("content") or ""
+            raw = _call_openrouter_mini(api_key, user_prompt, model or "openai/gpt-4o-mini")
         else:
             raw = _call_openai_mini(api_key, user_prompt, model or "gpt-4o-mini")
     except Exception:
@@ -2168,7 +2313,7 @@ def maybe_llm_enhance(
 
     # Parse [LABEL] … blocks from the model output
     mapping: dict[str, str] = {}
-    for m in re.finditer(r"(?ms)^\s*\[([^\]]+)\]\s*\n(.*?)(?=^\s*\[|\Z)", raw.strip()):
+    for m in _ENHANCE_LABEL_RE.finditer(raw.strip()):
         mapping[m.group(1).strip()] = m.group(2).strip()
 
     if not mapping:
@@ -2338,13 +2483,13 @@ def map_fields_with_optional_llm(
         )
 
         if provider == "openai":
-            raw = _call_openai(api_key, prompt, model)
+            raw = _call_openai(api_key, prompt, model, accept=_parse_possible_json)
         elif provider == "openrouter":
-            raw = _call_openrouter(api_key, prompt, model)
+            raw = _call_openrouter(api_key, prompt, model, accept=_parse_possible_json)
         elif provider == "anthropic":
-            raw = _call_claude(api_key, prompt, model)
+            raw = _call_claude(api_key, prompt, model, accept=_parse_possible_json)
         elif provider == "gemini":
-            raw = _call_gemini(api_key, prompt, model)
+            raw = _call_gemini(api_key, prompt, model, accept=_parse_possible_json)
         else:
             return data
     except Exception as e:
@@ -12,7 +12,7 @@ import os
 import re
 import uuid
 import urllib.parse
-from typing import Any
+from typing import Any, Callable
 
 # Optional AWS deps (local dev may not have boto3/botocore installed).
 try:
@@ -171,10 +171,13 @@ def run_fix_resume_pipeline(
     body: dict[str, Any],
     *,
     extract_text_from_bytes,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
     """
     Core implementation. extract_text_from_bytes is injected to avoid circular imports
     with ats_resume_scorer.extract_text_from_bytes.
+    on_partial: optional sink for sections of the AI JSON / HTML render as they stream in
+    (the returned result is the same either way).
     """
     user_id = _field_str(body, "userId", "user_id")
 
@@ -249,6 +252,7 @@ def run_fix_resume_pipeline(
                     "model": _field_str(body, "model", "llmModel"),
                 },
                 user_id=user_id or None,
+                on_partial=on_partial,
             )
         except Exception as e:
             return {"success": False, "message": f"AI resume JSON render failed: {e}"}
@@ -267,6 +271,7 @@ def run_fix_resume_pipeline(
                     "model": _field_str(body, "model", "llmModel"),
                 },
                 user_id=user_id or None,
+                on_partial=on_partial,
             )
         except Exception as e:
             return {"success": False, "message": f"AI HTML render failed: {e}"}
@@ -1,20 +1,46 @@
 """
-Shared PDF/DOCX → plain text extraction for ATS scorer and Fix Resume Lambdas.
+Shared PDF/DOCX → plain text ingestion for the ATS scorer, Fix Resume and portfolio
+builder Lambdas. Everything works on the uploaded bytes in memory (no temp files); file
+kinds map to extractors through one registry (_EXTRACTORS).
 
-PDF order: PyPDF2 → pdfminer.six (pure Python; helps when PyMuPDF .so is broken on Lambda)
-→ PyMuPDF → optional Textract OCR.
+PDFs are parsed once (PyMuPDF, or PyPDF2 when PyMuPDF cannot load) and every page gets a
+text_quality() score. Only pages below PDF_PAGE_MIN_QUALITY are re-extracted: first with
+one pdfminer.six pass over all of them, then with Textract OCR for the pages still weak.
+When no PDF library is bundled a stdlib content-stream scanner is the last resort. DOCX uses
+python-docx, or word/document.xml directly when it is not bundled.
+
+extract_clean_text() adds the clean_resume_text() / is_garbage_text() pass the
+regex-based portfolio parsers expect.
 
 Env (optional):
-- ENABLE_TEXTRACT_OCR=1, OCR_MAX_PDF_PAGES (default 3): Textract for scanned PDFs
-- MIN_PDF_TEXT_CHARS (default 40): threshold before trying extra extractors / OCR
+- ENABLE_TEXTRACT_OCR=1, OCR_MAX_PDF_PAGES (default 3): Textract for weak/scanned pages
+- OCR_CONCURRENCY (default 4): pages OCR'd in parallel
+- MIN_PDF_TEXT_CHARS (default 40): pages with less text score proportionally lower
+- PDF_PAGE_MIN_QUALITY (default 0.6): page score below which other extractors / OCR are tried
 - SKIP_PYMUPDF_PDF=1: never load PyMuPDF (use when native .so is broken on Lambda)
+- RESUME_TEXT_CACHE_ENTRIES (default 64): in-container LRU of extracted text (0 disables)
+- RESUME_TEXT_CACHE_S3_BUCKET, RESUME_TEXT_CACHE_S3_PREFIX (default resume-text-cache/):
+  optional second tier shared by all containers; needs s3:GetObject / s3:PutObject on the
+  prefix. Objects hold résumé text, so keep the bucket private and add a lifecycle rule.
+
+Extraction results are cached by SHA-256 of the file bytes + file type + EXTRACTOR_VERSION
++ the OCR / threshold settings above, so re-scoring the same résumé skips PDF parsing.
+Bump EXTRACTOR_VERSION whenever extraction output changes. Failures are never cached.
 """
 
 from __future__ import annotations
 
+import hashlib
 import io
+import json
 import os
 import re
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 # Optional AWS dependency (local dev may not have boto3 installed).
 try:
@@ -31,6 +57,33 @@ try:
     MIN_PDF_TEXT_CHARS = max(5, int(os.environ.get("MIN_PDF_TEXT_CHARS", "40")))
 except ValueError:
     MIN_PDF_TEXT_CHARS = 40
+try:
+    PDF_PAGE_MIN_QUALITY = max(0.0, min(1.0, float(os.environ.get("PDF_PAGE_MIN_QUALITY", "0.6"))))
+except ValueError:
+    PDF_PAGE_MIN_QUALITY = 0.6
+try:
+    OCR_CONCURRENCY = max(1, min(10, int(os.environ.get("OCR_CONCURRENCY", "4"))))
+except ValueError:
+    OCR_CONCURRENCY = 4
+
+# Render scale for OCR: scanned pages are rendered at their embedded image's own
+# resolution (no upsampling past it), other pages at the default; always within
+# [MIN, MAX] and shrunk until the PNG fits Textract's synchronous limits.
+OCR_DEFAULT_ZOOM = 2.0
+OCR_MIN_ZOOM = 1.0
+OCR_MAX_ZOOM = 3.0
+TEXTRACT_MAX_IMAGE_BYTES = 10 * 1024 * 1024
+TEXTRACT_MAX_IMAGE_SIDE = 10000
+
+EXTRACTOR_VERSION = "3"
+try:
+    RESUME_TEXT_CACHE_ENTRIES = max(0, int(os.environ.get("RESUME_TEXT_CACHE_ENTRIES", "64")))
+except ValueError:
+    RESUME_TEXT_CACHE_ENTRIES = 64
+RESUME_TEXT_CACHE_S3_BUCKET = (os.environ.get("RESUME_TEXT_CACHE_S3_BUCKET") or "").strip()
+RESUME_TEXT_CACHE_S3_PREFIX = (os.environ.get("RESUME_TEXT_CACHE_S3_PREFIX") or "resume-text-cache/").strip()
+if RESUME_TEXT_CACHE_S3_PREFIX and not RESUME_TEXT_CACHE_S3_PREFIX.endswith("/"):
+    RESUME_TEXT_CACHE_S3_PREFIX += "/"
 
 # Cached after first probe: False when PyMuPDF native libs cannot load (common bad Lambda zips).
 _fitz_usable: bool | None = None
@@ -66,16 +119,31 @@ def _invalidate_fitz() -> None:
     _fitz_usable = False
 
 
-def _pypdf_extract(data: bytes) -> str:
+def _pypdf_page_texts(data: bytes) -> list[str]:
     import PyPDF2
 
     reader = PyPDF2.PdfReader(io.BytesIO(data))
-    parts = []
-    for page in reader.pages:
-        t = page.extract_text()
-        if t:
-            parts.append(t)
-    return "\n".join(parts).strip()
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def _pdfminer_page_texts(data: bytes, page_indexes: list[int]) -> dict[int, str]:
+    """
+    Pure-Python text for the given pages in one pdfminer pass (the document is parsed
+    once and only those pages are laid out). pdfminer ends every page with a form feed,
+    so the output is split on it and matched to the indexes in document order.
+    """
+    if not page_indexes:
+        return {}
+    try:
+        from pdfminer.high_level import extract_text
+    except ImportError:
+        return {}
+    wanted = sorted(set(page_indexes))
+    try:
+        out = extract_text(io.BytesIO(data), page_numbers=wanted) or ""
+    except Exception:
+        return {}
+    return {i: chunk.strip() for i, chunk in zip(wanted, out.split("\f"))}
 
 
 def _pdfminer_extract(data: bytes) -> str:
@@ -90,46 +158,205 @@ def _pdfminer_extract(data: bytes) -> str:
         return ""
 
 
-def _fitz_text_extract(data: bytes) -> str:
-    import fitz
+_PDF_STREAM_RE = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.DOTALL)
+_PDF_TJ_RE = re.compile(r"\(((?:\\.|[^\\)])*)\)\s*Tj|\[([^\]]*)\]\s*TJ|<([0-9A-Fa-f]+)>\s*Tj")
+_PDF_STRING_RE = re.compile(r"\(((?:\\.|[^\\)])*)\)")
+_PDF_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "(": "(", ")": ")", "\\": "\\"}
+
+
+def _decode_pdf_string(s: str) -> str:
+    def _unescape(m):
+        esc = m.group(1)
+        if esc[0] in "01234567":
+            return chr(int(esc, 8))
+        return _PDF_ESCAPES.get(esc, esc)
+
+    s = re.sub(r"\\([0-7]{1,3}|.)", _unescape, s, flags=re.DOTALL)
+    return "".join(c for c in s if c.isprintable() or c in "\n\t")
+
+
+def _pdf_content_text(content: str) -> str:
+    parts = []
+    for m in _PDF_TJ_RE.finditer(content):
+        literal, array, hexstr = m.groups()
+        if literal is not None:
+            parts.append(_decode_pdf_string(literal))
+        elif array is not None:
+            parts.append("".join(_decode_pdf_string(s) for s in _PDF_STRING_RE.findall(array)))
+        else:
+            try:
+                parts.append(bytes.fromhex(hexstr).decode("utf-8", errors="ignore"))
+            except ValueError:
+                pass
+    return " ".join(p for p in parts if p.strip())
+
+
+def _looks_like_content_stream(raw: bytes) -> bool:
+    head = raw[:1024]
+    if not head or (b"Tj" not in raw and b"TJ" not in raw):
+        return False
+    return sum(1 for b in head if 32 <= b < 127 or b in (9, 10, 13)) / len(head) > 0.9
 
-    doc = fitz.open(stream=data, filetype="pdf")
+
+def _pdf_stdlib_text(data: bytes) -> str:
+    """
+    Last resort when no PDF library can open the file: pull Tj/TJ strings out of
+    FlateDecode (zlib) and uncompressed content streams. Stdlib only, no font maps,
+    so text in embedded/CID fonts comes out as garbage and scores low.
+    """
     parts = []
-    for i in range(doc.page_count):
-        parts.append(doc.load_page(i).get_text("text") or "")
-    doc.close()
-    return "\n".join(parts).strip()
+    for m in _PDF_STREAM_RE.finditer(data):
+        try:
+            raw = zlib.decompress(m.group(1))
+        except zlib.error:
+            raw = m.group(1)
+        if not _looks_like_content_stream(raw):
+            continue  # images, fonts, ICC profiles
+        text = _pdf_content_text(raw.decode("latin-1"))
+        if text:
+            parts.append(text)
+    text = "\n".join(parts)
+    return re.sub(r"([.!?])\s+([A-Z])", r"\1\n\2", text).strip()
+
+
+def _fitz_page_is_blank(page) -> bool:
+    """No text, images or vector drawings: nothing for OCR to find."""
+    try:
+        return not page.get_images(full=False) and not page.get_drawings()
+    except Exception:
+        return False
+
+
+_textract_client = None
 
 
-def _fitz_textract_ocr(data: bytes) -> str:
+def _get_textract_client():
+    global _textract_client
+    if _textract_client is None:
+        if boto3 is None:
+            raise RuntimeError("boto3 not installed; Textract OCR is unavailable.")
+        _textract_client = boto3.client("textract")
+    return _textract_client
+
+
+def _ocr_zoom(page) -> float:
+    """Render scale matching the largest embedded image (scans), else OCR_DEFAULT_ZOOM."""
+    zoom = OCR_DEFAULT_ZOOM
+    try:
+        best_area = 0.0
+        for img in page.get_images(full=True):
+            xref, width_px = img[0], img[2]
+            for rect in page.get_image_rects(xref):
+                if rect.width > 0 and rect.width * rect.height > best_area:
+                    best_area = rect.width * rect.height
+                    zoom = width_px / rect.width
+    except Exception:
+        pass
+    longest = max(page.rect.width, page.rect.height) or 1.0
+    return max(OCR_MIN_ZOOM, min(OCR_MAX_ZOOM, zoom, TEXTRACT_MAX_IMAGE_SIDE / longest))
+
+
+def _render_page_png(page) -> bytes:
     import fitz
 
-    if boto3 is None:
-        raise RuntimeError("boto3 not installed; Textract OCR is unavailable.")
-    textract = boto3.client("textract")
-    doc = fitz.open(stream=data, filetype="pdf")
-    out = []
-    n = min(doc.page_count, OCR_MAX_PDF_PAGES)
-    for i in range(n):
-        page = doc.load_page(i)
-        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
-        png = pix.tobytes("png")
-        resp = textract.detect_document_text(Document={"Bytes": png})
-        lines = [b.get("Text", "") for b in resp.get("Blocks", []) if b.get("BlockType") == "LINE"]
-        out.append("\n".join(lines))
-    doc.close()
-    return "\n".join(out).strip()
+    zoom = _ocr_zoom(page)
+    while True:
+        png = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False).tobytes("png")
+        if len(png) <= TEXTRACT_MAX_IMAGE_BYTES or zoom <= OCR_MIN_ZOOM:
+            return png
+        zoom = max(OCR_MIN_ZOOM, zoom * 0.7)
+
+
+def _textract_png(client, png: bytes) -> str:
+    resp = client.detect_document_text(Document={"Bytes": png})
+    lines = [b.get("Text", "") for b in resp.get("Blocks", []) if b.get("BlockType") == "LINE"]
+    return "\n".join(lines).strip()
+
+
+def _fitz_textract_ocr(doc, page_indexes: list[int], client=None) -> dict[int, str]:
+    """
+    Textract OCR for the given pages of an open PyMuPDF document: {page index: text}
+    in page order. Pages are rendered one by one on this thread (PyMuPDF documents
+    are not thread-safe) while up to OCR_CONCURRENCY Textract calls run in parallel,
+    so rendering page N+1 overlaps OCR of page N. Pages that fail are left out;
+    raises only if every page failed.
+    """
+    if not page_indexes:
+        return {}
+    client = client or _get_textract_client()
+    futures = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(OCR_CONCURRENCY, len(page_indexes))) as pool:
+        for i in page_indexes:
+            try:
+                png = _render_page_png(doc.load_page(i))
+            except Exception as e:
+                errors.append(e)
+                print(f"OCR render failed for page {i + 1}: {e}")
+                continue
+            futures[i] = pool.submit(_textract_png, client, png)
+    out = {}
+    for i in sorted(futures):
+        try:
+            out[i] = futures[i].result()
+        except Exception as e:
+            errors.append(e)
+            print(f"Textract failed for page {i + 1}: {e}")
+    if errors and not out:
+        raise errors[0]
+    return out
+
+
+_RESUME_HEADINGS = (
+    r"EXPERIENCE|WORK\s+EXPERIENCE|EDUCATION|SKILLS|PROJECTS?|SUMMARY|"
+    r"CERTIFICATIONS?|ACHIEVEMENTS?|TECHNICAL\s+SKILLS|PUBLICATIONS?|INTERNSHIP|CERTIFICATES?"
+)
+_HEADING_LINE_RE = re.compile(r"(?m)^\s*(?:" + _RESUME_HEADINGS + r")\s*:?\s*$", re.I)
+_GARBAGE_RE = re.compile(r"\(cid:\d+\)|[\ufffd\x00-\x08\x0b\x0c\x0e-\x1f\ue000-\uf8ff]")
+_TOKEN_EDGE = "\"'()[]{}<>,.;:!?|•·*–—-"
+
+
+def _is_wordlike(token: str) -> bool:
+    tok = token.strip(_TOKEN_EDGE)
+    if not tok:
+        return True  # bare punctuation / bullets
+    if "@" in tok or tok.lower().startswith(("http", "www.")):
+        return True
+    if any(c.isdigit() for c in tok):
+        # Dates, phone numbers, percentages, versions, "5+", "10k"
+        return sum(c.isalpha() for c in tok) <= 3 or len(tok) <= 12
+    core = tok.replace("'", "").replace("’", "").replace("-", "").replace("/", "").replace(".", "")
+    core = core.rstrip("+#")  # C++, C#
+    if not core.isalpha() or len(core) > 20:
+        return False
+    # Glued words from bad text layers ("SoftwareEngineeratAcme") switch case repeatedly
+    humps = sum(1 for a, b in zip(core, core[1:]) if a.islower() and b.isupper())
+    return humps <= 2
+
+
+def text_quality(text: str) -> float:
+    """
+    0..1 score for one page of extracted text: share of word-shaped tokens,
+    penalised for garbage glyphs ((cid:n), U+FFFD, control / private-use
+    chars), boosted by résumé section headings, scaled down below
+    MIN_PDF_TEXT_CHARS characters.
+    """
+    stripped = (text or "").strip()
+    if not stripped:
+        return 0.0
+    tokens = stripped.split()
+    word_ratio = sum(1 for t in tokens if _is_wordlike(t)) / len(tokens)
+    garbage = sum(len(m) for m in _GARBAGE_RE.findall(stripped)) / len(stripped)
+    headings = len(_HEADING_LINE_RE.findall(stripped))
+    score = word_ratio * max(0.0, 1.0 - 3.0 * garbage) + min(0.15, 0.05 * headings)
+    return max(0.0, min(1.0, score)) * min(1.0, len(stripped) / MIN_PDF_TEXT_CHARS)
 
 
 def structure_resume_sections(text: str) -> str:
     """Insert clearer breaks before common résumé headings."""
     if not text:
         return text
-    pattern = re.compile(
-        r"(?m)(^\s*(?:EXPERIENCE|WORK\s+EXPERIENCE|EDUCATION|SKILLS|PROJECTS?|SUMMARY|"
-        r"CERTIFICATIONS?|ACHIEVEMENTS?|TECHNICAL\s+SKILLS|PUBLICATIONS?|INTERNSHIP|CERTIFICATES?)\s*:?\s*$)",
-        re.I,
-    )
+    pattern = re.compile(r"(?m)(^\s*(?:" + _RESUME_HEADINGS + r")\s*:?\s*$)", re.I)
 
     def _break_before(m):
         return "\n\n" + m.group(1).strip() + "\n"
@@ -138,6 +365,39 @@ def structure_resume_sections(text: str) -> str:
     return re.sub(r"\n{3,}", "\n\n", out).strip()
 
 
+_BULLETS = "•●○▪▫►▸◆◇■□★☆➤➢→»"
+
+
+def clean_resume_text(text: str) -> str:
+    """
+    Normalise extracted text for the regex-based portfolio parsers: drop (cid:n) and
+    private-use glyphs, turn bullet glyphs into "-", re-join split emails / URLs /
+    phone digits, collapse whitespace and blank lines.
+    """
+    if not text:
+        return ""
+    text = re.sub(r"\(?cid:\d+\)?", "", text)
+    text = re.sub("[\ue000-\uf8ff]", "", text).replace("\ufffd", " ")
+    text = text.translate({ord(b): "-" for b in _BULLETS})
+    text = re.sub(r"(\w+)\s*@\s*(\w+)\s*\.\s*(\w+)", r"\1@\2.\3", text)
+    text = re.sub(r"(https?)\s*:\s*/\s*/\s*", r"\1://", text)
+    text = re.sub(r"(\+?\d)\s+(\d)\s+(\d)\s+(\d)", r"\1\2\3\4", text)
+    text = re.sub(r"[ \t]+", " ", text.replace("\r\n", "\n").replace("\r", "\n"))
+    lines = (line.strip() for line in text.split("\n"))
+    text = "\n".join(line for line in lines if line)
+    return "".join(c for c in text if c.isprintable() or c in "\n\t").strip()
+
+
+def is_garbage_text(text: str) -> bool:
+    """True for empty / very short text, many (cid:n) artifacts, or under 60% readable characters."""
+    if not text or len(text) < 50:
+        return True
+    if len(re.findall(r"cid:\d+", text)) > 10:
+        return True
+    readable = sum(1 for c in text if c.isalnum() or c in " .,;:!?@#$%&*()-_+=\n\t'\"/")
+    return readable / len(text) < 0.6
+
+
 def _pdf_extraction_deps_missing_hint(notes):
     blob = " ".join(notes)
     if "No module named 'PyPDF2'" in blob or "No module named 'fitz'" in blob:
@@ -153,67 +413,294 @@ def _pdf_extraction_deps_missing_hint(notes):
     return ""
 
 
-def extract_text_from_bytes(data: bytes, filename: str) -> str:
-    """Extract plain text from PDF or DOCX; PDF tries PyPDF2 → pdfminer → PyMuPDF → optional Textract OCR."""
+def _file_kind(filename: str, file_type: str = "") -> str:
+    """Registry kind from the file extension, else from the MIME type."""
     fn = (filename or "resume.pdf").lower()
-    if fn.endswith(".pdf"):
-        notes = []
-        text = ""
+    for ext, kind in _KIND_BY_EXTENSION.items():
+        if fn.endswith(ext):
+            return kind
+    mime = (file_type or "").lower()
+    for marker, kind in _KIND_BY_MIME.items():
+        if marker in mime:
+            return kind
+    raise ValueError("Unsupported file type. Use .pdf or .docx")
+
+
+def _extract_pdf(data: bytes) -> tuple[str, str, list[str]]:
+    """
+    Parse the PDF once (PyMuPDF, else PyPDF2), score every page with
+    text_quality() and re-extract only weak pages: one pdfminer pass over
+    all of them, then Textract OCR (ENABLE_TEXTRACT_OCR, at most OCR_MAX_PDF_PAGES pages).
+    Returns (text, extractors used joined by "+", notes).
+    """
+    notes: list[str] = []
+    doc = None
+    pages: list[str] = []
+    primary = ""
+    if _fitz_open_probe():
         try:
-            text = _pypdf_extract(data)
+            import fitz
+
+            doc = fitz.open(stream=data, filetype="pdf")
+            pages = [doc.load_page(i).get_text("text") or "" for i in range(doc.page_count)]
+            primary = "pymupdf"
+        except Exception as e:
+            notes.append(f"PyMuPDF:{e}")
+            _invalidate_fitz()
+            doc = None
+    if not primary:
+        try:
+            pages = _pypdf_page_texts(data)
+            primary = "pypdf2"
         except Exception as e:
             notes.append(f"PyPDF2:{e}")
-            text = ""
-        if len(text) < MIN_PDF_TEXT_CHARS:
-            t_min = _pdfminer_extract(data)
-            if len(t_min) > len(text):
-                text = t_min
-        if len(text) < MIN_PDF_TEXT_CHARS and _fitz_open_probe():
-            try:
-                t2 = _fitz_text_extract(data)
-                if len(t2) > len(text):
-                    text = t2
-            except Exception as e:
-                notes.append(f"PyMuPDF:{e}")
-                _invalidate_fitz()
-        if len(text) < MIN_PDF_TEXT_CHARS and ENABLE_TEXTRACT_OCR and _fitz_open_probe():
+    if not primary:
+        # Neither library could open the file; pdfminer, then the stdlib scanner, take the whole document
+        for name, whole_document in (("pdfminer", _pdfminer_extract), ("stdlib", _pdf_stdlib_text)):
+            whole = whole_document(data)
+            if whole:
+                pages, primary = [whole], name
+                break
+
+    try:
+        sources = [primary] * len(pages)
+        scores = [text_quality(p) for p in pages]
+        weak = []
+        for i, score in enumerate(scores):
+            if score >= PDF_PAGE_MIN_QUALITY:
+                continue
+            if doc is not None and not pages[i].strip() and _fitz_page_is_blank(doc.load_page(i)):
+                continue
+            weak.append(i)
+
+        if primary in ("pymupdf", "pypdf2"):
+            # A page with no text layer at all (scanned) can only be helped by OCR
+            retry = [i for i in weak if doc is None or pages[i].strip()]
+            alts = _pdfminer_page_texts(data, retry) if retry else {}
+            for i, alt in alts.items():
+                alt_score = text_quality(alt)
+                if alt_score > scores[i]:
+                    pages[i], sources[i], scores[i] = alt, "pdfminer", alt_score
+
+        needs_ocr = [i for i in weak if scores[i] < PDF_PAGE_MIN_QUALITY][:OCR_MAX_PDF_PAGES]
+        if needs_ocr and ENABLE_TEXTRACT_OCR and doc is not None:
             try:
-                t3 = _fitz_textract_ocr(data)
-                if len(t3) > len(text):
-                    text = t3
+                for i, ocr_text in _fitz_textract_ocr(doc, needs_ocr).items():
+                    ocr_score = text_quality(ocr_text)
+                    if ocr_score > scores[i]:
+                        pages[i], sources[i], scores[i] = ocr_text, "textract", ocr_score
             except Exception as e:
                 notes.append(f"Textract:{e}")
-                _invalidate_fitz()
-        if not text or len(text.strip()) < 5:
-            deps_hint = _pdf_extraction_deps_missing_hint(notes)
-            textract_hint = ""
-            if not deps_hint:
-                if not ENABLE_TEXTRACT_OCR:
-                    textract_hint = (
-                        " Try ENABLE_TEXTRACT_OCR=1 with textract:DetectDocumentText on the Lambda role "
-                        "(requires working PyMuPDF on this host for page images)."
-                    )
-                elif not _fitz_open_probe():
-                    textract_hint = (
-                        " Textract OCR is enabled but PyMuPDF cannot load on this host, so OCR was skipped. "
-                        "Use a text-based PDF/DOCX, fix the PyMuPDF Linux wheel in the deployment zip, or set "
-                        "SKIP_PYMUPDF_PDF=1."
-                    )
-            raise ValueError(
-                "Could not extract enough text from PDF (may be scanned)."
-                + deps_hint
-                + textract_hint
-                + (" Details: " + "; ".join(notes) if notes else "")
-            )
-        return structure_resume_sections(text)
-    if fn.endswith(".docx"):
-        try:
-            import docx
-        except ImportError as e:
-            raise RuntimeError("python-docx not installed in Lambda layer/package") from e
+    finally:
+        if doc is not None:
+            doc.close()
+
+    text = "\n".join(p.strip() for p in pages if p.strip())
+    used = [src for i, src in enumerate(sources) if pages[i].strip()]
+    extractor = "+".join(dict.fromkeys(used)) or primary
+    return text, extractor, notes
+
+
+def _pdf_to_text(data: bytes) -> tuple[str, str]:
+    text, extractor, notes = _extract_pdf(data)
+    if not text or len(text.strip()) < 5:
+        deps_hint = _pdf_extraction_deps_missing_hint(notes)
+        textract_hint = ""
+        if not deps_hint:
+            if not ENABLE_TEXTRACT_OCR:
+                textract_hint = (
+                    " Try ENABLE_TEXTRACT_OCR=1 with textract:DetectDocumentText on the Lambda role "
+                    "(requires working PyMuPDF on this host for page images)."
+                )
+            elif not _fitz_open_probe():
+                textract_hint = (
+                    " Textract OCR is enabled but PyMuPDF cannot load on this host, so OCR was skipped. "
+                    "Use a text-based PDF/DOCX, fix the PyMuPDF Linux wheel in the deployment zip, or set "
+                    "SKIP_PYMUPDF_PDF=1."
+                )
+        raise ValueError(
+            "Could not extract enough text from PDF (may be scanned)."
+            + deps_hint
+            + textract_hint
+            + (" Details: " + "; ".join(notes) if notes else "")
+        )
+    return structure_resume_sections(text), extractor
+
+
+def _docx_to_text(data: bytes) -> tuple[str, str]:
+    """python-docx when bundled, else paragraphs straight from word/document.xml."""
+    try:
+        import docx
+    except ImportError:
+        docx = None
+    if docx is not None:
         document = docx.Document(io.BytesIO(data))
-        text = "\n".join(p.text for p in document.paragraphs if p.text).strip()
-        if not text:
-            raise ValueError("Could not extract text from DOCX")
-        return structure_resume_sections(text)
-    raise ValueError("Unsupported file type. Use .pdf or .docx")
+        text, extractor = "\n".join(p.text for p in document.paragraphs if p.text).strip(), "python-docx"
+    else:
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as z:
+                xml = z.read("word/document.xml").decode("utf-8", errors="ignore")
+        except (zipfile.BadZipFile, KeyError) as e:
+            raise ValueError(f"Could not read DOCX: {e}") from e
+        paragraphs = (re.sub(r"<[^>]+>", "", p) for p in re.split(r"</w:p>", xml.replace("<w:tab/>", "\t")))
+        text, extractor = "\n".join(p.strip() for p in paragraphs if p.strip()), "docx-xml"
+    if not text:
+        raise ValueError("Could not extract text from DOCX")
+    return structure_resume_sections(text), extractor
+
+
+# Extractor registry: kind -> fn(bytes) -> (structured text, extractor name). Every
+# bundle (ATS, Fix Resume, portfolio builders) ingests résumés through this table.
+_EXTRACTORS = {"pdf": _pdf_to_text, "docx": _docx_to_text}
+_KIND_BY_EXTENSION = {".pdf": "pdf", ".docx": "docx"}
+_KIND_BY_MIME = {"pdf": "pdf", "wordprocessingml": "docx"}
+
+
+def _extract_uncached(data: bytes, kind: str) -> tuple[str, str]:
+    """(structured text, extractor that produced it) from the registered extractor for kind."""
+    extractor = _EXTRACTORS.get(kind)
+    if extractor is None:
+        raise ValueError("Unsupported file type. Use .pdf or .docx")
+    return extractor(data)
+
+
+# ---------------------------------------------------------------------------
+# Content-addressed extraction cache (in-container LRU + optional S3 tier)
+# ---------------------------------------------------------------------------
+
+_cache: "OrderedDict[str, dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "s3Hits": 0, "misses": 0, "s3Errors": 0}
+_s3_client = None
+
+
+def _settings_fingerprint(kind: str) -> str:
+    if kind != "pdf":
+        return ""
+    return f"ocr{int(ENABLE_TEXTRACT_OCR)}-p{OCR_MAX_PDF_PAGES}-m{MIN_PDF_TEXT_CHARS}-q{PDF_PAGE_MIN_QUALITY:g}"
+
+
+def extraction_cache_key(data: bytes, filename: str, file_type: str = "") -> str:
+    kind = _file_kind(filename, file_type)
+    digest = hashlib.sha256(data).hexdigest()
+    return f"v{EXTRACTOR_VERSION}/{kind}/{_settings_fingerprint(kind)}/{digest}".replace("//", "/")
+
+
+def _get_s3_client():
+    global _s3_client
+    if _s3_client is None and boto3 is not None:
+        region = (os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "ap-south-2").strip()
+        _s3_client = boto3.client("s3", region_name=region)
+    return _s3_client
+
+
+def _s3_get(key: str) -> dict | None:
+    client = _get_s3_client() if RESUME_TEXT_CACHE_S3_BUCKET else None
+    if client is None:
+        return None
+    try:
+        obj = client.get_object(Bucket=RESUME_TEXT_CACHE_S3_BUCKET, Key=RESUME_TEXT_CACHE_S3_PREFIX + key + ".json")
+        entry = json.loads(obj["Body"].read().decode("utf-8"))
+    except Exception as e:
+        # NoSuchKey is the normal miss; anything else is logged but never fails extraction
+        if "NoSuchKey" not in type(e).__name__ and "NoSuchKey" not in str(e):
+            _cache_stats["s3Errors"] += 1
+            print(f"resume text cache S3 get failed: {e}")
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("text"), str):
+        return None
+    return entry
+
+
+def _s3_put(key: str, entry: dict) -> None:
+    client = _get_s3_client() if RESUME_TEXT_CACHE_S3_BUCKET else None
+    if client is None:
+        return
+    try:
+        client.put_object(
+            Bucket=RESUME_TEXT_CACHE_S3_BUCKET,
+            Key=RESUME_TEXT_CACHE_S3_PREFIX + key + ".json",
+            Body=json.dumps(entry).encode("utf-8"),
+            ContentType="application/json",
+        )
+    except Exception as e:
+        _cache_stats["s3Errors"] += 1
+        print(f"resume text cache S3 put failed: {e}")
+
+
+def _remember(key: str, entry: dict) -> None:
+    if RESUME_TEXT_CACHE_ENTRIES <= 0:
+        return
+    with _cache_lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > RESUME_TEXT_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def extract_resume_text(data: bytes, filename: str, file_type: str = "") -> dict:
+    """
+    Cached extraction: {"text", "extractor", "sha256", "cache"} where cache is
+    "memory", "s3" or None (freshly parsed). Raises like extract_text_from_bytes.
+    file_type (MIME) is only consulted when the filename has no known extension.
+    """
+    key = extraction_cache_key(data, filename, file_type)
+    digest = key.rsplit("/", 1)[-1]
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            _cache_stats["hits"] += 1
+            return {**entry, "sha256": digest, "cache": "memory"}
+
+    entry = _s3_get(key)
+    if entry is not None:
+        entry = {"text": entry["text"], "extractor": entry.get("extractor") or "unknown"}
+        _cache_stats["s3Hits"] += 1
+        _remember(key, entry)
+        return {**entry, "sha256": digest, "cache": "s3"}
+
+    _cache_stats["misses"] += 1
+    text, extractor = _extract_uncached(data, _file_kind(filename, file_type))
+    entry = {"text": text, "extractor": extractor}
+    _remember(key, entry)
+    _s3_put(key, {**entry, "createdAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")})
+    return {**entry, "sha256": digest, "cache": None}
+
+
+def extract_text_from_bytes(data: bytes, filename: str, file_type: str = "") -> str:
+    """Extract plain text from PDF or DOCX (cached by content hash; see extract_resume_text)."""
+    return extract_resume_text(data, filename, file_type)["text"]
+
+
+def extract_clean_text(data: bytes, filename: str, file_type: str = "") -> str:
+    """
+    Portfolio builders: cleaned text via the same cached extractors, "" when the
+    résumé cannot be read or looks like garbage. Unregistered types are decoded as UTF-8.
+    """
+    try:
+        _file_kind(filename, file_type)
+    except ValueError:
+        text = clean_resume_text(data.decode("utf-8", errors="ignore"))
+    else:
+        try:
+            text = clean_resume_text(extract_resume_text(data, filename, file_type)["text"])
+        except Exception as e:
+            print(f"resume text extraction failed: {e}")
+            return ""
+    if is_garbage_text(text):
+        print("resume text extraction produced unreadable text")
+        return ""
+    return text
+
+
+def extraction_cache_stats() -> dict:
+    with _cache_lock:
+        return {**_cache_stats, "entries": len(_cache)}
+
+
+def clear_extraction_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+        for k in _cache_stats:
+            _cache_stats[k] = 0
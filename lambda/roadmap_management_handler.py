@@ -5,10 +5,25 @@ from decimal import Decimal
 from datetime import datetime
 from typing import Dict, List, Any
 
+try:
+    import catalog_cache
+except ImportError:
+    catalog_cache = None  # falls back to a scan per list request
+
 # Initialize DynamoDB
 dynamodb = boto3.resource('dynamodb', region_name='ap-south-2')
 ROADMAP_TABLE = 'Roadmaps'  # Single table for all roadmap data
 
+def _list_roadmap_items(table) -> List[Dict[str, Any]]:
+    """All roadmap rows, from the warm-container snapshot when available"""
+    if catalog_cache is not None:
+        return catalog_cache.get_table_items(table)
+    return table.scan().get('Items', [])
+
+def _invalidate_roadmaps():
+    if catalog_cache is not None:
+        catalog_cache.invalidate(ROADMAP_TABLE)
+
 def response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Create API Gateway response with CORS headers"""
     return {
@@ -33,8 +48,7 @@ def handle_list_categories():
     """List all categories from roadmaps table"""
     try:
         table = dynamodb.Table(ROADMAP_TABLE)
-        scan_response = table.scan()
-        items = scan_response.get('Items', [])
+        items = _list_roadmap_items(table)
         
         # Extract unique categories
         categories = []
@@ -82,6 +96,7 @@ def handle_delete_category(category_id: str):
     try:
         table = dynamodb.Table(ROADMAP_TABLE)
         table.delete_item(Key={'categoryId': category_id})
+        _invalidate_roadmaps()
         
         return response(200, {
             'success': True,
@@ -324,6 +339,7 @@ def handle_save_roadmap(event_body: Dict):
         
         # Save to DynamoDB
         table.put_item(Item=item)
+        _invalidate_roadmaps()
         
         return response(200, {
             'success': True,
@@ -352,13 +368,12 @@ def handle_list_all_roadmaps():
     """List all roadmaps"""
     try:
         table = dynamodb.Table(ROADMAP_TABLE)
-        scan_response = table.scan()
-        roadmaps = scan_response.get('Items', [])
-        
-        # Sort weeks for each roadmap
-        for roadmap in roadmaps:
+        roadmaps = []
+        # Sort weeks for each roadmap (on copies; cached items are shared)
+        for roadmap in _list_roadmap_items(table):
             if 'weeks' in roadmap:
-                roadmap['weeks'].sort(key=lambda x: x.get('weekNumber', 0))
+                roadmap = {**roadmap, 'weeks': sorted(roadmap['weeks'], key=lambda x: x.get('weekNumber', 0))}
+            roadmaps.append(roadmap)
         
         return response(200, {
             'success': True,
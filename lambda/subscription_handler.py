@@ -15,6 +15,8 @@ Environment:
   ALLOWED_ORIGIN, USERS_TABLE, SUBSCRIPTIONS_TABLE, REGION
   RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET (same as course purchase Lambda)
   INVOICE_S3_BUCKET, SMTP_USER, SMTP_APP_PASSWORD (invoice PDF + receipt email)
+  EMAIL_OUTBOX_QUEUE_URL (optional) — queue the receipt email (invoiceEmailStatus "queued")
+    for the email_outbox drainer instead of sending it during payment verification
 """
 import base64
 import hashlib
@@ -49,6 +51,15 @@ except ImportError:
     def send_subscription_receipt_email(*_args, **_kwargs) -> bool:
         return False
 
+try:
+    from email_outbox import enqueue as enqueue_email, idempotency_key, outbox_enabled
+except ImportError:
+    def outbox_enabled() -> bool:
+        return False
+
+    def idempotency_key(kind: str, *parts: Any) -> str:
+        return ":".join([kind, *[str(p) for p in parts]])
+
 try:
     from subscription_invoice import (
         build_subscription_invoice_pdf,
@@ -315,26 +326,49 @@ def issue_invoice_and_email(
 
     email = contact.get("email")
     if email and is_smtp_configured() and not email_sent:
-        sent = send_subscription_receipt_email(
-            email,
-            plan_name=plan_name,
-            price_inr=price_inr,
-            invoice_number=invoice_number,
-            payment_id=str(payment_id) if payment_id else None,
-            pdf_bytes=pdf_bytes,
-            is_upgrade=bool(upgrade_from_plan),
-            upgrade_from_plan=upgrade_from_plan,
-        )
+        if outbox_enabled() and (s3_key or not pdf_bytes):
+            # the outbox drainer attaches the PDF from S3; payment confirmation does not wait on SMTP
+            try:
+                status = enqueue_email(
+                    "subscription_receipt",
+                    email,
+                    {
+                        "planName": plan_name,
+                        "priceInr": price_inr,
+                        "invoiceNumber": invoice_number,
+                        "paymentId": str(payment_id) if payment_id else None,
+                        "isUpgrade": bool(upgrade_from_plan),
+                        "upgradeFromPlan": upgrade_from_plan,
+                        "invoiceS3Key": s3_key,
+                    },
+                    key=idempotency_key("subscription_receipt", user_id, subscription_id),
+                )
+            except Exception as exc:
+                print(f"subscription receipt email failed: {exc}")
+                status = "failed"
+        else:
+            # no outbox queue, or the PDF is only in memory (S3 upload failed): send inline
+            sent = send_subscription_receipt_email(
+                email,
+                plan_name=plan_name,
+                price_inr=price_inr,
+                invoice_number=invoice_number,
+                payment_id=str(payment_id) if payment_id else None,
+                pdf_bytes=pdf_bytes,
+                is_upgrade=bool(upgrade_from_plan),
+                upgrade_from_plan=upgrade_from_plan,
+            )
+            status = "sent" if sent else "failed"
         subscriptions_table.update_item(
             Key={"userId": user_id, "subscriptionId": subscription_id},
             UpdateExpression="SET invoiceEmailSentAt = :ts, invoiceEmailStatus = :st, updatedAt = :ts",
             ExpressionAttributeValues={
                 ":ts": ts,
-                ":st": "sent" if sent else "failed",
+                ":st": status,
             },
         )
         item["invoiceEmailSentAt"] = ts
-        item["invoiceEmailStatus"] = "sent" if sent else "failed"
+        item["invoiceEmailStatus"] = status
 
     return item
 
@@ -560,3 +560,11 @@ def get_invoice_presigned_url(
     except Exception as exc:
         print(f"get_invoice_presigned_url failed: {exc}")
         return None
+
+
+def download_invoice_pdf(s3_key: str) -> bytes:
+    """Fetch a stored invoice PDF (email outbox attachments). Raises when it cannot be read."""
+    if not INVOICE_S3_BUCKET:
+        raise RuntimeError("INVOICE_S3_BUCKET not configured")
+    obj = _s3_client().get_object(Bucket=INVOICE_S3_BUCKET, Key=s3_key)
+    return obj["Body"].read()
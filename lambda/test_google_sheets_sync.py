@@ -2,7 +2,7 @@
 """Local test for direct Google Sheets sync (file-based config)."""
 import sys
 
-from google_sheets_sync import append_user_attribution_row, is_google_sheets_configured
+from google_sheets_sync import append_user_attribution_row, flush_attribution_rows, is_google_sheets_configured
 
 
 def main() -> int:
@@ -26,7 +26,7 @@ def main() -> int:
         "attributionCapturedAt": "2026-06-06T12:00:00Z",
     }
 
-    ok = append_user_attribution_row(sample_user, "email")
+    ok = append_user_attribution_row(sample_user, "email") and flush_attribution_rows()
     if ok:
         print("Success: test row appended to Google Sheet.")
         return 0
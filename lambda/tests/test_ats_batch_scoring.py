@@ -0,0 +1,190 @@
+"""
+Unit Tests for batch ATS scoring (one résumé against many jobs, ats_resume_scorer.run_batch)
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import ats_local_scorer
+import ats_resume_scorer
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 123 4567
+EXPERIENCE
+Acme Corp 2018 - present
+- Built Python microservices on AWS Lambda serving 2,000,000 users
+SKILLS
+Python, Go, Docker, AWS, DynamoDB
+EDUCATION
+B.Tech Computer Science 2014 - 2018
+"""
+JOBS = [
+    {'jobId': 'j1', 'jobDescription': 'Backend engineer: Python, AWS, DynamoDB, Kubernetes.'},
+    {'id': 'j2', 'job_title': 'Frontend Developer', 'description': 'React, TypeScript and Figma.'},
+    {'jobId': 'j3', 'jobDescription': 'Data engineer: Spark, Airflow, Snowflake.'},
+]
+
+
+def _llm_answer(score):
+    return json.dumps({'overallScore': score, 'matchedKeywords': ['Python'], 'feedback': ['ok']})
+
+
+@pytest.fixture
+def scorer():
+    with patch.object(ats_resume_scorer, 'EntitlementContext'), \
+            patch.object(ats_resume_scorer, 'check_entitlement_or_error', return_value=(True, None)) as check, \
+            patch.object(ats_resume_scorer, 'consume_feature_use', return_value=(True, None, None)) as consume, \
+            patch.object(ats_resume_scorer, '_maybe_save_ats_history') as save, \
+            patch.object(ats_resume_scorer, '_call_openai', return_value=_llm_answer(70)) as llm:
+        yield Mock(check=check, consume=consume, save=save, llm=llm)
+
+
+def _call(**body):
+    body.setdefault('resumeText', RESUME)
+    body.setdefault('jobs', JOBS)
+    out = ats_resume_scorer.lambda_handler({'httpMethod': 'POST', 'body': json.dumps(body)}, None)
+    return out['statusCode'], json.loads(out['body'])
+
+
+class TestBatch:
+    def test_byok_scores_every_job_in_request_order(self, scorer):
+        status, body = _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 200
+        assert [r['jobId'] for r in body['results']] == ['j1', 'j2', 'j3']
+        assert all(r['success'] and r['provider'] == 'openai' for r in body['results'])
+        assert body['scored'] == 3 and body['failed'] == 0
+        assert scorer.llm.call_count == 3
+        assert 'Frontend Developer\nReact' in scorer.llm.call_args_list[1].args[1]
+
+    def test_entitlement_checked_once_and_each_scored_job_charged(self, scorer):
+        _call(provider='openai', apiKey='sk-test', userId='u1', sessionId='s1')
+        assert scorer.check.call_count == 1
+        sessions = sorted(c.kwargs['session_id'] for c in scorer.consume.call_args_list)
+        assert sessions == ['s1#j1', 's1#j2', 's1#j3']
+
+    def test_each_scored_job_saved_to_history(self, scorer):
+        scorer.save.return_value = ('bucket', 'ats-resume-history/u1/cv.pdf')
+        _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert scorer.save.call_count == 3
+        assert all(c.args[:2] == ('u1', 'openai') for c in scorer.save.call_args_list)
+        assert any('Spark, Airflow' in c.args[3] for c in scorer.save.call_args_list)
+        # the résumé is uploaded once and the key reused for the later reports
+        assert scorer.save.call_args_list[0].kwargs['resume_s3'] is None
+        assert all(c.kwargs['resume_s3'] == ('bucket', 'ats-resume-history/u1/cv.pdf')
+                   for c in scorer.save.call_args_list[1:])
+
+    def test_trial_running_out_stops_the_batch(self, scorer):
+        scorer.consume.side_effect = [(True, None, None), (False, None, 'Free trial uses exhausted for this feature')]
+        with patch.object(ats_resume_scorer, 'ATS_BATCH_CONCURRENCY', 1):
+            status, body = _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 200
+        assert [r['success'] for r in body['results']] == [True, False, False]
+        assert body['results'][2]['message'] == 'Free trial uses exhausted for this feature'
+        assert scorer.consume.call_count == 2 and scorer.save.call_count == 1
+        assert scorer.llm.call_count <= 3
+
+    def test_exhausted_trial_fails_the_request(self, scorer):
+        scorer.consume.return_value = (False, None, 'Free trial uses exhausted for this feature')
+        status, body = _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 403 and not scorer.save.called
+
+    def test_resume_extracted_once(self, scorer):
+        with patch.object(ats_resume_scorer, 'extract_text_from_bytes', return_value=RESUME) as extract:
+            status, _ = _call(provider='openai', apiKey='sk-test', resumeText='', resumeBase64='JVBERg==',
+                              resumeFileName='cv.pdf')
+        assert status == 200 and extract.call_count == 1
+
+    def test_local_mode_skips_llm_and_trial(self, scorer):
+        status, body = _call(scoringMode='local', userId='u1')
+        assert status == 200
+        assert all(r['provider'] == 'local' and r['atsResult']['scoredBy'] == 'local' for r in body['results'])
+        assert not scorer.llm.called and not scorer.consume.called and not scorer.save.called
+
+    def test_auto_mode_only_sends_borderline_jobs_to_llm(self, scorer):
+        decisive = {'j1': True, 'j2': False, 'j3': True}
+        seen = iter(['j1', 'j2', 'j3'])
+        with patch.object(ats_local_scorer, 'is_decisive', side_effect=lambda _: decisive[next(seen)]):
+            status, body = _call(scoringMode='auto', provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 200
+        assert [r['provider'] for r in body['results']] == ['local', 'openai', 'local']
+        assert scorer.llm.call_count == 1
+        assert scorer.consume.call_count == 3
+
+    def test_stored_keys_read_once(self, scorer):
+        with patch.object(ats_resume_scorer, 'get_user_llm_config', return_value=({'claude': 'k'}, {})) as cfg, \
+                patch.object(ats_resume_scorer, '_call_claude', return_value=_llm_answer(55)) as claude:
+            status, body = _call(userId='u1')
+        assert status == 200 and cfg.call_count == 1 and claude.call_count == 3
+        assert {r['provider'] for r in body['results']} == {'anthropic'}
+
+    def test_failed_job_does_not_fail_the_batch(self, scorer):
+        scorer.llm.side_effect = [_llm_answer(70), 'not json', _llm_answer(40)]
+        with patch.object(ats_resume_scorer, 'ATS_BATCH_CONCURRENCY', 1):
+            status, body = _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 200
+        assert [r['success'] for r in body['results']] == [True, False, True]
+        assert body['failed'] == 1 and scorer.consume.call_count == 2
+
+    def test_all_jobs_failing_consumes_nothing(self, scorer):
+        scorer.llm.side_effect = RuntimeError('OpenAI API error (401)')
+        status, body = _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 200 and body['scored'] == 0
+        assert not scorer.consume.called and not scorer.save.called
+        assert 'OpenAI API error' in body['results'][0]['message']
+
+    def test_concurrency_is_bounded(self, scorer):
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def call(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return _llm_answer(60)
+
+        scorer.llm.side_effect = call
+        jobs = [{'jobId': f'j{i}', 'jobDescription': f'Engineer {i}: Python, AWS.'} for i in range(12)]
+        with patch.object(ats_resume_scorer, 'ATS_BATCH_CONCURRENCY', 3), \
+                patch.object(ats_resume_scorer, 'ATS_BATCH_MAX_JOBS', 12):
+            status, body = _call(jobs=jobs, provider='openai', apiKey='sk-test')
+        assert status == 200 and body['scored'] == 12
+        assert peak[0] <= 3
+
+    @pytest.mark.parametrize('jobs,message', [
+        ([], 'non-empty'),
+        ('nope', 'non-empty'),
+        ([7], 'must be an object'),
+    ])
+    def test_bad_jobs_rejected(self, scorer, jobs, message):
+        status, body = _call(jobs=jobs, provider='openai', apiKey='sk-test')
+        assert status == 400 and message in body['message']
+
+    def test_batch_size_capped(self, scorer):
+        with patch.object(ats_resume_scorer, 'ATS_BATCH_MAX_JOBS', 2):
+            status, body = _call(provider='openai', apiKey='sk-test')
+        assert status == 400 and 'At most 2' in body['message']
+
+    def test_missing_description_fails_only_that_job(self, scorer):
+        status, body = _call(jobs=JOBS + [{'jobId': 'empty'}], provider='openai', apiKey='sk-test')
+        assert status == 200
+        assert body['results'][-1] == {'jobId': 'empty', 'success': False, 'message': 'jobDescription is required'}
+
+    def test_no_credentials(self, scorer):
+        status, _ = _call()
+        assert status == 400
+        with patch.object(ats_resume_scorer, 'get_user_llm_config', return_value=(None, None)):
+            status, _ = _call(userId='u1')
+        assert status == 403
+
+    def test_entitlement_denied(self, scorer):
+        scorer.check.return_value = (False, 'Upgrade to continue')
+        status, body = _call(provider='openai', apiKey='sk-test', userId='u1')
+        assert status == 403 and not scorer.llm.called
@@ -0,0 +1,144 @@
+"""
+Unit Tests for the deterministic ATS pre-scorer (ats_local_scorer) and its scoringMode wiring
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import ats_local_scorer
+from ats_local_scorer import WEIGHTS, detect_sections, extract_jd_keywords, is_decisive, score_locally, score_many
+
+JD = (
+    "Senior Backend Engineer. We need 5+ years building microservices in Python and Go on AWS "
+    "(Lambda, DynamoDB). Experience with Kubernetes, Terraform and CI/CD. Strong communication and "
+    "stakeholder management. Bachelor's degree in Computer Science."
+)
+RESUME = """Jane Doe
+jane@example.com | +1 555 123 4567
+SUMMARY
+Backend engineer building Python microservices on AWS.
+EXPERIENCE
+Acme Corp 2018 - present
+- Built Python microservices on AWS Lambda serving 2,000,000 users
+- Reduced p99 latency by 40% with DynamoDB single-table design
+- Led migration to Kubernetes; mentored 4 engineers
+SKILLS
+Python, Go, Docker, AWS, DynamoDB, CI/CD, Terraform
+EDUCATION
+B.Tech Computer Science 2014 - 2018
+"""
+
+
+class TestKeywords:
+    def test_tech_terms_and_phrases(self):
+        kws = extract_jd_keywords(JD)
+        for expected in ('Python', 'Go', 'AWS', 'DynamoDB', 'Kubernetes', 'CI/CD', 'stakeholder management'):
+            assert expected in kws
+        assert 'We' not in kws and 'building' not in kws
+
+    def test_phrase_words_not_repeated(self):
+        assert 'stakeholder' not in [k.lower() for k in extract_jd_keywords(JD)]
+
+    def test_limit(self):
+        assert len(extract_jd_keywords(JD, limit=3)) == 3
+
+    def test_empty(self):
+        assert extract_jd_keywords('') == []
+
+
+class TestScore:
+    def test_result_shape(self):
+        result = score_locally(RESUME, JD)
+        assert set(result['breakdown']) == set(WEIGHTS)
+        assert 0 <= result['overallScore'] <= 100
+        assert result['provisional'] is True and result['scoredBy'] == 'local'
+        assert [d['keyword'] for d in result['missingKeywordDetails']] == result['missingKeywords']
+        assert 1 <= len(result['feedback']) <= 4
+
+    def test_deterministic(self):
+        assert score_locally(RESUME, JD) == score_locally(RESUME, JD)
+
+    def test_strong_match_beats_unrelated_resume(self):
+        unrelated = "John Smith\nEXPERIENCE\nPastry chef 2019 - 2021\n- Baked bread daily\n"
+        assert score_locally(RESUME, JD)['overallScore'] > score_locally(unrelated, JD)['overallScore'] + 30
+
+    def test_missing_keywords_get_sections(self):
+        result = score_locally(RESUME.replace('Terraform', ''), JD)
+        details = {d['keyword']: d['suggestedSection'] for d in result['missingKeywordDetails']}
+        assert details['Terraform'] == ['Skills', 'Projects']
+
+    def test_education_dates_not_counted_as_experience(self):
+        assert score_locally(RESUME, JD)['signals']['experienceYears'] == datetime.now().year - 2018
+
+    def test_sections(self):
+        assert detect_sections(RESUME) == ['Summary', 'Experience', 'Skills', 'Education']
+
+    def test_score_many_matches_score_locally(self):
+        jds = [JD, 'Frontend developer: React, TypeScript, Figma.', '']
+        assert score_many(RESUME, jds) == [score_locally(RESUME, jd) for jd in jds]
+
+
+class TestDecisive:
+    def test_thresholds(self):
+        signals = {'jdKeywords': 10}
+        assert is_decisive({'overallScore': 20, 'signals': signals})
+        assert is_decisive({'overallScore': 95, 'signals': signals})
+        assert not is_decisive({'overallScore': 60, 'signals': signals})
+
+    def test_too_few_keywords_is_never_decisive(self):
+        assert not is_decisive({'overallScore': 5, 'signals': {'jdKeywords': 2}})
+
+
+class TestScoringModes:
+    @pytest.fixture
+    def scorer(self):
+        import ats_resume_scorer
+        with patch.object(ats_resume_scorer, 'check_entitlement_or_error', return_value=(True, None)), \
+                patch.object(ats_resume_scorer, 'consume_feature_use', return_value=(True, None, None)) as consume, \
+                patch.object(ats_resume_scorer, '_maybe_save_ats_history') as save, \
+                patch.object(ats_resume_scorer, '_call_openai', return_value=json.dumps({'overallScore': 61})) as llm:
+            yield Mock(module=ats_resume_scorer, consume=consume, save=save, llm=llm)
+
+    @staticmethod
+    def _call(scorer, **body):
+        out = scorer.module.lambda_handler({'httpMethod': 'POST', 'body': json.dumps(body)}, None)
+        return out['statusCode'], json.loads(out['body'])
+
+    def test_local_mode_skips_llm_trial_and_history(self, scorer):
+        status, body = self._call(scorer, scoringMode='local', userId='u1', jobDescription=JD, resumeText=RESUME)
+        assert status == 200 and body['atsResult']['scoredBy'] == 'local'
+        assert not scorer.llm.called
+        assert not scorer.consume.called
+        assert not scorer.save.called
+
+    def test_local_mode_needs_no_user(self, scorer):
+        status, _ = self._call(scorer, scoringMode='local', jobDescription=JD, resumeText=RESUME)
+        assert status == 200
+
+    def test_auto_mode_decisive_skips_llm(self, scorer):
+        with patch.object(ats_local_scorer, 'is_decisive', return_value=True):
+            status, body = self._call(
+                scorer, scoringMode='auto', provider='openai', apiKey='sk-test', userId='u1',
+                jobDescription=JD, resumeText=RESUME)
+        assert status == 200 and body['atsResult']['scoredBy'] == 'local'
+        assert not scorer.llm.called
+        assert scorer.consume.called
+        assert scorer.save.call_args[0][1] == 'local'
+
+    def test_auto_mode_borderline_calls_llm(self, scorer):
+        with patch.object(ats_local_scorer, 'is_decisive', return_value=False):
+            status, body = self._call(
+                scorer, scoringMode='auto', provider='openai', apiKey='sk-test',
+                jobDescription=JD, resumeText=RESUME)
+        assert status == 200 and body['atsResult']['overallScore'] == 61
+        assert scorer.llm.called
+
+    def test_default_mode_is_llm(self, scorer):
+        status, body = self._call(scorer, provider='openai', apiKey='sk-test', jobDescription=JD, resumeText=RESUME)
+        assert status == 200 and scorer.llm.called
+        assert 'scoredBy' not in body['atsResult']
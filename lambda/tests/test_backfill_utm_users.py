@@ -0,0 +1,167 @@
+"""
+Unit Tests for the UTM users -> Google Sheets backfill: projected segmented scan, watermark and incremental sync
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+
+import sys
+sys.path.insert(0, '..')
+import backfill_utm_users_to_sheets as backfill
+from backfill_utm_users_to_sheets import (
+    load_watermark,
+    next_watermark,
+    save_watermark,
+    scan_attributed_users,
+    scan_since,
+)
+
+
+def _user(user_id, created_at, **extra):
+    return dict({'userId': user_id, 'email': f'{user_id}@example.com', 'utmSource': 'google',
+                 'createdAt': created_at}, **extra)
+
+
+def _table(pages):
+    table = Mock()
+    table.scan.side_effect = pages
+    return table
+
+
+class TestScan:
+    def test_segments_scanned_in_parallel_with_projection(self):
+        tables = {}
+
+        def factory():
+            table = _table([{'Items': [], 'LastEvaluatedKey': {'userId': 'x'}}, {'Items': []}])
+            tables[len(tables)] = table
+            return table
+
+        scan_attributed_users(segments=3, table_factory=factory)
+        calls = [c.kwargs for t in tables.values() for c in t.scan.call_args_list]
+        assert sorted(c['Segment'] for c in calls) == [0, 0, 1, 1, 2, 2]
+        assert {c['TotalSegments'] for c in calls} == {3}
+        assert sum('ExclusiveStartKey' in c for c in calls) == 3
+        projected = {calls[0]['ExpressionAttributeNames'][n] for n in calls[0]['ProjectionExpression'].split(', ')}
+        assert projected == set(backfill.PROJECTED_KEYS)
+
+    def test_merges_sorts_and_converts(self):
+        pages = iter([
+            [{'Items': [_user('b', '2026-02-01T00:00:00', loginCount=Decimal('3'))]}],
+            [{'Items': [_user('a', '2026-01-01T00:00:00'), {'userId': 'c', 'createdAt': '2026-03-01'}]}],
+        ])
+        users = scan_attributed_users(segments=2, table_factory=lambda: _table(next(pages)))
+        assert [u['userId'] for u in users] == ['a', 'b']  # c has no campaign params
+        assert users[1]['loginCount'] == 3 and isinstance(users[1]['loginCount'], int)
+
+    def test_since_adds_watermark_filter(self):
+        table = _table([{'Items': []}])
+        scan_attributed_users(since='2026-01-01T00:00:00', segments=1, table_factory=lambda: table)
+        kwargs = table.scan.call_args.kwargs
+        assert 'Segment' not in kwargs
+        built = ConditionExpressionBuilder().build_expression(kwargs['FilterExpression'])
+        names = set(built.attribute_name_placeholders.values())
+        assert {'createdAt', 'attributionCapturedAt', 'utmSource', 'gclid'} <= names
+        assert '2026-01-01T00:00:00' in built.attribute_value_placeholders.values()
+
+
+class TestWatermark:
+    def test_latest_stamp_capped_at_scan_start(self):
+        users = [_user('a', '2026-01-02T10:00:00.123456'),
+                 _user('b', '2026-01-01T00:00:00', attributionCapturedAt='2026-01-03T00:00:00.000Z'),
+                 _user('c', '2026-01-01T00:00:00', attributionCapturedAt='2099-01-01T00:00:00Z')]
+        assert next_watermark(None, users, '2026-01-05T00:00:00') == '2026-01-03T00:00:00'
+
+    def test_never_moves_backwards(self):
+        assert next_watermark('2026-06-01T00:00:00', [_user('a', '2026-01-01T00:00:00')],
+                              '2026-07-01T00:00:00') == '2026-06-01T00:00:00'
+        assert next_watermark(None, [], '2026-07-01T00:00:00') is None
+
+    def test_scan_since_applies_lookback(self):
+        with patch.object(backfill, 'WATERMARK_LOOKBACK_MINUTES', 90):
+            assert scan_since('2026-01-02T01:00:00') == '2026-01-01T23:30:00'
+        assert scan_since('garbage') == 'garbage'
+
+    def test_file_round_trip(self, tmp_path):
+        path = str(tmp_path / 'state.json')
+        assert load_watermark(path) is None
+        save_watermark('2026-01-01T00:00:00', path)
+        assert load_watermark(path) == '2026-01-01T00:00:00'
+        assert json.loads(open(path).read())['table'] == backfill.USERS_TABLE
+
+    def test_missing_s3_object_means_no_watermark(self):
+        error = type('ClientError', (Exception,), {})()
+        error.response = {'Error': {'Code': 'NoSuchKey'}}
+        s3 = Mock(get_object=Mock(side_effect=error))
+        with patch.object(backfill.boto3, 'client', return_value=s3):
+            assert load_watermark('s3://bucket/utm/state.json') is None
+        s3.get_object.assert_called_once_with(Bucket='bucket', Key='utm/state.json')
+
+
+class TestIncrementalMain:
+    @pytest.fixture
+    def run(self, tmp_path):
+        state = str(tmp_path / 'state.json')
+
+        def _run(users, existing=(), append=None, argv=('--incremental',)):
+            scan = Mock(return_value=users)
+            fetch = Mock(return_value=set(existing))
+            append = append or Mock()
+            with patch.object(sys, 'argv', ['backfill', *argv, '--state', state]), \
+                    patch.object(backfill, 'is_google_sheets_configured', return_value=True), \
+                    patch.object(backfill, 'scan_attributed_users', scan), \
+                    patch.object(backfill, 'fetch_existing_user_ids', fetch), \
+                    patch.object(backfill, 'append_attribution_rows', append):
+                code = backfill.main()
+            return code, scan, fetch, append
+
+        _run.state = state
+        return _run
+
+    def test_first_run_scans_everything_and_saves_watermark(self, run):
+        code, scan, _, append = run([_user('a', '2026-01-01T00:00:00'), _user('b', '2026-01-02T00:00:00')],
+                                    existing={'a'})
+        assert code == 0 and scan.call_args.kwargs['since'] is None
+        assert [r['userId'] for r in append.call_args[0][0]] == ['b']
+        assert load_watermark(run.state) == '2026-01-02T00:00:00'
+
+    def test_next_run_scans_from_watermark_and_skips_sheet_when_nothing_new(self, run):
+        save_watermark('2026-01-02T00:00:00', run.state)
+        code, scan, fetch, append = run([])
+        assert code == 0 and scan.call_args.kwargs['since'] == scan_since('2026-01-02T00:00:00')
+        fetch.assert_not_called()
+        append.assert_not_called()
+        assert load_watermark(run.state) == '2026-01-02T00:00:00'
+
+    def test_failed_append_keeps_old_watermark(self, run):
+        save_watermark('2026-01-02T00:00:00', run.state)
+        code, _, _, _ = run([_user('c', '2026-01-03T00:00:00')], append=Mock(side_effect=RuntimeError('quota')))
+        assert code == 1 and load_watermark(run.state) == '2026-01-02T00:00:00'
+
+    def test_full_run_ignores_watermark(self, run):
+        save_watermark('2026-01-02T00:00:00', run.state)
+        _, scan, _, _ = run([], argv=())
+        assert scan.call_args.kwargs['since'] is None
+
+
+class TestScheduledRun:
+    def test_runs_incremental_against_s3_state(self):
+        with patch.object(backfill, 'STATE_LOCATION', 's3://bucket/utm/state.json'), \
+                patch.object(backfill, 'main', return_value=0) as main:
+            assert backfill.lambda_handler({}, None) == {'ok': True}
+        main.assert_called_once_with(['--incremental'])
+
+    def test_failure_raises_so_the_schedule_retries(self):
+        with patch.object(backfill, 'STATE_LOCATION', 's3://bucket/utm/state.json'), \
+                patch.object(backfill, 'main', return_value=1):
+            with pytest.raises(RuntimeError):
+                backfill.lambda_handler({}, None)
+
+    def test_local_state_file_rejected(self):
+        with patch.object(backfill, 'STATE_LOCATION', '/var/task/.utm_backfill_state.json'):
+            with pytest.raises(RuntimeError):
+                backfill.lambda_handler({}, None)
@@ -0,0 +1,109 @@
+"""
+Unit Tests for the warm-container catalog snapshot cache
+"""
+
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+
+import sys
+sys.path.insert(0, '..')
+import catalog_cache
+
+
+@pytest.fixture
+def versions():
+    table = Mock()
+    table.get_item.return_value = {'Item': {'catalog': 'Roadmaps', 'version': 3}}
+    catalog_cache.clear()
+    catalog_cache.set_versions_table(table)
+    yield table
+    catalog_cache.clear()
+
+
+def _catalog(*pages):
+    table = Mock()
+    table.name = 'Roadmaps'
+    table.scan.side_effect = list(pages)
+    return table
+
+
+class TestGetTableItems:
+    def test_second_read_is_served_from_snapshot(self, versions):
+        table = _catalog({'Items': [{'id': 'a'}]})
+
+        assert catalog_cache.get_table_items(table) == [{'id': 'a'}]
+        assert catalog_cache.get_table_items(table) == [{'id': 'a'}]
+        assert table.scan.call_count == 1
+        # Within CHECK_SECONDS the version is not re-read either
+        assert versions.get_item.call_count == 1
+
+    def test_scan_is_paginated(self, versions):
+        table = _catalog({'Items': [{'id': 'a'}], 'LastEvaluatedKey': {'id': 'a'}}, {'Items': [{'id': 'b'}]})
+
+        assert catalog_cache.get_table_items(table) == [{'id': 'a'}, {'id': 'b'}]
+        assert table.scan.call_args.kwargs == {'ExclusiveStartKey': {'id': 'a'}}
+
+    def test_returned_list_is_a_copy(self, versions):
+        table = _catalog({'Items': [{'id': 'a'}]})
+
+        catalog_cache.get_table_items(table).append({'id': 'x'})
+        assert catalog_cache.get_table_items(table) == [{'id': 'a'}]
+
+    def test_unchanged_version_keeps_snapshot(self, versions, monkeypatch):
+        table = _catalog({'Items': [{'id': 'a'}]})
+        catalog_cache.get_table_items(table)
+
+        monkeypatch.setattr(catalog_cache, 'CHECK_SECONDS', 0)
+        catalog_cache.get_table_items(table)
+
+        assert versions.get_item.call_count == 2
+        assert table.scan.call_count == 1
+
+    def test_version_bump_reloads(self, versions, monkeypatch):
+        table = _catalog({'Items': [{'id': 'a'}]}, {'Items': [{'id': 'b'}]})
+        catalog_cache.get_table_items(table)
+
+        monkeypatch.setattr(catalog_cache, 'CHECK_SECONDS', 0)
+        versions.get_item.return_value = {'Item': {'catalog': 'Roadmaps', 'version': 4}}
+
+        assert catalog_cache.get_table_items(table) == [{'id': 'b'}]
+        assert catalog_cache.stats()['loads'] == 2
+
+
+class TestInvalidate:
+    def test_drops_local_snapshot_and_bumps_version(self, versions):
+        table = _catalog({'Items': [{'id': 'a'}]}, {'Items': [{'id': 'b'}]})
+        catalog_cache.get_table_items(table)
+
+        catalog_cache.invalidate('Roadmaps')
+
+        assert catalog_cache.get_table_items(table) == [{'id': 'b'}]
+        kwargs = versions.update_item.call_args.kwargs
+        assert kwargs['Key'] == {'catalog': 'Roadmaps'}
+        assert kwargs['UpdateExpression'].startswith('ADD version :one')
+
+
+class TestVersionsTableMissing:
+    def test_falls_back_to_max_age(self, versions, monkeypatch):
+        versions.get_item.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'missing'}}, 'GetItem'
+        )
+        table = _catalog({'Items': [{'id': 'a'}]}, {'Items': [{'id': 'b'}]})
+
+        assert catalog_cache.get_table_items(table) == [{'id': 'a'}]
+        assert catalog_cache.get_table_items(table) == [{'id': 'a'}]
+        assert versions.get_item.call_count == 1
+        assert catalog_cache.stats()['versioned'] is False
+
+        monkeypatch.setattr(catalog_cache, 'MAX_AGE_SECONDS', 0)
+        assert catalog_cache.get_table_items(table) == [{'id': 'b'}]
+
+    def test_invalidate_skips_bump(self, versions):
+        versions.get_item.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}}, 'GetItem'
+        )
+        catalog_cache.get_table_items(_catalog({'Items': []}))
+
+        catalog_cache.invalidate('Roadmaps')
+        versions.update_item.assert_not_called()
@@ -0,0 +1,233 @@
+"""
+Unit Tests for the email outbox (email_outbox): enqueue, drainer batching, retries and idempotency
+"""
+
+import email
+import json
+import smtplib
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import email_outbox
+import email_service
+from email_outbox import (
+    DynamoDeliveryLog,
+    MemoryDeliveryLog,
+    MemoryQueue,
+    drain,
+    enqueue,
+    enqueue_job_digest,
+    idempotency_key,
+    process_messages,
+)
+from tests.test_email_service import FakeServer
+
+JOBS = [{'job_title': 'Backend Engineer', 'company': 'Acme', 'apply_link': 'https://example.com/1',
+         'description': 'x' * 2000, 'internal_score': 0.93}]
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture(autouse=True)
+def smtp_configured():
+    with patch.object(email_service, 'SMTP_USER', 'me@example.com'), \
+            patch.object(email_service, 'SMTP_APP_PASSWORD', 'pw'):
+        yield
+
+
+def _verification(queue, to='a@example.com', key='k1'):
+    return enqueue('email_verification', to, {'code': '123456', 'verifyLink': 'https://x/verify'}, key=key, queue=queue)
+
+
+class TestEnqueue:
+    def test_record_is_compact(self):
+        queue = MemoryQueue()
+        assert _verification(queue) == 'queued'
+        [(_, body)] = queue.receive()
+        record = json.loads(body)
+        assert record == {'v': 1, 'key': 'k1', 'kind': 'email_verification', 'to': 'a@example.com',
+                          'params': {'code': '123456', 'verifyLink': 'https://x/verify'}, 'attempt': 1}
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(ValueError):
+            enqueue('newsletter', 'a@example.com', {}, key='k', queue=MemoryQueue())
+
+    def test_without_queue_delivers_inline(self, server):
+        with patch.object(email_outbox, 'OUTBOX_QUEUE_URL', ''), \
+                patch.object(email_service, 'open_smtp_connection', server.connect):
+            assert _verification(None) == 'sent'
+        msg = email.message_from_bytes(server.messages[0][2])
+        assert msg['To'] == 'a@example.com' and '123456' in msg.get_payload()[0].get_payload(decode=True).decode()
+
+    def test_inline_failure_raises(self, server):
+        server.refuse_connections = True
+        with patch.object(email_outbox, 'OUTBOX_QUEUE_URL', ''), \
+                patch.object(email_service, 'open_smtp_connection', server.connect):
+            with pytest.raises(Exception):
+                _verification(None)
+
+    def test_digest_chunks_and_trims_jobs(self):
+        queue = MemoryQueue()
+        recipients = [f'u{i}@example.com' for i in range(7)] + ['u0@example.com']
+        with patch.object(email_outbox, 'DIGEST_CHUNK', 3):
+            assert enqueue_job_digest(recipients, JOBS, queue=queue) == 3
+        records = [json.loads(body) for _, body in queue.receive()]
+        assert [len(r['to']) for r in records] == [3, 3, 1]
+        job = records[0]['params']['jobs'][0]
+        assert len(job['description']) == 301 and 'internal_score' not in job
+        assert len({r['key'] for r in records}) == 3
+
+    def test_digest_key_is_stable(self):
+        q1, q2 = MemoryQueue(), MemoryQueue()
+        enqueue_job_digest(['a@example.com'], JOBS, queue=q1)
+        enqueue_job_digest(['a@example.com'], JOBS, queue=q2)
+        assert json.loads(q1.receive()[0][1])['key'] == json.loads(q2.receive()[0][1])['key']
+
+
+class TestDrain:
+    def test_batch_shares_one_connection(self, server):
+        queue = MemoryQueue()
+        for i in range(8):
+            _verification(queue, to=f'u{i}@example.com', key=f'k{i}')
+        result = drain(queue, connect=server.connect, batch_size=10)
+        assert result.sent == 8 and server.opened == 1 and len(queue) == 0
+
+    def test_duplicate_key_sent_once(self, server):
+        queue = MemoryQueue()
+        _verification(queue)
+        _verification(queue)
+        result = drain(queue, connect=server.connect)
+        assert result.sent == 1 and result.duplicates == 1 and len(server.messages) == 1
+
+    def test_failure_is_retried_with_backoff(self, server):
+        queue = MemoryQueue()
+        server.failures['a@example.com'] = smtplib.SMTPRecipientsRefused({'a@example.com': (550, b'busy')})
+        _verification(queue)
+        result = drain(queue, connect=server.connect)
+        assert result.retried == 1 and result.sent == 1
+        assert queue.delays == [30]
+
+    def test_gives_up_after_max_attempts(self, server):
+        queue = MemoryQueue()
+        log = MemoryDeliveryLog()
+        with patch.object(email_outbox, 'MAX_ATTEMPTS', 3), \
+                patch.object(email_outbox, '_deliver_one', side_effect=smtplib.SMTPDataError(451, b'later')):
+            _verification(queue)
+            result = drain(queue, connect=server.connect, log=log)
+        assert result.retried == 2 and [k for k, _ in result.dropped] == ['k1']
+        assert queue.delays == [30, 60]
+        assert log.claim('k1')  # released, not marked sent
+
+    def test_unreadable_message_dropped(self, server):
+        queue = MemoryQueue()
+        queue.send('not json')
+        queue.send(json.dumps({'key': 'x', 'kind': 'newsletter'}))
+        result = drain(queue, connect=server.connect)
+        assert len(result.dropped) == 2 and server.opened == 0
+
+    def test_digest_retries_only_failed_recipients(self, server):
+        queue = MemoryQueue()
+        server.failures['b@example.com'] = smtplib.SMTPRecipientsRefused({'b@example.com': (550, b'full')})
+        enqueue_job_digest(['a@example.com', 'b@example.com', 'not-an-address'], JOBS, queue=queue)
+        result = drain(queue, connect=server.connect)
+        delivered = [to[0] for _, to, _ in server.messages]
+        assert delivered.count('a@example.com') == 1 and delivered.count('b@example.com') == 1
+        assert result.sent == 2 and result.retried == 1
+
+    def test_digests_and_transactional_share_the_batch_session(self, server):
+        queue = MemoryQueue()
+        with patch.object(email_outbox, 'DIGEST_CHUNK', 5):
+            enqueue_job_digest([f'u{i}@example.com' for i in range(15)], JOBS, queue=queue)
+        _verification(queue)
+        result = drain(queue, connect=server.connect, batch_size=10)
+        assert result.sent == 16 and server.opened == 1
+        assert all(email.message_from_bytes(raw)['To'] == to[0] for _, to, raw in server.messages)
+
+    def test_digest_connect_failure_retries_the_rest_of_the_chunk(self, server):
+        queue = MemoryQueue()
+        enqueue_job_digest(['a@example.com', 'b@example.com'], JOBS, queue=queue)
+        server.refuse_connections = True
+        result = process_messages(queue.receive(), queue, connect=server.connect, log=MemoryDeliveryLog())
+        [(_, body)] = queue.receive()
+        retry = json.loads(body)
+        assert result.sent == 0 and result.retried == 1
+        assert retry['to'] == ['a@example.com', 'b@example.com'] and retry['attempt'] == 2
+
+    def test_digest_re_enqueue_failure_still_marks_chunk_sent(self, server):
+        queue = MemoryQueue()
+        enqueue_job_digest(['a@example.com', 'b@example.com'], JOBS, queue=queue)
+        messages = queue.receive()
+        server.refuse_connections = True
+        log = MemoryDeliveryLog()
+        with patch.object(queue, 'send', side_effect=RuntimeError('SQS throttled')):
+            result = process_messages(messages, queue, connect=server.connect, log=log)
+        key = json.loads(messages[0][1])['key']
+        assert result.failed_ids == [] and result.retried == 0
+        assert len(result.dropped) == 1 and 're-enqueue failed' in result.dropped[0][1]
+        assert log.is_sent(key) and len(queue) == 0
+
+    def test_receipt_attaches_invoice_from_s3(self, server):
+        queue = MemoryQueue()
+        params = {'planName': 'Pro', 'priceInr': 499, 'invoiceNumber': 'INV-1', 'paymentId': 'pay_1',
+                  'isUpgrade': False, 'upgradeFromPlan': None, 'invoiceS3Key': 'subscription-invoices/u1/s1.pdf'}
+        enqueue('subscription_receipt', 'a@example.com', params, key='r1', queue=queue)
+        with patch('subscription_invoice.download_invoice_pdf', return_value=b'%PDF-1.4') as download:
+            result = drain(queue, connect=server.connect)
+        download.assert_called_once_with('subscription-invoices/u1/s1.pdf')
+        assert result.sent == 1
+        parts = list(email.message_from_bytes(server.messages[0][2]).walk())
+        assert parts[-1].get_filename() == 'CodeXCareer-Invoice-INV-1.pdf'
+        assert parts[-1].get_payload(decode=True) == b'%PDF-1.4'
+
+    def test_smtp_not_configured_hands_batch_back(self):
+        queue = MemoryQueue()
+        _verification(queue)
+        messages = queue.receive()
+        with patch.object(email_service, 'SMTP_USER', ''):
+            result = process_messages(messages, queue, log=MemoryDeliveryLog())
+        assert result.failed_ids == [messages[0][0]]
+
+
+class TestLambdaHandler:
+    def test_reports_batch_item_failures(self, server):
+        log = Mock(claim=Mock(side_effect=[True, RuntimeError('dynamo down')]))
+        records = [{'messageId': f'm{i}', 'body': json.dumps(email_outbox.make_record(
+            'password_reset', 'a@example.com', {'code': '1', 'resetLink': 'https://x'}, f'k{i}'))} for i in range(2)]
+        with patch.object(email_outbox, '_get_queue', return_value=MemoryQueue()), \
+                patch.object(email_outbox, '_get_log', return_value=log), \
+                patch.object(email_service, 'open_smtp_connection', server.connect):
+            out = email_outbox.lambda_handler({'Records': records}, None)
+        assert out == {'batchItemFailures': [{'itemIdentifier': 'm1'}]}
+        assert len(server.messages) == 1 and log.mark_sent.call_args[0][0] == 'k0'
+
+
+class TestDeliveryLog:
+    def test_memory_claim_lifecycle(self):
+        now = [1000.0]
+        log = MemoryDeliveryLog(clock=lambda: now[0])
+        assert log.claim('k') and not log.claim('k')
+        now[0] += email_outbox.CLAIM_SECONDS + 1
+        assert log.claim('k')  # abandoned claim taken over
+        log.mark_sent('k')
+        assert not log.claim('k') and log.is_sent('k')
+
+    def test_dynamo_claim_is_conditional_put(self):
+        error = type('ClientError', (Exception,), {})()
+        error.response = {'Error': {'Code': 'ConditionalCheckFailedException'}}
+        table = Mock(put_item=Mock(side_effect=[None, error]))
+        log = DynamoDeliveryLog(table, clock=lambda: 5000)
+        assert log.claim('k') is True
+        assert log.claim('k') is False
+        kwargs = table.put_item.call_args.kwargs
+        assert 'attribute_not_exists' in kwargs['ConditionExpression']
+        assert kwargs['ExpressionAttributeValues'][':stale'] == 5000 - email_outbox.CLAIM_SECONDS
+
+    def test_idempotency_key_hides_secrets(self):
+        key = idempotency_key('email_verification', 'u1', 'secret-token')
+        assert key.startswith('email_verification:') and 'secret-token' not in key
@@ -0,0 +1,171 @@
+"""
+Unit Tests for bulk email sending (email_service.send_bulk_email / send_job_digest_bulk) and template rendering
+"""
+
+import email
+import email.header
+import smtplib
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import email_service
+from email_service import send_bulk_email, send_job_digest_bulk
+
+
+class FakeSmtp:
+    """Logged-in connection stand-in: records messages, fails on demand."""
+
+    def __init__(self, server):
+        self.server = server
+        self.sent = 0
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        with self.server.lock:
+            failure = self.server.failures.pop(to_addrs[0], None)
+        if failure is not None:
+            if isinstance(failure, smtplib.SMTPServerDisconnected):
+                self.server.dropped += 1
+            raise failure
+        self.sent += 1
+        with self.server.lock:
+            self.server.messages.append((from_addr, to_addrs, msg))
+
+    def quit(self):
+        self.server.quits += 1
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.messages = []
+        self.failures = {}
+        self.opened = 0
+        self.quits = 0
+        self.dropped = 0
+        self.refuse_connections = False
+
+    def connect(self):
+        if self.refuse_connections:
+            raise smtplib.SMTPAuthenticationError(535, b'bad credentials')
+        with self.lock:
+            self.opened += 1
+        return FakeSmtp(self)
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+def _send(server, recipients, **kwargs):
+    kwargs.setdefault('connections', 2)
+    return send_bulk_email(recipients, 'Hello — digest', 'plain body', '<p>html body</p>', connect=server.connect, **kwargs)
+
+
+class TestBulkSend:
+    def test_every_recipient_gets_its_own_addressed_message(self, server):
+        recipients = [f'user{i}@example.com' for i in range(25)]
+        result = _send(server, recipients)
+        assert result.sent == 25 and result.failed == []
+        assert sorted(to[0] for _, to, _ in server.messages) == sorted(recipients)
+        for _, to, raw in server.messages:
+            msg = email.message_from_bytes(raw)
+            assert msg['To'] == to[0]
+            assert msg.get_all('To') == [to[0]]
+            assert str(email.header.make_header(email.header.decode_header(msg['Subject']))) == 'Hello — digest'
+            assert [p.get_content_type() for p in msg.walk()][1:] == ['text/plain', 'text/html']
+            assert b'\r\n' in raw and b'\n' not in raw.replace(b'\r\n', b'')
+
+    def test_connections_are_reused_and_bounded(self, server):
+        result = _send(server, [f'u{i}@example.com' for i in range(40)], connections=3)
+        assert server.opened <= 3
+        assert result.connections == server.opened
+        assert server.quits == server.opened
+
+    def test_connection_recycled_after_message_limit(self, server):
+        result = _send(server, [f'u{i}@example.com' for i in range(10)], connections=1, messages_per_connection=3)
+        assert result.sent == 10 and server.opened == 4
+
+    def test_dropped_connection_retried_on_new_one(self, server):
+        server.failures['u3@example.com'] = smtplib.SMTPServerDisconnected('gone')
+        result = _send(server, [f'u{i}@example.com' for i in range(6)], connections=1)
+        assert result.sent == 6 and result.failed == []
+        assert server.dropped == 1 and server.opened == 2
+
+    def test_refused_recipient_is_reported_without_reconnecting(self, server):
+        server.failures['bad@example.com'] = smtplib.SMTPRecipientsRefused({'bad@example.com': (550, b'no such user')})
+        result = _send(server, ['a@example.com', 'bad@example.com', 'b@example.com'], connections=1)
+        assert result.sent == 2 and [r for r, _ in result.failed] == ['bad@example.com']
+        assert server.opened == 1
+
+    def test_temporary_error_retried_once(self, server):
+        server.failures['t@example.com'] = smtplib.SMTPDataError(451, b'try again')
+        result = _send(server, ['t@example.com'], connections=1)
+        assert result.sent == 1 and server.opened == 2
+
+    def test_invalid_and_duplicate_addresses(self, server):
+        result = _send(server, ['a@example.com', 'A@example.com', 'no-at-sign', 'x@example.com\r\nBcc: evil@example.com', ''])
+        assert result.sent == 1
+        assert len(result.failed) == 3 and all(err == 'invalid address' for _, err in result.failed)
+
+    def test_login_failure_reports_everyone_failed(self, server):
+        server.refuse_connections = True
+        result = _send(server, [f'u{i}@example.com' for i in range(5)])
+        assert result.sent == 0 and len(result.failed) == 5
+        assert {err for _, err in result.failed} == {'no SMTP connection available'}
+
+    def test_requires_smtp_config(self):
+        with patch.object(email_service, 'SMTP_USER', ''):
+            with pytest.raises(RuntimeError):
+                send_bulk_email(['a@example.com'], 's', 't')
+
+
+class TestJobDigestBulk:
+    JOBS = [{'job_title': 'Backend Engineer', 'company': 'Acme', 'apply_link': 'https://example.com/1'}]
+
+    def test_digest_rendered_once_for_all_recipients(self, server):
+        with patch.object(email_service, 'SMTP_USER', 'me@example.com'), \
+                patch.object(email_service, 'SMTP_APP_PASSWORD', 'pw'), \
+                patch.object(email_service, '_build_job_digest_email_html', wraps=email_service._build_job_digest_email_html) as render:
+            result = send_job_digest_bulk(['a@example.com', 'b@example.com'], self.JOBS, connect=server.connect)
+        assert result.sent == 2 and render.call_count == 1
+        msg = email.message_from_bytes(server.messages[0][2])
+        assert msg['Subject'] == '1 new job on CodeXCareer Job Hunt'
+
+    def test_not_configured_fails_every_recipient(self):
+        with patch.object(email_service, 'SMTP_USER', ''):
+            result = send_job_digest_bulk(['a@example.com', 'b@example.com'], self.JOBS)
+        assert result.sent == 0 and len(result.failed) == 2
+
+
+class TestTemplates:
+    JOB = {'job_title': 'Backend <Engineer>', 'company': 'A&B', 'description': 'd' * 301, 'apply_link': 'https://example.com/1'}
+
+    def test_shell_escapes_titles_and_keeps_body(self):
+        html = email_service._build_branded_shell(
+            page_title='a<b', hero_title='T&C', hero_subtitle='"sub"', body_html='<p>body</p>')
+        assert '<title>a&lt;b</title>' in html and 'T&amp;C' in html and '&quot;sub&quot;' in html
+        assert '<p>body</p>' in html and '\x00' not in html
+
+    def test_job_card_memoized_per_job_content(self):
+        email_service._job_card_html.cache_clear()
+        first = email_service._build_job_card_html(self.JOB)
+        assert email_service._build_job_card_html(dict(self.JOB)) is first
+        assert 'Backend &lt;Engineer&gt;' in first and 'd' * 300 + '…' in first
+        edited = email_service._build_job_card_html(dict(self.JOB, company='C'))
+        assert edited is not first and '>C</p>' in edited
+        assert email_service._job_card_html.cache_info().misses == 2
+
+    def test_bulk_body_serialized_once_across_sends(self, server):
+        email_service._bulk_message.cache_clear()
+        with patch.object(email_service, 'render_message', wraps=email_service.render_message) as render:
+            _send(server, ['a@example.com'])
+            _send(server, ['b@example.com'])
+        assert render.call_count == 1 and len(server.messages) == 2
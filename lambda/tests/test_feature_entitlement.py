@@ -0,0 +1,111 @@
+"""
+Unit Tests for feature entitlement gating (EntitlementContext / consume_feature_use)
+"""
+
+import pytest
+from unittest.mock import Mock
+
+import sys
+sys.path.insert(0, '..')
+
+moto = pytest.importorskip('moto')
+import boto3
+
+import feature_entitlement as fe
+from feature_entitlement import EntitlementContext, check_entitlement_or_error, consume_feature_use
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    with moto.mock_aws():
+        ddb = boto3.resource('dynamodb', region_name='us-east-1')
+        users = ddb.create_table(
+            TableName='Users',
+            KeySchema=[{'AttributeName': 'userId', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'userId', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST',
+        )
+        subs = ddb.create_table(
+            TableName='UserSubscriptions',
+            KeySchema=[
+                {'AttributeName': 'userId', 'KeyType': 'HASH'},
+                {'AttributeName': 'subscriptionId', 'KeyType': 'RANGE'},
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'userId', 'AttributeType': 'S'},
+                {'AttributeName': 'subscriptionId', 'AttributeType': 'S'},
+            ],
+            BillingMode='PAY_PER_REQUEST',
+        )
+        users_spy = Mock(wraps=users)
+        subs_spy = Mock(wraps=subs)
+        monkeypatch.setattr(fe, '_users_table', users_spy)
+        monkeypatch.setattr(fe, '_subscriptions_table', subs_spy)
+        yield users, users_spy, subs, subs_spy
+
+
+class TestEntitlementContext:
+    def test_check_then_consume_reads_once_and_writes_once(self, tables):
+        users, users_spy, _, subs_spy = tables
+        users.put_item(Item={'userId': 'u1', 'featureUsage': {}})
+
+        ctx = EntitlementContext('u1')
+        assert check_entitlement_or_error('u1', 'ats-scorer', ctx=ctx) == (True, None)
+        ok, ent, err = consume_feature_use('u1', 'ats-scorer', session_id='s1', ctx=ctx)
+
+        assert ok and err is None
+        assert ent['used'] == 1 and ent['remaining'] == 1
+        assert subs_spy.query.call_count == 1
+        assert users_spy.get_item.call_count == 1
+        assert users_spy.update_item.call_count == 1
+
+    def test_plan_feature_skips_usage_write(self, tables):
+        users, users_spy, subs, _ = tables
+        users.put_item(Item={'userId': 'u1', 'featureUsage': {}})
+        subs.put_item(Item={
+            'userId': 'u1', 'subscriptionId': 'sub-1', 'status': 'active',
+            'planId': 'monthly', 'enabledFeatures': ['ats-scorer'],
+        })
+
+        ok, ent, _ = consume_feature_use('u1', 'ats-scorer', ctx=EntitlementContext('u1'))
+        assert ok and ent['source'] == 'plan'
+        users_spy.update_item.assert_not_called()
+
+
+class TestConsumeFeatureUse:
+    def test_limit_is_enforced_by_condition(self, tables):
+        users, _, _, _ = tables
+        users.put_item(Item={'userId': 'u1', 'featureUsage': {}})
+        # Two stale contexts both believe one use is left
+        stale = [EntitlementContext('u1'), EntitlementContext('u1')]
+        for ctx in stale:
+            ctx.user_item = {'userId': 'u1', 'featureUsage': {'portfolio': 1}}
+        users.put_item(Item={'userId': 'u1', 'featureUsage': {'portfolio': 1}})
+
+        assert consume_feature_use('u1', 'portfolio', ctx=stale[0])[0] is True
+        ok, ent, err = consume_feature_use('u1', 'portfolio', ctx=stale[1])
+        assert ok is False and ent['remaining'] == 0
+        assert 'exhausted' in err
+        assert users.get_item(Key={'userId': 'u1'})['Item']['featureUsage']['portfolio'] == 2
+
+    def test_same_session_counts_once(self, tables):
+        users, _, _, _ = tables
+        users.put_item(Item={'userId': 'u1', 'featureUsage': {}})
+
+        assert consume_feature_use('u1', 'ats-scorer', session_id='s1')[0] is True
+        ok, ent, _ = consume_feature_use('u1', 'ats-scorer', session_id='s1')
+        assert ok and ent['used'] == 1
+
+    def test_creates_missing_usage_maps(self, tables):
+        users, _, _, _ = tables
+        users.put_item(Item={'userId': 'legacy'})
+
+        assert consume_feature_use('legacy', 'live-ai', session_id='s1')[0] is True
+        assert consume_feature_use('legacy', 'live-ai', session_id='s2')[0] is True
+        item = users.get_item(Key={'userId': 'legacy'})['Item']
+        assert item['featureUsage'] == {'live-ai': 2}
+        assert set(item['featureUsageSessions']['live-ai']) == {'s1', 's2'}
+
+    def test_unknown_user(self, tables):
+        ok, _, err = consume_feature_use('ghost', 'portfolio')
+        assert ok is False and err == 'User not found'
@@ -19,11 +19,24 @@ from freelancers_handler import (
     handle_search_freelancers,
     format_freelancer,
     get_seller_stats,
+    get_freelancer_reviews_stats,
+    backfill_review_counters,
+    fill_uncounted_review_stats,
+    prefetch_freelancer_stats,
+    reset_stats_memo,
     decimal_to_float,
     response
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_stats_memo():
+    """Stats memo is per-invocation; don't let it leak between tests"""
+    reset_stats_memo()
+    yield
+    reset_stats_memo()
+
+
 class TestDecimalToFloat:
     """Test the decimal_to_float helper function"""
 
@@ -797,5 +810,185 @@ class TestEdgeCases:
             assert result['statusCode'] == 200
 
 
+class TestPrefetchFreelancerStats:
+    """Test batched seller/review stats loading"""
+
+    @patch('freelancers_handler.interactions_table')
+    @patch('freelancers_handler.projects_table')
+    def test_one_projects_scan_and_review_stats_from_counters(self, mock_projects_table, mock_interactions_table):
+        mock_projects_table.scan.return_value = {
+            'Items': [
+                {'sellerId': 'a', 'purchasesCount': 2, 'price': Decimal('10'), 'viewsCount': 5, 'likesCount': 1},
+                {'sellerId': 'a', 'purchasesCount': 1, 'price': Decimal('20'), 'viewsCount': 3, 'likesCount': 0},
+                {'sellerId': 'other', 'purchasesCount': 9, 'price': Decimal('99')},
+            ]
+        }
+        users = [
+            {'userId': 'a', 'reviewCount': Decimal('2'), 'reviewRatingSum': Decimal('9')},
+            {'userId': 'b', 'reviewCount': Decimal('1'), 'reviewRatingSum': Decimal('3')},
+            {'userId': 'c', 'reviewCount': Decimal('0')},
+        ]
+
+        assert prefetch_freelancer_stats(users, query_uncounted=False) == set()
+
+        assert mock_projects_table.scan.call_count == 1
+        assert get_seller_stats('a')['projectsCount'] == 2
+        assert get_seller_stats('a')['totalRevenue'] == 40.0
+        assert get_seller_stats('c')['projectsCount'] == 0
+        assert get_freelancer_reviews_stats('a') == {'count': 2, 'averageRating': 4.5}
+        assert get_freelancer_reviews_stats('c')['count'] == 0
+        # Memoized lookups must not hit DynamoDB again
+        assert mock_projects_table.scan.call_count == 1
+        mock_interactions_table.query.assert_not_called()
+        mock_interactions_table.scan.assert_not_called()
+
+    @patch('freelancers_handler.interactions_table')
+    @patch('freelancers_handler.projects_table')
+    def test_uncounted_page_rows_get_one_paginated_query(self, mock_projects_table, mock_interactions_table):
+        mock_projects_table.scan.return_value = {'Items': []}
+        mock_interactions_table.query.side_effect = [
+            {'Items': [{'rating': Decimal('5')}], 'LastEvaluatedKey': {'interactionId': 'x'}},
+            {'Items': [{'rating': Decimal('3')}]},
+        ]
+
+        uncounted = prefetch_freelancer_stats([{'userId': 'a'}, {'userId': 'b'}], query_uncounted=False)
+        page = [{'id': 'a', 'rating': 0, 'reviewsCount': 0}]
+        fill_uncounted_review_stats(page, uncounted)
+
+        assert uncounted == {'a', 'b'}
+        assert page[0]['rating'] == 4.0 and page[0]['reviewsCount'] == 2
+        assert mock_interactions_table.query.call_args.kwargs['IndexName'] == 'targetId-index'
+        assert mock_interactions_table.query.call_args.kwargs['ExclusiveStartKey'] == {'interactionId': 'x'}
+        assert mock_interactions_table.query.call_count == 2
+        mock_interactions_table.scan.assert_not_called()
+
+    @patch('freelancers_handler.interactions_table')
+    @patch('freelancers_handler.projects_table')
+    @patch('freelancers_handler.users_table')
+    def test_browse_page_cost_is_independent_of_result_size(self, mock_users_table, mock_projects_table, mock_interactions_table):
+        mock_users_table.scan.return_value = {
+            'Items': [
+                {'userId': f'f-{i}', 'fullName': f'F {i}', 'role': 'seller', 'status': 'active'}
+                for i in range(40)
+            ]
+        }
+        mock_projects_table.scan.return_value = {'Items': []}
+        mock_interactions_table.query.return_value = {'Items': []}
+
+        result = handle_get_all_freelancers({'limit': 10, 'offset': 0})
+
+        assert result['statusCode'] == 200
+        assert mock_projects_table.scan.call_count == 1
+        # Rows without counters: at most one review query per freelancer on the page
+        assert mock_interactions_table.query.call_count == 10
+        mock_interactions_table.scan.assert_not_called()
+
+    @patch('freelancers_handler.interactions_table')
+    @patch('freelancers_handler.projects_table')
+    @patch('freelancers_handler.users_table')
+    def test_browse_ranks_by_counters_without_review_queries(self, mock_users_table, mock_projects_table, mock_interactions_table):
+        mock_users_table.scan.return_value = {
+            'Items': [
+                {'userId': f'f-{i}', 'fullName': f'F {i}', 'role': 'seller', 'status': 'active',
+                 'reviewCount': Decimal('1'), 'reviewRatingSum': Decimal(str(1 + i % 5))}
+                for i in range(40)
+            ]
+        }
+        mock_projects_table.scan.return_value = {'Items': []}
+
+        result = handle_get_all_freelancers({'limit': 5, 'offset': 0})
+
+        body = json.loads(result['body'])
+        assert [f['rating'] for f in body['data']['freelancers']] == [5] * 5
+        mock_interactions_table.query.assert_not_called()
+        mock_interactions_table.scan.assert_not_called()
+
+
+class TestReviewCounters:
+    def test_backfill_sets_counters_for_freelancers_and_reviewed_users(self):
+        interactions = Mock()
+        interactions.scan.return_value = {'Items': [
+            {'targetId': 'a', 'rating': Decimal('4')},
+            {'targetId': 'a', 'rating': Decimal('5')},
+            {'targetId': 'gone', 'rating': Decimal('1')},
+        ]}
+        users = Mock()
+        users.scan.return_value = {'Items': [{'userId': 'a'}, {'userId': 'b'}]}
+        missing = type('ClientError', (Exception,), {})()
+        missing.response = {'Error': {'Code': 'ConditionalCheckFailedException'}}
+
+        def update_item(**kwargs):
+            if kwargs['Key']['userId'] == 'gone':
+                raise missing
+
+        users.update_item.side_effect = update_item
+
+        assert backfill_review_counters(users, interactions) == 2
+
+        written = {c.kwargs['Key']['userId']: c.kwargs['ExpressionAttributeValues'] for c in users.update_item.call_args_list}
+        assert written['a'] == {':count': 2, ':sum': Decimal('9')}
+        assert written['b'] == {':count': 0, ':sum': Decimal('0')}
+
+
+class TestSearchIndex:
+    """Test the inverted-index search path"""
+
+    def test_posting_terms_cover_prefixes_and_facets(self):
+        import freelancer_search_index as idx
+        fields = idx.profile_fields({
+            'userId': 'u1',
+            'fullName': 'Asha Rao',
+            'skills': 'React, Node.js',
+            'location': 'Pune, India',
+            'hourlyRate': Decimal('35')
+        })
+        terms = idx.posting_terms(fields)
+        assert 'tok#re' in terms and 'tok#react' in terms
+        assert 'tok#node.js' in terms
+        assert 'skill#node.js' in terms
+        assert 'country#india' in terms
+        assert fields['hourlyRate'] == 35.0
+        assert idx.rate_key(35.0, 'u1') == '000000003500#u1'
+
+    @patch('freelancers_handler.users_table')
+    @patch('freelancers_handler.freelancer_search_index')
+    def test_search_reads_users_only_for_page(self, mock_index, mock_users_table):
+        mock_index.max_hourly_rate.return_value = 120.0
+        mock_index.search.return_value = [
+            (f'f-{i}', {'rating': Decimal('0'), 'successRate': Decimal('90')}) for i in range(30)
+        ]
+        mock_users_table.name = 'Users'
+        mock_users_table.meta.client.batch_get_item.return_value = {'Responses': {'Users': [
+            {'userId': 'f-10', 'fullName': 'Ten', 'role': 'seller'},
+            {'userId': 'f-11', 'fullName': 'Eleven', 'role': 'seller'},
+        ]}}
+
+        with patch('freelancers_handler.prefetch_freelancer_stats'), \
+                patch('freelancers_handler.get_seller_stats', return_value={}), \
+                patch('freelancers_handler.get_freelancer_reviews_stats', return_value={'count': 0, 'averageRating': 0}):
+            result = handle_search_freelancers({'query': 'dev', 'limit': 2, 'offset': 10})
+        body = json.loads(result['body'])
+
+        assert result['statusCode'] == 200
+        assert [f['id'] for f in body['data']['freelancers']] == ['f-10', 'f-11']
+        assert body['data']['totalCount'] == 30
+        assert body['data']['maxHourlyRate'] == 120.0
+        mock_users_table.scan.assert_not_called()
+        keys = mock_users_table.meta.client.batch_get_item.call_args.kwargs['RequestItems']['Users']['Keys']
+        assert keys == [{'userId': 'f-10'}, {'userId': 'f-11'}]
+
+    @patch('freelancers_handler.users_table')
+    @patch('freelancers_handler.freelancer_search_index')
+    def test_empty_index_falls_back_to_scan(self, mock_index, mock_users_table):
+        mock_index.max_hourly_rate.return_value = None
+        mock_users_table.scan.return_value = {'Items': []}
+
+        result = handle_search_freelancers({'query': 'dev'})
+
+        assert result['statusCode'] == 200
+        mock_users_table.scan.assert_called_once()
+        mock_index.search.assert_not_called()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,54 @@
+"""
+Unit Tests for the admin users Lambda: UPDATE_USER keeps the freelancer search index in step
+"""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import sys
+sys.path.insert(0, '..')
+import freelancer_search_index
+import get_all_users_for_admin
+from get_all_users_for_admin import handle_update_user
+
+
+class TestUpdateUserStatus:
+    def test_blocking_reindexes_with_new_attributes(self):
+        blocked = {'userId': 'u1', 'role': 'seller', 'status': 'blocked'}
+        table = Mock(update_item=Mock(return_value={'Attributes': blocked}))
+        with patch.object(get_all_users_for_admin, 'table', table), \
+                patch.object(freelancer_search_index, 'index_user') as index_user:
+            result = handle_update_user({'userId': 'u1', 'status': 'blocked'})
+        assert result['statusCode'] == 200
+        assert table.update_item.call_args.kwargs['ReturnValues'] == 'ALL_NEW'
+        index_user.assert_called_once_with(blocked)
+
+    def test_credits_only_update_does_not_touch_index(self):
+        table = Mock(update_item=Mock(return_value={}))
+        with patch.object(get_all_users_for_admin, 'table', table), \
+                patch.object(freelancer_search_index, 'index_user') as index_user:
+            handle_update_user({'userId': 'u1', 'credits': 5})
+        assert 'ReturnValues' not in table.update_item.call_args.kwargs
+        index_user.assert_not_called()
+
+    def test_index_failure_does_not_fail_the_update(self):
+        table = Mock(update_item=Mock(return_value={'Attributes': {'userId': 'u1', 'status': 'deleted'}}))
+        with patch.object(get_all_users_for_admin, 'table', table), \
+                patch.object(freelancer_search_index, 'index_user', side_effect=RuntimeError('throttled')):
+            assert handle_update_user({'userId': 'u1', 'status': 'deleted'})['statusCode'] == 200
+
+
+class TestIndexUserStatus:
+    def test_inactive_user_postings_are_removed(self):
+        batch = Mock()
+        index = Mock()
+        index.batch_writer.return_value.__enter__ = Mock(return_value=batch)
+        index.batch_writer.return_value.__exit__ = Mock(return_value=False)
+        previous = {'terms': ['tok#as', 'skill#react'], 'rateKey': '000000003500#u1'}
+        user = {'userId': 'u1', 'role': 'seller', 'fullName': 'Asha', 'hourlyRate': Decimal('35'), 'status': 'blocked'}
+
+        freelancer_search_index.index_user(user, previous_doc=previous, table=index)
+
+        deleted = {(c.kwargs['Key']['term'], c.kwargs['Key']['sk']) for c in batch.delete_item.call_args_list}
+        assert deleted == {('tok#as', 'u1'), ('skill#react', 'u1'), ('rate', '000000003500#u1'), ('all', 'u1')}
+        batch.put_item.assert_not_called()
@@ -0,0 +1,160 @@
+"""
+Unit Tests for the job feed (get_jobs_details)
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, '..')
+
+moto = pytest.importorskip('moto')
+import boto3
+
+import get_jobs_details as jobs
+
+
+def _create_jobs_table(ddb, with_index=True):
+    kwargs = {}
+    if with_index:
+        kwargs['GlobalSecondaryIndexes'] = [{
+            'IndexName': jobs.FEED_INDEX,
+            'KeySchema': [
+                {'AttributeName': 'feed', 'KeyType': 'HASH'},
+                {'AttributeName': 'scraped_at', 'KeyType': 'RANGE'},
+            ],
+            'Projection': {'ProjectionType': 'ALL'},
+        }]
+    return ddb.create_table(
+        TableName=jobs.TABLE_NAME,
+        KeySchema=[{'AttributeName': 'id', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[
+            {'AttributeName': 'id', 'AttributeType': 'S'},
+            {'AttributeName': 'feed', 'AttributeType': 'S'},
+            {'AttributeName': 'scraped_at', 'AttributeType': 'N'},
+        ] if with_index else [{'AttributeName': 'id', 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST',
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    with moto.mock_aws():
+        ddb = boto3.resource('dynamodb', region_name='us-east-1')
+        saved = ddb.create_table(
+            TableName=jobs.SAVED_JOBS_TABLE_NAME,
+            KeySchema=[
+                {'AttributeName': 'userId', 'KeyType': 'HASH'},
+                {'AttributeName': 'jobId', 'KeyType': 'RANGE'},
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'userId', 'AttributeType': 'S'},
+                {'AttributeName': 'jobId', 'AttributeType': 'S'},
+            ],
+            BillingMode='PAY_PER_REQUEST',
+        )
+        monkeypatch.setattr(jobs, 'dynamodb', ddb)
+        monkeypatch.setattr(jobs, 'saved_table', saved)
+        monkeypatch.setitem(jobs._total_cache, 'expires', 0.0)
+        yield ddb, saved
+
+
+def _seed(table, n):
+    for i in range(n):
+        table.put_item(Item={'id': f'job-{i:02d}', 'feed': 'jobs', 'scraped_at': 1000 + i, 'job_title': f'Role {i}'})
+
+
+def _get(params):
+    res = jobs.handle_get(params)
+    return res['statusCode'], json.loads(res['body'])
+
+
+class TestFeedPagination:
+    def test_cursor_walks_feed_newest_first(self, aws, monkeypatch):
+        ddb, _ = aws
+        table = _create_jobs_table(ddb)
+        monkeypatch.setattr(jobs, 'table', table)
+        _seed(table, 7)
+
+        seen, cursor = [], None
+        with patch.object(jobs, 'scan_all_job_items', side_effect=AssertionError('scan')):
+            while True:
+                params = {'limit': '3'}
+                if cursor:
+                    params['cursor'] = cursor
+                status, body = _get(params)
+                assert status == 200
+                seen.extend(j['id'] for j in body['data']['jobs'])
+                cursor = body['data']['next_cursor']
+                if not body['data']['has_more']:
+                    break
+
+        assert seen == [f'job-{i:02d}' for i in range(6, -1, -1)]
+        assert cursor is None
+
+    def test_offset_matches_cursor_page(self, aws, monkeypatch):
+        ddb, _ = aws
+        table = _create_jobs_table(ddb)
+        monkeypatch.setattr(jobs, 'table', table)
+        _seed(table, 7)
+
+        _, first = _get({'limit': '3'})
+        _, by_cursor = _get({'limit': '3', 'cursor': first['data']['next_cursor']})
+        _, by_offset = _get({'limit': '3', 'offset': '3'})
+        assert [j['id'] for j in by_cursor['data']['jobs']] == [j['id'] for j in by_offset['data']['jobs']]
+
+        _, last = _get({'limit': '3', 'offset': '6'})
+        assert [j['id'] for j in last['data']['jobs']] == ['job-00']
+        assert last['data']['total'] == 7 and last['data']['has_more'] is False
+
+        _, past = _get({'limit': '3', 'offset': '50'})
+        assert past['data']['jobs'] == []
+
+    def test_invalid_cursor_is_rejected(self, aws, monkeypatch):
+        ddb, _ = aws
+        monkeypatch.setattr(jobs, 'table', _create_jobs_table(ddb))
+        status, body = _get({'cursor': 'not-a-cursor'})
+        assert status == 400
+        assert body['success'] is False
+
+    def test_saved_flags_attached(self, aws, monkeypatch):
+        ddb, saved = aws
+        table = _create_jobs_table(ddb)
+        monkeypatch.setattr(jobs, 'table', table)
+        _seed(table, 3)
+        saved.put_item(Item={'userId': 'u1', 'jobId': 'job-01'})
+
+        _, body = _get({'userId': 'u1'})
+        flags = {j['id']: j['saved'] for j in body['data']['jobs']}
+        assert flags == {'job-02': False, 'job-01': True, 'job-00': False}
+        assert body['data']['saved_count'] == 1
+
+    def test_missing_index_falls_back_to_scan(self, aws, monkeypatch):
+        ddb, _ = aws
+        table = _create_jobs_table(ddb, with_index=False)
+        monkeypatch.setattr(jobs, 'table', table)
+        _seed(table, 4)
+
+        _, body = _get({'limit': '2', 'offset': '2'})
+        assert [j['id'] for j in body['data']['jobs']] == ['job-01', 'job-00']
+        assert body['data']['total'] == 4
+
+
+class TestSavedOnly:
+    def test_batch_gets_only_saved_ids(self, aws, monkeypatch):
+        ddb, saved = aws
+        table = _create_jobs_table(ddb)
+        monkeypatch.setattr(jobs, 'table', table)
+        _seed(table, 5)
+        for jid in ('job-00', 'job-03', 'job-gone'):
+            saved.put_item(Item={'userId': 'u1', 'jobId': jid})
+
+        with patch.object(jobs, 'scan_all_job_items', side_effect=AssertionError('scan')):
+            _, body = _get({'userId': 'u1', 'saved_only': '1'})
+
+        assert [j['id'] for j in body['data']['jobs']] == ['job-03', 'job-00']
+        assert all(j['saved'] for j in body['data']['jobs'])
+        assert body['data']['total'] == 2
@@ -0,0 +1,212 @@
+"""
+Unit Tests for the shared pooled HTTP client (http_client), against a local HTTP stub
+"""
+
+import http.server
+import json
+import socket
+import struct
+import threading
+import time
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import http_client
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=None, close=False):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        if close:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        payload = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        server = self.server
+        server.connections.add(id(self.connection))
+        server.hits[self.path] = server.hits.get(self.path, 0) + 1
+        if self.path == '/echo':
+            self._reply(200, json.dumps({'got': payload.decode(), 'auth': self.headers.get('Authorization')}).encode())
+        elif self.path == '/flaky':
+            if server.hits[self.path] == 1:
+                self._reply(503, b'busy', {'Retry-After': '0'})
+            else:
+                self._reply(200, b'{"ok": true}')
+        elif self.path == '/bad':
+            self._reply(401, b'{"error": "invalid key"}')
+        elif self.path == '/close':
+            self._reply(200, b'bye', close=True)
+        elif self.path == '/drop':
+            # Keep-alive response, then the server silently closes (idle timeout)
+            self._reply(200, b'{}')
+            self.close_connection = True
+        elif self.path == '/reset':
+            # Request read (and possibly processed), then the connection is reset without a response
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            self.close_connection = True
+        elif self.path == '/big':
+            self._reply(200, b'x' * 4096)
+        elif self.path == '/stream':
+            self._reply(200, b'data: {"a": 1}\r\n\r\ndata: {"a": 2}\r\n\r\ndata: [DONE]')
+        elif self.path == '/slow-stream':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for part in (b'data: first\n\n', b'data: second\n\n'):
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(part), part))
+                self.wfile.flush()
+                time.sleep(0.3)
+            self.wfile.write(b'0\r\n\r\n')
+
+    do_GET = do_POST
+
+
+@pytest.fixture
+def stub():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.connections = set()
+    server.hits = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    http_client.close_all()
+    yield server, f'http://127.0.0.1:{server.server_address[1]}'
+    http_client.close_all()
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, path, body=b'{}', **kwargs):
+    req = urllib.request.Request(url + path, data=body, headers={'Content-Type': 'application/json'}, method='POST')
+    return http_client.urlopen(req, timeout=5, **kwargs)
+
+
+class TestPooling:
+    def test_connection_is_reused_across_requests(self, stub):
+        server, url = stub
+        for i in range(5):
+            with _post(url, '/echo', json.dumps({'i': i}).encode()) as resp:
+                assert resp.status == 200
+                assert json.loads(resp.read())['got'] == json.dumps({'i': i})
+        stats = http_client.pool_stats()
+        assert stats['newConnections'] == 1 and stats['reusedConnections'] == 4
+        assert len(server.connections) == 1
+
+    def test_request_headers_are_sent(self, stub):
+        _, url = stub
+        req = urllib.request.Request(url + '/echo', data=b'x', headers={'Authorization': 'Bearer sk'}, method='POST')
+        with http_client.urlopen(req, timeout=5) as resp:
+            assert json.loads(resp.read())['auth'] == 'Bearer sk'
+
+    def test_connection_close_is_not_pooled(self, stub):
+        _, url = stub
+        with _post(url, '/close') as resp:
+            assert resp.read() == b'bye'
+        assert http_client.pool_stats()['idle'] == 0
+
+    def test_unread_small_body_is_drained_on_close(self, stub):
+        _, url = stub
+        with _post(url, '/big') as resp:
+            resp.read(10)
+        assert http_client.pool_stats()['idle'] == 1
+        with _post(url, '/echo', b'next') as resp:
+            assert json.loads(resp.read())['got'] == 'next'
+        assert http_client.pool_stats()['reusedConnections'] == 1
+
+    def test_stale_pooled_connection_is_retried_on_a_fresh_one(self, stub):
+        server, url = stub
+        with _post(url, '/drop') as resp:
+            resp.read()
+        assert http_client.pool_stats()['idle'] == 1
+        time.sleep(0.05)
+        with _post(url, '/echo', b'again') as resp:
+            assert json.loads(resp.read())['got'] == 'again'
+        stats = http_client.pool_stats()
+        assert stats['newConnections'] == 2 and stats['retries'] == 0
+        assert len(server.connections) == 2
+
+
+class TestErrors:
+    def test_non_2xx_raises_http_error_with_readable_body(self, stub):
+        _, url = stub
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _post(url, '/bad')
+        assert exc.value.code == 401
+        assert json.loads(exc.value.read())['error'] == 'invalid key'
+        # The error body was read, so the connection is still reusable
+        assert http_client.pool_stats()['idle'] == 1
+
+    def test_retryable_status_is_retried(self, stub):
+        server, url = stub
+        with patch.object(http_client.time, 'sleep') as sleep:
+            with _post(url, '/flaky') as resp:
+                assert json.loads(resp.read()) == {'ok': True}
+        assert server.hits['/flaky'] == 2
+        assert http_client.pool_stats()['retries'] == 1
+        sleep.assert_called_once_with(0.0)
+
+    def test_retryable_status_without_retries_raises(self, stub):
+        _, url = stub
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _post(url, '/flaky', retries=0)
+        assert exc.value.code == 503
+
+    def test_post_reset_after_request_was_read_is_not_retried(self, stub):
+        server, url = stub
+        with patch.object(http_client.time, 'sleep'):
+            with pytest.raises(urllib.error.URLError):
+                _post(url, '/reset', retries=2)
+        assert server.hits['/reset'] == 1 and http_client.pool_stats()['retries'] == 0
+
+    def test_idempotent_reset_after_request_was_read_is_retried(self, stub):
+        server, url = stub
+        with patch.object(http_client.time, 'sleep'):
+            with pytest.raises(urllib.error.URLError):
+                http_client.urlopen(url + '/reset', timeout=5, retries=2)
+        assert server.hits['/reset'] == 3
+
+    def test_connection_refused_is_url_error(self):
+        with patch.object(http_client.time, 'sleep'):
+            with pytest.raises(urllib.error.URLError):
+                http_client.urlopen('http://127.0.0.1:9/', timeout=1, retries=1)
+
+    def test_backoff_respects_sleep_budget(self):
+        with patch.object(http_client, 'RETRY_MAX_SLEEP_SECONDS', 1.0):
+            assert http_client._backoff(3, None, 0.9) <= 0.1 + 1e-9
+            assert http_client._backoff(0, 30.0, 0.0) == 1.0
+
+
+class TestStreaming:
+    def test_iter_lines_yields_sse_lines_and_releases_connection(self, stub):
+        _, url = stub
+        with _post(url, '/stream') as resp:
+            lines = [line for line in resp.iter_lines(chunk_size=7) if line]
+        assert lines == [b'data: {"a": 1}', b'data: {"a": 2}', b'data: [DONE]']
+        assert http_client.pool_stats()['idle'] == 1
+
+    def test_chunked_lines_arrive_before_the_body_ends(self, stub):
+        _, url = stub
+        start = time.monotonic()
+        with _post(url, '/slow-stream') as resp:
+            lines = resp.iter_lines()
+            assert next(lines) == b'data: first'
+            first_at = time.monotonic() - start
+            rest = [line for line in lines if line]
+        assert first_at < 0.25
+        assert rest == [b'data: second']
+        assert http_client.pool_stats()['idle'] == 1
@@ -0,0 +1,114 @@
+"""
+Unit Tests for the shared résumé keyword index (keyword_matcher)
+"""
+
+import random
+import re
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import keyword_matcher
+from keyword_matcher import KeywordIndex, index_for, simple_stem
+
+RESUME = (
+    "Jane Doe\nSUMMARY\nData scientist building predictive models in Python and JavaScript.\n"
+    "EXPERIENCE\nLed analysis for stakeholders; communicating results to leadership.\n"
+    "SKILLS\nPython, SQL, AWS Lambda, DynamoDB, C++, CI/CD, Docker"
+)
+
+
+def _legacy_covers(resume_text, phrase):
+    """The per-keyword check refine_keyword_lists used before the index (reference semantics)."""
+    rlow = resume_text.lower()
+    stems = set()
+    for w in re.findall(r"[a-zA-Z0-9+]{2,}", rlow):
+        stems.add(w.lower())
+        stems.add(simple_stem(w))
+    pl = phrase.lower().strip()
+    if not pl or pl in rlow:
+        return True
+    toks = [t for t in re.split(r"[^\w+]+", pl) if t and len(t) > 1]
+    if not toks:
+        return False
+    for tok in toks:
+        ok = tok in rlow or simple_stem(tok) in stems
+        for syn in keyword_matcher.SYNONYM_GROUPS:
+            if tok in syn and any(s in rlow for s in syn):
+                ok = True
+        if not ok:
+            return False
+    return True
+
+
+class TestCovers:
+    @pytest.mark.parametrize('phrase', [
+        'python', 'Data Science', 'machine learning', 'communication skills', 'stakeholder management',
+        'java', 'c++', 'ci/cd', 'predicted', 'analytical', 'kubernetes', 'aws lambda', '', '  ', '-',
+    ])
+    def test_matches_legacy(self, phrase):
+        assert KeywordIndex(RESUME).covers(phrase) == _legacy_covers(RESUME, phrase)
+
+    def test_random_phrases_match_legacy(self):
+        rng = random.Random(3)
+        vocab = re.findall(r"\w+", RESUME.lower()) + ['ml', 'collaboration', 'terraform', 'predict', 'ing']
+        index = KeywordIndex(RESUME)
+        for _ in range(300):
+            phrase = ' '.join(rng.choice(vocab) for _ in range(rng.randint(1, 3)))
+            assert index.covers(phrase) == _legacy_covers(RESUME, phrase), phrase
+
+    def test_synonym_group(self):
+        assert KeywordIndex('Built machine learning pipelines').covers('ML')
+        assert KeywordIndex('Strong collaboration').covers('collaborate')
+        assert not KeywordIndex('Built pipelines').covers('ML')
+
+    def test_substring_semantics(self):
+        assert KeywordIndex('JavaScript').covers('java')
+
+
+class TestHasAllTokens:
+    def test_short_tokens_are_ignored(self):
+        index = KeywordIndex('react and node services')
+        assert index.has_all_tokens('React JS')
+        assert not index.has_all_tokens('Go')
+
+    def test_every_token_required(self):
+        index = KeywordIndex(RESUME.lower())
+        assert index.has_all_tokens('python docker')
+        assert not index.has_all_tokens('python kubernetes')
+
+
+class TestIndexCache:
+    def test_same_text_reuses_index(self):
+        assert index_for(RESUME) is index_for(RESUME)
+
+    def test_relevance_tokens(self):
+        assert keyword_matcher.relevance_tokens('Node.js and C++ on AWS') == {'node.js', 'and', 'c++', 'aws'}
+
+
+class TestCallers:
+    def test_refine_keyword_lists_moves_covered_keywords(self):
+        from ats_resume_scorer import refine_keyword_lists
+
+        result = {
+            'matchedKeywords': ['Python'],
+            'missingKeywords': ['ML', 'Kubernetes', {'keyword': 'stakeholder', 'suggestedSection': 'Experience'}],
+        }
+        refine_keyword_lists(result, RESUME.replace('Python', 'Python, machine learning'))
+
+        assert result['matchedKeywords'] == ['Python', 'ML', 'stakeholder']
+        assert result['missingKeywords'] == ['Kubernetes']
+
+    def test_apply_missing_keywords_skips_present_and_placed(self):
+        import resume_fix_engine
+
+        structured = {
+            'name': 'Jane', 'summary': 'Backend engineer.', 'skills': ['Python', 'Docker'],
+            'experience': [{'title': 'Engineer', 'detail': 'Built services with Python.'}], 'projects': [],
+        }
+        _, added = resume_fix_engine.apply_missing_keywords(
+            structured, ['python', 'Kubernetes', 'kubernetes', 'stakeholder communication'])
+
+        assert 'python' not in added
+        assert added.count('Kubernetes') == 1 and 'kubernetes' not in added
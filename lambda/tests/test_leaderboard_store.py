@@ -0,0 +1,230 @@
+"""
+Unit Tests for the sharded leaderboard store
+"""
+
+from unittest.mock import Mock, patch
+from decimal import Decimal
+
+import sys
+sys.path.insert(0, '..')
+import leaderboard_store
+from leaderboard_store import (
+    approximate_rank,
+    bucket_for,
+    build_entry,
+    put_entry,
+    read_page,
+    rank_of,
+    shard_for,
+    shard_key,
+)
+
+
+def _progress(xp, tests=1):
+    return {'totalXP': Decimal(str(xp)), 'testsCompleted': Decimal(str(tests)), 'avgScore': Decimal('80.5'), 'badges': []}
+
+
+class FakeLeaderboard:
+    """In-memory single-timeframe table: put_item with ALL_OLD, ADD updates and key queries."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def put_item(self, Item, ReturnValues=None):
+        old = self.rows.get(Item['userId'])
+        self.rows[Item['userId']] = dict(Item)
+        return {'Attributes': old} if old and ReturnValues == 'ALL_OLD' else {}
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeValues):
+        row = self.rows.setdefault(Key['userId'], dict(Key))
+        for clause in UpdateExpression[len('ADD '):].split(', '):
+            name, value = clause.split(' ')
+            row[name] = row.get(name, 0) + ExpressionAttributeValues[value]
+
+    def query(self, **kwargs):
+        return {'Items': list(self.rows.values())}
+
+
+class TestBuildEntry:
+    def test_shard_is_stable(self):
+        assert shard_for('user-123') == shard_for('user-123')
+        assert 0 <= shard_for('user-123') < leaderboard_store.LEADERBOARD_SHARDS
+
+    def test_entry_normalises_numbers(self):
+        entry = build_entry('user-123', {'totalXP': '150', 'testsCompleted': Decimal('2'), 'avgScore': 75.456})
+        assert entry['xp'] == 150
+        assert entry['testsCompleted'] == 2
+        assert entry['avgScore'] == Decimal('75.46')
+        assert entry['lbShard'] == shard_key('all', shard_for('user-123'))
+        assert entry['name'] == 'User user-123'
+
+
+class TestPutEntry:
+    def test_new_entry_increments_shard_counter(self):
+        table = Mock()
+        table.put_item.return_value = {}
+        put_entry(table, 'user-1', _progress(100))
+        table.update_item.assert_called_once()
+        kwargs = table.update_item.call_args.kwargs
+        assert kwargs['Key']['userId'] == f"__count__#{shard_for('user-1')}"
+        assert kwargs['UpdateExpression'] == f"ADD members :one, b{bucket_for(100)} :one"
+
+    def test_same_bucket_does_not_touch_counter(self):
+        table = Mock()
+        table.put_item.return_value = {'Attributes': {'userId': 'user-1', 'xp': Decimal('101')}}
+        put_entry(table, 'user-1', _progress(150))
+        table.update_item.assert_not_called()
+
+    def test_bucket_change_moves_user(self):
+        table = Mock()
+        table.put_item.return_value = {'Attributes': {'userId': 'user-1', 'xp': Decimal('150')}}
+        put_entry(table, 'user-1', _progress(350))
+        kwargs = table.update_item.call_args.kwargs
+        assert kwargs['UpdateExpression'] == f"ADD b{bucket_for(350)} :one, b{bucket_for(150)} :minus"
+        assert kwargs['ExpressionAttributeValues'][':minus'] == Decimal('-1')
+
+    def test_users_without_tests_are_skipped(self):
+        table = Mock()
+        put_entry(table, 'user-1', _progress(0, tests=0))
+        table.put_item.assert_not_called()
+
+
+class TestReadPage:
+    def test_merges_shards_in_xp_order(self):
+        shards = {
+            'all#0': [{'userId': 'a', 'xp': Decimal('500')}, {'userId': 'c', 'xp': Decimal('100')}],
+            'all#1': [{'userId': 'b', 'xp': Decimal('300')}],
+        }
+        table = Mock()
+
+        def query(**kwargs):
+            shard = kwargs['KeyConditionExpression']._values[1]
+            return {'Items': shards.get(shard, [])[:kwargs['Limit']]}
+
+        table.query.side_effect = query
+        with patch.object(leaderboard_store, 'LEADERBOARD_SHARDS', 2):
+            page = read_page(table, offset=1, limit=2)
+
+        assert [e['userId'] for e in page] == ['b', 'c']
+        assert [e['rank'] for e in page] == [2, 3]
+        assert page[0]['xp'] == 300
+
+    def test_zero_limit_returns_empty_without_queries(self):
+        table = Mock()
+        assert read_page(table, limit=0) == []
+        table.query.assert_not_called()
+
+
+class TestRankOf:
+    def test_rank_counts_users_with_more_xp(self):
+        table = Mock()
+        table.get_item.return_value = {'Item': {'userId': 'u', 'xp': Decimal('200')}}
+        table.query.side_effect = [{'Count': 3}, {'Count': 1}]
+        with patch.object(leaderboard_store, 'LEADERBOARD_SHARDS', 2):
+            assert rank_of(table, 'u') == 5
+
+    def test_unknown_user_has_no_rank(self):
+        table = Mock()
+        table.get_item.return_value = {}
+        assert rank_of(table, 'nobody') is None
+
+
+class TestHistogram:
+    def test_read_histogram_merges_shards(self):
+        table = Mock()
+        table.name = 'Leaderboard'
+        table.meta.client.batch_get_item.return_value = {'Responses': {'Leaderboard': [
+            {'userId': '__count__#0', 'members': Decimal('3'), 'b0': Decimal('2'), 'b5': Decimal('1')},
+            {'userId': '__count__#1', 'members': Decimal('1'), 'b5': Decimal('1')},
+        ]}}
+        histogram = leaderboard_store.read_histogram(table)
+        assert histogram['total'] == 4
+        assert histogram['buckets'][0] == 2
+        assert histogram['buckets'][5] == 2
+        assert histogram['backfilled'] is False
+
+    def test_backfill_marker_read_in_same_batch(self):
+        table = Mock()
+        table.name = 'Leaderboard'
+        table.meta.client.batch_get_item.return_value = {'Responses': {'Leaderboard': [
+            {'userId': '__count__#0', 'members': Decimal('1'), 'b0': Decimal('1')},
+            {'userId': '__backfill__', 'completedAt': '2026-01-01T00:00:00'},
+        ]}}
+        histogram = leaderboard_store.read_histogram(table)
+        assert histogram['backfilled'] is True and histogram['total'] == 1
+        keys = table.meta.client.batch_get_item.call_args.kwargs['RequestItems']['Leaderboard']['Keys']
+        assert {'timeframe': 'all', 'userId': '__backfill__'} in keys
+
+    def test_approximate_rank_counts_higher_buckets(self):
+        buckets = [0] * leaderboard_store.HISTOGRAM_MAX_BUCKETS
+        buckets[0] = 50
+        buckets[1] = 30
+        buckets[2] = 20
+        estimate = approximate_rank({'total': 100, 'buckets': buckets}, 199)
+        # 20 users in bucket 2 are above; the user is at the top of bucket 1
+        assert estimate['rank'] == 21
+        assert estimate['percentile'] == 79.0
+
+    def test_top_user_ranks_first(self):
+        buckets = [0] * leaderboard_store.HISTOGRAM_MAX_BUCKETS
+        buckets[3] = 1
+        estimate = approximate_rank({'total': 1, 'buckets': buckets}, 350)
+        assert estimate['rank'] == 1
+
+
+class TestBackfill:
+    def test_backfill_writes_marker_after_last_page(self):
+        progress = Mock()
+        progress.scan.side_effect = [
+            {'Items': [dict(_progress(100), userId='u1')], 'LastEvaluatedKey': {'userId': 'u1'}},
+            {'Items': [dict(_progress(0, tests=0), userId='u2')]},
+        ]
+        table = Mock()
+        table.put_item.return_value = {}
+        table.query.return_value = {'Items': []}
+        assert leaderboard_store.backfill_from_progress(progress, table) == 1
+        assert table.put_item.call_args.kwargs['Item']['userId'] == '__backfill__'
+
+    def test_backfill_counts_rows_written_by_legacy_update(self):
+        table = FakeLeaderboard()
+        for user_id, xp in (('u1', 150), ('u2', 350)):
+            table.rows[user_id] = dict(build_entry(user_id, _progress(xp)))  # pre-existing legacy rows
+        progress = Mock()
+        progress.scan.return_value = {'Items': [dict(_progress(150), userId='u1'),
+                                                dict(_progress(350), userId='u2'),
+                                                dict(_progress(50), userId='u3')]}
+
+        leaderboard_store.backfill_from_progress(progress, table)
+        put_entry(table, 'u1', _progress(450))  # live update after the migration
+
+        counters = [r for k, r in table.rows.items() if k.startswith('__count__#')]
+        buckets = {}
+        for row in counters:
+            for name, count in row.items():
+                if name.startswith('b'):
+                    buckets[name] = buckets.get(name, 0) + count
+        assert sum(r.get('members', 0) for r in counters) == 3
+        assert all(count >= 0 for count in buckets.values())
+        assert buckets[f'b{bucket_for(450)}'] == 1 and buckets[f'b{bucket_for(150)}'] == 0
+        assert '__backfill__' in table.rows
+
+
+class TestGetLeaderboardFallback:
+    def _get(self, histogram, page=()):
+        import mock_assessment_handler
+        with patch.object(mock_assessment_handler, '_get_leaderboard_from_progress_scan',
+                          return_value='scanned') as scan, \
+                patch.object(leaderboard_store, 'read_histogram', return_value=histogram), \
+                patch.object(leaderboard_store, 'read_page', return_value=list(page)) as read_page:
+            return mock_assessment_handler.get_leaderboard({'limit': 10}), scan, read_page
+
+    def test_index_without_backfill_marker_falls_back_to_scan(self):
+        result, scan, read_page = self._get({'total': 3, 'buckets': [3], 'backfilled': False})
+        assert result == 'scanned'
+        scan.assert_called_once_with(10, 0, None)
+        read_page.assert_not_called()
+
+    def test_backfilled_index_is_used(self):
+        result, scan, _ = self._get({'total': 0, 'buckets': [0], 'backfilled': True})
+        scan.assert_not_called()
+        assert result['statusCode'] == 200
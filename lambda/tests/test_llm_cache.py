@@ -0,0 +1,152 @@
+"""
+Unit Tests for the shared LLM response cache (llm_cache)
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import llm_cache
+from llm_cache import cache_key, cache_stats, cached_completion, normalize_prompt
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    llm_cache.clear_cache()
+    yield
+    llm_cache.clear_cache()
+
+
+def _call(prompt='Score this résumé', response='{"overallScore": 70}', **kwargs):
+    fn = Mock(return_value=response)
+    out = cached_completion('openai', 'gpt-4o-mini', prompt, fn, api_key='sk-1', **kwargs)
+    return out, fn
+
+
+class TestKey:
+    def test_formatting_noise_is_normalized(self):
+        assert normalize_prompt('  a  \r\nb\n\n\n\nc \n') == 'a\nb\n\nc'
+        assert cache_key('openai', 'm', 'JD:\r\nPython  \n') == cache_key('openai', 'm', 'JD:\nPython')
+
+    def test_words_are_not_normalized(self):
+        assert cache_key('openai', 'm', 'Python Go') != cache_key('openai', 'm', 'Python  Go')
+        assert cache_key('openai', 'm', 'Python') != cache_key('openai', 'm', 'python')
+
+    @pytest.mark.parametrize('other', [
+        dict(provider='gemini'), dict(model='gpt-4o'), dict(variant='portfolio'), dict(api_key='sk-2'),
+    ])
+    def test_key_parts(self, other):
+        base = dict(provider='openai', model='gpt-4o-mini', prompt='p', variant='ats', api_key='sk-1')
+        assert cache_key(**base) != cache_key(**{**base, **other})
+
+
+class TestCachedCompletion:
+    def test_second_identical_call_is_served_from_cache(self):
+        first, fn1 = _call()
+        second, fn2 = _call(prompt='Score this résumé  \n')
+        assert first == second
+        assert fn1.call_count == 1 and fn2.call_count == 0
+        stats = cache_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1 and stats['hitRate'] == 0.5
+        assert stats['savedCompletionTokens'] > 0 and stats['savedPromptTokens'] > 0
+
+    def test_rejected_and_empty_responses_are_not_cached(self):
+        _call(response='not json', accept=json.loads)
+        _, fn = _call(response='not json', accept=json.loads)
+        assert fn.called
+        _call(response='  ')
+        _, fn = _call(response='  ')
+        assert fn.called
+        assert cache_stats()['rejected'] == 4
+
+    def test_errors_propagate_and_are_not_cached(self):
+        with pytest.raises(RuntimeError):
+            cached_completion('openai', 'm', 'p', Mock(side_effect=RuntimeError('429')))
+        _, fn = _call(prompt='p')
+        assert fn.called
+
+    def test_ttl_expiry(self):
+        _call()
+        with patch.object(llm_cache.time, 'time', return_value=llm_cache.time.time() + llm_cache.LLM_CACHE_TTL_SECONDS + 1):
+            _, fn = _call()
+        assert fn.called
+
+    def test_lru_eviction(self):
+        with patch.object(llm_cache, 'LLM_CACHE_ENTRIES', 2):
+            for p in ('a', 'b', 'c'):
+                _call(prompt=p)
+            _, fn_a = _call(prompt='a')
+            _, fn_c = _call(prompt='c')
+        assert fn_a.called and not fn_c.called
+
+    def test_disabled(self):
+        with patch.object(llm_cache, 'LLM_CACHE_TTL_SECONDS', 0):
+            _call()
+            _, fn = _call()
+        assert fn.called
+
+
+class TestDynamoTier:
+    def test_dynamo_hit_fills_memory_tier(self):
+        table = Mock()
+        table.get_item.return_value = {'Item': {
+            'cacheKey': 'k', 'response': 'cached', 'promptTokens': 10,
+            'expiresAt': int(llm_cache.time.time()) + 60,
+        }}
+        with patch.object(llm_cache, '_get_table', return_value=table):
+            out, fn = _call()
+            out2, fn2 = _call()
+        assert out == out2 == 'cached'
+        assert not fn.called and not fn2.called
+        assert table.get_item.call_count == 1
+        assert cache_stats()['dynamoHits'] == 1 and cache_stats()['hits'] == 1
+
+    def test_expired_item_is_a_miss_and_fresh_response_is_written(self):
+        table = Mock()
+        table.get_item.return_value = {'Item': {'response': 'old', 'expiresAt': 1}}
+        with patch.object(llm_cache, '_get_table', return_value=table):
+            out, fn = _call()
+        assert out == '{"overallScore": 70}' and fn.called
+        item = table.put_item.call_args.kwargs['Item']
+        assert item['response'] == out and item['expiresAt'] > llm_cache.time.time()
+
+    def test_dynamo_errors_do_not_fail_the_call(self):
+        table = Mock()
+        table.get_item.side_effect = Exception('throttled')
+        table.put_item.side_effect = Exception('throttled')
+        with patch.object(llm_cache, '_get_table', return_value=table):
+            out, fn = _call()
+        assert fn.called and out
+        assert cache_stats()['dynamoErrors'] == 2
+
+
+class TestCallers:
+    def test_ats_provider_calls_are_cached(self):
+        import ats_resume_scorer
+
+        with patch.object(ats_resume_scorer, '_request_openai', return_value='{"overallScore": 80}') as req:
+            for _ in range(3):
+                out = ats_resume_scorer._call_openai('sk-1', 'prompt', accept=ats_resume_scorer.parse_llm_json)
+        assert out == '{"overallScore": 80}'
+        assert req.call_count == 1
+
+    def test_ats_invalid_json_is_retried(self):
+        import ats_resume_scorer
+
+        with patch.object(ats_resume_scorer, '_request_gemini', return_value='oops') as req:
+            ats_resume_scorer._call_gemini('k', 'prompt', accept=ats_resume_scorer.parse_llm_json)
+            ats_resume_scorer._call_gemini('k', 'prompt', accept=ats_resume_scorer.parse_llm_json)
+        assert req.call_count == 2
+
+    def test_fix_enhance_is_cached(self):
+        import resume_fix_engine
+
+        data = {'summary': 'Backend engineer.', 'experience': [], 'projects': []}
+        with patch.object(resume_fix_engine, '_request_openai_mini', return_value='[SUMMARY]\nBackend engineer using Go.') as req:
+            for _ in range(2):
+                out = resume_fix_engine.maybe_llm_enhance(data, ['Go'], provider='openai', api_key='sk', model=None)
+        assert out['summary'] == 'Backend engineer using Go.'
+        assert req.call_count == 1
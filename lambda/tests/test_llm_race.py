@@ -0,0 +1,115 @@
+"""
+Unit Tests for hedged LLM provider execution (llm_race)
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import llm_race
+from llm_race import AllProvidersFailed, race, rank
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    llm_race.reset_stats()
+    yield
+    llm_race.reset_stats()
+
+
+def _answer(value, delay=0.0):
+    def call():
+        time.sleep(delay)
+        return value
+    return call
+
+
+def _fail(message, delay=0.0):
+    def call():
+        time.sleep(delay)
+        raise RuntimeError(message)
+    return call
+
+
+class TestRace:
+    def test_fast_first_provider_never_starts_backup(self):
+        backup_called = threading.Event()
+
+        def backup():
+            backup_called.set()
+            return '{"overallScore": 1}'
+
+        result = race([('openai', _answer('{"overallScore": 80}')), ('claude', backup)],
+                      validate=json.loads, hedge_delay=1.0)
+
+        assert result.provider == 'openai'
+        assert result.value == {'overallScore': 80}
+        assert result.started == ['openai']
+        assert not backup_called.is_set()
+
+    def test_slow_first_provider_is_hedged(self):
+        result = race([('openai', _answer('{"a": 1}', delay=1.0)), ('claude', _answer('{"b": 2}'))],
+                      validate=json.loads, hedge_delay=0.05)
+
+        assert result.provider == 'claude'
+        assert result.started == ['openai', 'claude']
+        assert result.seconds < 0.5
+
+    def test_failure_fails_over_without_waiting_for_delay(self):
+        result = race([('openai', _fail('boom')), ('claude', _answer('{"b": 2}'))],
+                      validate=json.loads, hedge_delay=5.0)
+
+        assert result.provider == 'claude'
+        assert result.seconds < 1.0
+
+    def test_invalid_json_counts_as_failure(self):
+        result = race([('openai', _answer('not json')), ('gemini', _answer('{"ok": true}'))],
+                      validate=json.loads, hedge_delay=5.0)
+
+        assert result.provider == 'gemini'
+        assert llm_race.provider_stats()['openai']['errors'] == 1
+
+    def test_all_failed_reports_tried_and_last_error(self):
+        with pytest.raises(AllProvidersFailed) as exc:
+            race([('openai', _fail('first')), ('claude', _fail('second', delay=0.01))], hedge_delay=5.0)
+
+        assert exc.value.tried == ['openai', 'claude']
+        assert str(exc.value.last_error) == 'second'
+
+    def test_disabled_hedging_is_sequential(self):
+        result = race([('openai', _answer('a', delay=0.2)), ('claude', _answer('b'))], hedge_delay=float('inf'))
+
+        assert result.provider == 'openai'
+        assert result.started == ['openai']
+
+    def test_max_in_flight_limits_hedges(self):
+        calls = [(name, _answer(name, delay=0.3)) for name in ('openai', 'claude', 'gemini')]
+        result = race(calls, hedge_delay=0.02, max_in_flight=2)
+
+        assert result.started == ['openai', 'claude']
+
+    def test_no_calls(self):
+        with pytest.raises(AllProvidersFailed):
+            race([])
+
+
+class TestRank:
+    def test_untried_keep_given_order(self):
+        assert rank(['openai', 'claude', 'gemini']) == ['openai', 'claude', 'gemini']
+
+    def test_failing_provider_moves_back(self):
+        for _ in range(3):
+            llm_race.record('openai', 1.0, ok=False)
+        llm_race.record('claude', 2.0, ok=True)
+
+        assert rank(['openai', 'claude', 'gemini']) == ['claude', 'gemini', 'openai']
+
+    def test_faster_provider_moves_forward(self):
+        llm_race.record('openai', 12.0, ok=True)
+        llm_race.record('gemini', 3.0, ok=True)
+
+        assert rank(['openai', 'claude', 'gemini']) == ['gemini', 'claude', 'openai']
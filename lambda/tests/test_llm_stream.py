@@ -0,0 +1,197 @@
+"""
+Unit Tests for streamed LLM completions (llm_stream) and the Fix Resume streaming render
+"""
+
+import json
+import random
+import re
+from unittest.mock import patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import llm_cache
+import llm_stream
+from llm_stream import JsonMemberStream, MarkupSplitter
+
+
+class _Resp:
+    def __init__(self, text):
+        self._lines = [line.encode() for line in text.split('\n')]
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+
+def _sse(*events, done=True):
+    out = ''.join(f'data: {json.dumps(e)}\n\n' for e in events)
+    return out + ('data: [DONE]\n\n' if done else '')
+
+
+def _chunks(text, seed, max_len=9):
+    rng = random.Random(seed)
+    i = 0
+    while i < len(text):
+        k = rng.randint(1, max_len)
+        yield text[i:i + k]
+        i += k
+
+
+RESUME = {
+    'name': 'Jane "JD" Doe',
+    'subtitle': ['Backend Engineer, {Platform}'],
+    'contacts': [{'icon': 'email', 'label': 'Email', 'href': 'mailto:jane@example.com'}],
+    'sections': [
+        {'type': 'skills', 'title': 'Skills', 'items': [{'label': 'Languages', 'value': 'Python, Go]'}]},
+        {'type': 'bogus', 'title': 'Dropped'},
+        {'type': 'entries', 'title': 'Experience',
+         'items': [{'title': 'Engineer', 'org': 'Acme', 'bullets': ['Built "things", fast\\n']}]},
+    ],
+}
+
+
+class TestSse:
+    def test_openai_deltas_comments_and_done(self):
+        body = ': OPENROUTER PROCESSING\n\n' + _sse(
+            {'choices': [{'delta': {'role': 'assistant'}}]},
+            {'choices': [{'delta': {'content': 'Hel'}}]},
+            {'choices': [{'delta': {'content': 'lo'}}]},
+        ) + 'data: {"choices": [{"delta": {"content": "ignored after DONE"}}]}\n\n'
+        seen = []
+        assert llm_stream.read_sse_text(_Resp(body), llm_stream.openai_text, seen.append) == 'Hello'
+        assert seen == ['Hel', 'lo']
+
+    def test_anthropic_and_gemini_extractors(self):
+        body = 'event: message_start\n' + _sse(
+            {'type': 'message_start'},
+            {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': 'a'}},
+            {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': 'b'}},
+            done=False,
+        )
+        assert llm_stream.read_sse_text(_Resp(body), llm_stream.anthropic_text, lambda _: None) == 'ab'
+        body = _sse({'candidates': [{'content': {'parts': [{'text': 'x'}, {'text': 'y'}]}}]}, done=False)
+        assert llm_stream.read_sse_text(_Resp(body), llm_stream.gemini_text, lambda _: None) == 'xy'
+
+    @pytest.mark.parametrize('extract,event', [
+        (llm_stream.openai_text, {'error': {'message': 'rate limited'}}),
+        (llm_stream.anthropic_text, {'type': 'error', 'error': {'message': 'overloaded'}}),
+        (llm_stream.gemini_text, {'promptFeedback': {'blockReason': 'SAFETY'}}),
+    ])
+    def test_in_stream_errors_raise(self, extract, event):
+        with pytest.raises(RuntimeError):
+            llm_stream.read_sse_text(_Resp(_sse(event)), extract, lambda _: None)
+
+
+class TestJsonMemberStream:
+    @pytest.mark.parametrize('seed', range(25))
+    def test_any_chunking_yields_members_and_items(self, seed):
+        text = '```json\n' + json.dumps(RESUME, indent=2) + '\n```'
+        stream = JsonMemberStream(item_keys=('sections',))
+        events = [ev for chunk in _chunks(text, seed) for ev in stream.feed(chunk)]
+        assert [ev[3] for ev in events if ev[0] == 'item'] == RESUME['sections']
+        assert {ev[1]: ev[2] for ev in events if ev[0] == 'member'} == RESUME
+        kinds = [(ev[0], ev[1]) for ev in events]
+        assert kinds.index(('member', 'name')) < kinds.index(('item', 'sections'))
+
+    def test_items_are_emitted_before_the_object_closes(self):
+        text = json.dumps(RESUME)
+        cut = text.index('"Experience"')
+        stream = JsonMemberStream(item_keys=('sections',))
+        events = stream.feed(text[:cut])
+        assert [ev[2] for ev in events if ev[0] == 'item'] == [0, 1]
+        assert not any(ev[0] == 'member' and ev[1] == 'sections' for ev in events)
+
+
+class TestMarkupSplitter:
+    def test_splits_at_complete_boundary_tags(self):
+        boundary = re.compile(r'<h2[^>]*>')
+        splitter = MarkupSplitter(boundary)
+        assert splitter.feed('<p>intro</p><h2 cla') == []
+        assert splitter.feed('ss="x">A</h2>a<h2>') == ['<p>intro</p>', '<h2 class="x">A</h2>a']
+        assert splitter.feed('B</h2>b') == []
+        assert splitter.close() == '<h2>B</h2>b'
+
+
+@pytest.fixture
+def engine():
+    import ats_resume_scorer
+    import resume_fix_engine
+
+    llm_cache.clear_cache()
+    yield resume_fix_engine, ats_resume_scorer
+    llm_cache.clear_cache()
+
+
+def _streaming_request(text):
+    def request(api_key, prompt, model, on_delta=None):
+        if on_delta is not None:
+            for chunk in _chunks(text, 7):
+                on_delta(chunk)
+        return text.strip()
+    return request
+
+
+class TestStreamedResumeJson:
+    def _render(self, engine, text, on_partial=None):
+        resume_fix_engine, ats_resume_scorer = engine
+        with patch.object(ats_resume_scorer, '_request_openai', side_effect=_streaming_request(text)) as req:
+            out = resume_fix_engine.render_resume_data_with_llm(
+                'Jane Doe\njane@example.com\nPython Go', ['Kubernetes'],
+                {'provider': 'openai', 'apiKey': 'sk-test'}, on_partial=on_partial,
+            )
+        return out, req
+
+    def test_sections_are_validated_and_emitted_in_order(self, engine):
+        events = []
+        (data, added), _ = self._render(engine, json.dumps(RESUME), events.append)
+        fields = {e['key']: e['value'] for e in events if e['event'] == 'field'}
+        sections = [e for e in events if e['event'] == 'section']
+        assert fields['name'] == 'Jane "JD" Doe'
+        assert fields['contacts'][0]['label'] == 'jane@example.com'
+        assert [e['index'] for e in sections] == [0, 1]
+        assert [e['section']['title'] for e in sections] == ['Skills', 'Experience']
+        assert [s['title'] for s in data['sections']] == ['Skills', 'Experience']
+        assert fields['contacts'] == data['contacts']
+
+    def test_streaming_does_not_change_the_result(self, engine):
+        streamed, _ = self._render(engine, json.dumps(RESUME), lambda _: None)
+        llm_cache.clear_cache()
+        plain, req = self._render(engine, json.dumps(RESUME))
+        assert streamed == plain
+        assert req.call_args.args[3] is None
+
+    def test_cache_hit_is_replayed_to_the_sink(self, engine):
+        first, second = [], []
+        self._render(engine, json.dumps(RESUME), first.append)
+        _, req = self._render(engine, json.dumps(RESUME), second.append)
+        assert not req.called
+        assert first == second
+
+
+class TestStreamedHtml:
+    HTML = (
+        '<!DOCTYPE html><html><head><style>.section-title{}</style></head><body>'
+        '<div class="garamond-resume-root"><div class="page">'
+        '<div class="header"><div class="header-left"><h1 id="r-name">Jane</h1></div>'
+        '<div class="header-right" id="r-contacts"></div></div>\n'
+        '<div id="r-sections">\n'
+        '<div class="section-title">Skills</div><ul class="skills-list"><li onclick="x()">Python</li></ul>\n'
+        '<div class="section-title">Experience</div><div class="entry"><div class="entry-title">Eng</div></div>\n'
+        '</div>\n</div></div>\n</body></html>'
+    )
+
+    def test_header_and_sections_are_emitted_sanitized(self, engine):
+        resume_fix_engine, ats_resume_scorer = engine
+        events = []
+        with patch.object(ats_resume_scorer, '_request_openai', side_effect=_streaming_request(self.HTML)):
+            html = resume_fix_engine.render_resume_html_with_llm(
+                'Jane Doe', ['Go'], {'provider': 'openai', 'apiKey': 'sk-test'}, on_partial=events.append,
+            )
+        assert html.startswith('<!DOCTYPE html>')
+        assert [e['event'] for e in events] == ['header', 'section', 'section']
+        assert 'id="r-name">Jane' in events[0]['html'] and 'r-sections' not in events[0]['html']
+        assert [e['title'] for e in events[1:]] == ['Skills', 'Experience']
+        assert 'onclick' not in events[1]['html']
+        last = events[2]['html']
+        assert last.count('<div') == last.count('</div>')
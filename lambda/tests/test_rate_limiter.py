@@ -0,0 +1,175 @@
+"""
+Unit Tests for the atomic DynamoDB rate limiter
+
+Runs against moto's in-memory DynamoDB (the same calls work against
+DynamoDB Local via DYNAMODB_ENDPOINT_URL).
+"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+
+import sys
+sys.path.insert(0, '..')
+
+moto = pytest.importorskip('moto')
+import boto3
+
+import rate_limiter
+from rate_limiter import RateLimiter, check_rate_limit
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def table():
+    with moto.mock_aws():
+        ddb = boto3.resource('dynamodb', region_name='us-east-1')
+        yield ddb.create_table(
+            TableName=rate_limiter.RATE_LIMIT_TABLE,
+            KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'pk', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST',
+        )
+
+
+class AtomicTable:
+    """moto does not apply a conditional update atomically across threads; DynamoDB does."""
+
+    def __init__(self, table):
+        self._table = table
+        self._lock = threading.Lock()
+
+    def update_item(self, **kwargs):
+        with self._lock:
+            return self._table.update_item(**kwargs)
+
+
+def _hits(limiter, key, n, **kwargs):
+    return [limiter.hit(key, **kwargs)[0] for _ in range(n)]
+
+
+class TestFixedWindow:
+    def test_allows_max_then_denies_until_next_window(self, table):
+        clock = Clock()
+        limiter = RateLimiter(table=table, clock=clock)
+        assert _hits(limiter, 'login:1.2.3.4', 4, max_requests=3, window_seconds=60) == [True, True, True, False]
+
+        clock.now += 60
+        assert limiter.hit('login:1.2.3.4', max_requests=3, window_seconds=60)[0] is True
+
+    def test_concurrent_containers_never_exceed_limit(self, table):
+        clock = Clock()
+        shared = AtomicTable(table)
+        results = []
+
+        def worker():
+            # Separate limiter per thread = separate Lambda containers
+            limiter = RateLimiter(table=shared, clock=clock)
+            results.extend(_hits(limiter, 'signup:9.9.9.9', 5, max_requests=10, window_seconds=300))
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results.count(True) == 10
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self, table):
+        clock = Clock()
+        limiter = RateLimiter(table=table, clock=clock)
+        kwargs = dict(max_requests=5, window_seconds=50, mode='token_bucket')
+        assert _hits(limiter, 'k', 6, **kwargs) == [True] * 5 + [False]
+
+        clock.now += 10   # one token back
+        assert _hits(limiter, 'k', 2, **kwargs) == [True, False]
+
+    def test_stale_hint_in_other_container_is_corrected(self, table):
+        clock = Clock()
+        kwargs = dict(max_requests=2, window_seconds=20, mode='token_bucket')
+        a, b = RateLimiter(table=table, clock=clock), RateLimiter(table=table, clock=clock)
+        assert a.hit('k', **kwargs)[0] is True
+        assert b.hit('k', **kwargs)[0] is True    # b guessed "idle", retried as "active"
+        assert a.hit('k', **kwargs)[0] is False
+
+    def test_idle_bucket_resets(self, table):
+        clock = Clock()
+        limiter = RateLimiter(table=table, clock=clock)
+        kwargs = dict(max_requests=3, window_seconds=30, mode='token_bucket')
+        _hits(limiter, 'k', 3, **kwargs)
+        clock.now += 3600
+        assert _hits(limiter, 'k', 4, **kwargs) == [True, True, True, False]
+
+
+class TestSlidingLog:
+    def test_window_slides_per_request(self, table):
+        clock = Clock()
+        limiter = RateLimiter(table=table, clock=clock)
+        kwargs = dict(max_requests=2, window_seconds=10, mode='sliding_log')
+        assert limiter.hit('k', **kwargs)[0] is True
+        clock.now += 6
+        assert limiter.hit('k', **kwargs)[0] is True
+        assert limiter.hit('k', **kwargs) == (False, 4)
+
+        clock.now += 4    # first request left the window, second has not
+        assert _hits(limiter, 'k', 2, **kwargs) == [True, False]
+
+    def test_other_container_writes_are_seen(self, table):
+        clock = Clock()
+        kwargs = dict(max_requests=2, window_seconds=10, mode='sliding_log')
+        a, b = RateLimiter(table=table, clock=clock), RateLimiter(table=table, clock=clock)
+        assert a.hit('k', **kwargs)[0] is True
+        assert b.hit('k', **kwargs)[0] is True
+        assert a.hit('k', **kwargs)[0] is False
+        assert b.hit('k', **kwargs)[0] is False
+
+
+class TestPrefilter:
+    def test_blocked_key_skips_dynamodb(self):
+        fake = Mock()
+        fake.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': ''}}, 'UpdateItem'
+        )
+        clock = Clock()
+        limiter = RateLimiter(table=fake, clock=clock)
+
+        assert limiter.hit('k', max_requests=1, window_seconds=60)[0] is False
+        assert limiter.hit('k', max_requests=1, window_seconds=60)[0] is False
+        assert fake.update_item.call_count == 1
+
+        clock.now += 60
+        limiter.hit('k', max_requests=1, window_seconds=60)
+        assert fake.update_item.call_count == 2
+
+
+class TestCheckRateLimit:
+    def test_returns_429_with_retry_after(self, table, monkeypatch):
+        monkeypatch.setattr(rate_limiter, '_limiter', RateLimiter(table=table, clock=Clock(1_699_999_990.0)))
+        event = {'requestContext': {'identity': {'sourceIp': '5.5.5.5'}}}
+
+        assert check_rate_limit(event, 'login', max_requests=1, window_seconds=60) is None
+        blocked = check_rate_limit(event, 'login', max_requests=1, window_seconds=60)
+        assert blocked['statusCode'] == 429
+        assert blocked['headers']['Retry-After'] == '50'
+
+    def test_fails_open_on_infra_error(self, monkeypatch):
+        fake = Mock()
+        fake.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'no table'}}, 'UpdateItem'
+        )
+        monkeypatch.setattr(rate_limiter, '_limiter', RateLimiter(table=fake))
+        assert check_rate_limit({}, 'login', mode='sliding_log') is None
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            check_rate_limit({}, 'login', mode='leaky')
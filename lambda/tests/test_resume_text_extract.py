@@ -0,0 +1,391 @@
+"""
+Unit Tests for the shared resume text ingestion library (extractors + content-addressed cache)
+"""
+
+import io
+import os
+import threading
+import time
+import json
+import zipfile
+import zlib
+import pytest
+from unittest.mock import Mock
+
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+import sys
+sys.path.insert(0, '..')
+import resume_text_extract as rte
+from resume_text_extract import extract_resume_text, extract_text_from_bytes
+
+RESUME_TEXT = "Jane Doe\nSKILLS\nPython, AWS, DynamoDB, system design, distributed systems"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    rte.clear_extraction_cache()
+    monkeypatch.setattr(rte, 'RESUME_TEXT_CACHE_S3_BUCKET', '')
+    yield
+    rte.clear_extraction_cache()
+
+
+@pytest.fixture
+def parse_pdf(monkeypatch):
+    parser = Mock(return_value=(RESUME_TEXT, 'pymupdf', []))
+    monkeypatch.setattr(rte, '_extract_pdf', parser)
+    return parser
+
+
+class TestMemoryTier:
+    def test_repeat_extraction_skips_parsing(self, parse_pdf):
+        first = extract_resume_text(b'%PDF same bytes', 'cv.pdf')
+        second = extract_resume_text(b'%PDF same bytes', 'other-name.pdf')
+
+        assert parse_pdf.call_count == 1
+        assert first['cache'] is None and second['cache'] == 'memory'
+        assert first['extractor'] == second['extractor'] == 'pymupdf'
+        assert second['text'] == first['text']
+        assert rte.extraction_cache_stats()['hits'] == 1
+        assert rte.extraction_cache_stats()['misses'] == 1
+
+    def test_different_bytes_miss(self, parse_pdf):
+        extract_text_from_bytes(b'%PDF one', 'cv.pdf')
+        extract_text_from_bytes(b'%PDF two', 'cv.pdf')
+
+        assert parse_pdf.call_count == 2
+
+    def test_ocr_setting_is_part_of_key(self, parse_pdf, monkeypatch):
+        extract_text_from_bytes(b'%PDF one', 'cv.pdf')
+        monkeypatch.setattr(rte, 'ENABLE_TEXTRACT_OCR', True)
+        extract_text_from_bytes(b'%PDF one', 'cv.pdf')
+
+        assert parse_pdf.call_count == 2
+
+    def test_lru_evicts_oldest(self, parse_pdf, monkeypatch):
+        monkeypatch.setattr(rte, 'RESUME_TEXT_CACHE_ENTRIES', 2)
+        for data in (b'a', b'b', b'c'):
+            extract_text_from_bytes(data, 'cv.pdf')
+        extract_text_from_bytes(b'a', 'cv.pdf')
+
+        assert parse_pdf.call_count == 4
+        assert rte.extraction_cache_stats()['entries'] == 2
+
+    def test_failures_are_not_cached(self, monkeypatch):
+        parser = Mock(return_value=('', 'pymupdf', []))
+        monkeypatch.setattr(rte, '_extract_pdf', parser)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                extract_text_from_bytes(b'%PDF scanned', 'cv.pdf')
+        assert parser.call_count == 2
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError, match='Unsupported file type'):
+            extract_text_from_bytes(b'x', 'cv.txt')
+
+
+class TestS3Tier:
+    @pytest.fixture
+    def s3(self, monkeypatch):
+        client = Mock()
+        monkeypatch.setattr(rte, 'RESUME_TEXT_CACHE_S3_BUCKET', 'bucket')
+        monkeypatch.setattr(rte, '_s3_client', client)
+        return client
+
+    def test_miss_writes_through(self, parse_pdf, s3):
+        s3.get_object.side_effect = type('NoSuchKey', (Exception,), {})()
+
+        extract_text_from_bytes(b'%PDF bytes', 'cv.pdf')
+
+        put = s3.put_object.call_args.kwargs
+        assert put['Key'] == 'resume-text-cache/' + rte.extraction_cache_key(b'%PDF bytes', 'cv.pdf') + '.json'
+        assert json.loads(put['Body'])['extractor'] == 'pymupdf'
+        assert rte.extraction_cache_stats()['s3Errors'] == 0
+
+    def test_hit_skips_parsing(self, parse_pdf, s3):
+        body = json.dumps({'text': 'cached text', 'extractor': 'pdfminer'}).encode()
+        s3.get_object.return_value = {'Body': io.BytesIO(body)}
+
+        result = extract_resume_text(b'%PDF bytes', 'cv.pdf')
+
+        assert result['cache'] == 's3'
+        assert result['text'] == 'cached text' and result['extractor'] == 'pdfminer'
+        parse_pdf.assert_not_called()
+        assert extract_resume_text(b'%PDF bytes', 'cv.pdf')['cache'] == 'memory'
+
+    def test_s3_errors_do_not_fail_extraction(self, parse_pdf, s3):
+        s3.get_object.side_effect = RuntimeError('AccessDenied')
+        s3.put_object.side_effect = RuntimeError('AccessDenied')
+
+        assert extract_text_from_bytes(b'%PDF bytes', 'cv.pdf')
+        assert rte.extraction_cache_stats()['s3Errors'] == 2
+
+
+class TestTextQuality:
+    def test_clean_resume_page_scores_high(self):
+        assert rte.text_quality(RESUME_TEXT + "\nEXPERIENCE\nSoftware Engineer at Acme, 2021-2024") > 0.8
+
+    def test_cid_garbage_scores_low(self):
+        assert rte.text_quality("(cid:12)(cid:44)(cid:3) " * 20) < 0.2
+
+    def test_glued_words_score_low(self):
+        glued = "SoftwareEngineeratAcmeCorpBuiltScalableServicesUsingPythonAndAWS " * 5
+        assert rte.text_quality(glued) < rte.PDF_PAGE_MIN_QUALITY
+
+    def test_short_text_is_scaled_down(self):
+        assert rte.text_quality("Jane Doe") < rte.text_quality(RESUME_TEXT)
+
+    def test_empty(self):
+        assert rte.text_quality("   ") == 0.0
+
+
+@pytest.mark.skipif(fitz is None, reason='PyMuPDF not installed')
+class TestPdfEngine:
+    def _pdf(self, pages):
+        doc = fitz.open()
+        for text in pages:
+            page = doc.new_page()
+            if text:
+                page.insert_text((72, 72), text)
+        data = doc.tobytes()
+        doc.close()
+        return data
+
+    def test_good_pages_use_single_parse(self, monkeypatch):
+        pdfminer = Mock(return_value={})
+        monkeypatch.setattr(rte, '_pdfminer_page_texts', pdfminer)
+        data = self._pdf([RESUME_TEXT, "EXPERIENCE\nBackend engineer building payment services in Python"])
+
+        text, extractor, notes = rte._extract_pdf(data)
+
+        assert 'DynamoDB' in text and 'payment services' in text
+        assert extractor == 'pymupdf' and notes == []
+        pdfminer.assert_not_called()
+
+    def test_only_weak_pages_are_re_extracted(self, monkeypatch):
+        pdfminer = Mock(return_value={1: RESUME_TEXT, 3: RESUME_TEXT})
+        monkeypatch.setattr(rte, '_pdfminer_page_texts', pdfminer)
+        weak = "(cid:1)(cid:2)(cid:3)(cid:4)(cid:5)(cid:6)(cid:7)"
+        data = self._pdf([RESUME_TEXT, weak, RESUME_TEXT, weak])
+
+        _, extractor, _ = rte._extract_pdf(data)
+
+        pdfminer.assert_called_once()
+        assert pdfminer.call_args.args[1] == [1, 3]
+        assert extractor == 'pymupdf+pdfminer'
+
+    def test_pdfminer_pass_splits_pages(self, monkeypatch):
+        high_level = pytest.importorskip('pdfminer.high_level')
+        calls = Mock(wraps=high_level.extract_text)
+        monkeypatch.setattr(high_level, 'extract_text', calls)
+        data = self._pdf(["first page", "second page", "third page"])
+
+        texts = rte._pdfminer_page_texts(data, [2, 0])
+
+        calls.assert_called_once()
+        assert texts == {0: 'first page', 2: 'third page'}
+
+    def test_blank_pages_are_skipped(self, monkeypatch):
+        pdfminer = Mock(return_value={})
+        monkeypatch.setattr(rte, '_pdfminer_page_texts', pdfminer)
+
+        rte._extract_pdf(self._pdf([RESUME_TEXT, None]))
+
+        pdfminer.assert_not_called()
+
+    def test_ocr_covers_only_weak_pages(self, monkeypatch):
+        ocr = Mock(return_value={1: RESUME_TEXT})
+        monkeypatch.setattr(rte, '_fitz_textract_ocr', ocr)
+        monkeypatch.setattr(rte, '_pdfminer_page_texts', lambda data, pages: {})
+        monkeypatch.setattr(rte, 'ENABLE_TEXTRACT_OCR', True)
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), RESUME_TEXT)
+        doc.new_page().draw_rect(fitz.Rect(50, 50, 300, 300))  # "scanned" page: drawing, no text
+        data = doc.tobytes()
+
+        text, extractor, _ = rte._extract_pdf(data)
+
+        assert ocr.call_args.args[1] == [1]
+        assert extractor == 'pymupdf+textract'
+
+
+class FakeTextract:
+    """Local stand-in for the Textract client: fixed latency, echoes the PNG size."""
+
+    def __init__(self, latency=0.0, fail_calls=()):
+        self.latency = latency
+        self.fail_calls = set(fail_calls)
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sizes = []
+        self._lock = threading.Lock()
+
+    def detect_document_text(self, Document):
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.sizes.append(len(Document['Bytes']))
+        try:
+            time.sleep(self.latency)
+            if call in self.fail_calls:
+                raise RuntimeError('ThrottlingException')
+            return {'Blocks': [
+                {'BlockType': 'PAGE'},
+                {'BlockType': 'LINE', 'Text': f'call {call}'},
+                {'BlockType': 'WORD', 'Text': 'ignored'},
+            ]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.mark.skipif(fitz is None, reason='PyMuPDF not installed')
+class TestConcurrentOcr:
+    def _doc(self, pages):
+        doc = fitz.open()
+        for n in range(pages):
+            doc.new_page().insert_text((72, 72), f'page {n}')
+        return doc
+
+    def test_pages_run_in_parallel_and_keep_order(self, monkeypatch):
+        monkeypatch.setattr(rte, 'OCR_CONCURRENCY', 4)
+        stub = FakeTextract(latency=0.2)
+
+        start = time.perf_counter()
+        out = rte._fitz_textract_ocr(self._doc(4), [3, 0, 2, 1], client=stub)
+        elapsed = time.perf_counter() - start
+
+        assert list(out) == [0, 1, 2, 3]
+        assert stub.calls == 4 and stub.max_in_flight > 1
+        assert elapsed < 0.6  # serial would be 0.8 s
+
+    def test_concurrency_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(rte, 'OCR_CONCURRENCY', 2)
+        stub = FakeTextract(latency=0.05)
+
+        rte._fitz_textract_ocr(self._doc(5), list(range(5)), client=stub)
+
+        assert stub.max_in_flight <= 2
+
+    def test_failed_page_is_skipped(self):
+        stub = FakeTextract(fail_calls={1})
+
+        out = rte._fitz_textract_ocr(self._doc(3), [0, 1, 2], client=stub)
+
+        assert len(out) == 2
+
+    def test_all_pages_failing_raises(self):
+        with pytest.raises(RuntimeError, match='Throttling'):
+            rte._fitz_textract_ocr(self._doc(2), [0, 1], client=FakeTextract(fail_calls={0, 1}))
+
+    def test_scanned_page_renders_at_image_resolution(self):
+        doc = fitz.open()
+        page = doc.new_page(width=600, height=800)
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 1500, 2000), False)
+        pix.clear_with(255)
+        page.insert_image(page.rect, pixmap=pix)
+
+        assert rte._ocr_zoom(page) == pytest.approx(2.5)
+        assert rte._ocr_zoom(doc.new_page()) == rte.OCR_DEFAULT_ZOOM
+
+    def test_oversized_render_is_shrunk(self, monkeypatch):
+        monkeypatch.setattr(rte, 'TEXTRACT_MAX_IMAGE_BYTES', 2000)
+        stub = FakeTextract()
+
+        rte._fitz_textract_ocr(self._doc(1), [0], client=stub)
+
+        full = len(self._doc(1).load_page(0).get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False).tobytes('png'))
+        assert stub.sizes[0] < full
+
+
+def _stdlib_pdf(content: bytes) -> bytes:
+    stream = zlib.compress(content)
+    image = bytes(range(256)) * 8  # binary stream that happens to hold "Tj"-free noise
+    return (b"%%PDF-1.4\n1 0 obj<</Length %d/Filter/FlateDecode>>stream\n" % len(stream) + stream
+            + b"\nendstream endobj\n2 0 obj<</Subtype/Image>>stream\n" + image + b"\nendstream endobj\n%%EOF")
+
+
+class TestStdlibFallback:
+    CONTENT = b"BT /F1 12 Tf 72 720 Td (Jane Doe \\(CV\\)) Tj 0 -14 Td [(Soft) -20 (ware Engineer)] TJ <414253> Tj ET"
+
+    def test_reads_flate_content_streams(self):
+        text = rte._pdf_stdlib_text(_stdlib_pdf(self.CONTENT))
+
+        assert text == 'Jane Doe (CV) Software Engineer ABS'
+
+    def test_used_when_no_pdf_library_loads(self, monkeypatch):
+        monkeypatch.setattr(rte, '_fitz_open_probe', lambda: False)
+        monkeypatch.setattr(rte, '_pypdf_page_texts', Mock(side_effect=ImportError("No module named 'PyPDF2'")))
+        monkeypatch.setattr(rte, '_pdfminer_extract', lambda data: '')
+
+        text, extractor, notes = rte._extract_pdf(_stdlib_pdf(self.CONTENT))
+
+        assert extractor == 'stdlib' and 'Software Engineer' in text
+        assert notes and 'PyPDF2' in notes[0]
+
+
+class TestDocx:
+    def _docx(self, paragraphs):
+        body = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in paragraphs)
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as z:
+            z.writestr('word/document.xml', f'<w:document><w:body>{body}</w:body></w:document>')
+        return buf.getvalue()
+
+    def test_xml_fallback_without_python_docx(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'docx', None)
+
+        result = extract_resume_text(self._docx(['Jane Doe', 'SKILLS', 'Python, AWS']), 'cv.docx')
+
+        assert result['extractor'] == 'docx-xml'
+        assert result['text'] == 'Jane Doe\n\nSKILLS\n\nPython, AWS'
+
+    def test_corrupt_docx_raises_value_error(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'docx', None)
+
+        with pytest.raises(ValueError, match='DOCX'):
+            extract_text_from_bytes(b'not a zip', 'cv.docx')
+
+    def test_kind_from_mime_type(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'docx', None)
+        mime = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+        assert 'Jane Doe' in extract_text_from_bytes(self._docx(['Jane Doe']), 'upload', mime)
+
+
+class TestCleanText:
+    def test_clean_resume_text(self):
+        raw = "● Built APIs(cid:12)\r\n\n\n jane @ example . com  |  https : //x.dev \ue001"
+
+        assert rte.clean_resume_text(raw) == "- Built APIs\njane@example.com | https://x.dev"
+
+    def test_garbage_text(self):
+        assert rte.is_garbage_text("short")
+        assert rte.is_garbage_text("(cid:1)" * 20 + RESUME_TEXT)
+        assert not rte.is_garbage_text(RESUME_TEXT)
+
+    def test_extract_clean_text_returns_empty_on_failure(self, monkeypatch):
+        monkeypatch.setattr(rte, '_extract_pdf', Mock(return_value=('', '', [])))
+
+        assert rte.extract_clean_text(b'%PDF scanned', 'cv.pdf') == ''
+
+    def test_extract_clean_text_decodes_plain_text(self):
+        assert rte.extract_clean_text(RESUME_TEXT.encode(), 'cv.txt', 'text/plain') == RESUME_TEXT
+
+    def test_portfolio_builder_wrapper_uses_shared_cache(self, parse_pdf):
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'portfolio-builder'))
+        try:
+            from resume_extract import extract_text_from_resume
+        finally:
+            sys.path.pop(0)
+
+        for _ in range(2):
+            assert extract_text_from_resume(b'%PDF bytes', 'application/pdf', 'cv.pdf').startswith('Jane Doe')
+        assert parse_pdf.call_count == 1
@@ -0,0 +1,222 @@
+"""
+Unit Tests for Google Sheets attribution sync: token / header caching and the batching SheetsSyncEngine
+"""
+
+import io
+import json
+import threading
+import time
+import urllib.error
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+import google_sheets_sync
+from google_sheets_sync import SheetsSyncEngine, append_attribution_rows, append_user_attribution_row
+
+USER = {'userId': 'u1', 'email': 'a@example.com', 'utmSource': 'google', 'createdAt': '2026-01-01T00:00:00Z'}
+
+
+class FakeResponse(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeGoogle:
+    """Answers token, header read / write and append calls; records (method, url, payload)."""
+
+    def __init__(self):
+        self.calls = []
+        self.header = []
+        self.reject_tokens = set()
+        self.tokens = 0
+
+    def urlopen(self, req, timeout=None):
+        url = req.full_url
+        body = req.data.decode() if req.data else ''
+        self.calls.append((req.get_method(), url, body))
+        if url == google_sheets_sync.TOKEN_URL:
+            self.tokens += 1
+            return FakeResponse(json.dumps({'access_token': f'tok{self.tokens}', 'expires_in': 3600}).encode())
+        token = req.get_header('Authorization', '').split()[-1]
+        if token in self.reject_tokens:
+            raise urllib.error.HTTPError(url, 401, 'Unauthorized', {}, io.BytesIO(b'{"error": "expired"}'))
+        if req.get_method() == 'GET':
+            return FakeResponse(json.dumps({'values': [self.header]} if self.header else {}).encode())
+        if req.get_method() == 'PUT':
+            self.header = json.loads(body)['values'][0]
+        return FakeResponse(b'{}')
+
+    def appends(self):
+        return [json.loads(body)['values'] for method, url, body in self.calls if method == 'POST' and ':append' in url]
+
+
+@pytest.fixture
+def google():
+    fake = FakeGoogle()
+    with patch.object(google_sheets_sync, '_urlopen', fake.urlopen), \
+            patch.object(google_sheets_sync, 'jwt', Mock(encode=Mock(return_value='signed'))), \
+            patch.object(google_sheets_sync, 'GOOGLE_SHEETS_WEBAPP_URL', ''), \
+            patch.object(google_sheets_sync, 'GOOGLE_SHEET_ID', 'sheet1'), \
+            patch.object(google_sheets_sync, 'GOOGLE_SERVICE_ACCOUNT_EMAIL', 'sa@example.com'), \
+            patch.object(google_sheets_sync, 'GOOGLE_SERVICE_ACCOUNT_PRIVATE_KEY', 'key'), \
+            patch.object(google_sheets_sync, '_cached_token', None), \
+            patch.object(google_sheets_sync, '_header_verified', None):
+        yield fake
+
+
+def _rows(n):
+    return [google_sheets_sync.build_attribution_row(dict(USER, userId=f'u{i}'), 'email') for i in range(n)]
+
+
+class TestServiceAccountAppend:
+    def test_token_and_header_reused_across_appends(self, google):
+        append_attribution_rows(_rows(2))
+        append_attribution_rows(_rows(1))
+        assert google.tokens == 1
+        assert [m for m, _, _ in google.calls].count('GET') == 1
+        assert google.header == google_sheets_sync.SHEET_HEADER_ROW
+        assert [len(values) for values in google.appends()] == [2, 1]
+
+    def test_expired_token_refreshed(self, google):
+        with patch.object(google_sheets_sync, '_cached_token', ('old', time.time() - 1)):
+            append_attribution_rows(_rows(1))
+        assert google.tokens == 1
+
+    def test_rejected_token_retried_once_with_new_token(self, google):
+        append_attribution_rows(_rows(1))
+        google.reject_tokens.add('tok1')
+        append_attribution_rows(_rows(1))
+        assert google.tokens == 2 and len(google.appends()) == 3  # ok, rejected, retried
+
+    def test_second_rejection_raises(self, google):
+        google.reject_tokens.update({'tok1', 'tok2'})
+        with pytest.raises(google_sheets_sync.GoogleSheetsHTTPError) as exc_info:
+            append_attribution_rows(_rows(1))
+        assert exc_info.value.status == 401 and google.tokens == 2
+
+
+class TestEngine:
+    def test_rows_coalesced_into_one_flush(self):
+        written = []
+        engine = SheetsSyncEngine(written.append, flush_seconds=0.05, batch_size=100)
+        for row in _rows(5):
+            engine.submit(row)
+        deadline = time.time() + 2
+        while not written and time.time() < deadline:
+            time.sleep(0.01)
+        assert [len(batch) for batch in written] == [5] and engine.pending() == 0
+
+    def test_batch_size_flushes_early(self):
+        flushed = threading.Event()
+        engine = SheetsSyncEngine(lambda rows: flushed.set(), flush_seconds=60, batch_size=3)
+        for row in _rows(3):
+            engine.submit(row)
+        assert flushed.wait(2)
+
+    def test_failed_flush_keeps_rows(self):
+        write = Mock(side_effect=[RuntimeError('quota'), None])
+        engine = SheetsSyncEngine(write, flush_seconds=60)
+        engine.submit(_rows(1)[0])
+        assert engine.flush() is False and engine.pending() == 1
+        assert engine.flush() is True and engine.pending() == 0
+        assert engine.stats['failedFlushes'] == 1 and engine.stats['written'] == 1
+
+    def test_partial_web_app_failure_keeps_only_unwritten_rows(self):
+        def post(url, row):
+            if row['userId'] == 'u2':
+                raise RuntimeError('Apps Script quota')
+
+        engine = SheetsSyncEngine(append_attribution_rows, flush_seconds=60)
+        for row in _rows(4):
+            engine.submit(row)
+        with patch.object(google_sheets_sync, 'GOOGLE_SHEETS_WEBAPP_URL', 'https://script.google.com/x/exec'), \
+                patch.object(google_sheets_sync, '_post_json', side_effect=post):
+            assert engine.flush() is False
+            assert engine.pending() == 2 and engine.stats['written'] == 2
+            post_ok = Mock()
+            with patch.object(google_sheets_sync, '_post_json', post_ok):
+                assert engine.flush() is True
+        assert [c.args[1]['userId'] for c in post_ok.call_args_list] == ['u2', 'u3']
+
+    def test_full_buffer_drops_oldest(self):
+        written = []
+        engine = SheetsSyncEngine(written.extend, flush_seconds=60, batch_size=100, max_buffered=2)
+        for row in _rows(3):
+            engine.submit(row)
+        engine.flush()
+        assert [r['userId'] for r in written] == ['u1', 'u2'] and engine.stats['dropped'] == 1
+
+
+class TestAppendUserAttributionRow:
+    def test_buffered_signup_does_not_call_google(self, google):
+        engine = SheetsSyncEngine(Mock(), flush_seconds=60)
+        with patch.object(google_sheets_sync, '_get_engine', return_value=engine), \
+                patch.object(google_sheets_sync, 'FLUSH_SECONDS', 60):
+            assert append_user_attribution_row(USER, 'email') is True
+        assert google.calls == [] and engine.pending() == 1
+
+    def test_synchronous_when_flush_disabled(self, google):
+        with patch.object(google_sheets_sync, 'FLUSH_SECONDS', 0):
+            assert append_user_attribution_row(USER, 'google') is True
+        assert google.appends()[0][0][3] == 'google'
+
+    def test_inline_by_default(self, google):
+        assert append_user_attribution_row(USER, 'email') is True
+        assert len(google.appends()) == 1
+
+    def test_queued_signup_does_not_call_google(self, google):
+        sqs = Mock()
+        with patch.object(google_sheets_sync, 'GOOGLE_SHEETS_QUEUE_URL', 'https://sqs/q'), \
+                patch.object(google_sheets_sync, '_sqs_client', sqs):
+            assert append_user_attribution_row(USER, 'email') is True
+        assert google.calls == []
+        kwargs = sqs.send_message.call_args.kwargs
+        assert kwargs['QueueUrl'] == 'https://sqs/q' and json.loads(kwargs['MessageBody'])['userId'] == 'u1'
+
+    def test_enqueue_failure_appends_inline(self, google):
+        sqs = Mock(send_message=Mock(side_effect=RuntimeError('throttled')))
+        with patch.object(google_sheets_sync, 'GOOGLE_SHEETS_QUEUE_URL', 'https://sqs/q'), \
+                patch.object(google_sheets_sync, '_sqs_client', sqs):
+            assert append_user_attribution_row(USER, 'email') is True
+        assert len(google.appends()) == 1
+
+    def test_skips_users_without_attribution(self, google):
+        assert append_user_attribution_row({'userId': 'u2', 'email': 'b@example.com'}, 'email') is False
+
+
+def _sqs_event(bodies):
+    return {'Records': [{'messageId': f'm{i}', 'body': body} for i, body in enumerate(bodies)]}
+
+
+class TestDrainer:
+    def test_batch_appended_in_one_call(self, google):
+        result = google_sheets_sync.lambda_handler(_sqs_event([json.dumps(row) for row in _rows(3)]), None)
+        assert result == {'batchItemFailures': []}
+        assert [len(values) for values in google.appends()] == [3]
+        assert google.appends()[0][1][1] == 'u1'
+
+    def test_failed_append_returns_batch_to_sqs(self, google):
+        google.reject_tokens.update({'tok1', 'tok2'})
+        result = google_sheets_sync.lambda_handler(_sqs_event([json.dumps(row) for row in _rows(2)]), None)
+        assert [f['itemIdentifier'] for f in result['batchItemFailures']] == ['m0', 'm1']
+
+    def test_partial_web_app_failure_returns_only_unwritten_messages(self):
+        def post(url, row):
+            if row['userId'] == 'u1':
+                raise RuntimeError('Apps Script quota')
+
+        with patch.object(google_sheets_sync, 'GOOGLE_SHEETS_WEBAPP_URL', 'https://script.google.com/x/exec'), \
+                patch.object(google_sheets_sync, '_post_json', side_effect=post):
+            result = google_sheets_sync.lambda_handler(_sqs_event([json.dumps(row) for row in _rows(3)]), None)
+        assert [f['itemIdentifier'] for f in result['batchItemFailures']] == ['m1', 'm2']
+
+    def test_unreadable_messages_dropped(self, google):
+        result = google_sheets_sync.lambda_handler(_sqs_event(['not json', '{}', json.dumps(_rows(1)[0])]), None)
+        assert result == {'batchItemFailures': []}
+        assert [len(values) for values in google.appends()] == [1]
@@ -0,0 +1,96 @@
+"""
+Unit Tests for indexed Users lookups (login_handler)
+"""
+
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+
+import sys
+sys.path.insert(0, '..')
+import user_lookup
+from user_lookup import get_user_by_email, get_user_by_google_sub, remember
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    user_lookup.clear_cache()
+    yield
+    user_lookup.clear_cache()
+
+
+def _table(user):
+    table = Mock()
+    table.query.return_value = {'Items': [{'userId': user['userId'], 'email': user.get('email')}]}
+    table.get_item.return_value = {'Item': user}
+    return table
+
+
+class TestGetUserByEmail:
+    def test_uses_gsi_then_consistent_get(self):
+        user = {'userId': 'u1', 'email': 'a@example.com', 'status': 'active'}
+        table = _table(user)
+
+        assert get_user_by_email(table, 'a@example.com') == user
+        assert table.query.call_args.kwargs['IndexName'] == user_lookup.EMAIL_INDEX
+        assert table.get_item.call_args.kwargs == {'Key': {'userId': 'u1'}, 'ConsistentRead': True}
+        table.scan.assert_not_called()
+
+    def test_second_lookup_skips_index_query(self):
+        user = {'userId': 'u1', 'email': 'a@example.com'}
+        table = _table(user)
+
+        get_user_by_email(table, 'a@example.com')
+        get_user_by_email(table, 'a@example.com')
+
+        assert table.query.call_count == 1
+        assert table.get_item.call_count == 2
+
+    def test_stale_cache_entry_is_requeried(self):
+        table = _table({'userId': 'u2', 'email': 'a@example.com'})
+        remember({'userId': 'u1', 'email': 'a@example.com'})
+        table.get_item.side_effect = [{'Item': {'userId': 'u1', 'email': 'other@example.com'}},
+                                      {'Item': {'userId': 'u2', 'email': 'a@example.com'}}]
+
+        assert get_user_by_email(table, 'a@example.com')['userId'] == 'u2'
+        assert table.query.call_count == 1
+
+    def test_unknown_email_returns_none(self):
+        table = Mock()
+        table.query.return_value = {'Items': []}
+        assert get_user_by_email(table, 'nobody@example.com') is None
+        table.get_item.assert_not_called()
+
+    def test_missing_index_falls_back_to_paginated_scan(self):
+        table = Mock()
+        table.query.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'The table does not have the specified index: email-index'}},
+            'Query',
+        )
+        user = {'userId': 'u9', 'email': 'late@example.com'}
+        table.scan.side_effect = [{'Items': [], 'LastEvaluatedKey': {'userId': 'x'}}, {'Items': [user]}]
+
+        assert get_user_by_email(table, 'late@example.com') == user
+        assert table.scan.call_count == 2
+        assert table.scan.call_args.kwargs['ExclusiveStartKey'] == {'userId': 'x'}
+
+    def test_other_client_errors_propagate(self):
+        table = Mock()
+        table.query.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'slow down'}}, 'Query'
+        )
+        with pytest.raises(ClientError):
+            get_user_by_email(table, 'a@example.com')
+
+
+class TestGetUserByGoogleSub:
+    def test_uses_google_sub_index(self):
+        user = {'userId': 'g1', 'email': 'g@example.com', 'googleSub': 'sub-1'}
+        table = _table(user)
+        assert get_user_by_google_sub(table, 'sub-1') == user
+        assert table.query.call_args.kwargs['IndexName'] == user_lookup.GOOGLE_SUB_INDEX
+
+    def test_empty_sub_is_not_looked_up(self):
+        table = Mock()
+        assert get_user_by_google_sub(table, '') is None
+        table.query.assert_not_called()
@@ -12,7 +12,9 @@ from xml.sax.saxutils import escape
 from botocore.config import Config
 from boto3.dynamodb.conditions import Key
 
-from feature_entitlement import check_entitlement_or_error, consume_feature_use
+from feature_entitlement import EntitlementContext, check_entitlement_or_error, consume_feature_use
+import freelancer_search_index
+import http_client
 
 # ---------- CONFIG ----------
 USERS_TABLE = "Users"
@@ -26,6 +28,10 @@ S3_REGION = "ap-south-2"
 # Override when ATS resume bucket lives in another region than S3_REGION (profile-images client).
 ATS_RESUME_S3_REGION = (os.environ.get("ATS_RESUME_S3_REGION") or "").strip()
 
+# Profile fields that feed the freelancer search index (freelancer_search_index.py);
+# status decides whether the user is listed at all (blocked / deleted are dropped)
+SEARCH_INDEXED_FIELDS = ("fullName", "role", "location", "hourlyRate", "isFreelancer", "skills", "status")
+
 # ---------- AWS ----------
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(USERS_TABLE)
@@ -152,7 +158,7 @@ def _test_openai_key(api_key):
         method="GET",
     )
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
+        with http_client.urlopen(req, timeout=10) as resp:
             return resp.status == 200, None
     except urllib.error.HTTPError as e:
         return False, e.read().decode("utf-8", errors="ignore") or str(e)
@@ -168,7 +174,7 @@ def _test_openrouter_key(api_key):
         method="GET",
     )
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with http_client.urlopen(req, timeout=15) as resp:
             return resp.status == 200, None
     except urllib.error.HTTPError as e:
         return False, e.read().decode("utf-8", errors="ignore") or str(e)
@@ -182,7 +188,7 @@ def _test_gemini_key(api_key):
     data = json.dumps({"contents": [{"parts": [{"text": "Hi"}]}]}).encode("utf-8")
     req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with http_client.urlopen(req, timeout=15) as resp:
             return resp.status == 200, None
     except urllib.error.HTTPError as e:
         return False, e.read().decode("utf-8", errors="ignore") or str(e)
@@ -201,7 +207,7 @@ def _test_groq_key(api_key):
         method="GET",
     )
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with http_client.urlopen(req, timeout=15) as resp:
             return resp.status == 200, None
     except urllib.error.HTTPError as e:
         return False, e.read().decode("utf-8", errors="ignore") or str(e)
@@ -227,7 +233,7 @@ def _test_claude_key(api_key):
         method="POST",
     )
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with http_client.urlopen(req, timeout=15) as resp:
             return resp.status == 200, None
     except urllib.error.HTTPError as e:
         return False, e.read().decode("utf-8", errors="ignore") or str(e)
@@ -410,7 +416,7 @@ def _call_openai_compatible_chat(api_key, endpoint, model, user_content, tempera
     if "groq.com" in endpoint:
         headers["User-Agent"] = GROQ_USER_AGENT
     req = urllib.request.Request(endpoint, data=data, headers=headers, method="POST")
-    with urllib.request.urlopen(req, timeout=90) as resp:
+    with http_client.urlopen(req, timeout=90) as resp:
         out = json.loads(resp.read().decode("utf-8"))
     err = out.get("error")
     if err:
@@ -849,6 +855,13 @@ def handle_update_settings(body):
             "message": f"Database update error: {str(e)}"
         })
 
+    # Incrementally re-index freelancer search postings (don't fail the save)
+    if any(k in updates for k in SEARCH_INDEXED_FIELDS):
+        try:
+            freelancer_search_index.index_user(result["Attributes"])
+        except Exception as e:
+            print(f"Freelancer search index update failed (non-fatal): {e}")
+
     return response(200, {
         "success": True,
         "message": "Settings updated successfully",
@@ -1191,20 +1204,20 @@ def handle_generate_resume_pdf(body):
     if not user_id:
         return response(400, {"success": False, "message": "userId is required"})
 
-    allowed, ent_err = check_entitlement_or_error(user_id, "resume-builder")
-    if not allowed:
-        return response(403, {"success": False, "message": ent_err})
-
+    ent_ctx = EntitlementContext(user_id)
     try:
-        existing = table.get_item(Key={"userId": user_id})
+        allowed, ent_err = check_entitlement_or_error(user_id, "resume-builder", ctx=ent_ctx)
+        user_item = ent_ctx.user_item
     except Exception as e:
         print(f"generateResumePdf get_item error: {e}")
         return response(500, {"success": False, "message": str(e)})
+    if not allowed:
+        return response(403, {"success": False, "message": ent_err})
 
-    if "Item" not in existing:
+    if not user_item:
         return response(404, {"success": False, "message": "User not found"})
 
-    item = decimal_to_native(existing["Item"])
+    item = decimal_to_native(user_item)
     profile = item.get("savedResumeProfile")
     settings = item.get("resumeExportSettings")
 
@@ -1246,7 +1259,7 @@ def handle_generate_resume_pdf(body):
 
     session_id = (body.get("sessionId") or "").strip() or key
     ok_consume, _, consume_err = consume_feature_use(
-        user_id, "resume-builder", session_id=session_id
+        user_id, "resume-builder", session_id=session_id, ctx=ent_ctx
     )
     if not ok_consume:
         return response(403, {"success": False, "message": consume_err or "Trial limit reached"})
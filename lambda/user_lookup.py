@@ -0,0 +1,247 @@
+"""
+Indexed Users lookups by email and Google subject for login_handler.
+
+Users table GSIs (both KEYS_ONLY; DynamoDB backfills existing rows when created):
+  email-index      PK: email     (string)
+  googleSub-index  PK: googleSub (string, sparse: only Google sign-ins)
+
+A lookup is one GSI Query for the userId plus one strongly consistent GetItem
+for the full row, so login cost no longer grows with the user base. The
+email/googleSub -> userId mapping is cached in the warm container for
+USER_LOOKUP_CACHE_TTL seconds; the row itself is always read fresh so status
+and password changes apply immediately.
+
+If an index is missing (not created yet) the lookup falls back to a paginated
+scan, so deploying this module before running the migration is safe.
+
+Migration / backfill (run from lambda/):
+    python user_lookup.py                      # dry run: index status + data checks
+    python user_lookup.py --apply              # create missing GSIs (backfill is automatic)
+    python user_lookup.py --apply --normalize-emails
+                                               # also lowercase stored emails that
+                                               # login could never match
+"""
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+EMAIL_INDEX = os.environ.get("USERS_EMAIL_INDEX", "email-index")
+GOOGLE_SUB_INDEX = os.environ.get("USERS_GOOGLE_SUB_INDEX", "googleSub-index")
+try:
+    CACHE_TTL_SECONDS = max(0, int(os.environ.get("USER_LOOKUP_CACHE_TTL", "60")))
+except ValueError:
+    CACHE_TTL_SECONDS = 60
+CACHE_MAX_ENTRIES = 1024
+
+# (attribute, value) -> (expires_at, userId)
+_id_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+# Indexes found missing in this container; skip straight to the scan fallback
+_missing_indexes: set = set()
+
+
+def _cache_get(attr: str, value: str) -> Optional[str]:
+    entry = _id_cache.get((attr, value))
+    if not entry:
+        return None
+    expires_at, user_id = entry
+    if expires_at < time.time():
+        _id_cache.pop((attr, value), None)
+        return None
+    _id_cache.move_to_end((attr, value))
+    return user_id
+
+
+def _cache_put(attr: str, value: str, user_id: str) -> None:
+    if CACHE_TTL_SECONDS <= 0:
+        return
+    _id_cache[(attr, value)] = (time.time() + CACHE_TTL_SECONDS, user_id)
+    _id_cache.move_to_end((attr, value))
+    while len(_id_cache) > CACHE_MAX_ENTRIES:
+        _id_cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    _id_cache.clear()
+    _missing_indexes.clear()
+
+
+def remember(user: Dict[str, Any]) -> None:
+    """Seed the cache after creating or updating a user."""
+    user_id = user.get("userId")
+    if not user_id:
+        return
+    if user.get("email"):
+        _cache_put("email", user["email"], user_id)
+    if user.get("googleSub"):
+        _cache_put("googleSub", user["googleSub"], user_id)
+
+
+def _get_by_id(table, user_id: str) -> Optional[Dict[str, Any]]:
+    return table.get_item(Key={"userId": user_id}, ConsistentRead=True).get("Item")
+
+
+def _is_missing_index_error(exc: ClientError) -> bool:
+    err = exc.response.get("Error", {})
+    return err.get("Code") in ("ValidationException", "ResourceNotFoundException") and "index" in (
+        err.get("Message") or ""
+    ).lower()
+
+
+def _scan_for(table, attr: str, value: str) -> Optional[Dict[str, Any]]:
+    kwargs: Dict[str, Any] = {"FilterExpression": Attr(attr).eq(value)}
+    while True:
+        result = table.scan(**kwargs)
+        items = result.get("Items") or []
+        if items:
+            return items[0]
+        if "LastEvaluatedKey" not in result:
+            return None
+        kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+
+def _lookup(table, attr: str, index: str, value: str) -> Optional[Dict[str, Any]]:
+    if not value:
+        return None
+
+    cached_id = _cache_get(attr, value)
+    if cached_id:
+        user = _get_by_id(table, cached_id)
+        if user and user.get(attr) == value:
+            return user
+        _id_cache.pop((attr, value), None)
+
+    if index in _missing_indexes:
+        user = _scan_for(table, attr, value)
+    else:
+        try:
+            result = table.query(IndexName=index, KeyConditionExpression=Key(attr).eq(value), Limit=1)
+        except ClientError as e:
+            if not _is_missing_index_error(e):
+                raise
+            print(f"Users index {index} missing; falling back to scan (run user_lookup.py --apply)")
+            _missing_indexes.add(index)
+            user = _scan_for(table, attr, value)
+        else:
+            items = result.get("Items") or []
+            user = _get_by_id(table, items[0]["userId"]) if items else None
+
+    if user and user.get("userId"):
+        _cache_put(attr, value, user["userId"])
+    return user
+
+
+def get_user_by_email(table, email: str) -> Optional[Dict[str, Any]]:
+    """Resolve a user by (already normalised) email."""
+    return _lookup(table, "email", EMAIL_INDEX, email)
+
+
+def get_user_by_google_sub(table, google_sub: str) -> Optional[Dict[str, Any]]:
+    return _lookup(table, "googleSub", GOOGLE_SUB_INDEX, google_sub)
+
+
+# ---------- MIGRATION ----------
+def _index_statuses(desc: Dict[str, Any]) -> Dict[str, str]:
+    statuses = {}
+    for gsi in desc.get("GlobalSecondaryIndexes") or []:
+        status = gsi.get("IndexStatus", "")
+        if gsi.get("Backfilling"):
+            status += " (backfilling)"
+        statuses[gsi["IndexName"]] = status
+    return statuses
+
+
+def ensure_indexes(table, apply: bool = False) -> Dict[str, str]:
+    """Create whichever lookup GSIs are missing. DynamoDB allows one GSI creation at a time."""
+    desc = table.meta.client.describe_table(TableName=table.name)["Table"]
+    statuses = _index_statuses(desc)
+    on_demand = (desc.get("BillingModeSummary") or {}).get("BillingMode") == "PAY_PER_REQUEST"
+    for index, attr in ((EMAIL_INDEX, "email"), (GOOGLE_SUB_INDEX, "googleSub")):
+        if index in statuses:
+            continue
+        if not apply:
+            statuses[index] = "MISSING"
+            continue
+        create: Dict[str, Any] = {
+            "IndexName": index,
+            "KeySchema": [{"AttributeName": attr, "KeyType": "HASH"}],
+            "Projection": {"ProjectionType": "KEYS_ONLY"},
+        }
+        if not on_demand:
+            create["ProvisionedThroughput"] = {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5}
+        table.meta.client.update_table(
+            TableName=table.name,
+            AttributeDefinitions=[{"AttributeName": attr, "AttributeType": "S"}],
+            GlobalSecondaryIndexUpdates=[{"Create": create}],
+        )
+        statuses[index] = "CREATING (re-run once ACTIVE to create the next index)"
+        break
+    return statuses
+
+
+def normalize_emails(table, apply: bool = False) -> Tuple[int, int]:
+    """
+    Lowercase stored emails that contain uppercase/whitespace (login always
+    lowercases input, so these rows were unreachable). Rows whose normalised
+    email already belongs to another user are reported and left alone.
+    Returns (rows needing change, rows changed).
+    """
+    seen: Dict[str, str] = {}
+    pending = []
+    kwargs: Dict[str, Any] = {"ProjectionExpression": "userId, email"}
+    while True:
+        result = table.scan(**kwargs)
+        for item in result.get("Items") or []:
+            email = item.get("email")
+            if not isinstance(email, str):
+                continue
+            normalised = email.lower().strip()
+            if normalised == email:
+                seen[email] = item["userId"]
+            else:
+                pending.append((item["userId"], email, normalised))
+        if "LastEvaluatedKey" not in result:
+            break
+        kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+    changed = 0
+    for user_id, email, normalised in pending:
+        if normalised in seen and seen[normalised] != user_id:
+            print(f"  skip {user_id}: {email!r} collides with {seen[normalised]}")
+            continue
+        print(f"  {user_id}: {email!r} -> {normalised!r}")
+        if apply:
+            table.update_item(
+                Key={"userId": user_id},
+                UpdateExpression="SET email = :e",
+                ConditionExpression="email = :old",
+                ExpressionAttributeValues={":e": normalised, ":old": email},
+            )
+            changed += 1
+        seen[normalised] = user_id
+    return len(pending), changed
+
+
+if __name__ == "__main__":
+    import sys
+
+    import boto3
+
+    apply_changes = "--apply" in sys.argv
+    region = os.environ.get("AWS_REGION") or os.environ.get("REGION") or "ap-south-2"
+    users = boto3.resource("dynamodb", region_name=region).Table(os.environ.get("USERS_TABLE", "Users"))
+
+    print("Users GSIs:")
+    for name, status in ensure_indexes(users, apply=apply_changes).items():
+        print(f"  {name}: {status}")
+    if "--normalize-emails" in sys.argv or not apply_changes:
+        print("Emails that login cannot match:")
+        needing, done = normalize_emails(users, apply=apply_changes and "--normalize-emails" in sys.argv)
+        print(f"  {needing} found, {done} updated")
+    if not apply_changes:
+        print("Dry run only. Re-run with --apply to make changes.")
@@ -83,6 +83,9 @@ export interface AtsResult {
   /** Rich missing-keyword rows when the scorer returns section hints. */
   missingKeywordDetails?: MissingKeywordItem[];
   feedback: string[];
+  /** True for the deterministic estimate (scoringMode 'local', or 'auto' when the LLM was skipped). */
+  provisional?: boolean;
+  scoredBy?: 'local';
 }
 
 /** Normalize API payload: strings-only legacy vs objects with suggestedSection (snake_case tolerant). */
@@ -308,8 +311,12 @@ export interface AnalyzeAtsWithProviderParams {
   resumeFile: File;
   /** Provider model id (optional), e.g. gemini-2.0-flash, gpt-4o-mini, claude-3-haiku-20240307 */
   model?: string;
+  /** 'local' = instant deterministic estimate (no LLM, no trial use); 'auto' = LLM only for borderline scores. */
+  scoringMode?: AtsScoringMode;
 }
 
+export type AtsScoringMode = 'llm' | 'local' | 'auto';
+
 /** Response from the Fix My Resume Lambda. */
 export interface FixResumeResult {
   success: boolean;
@@ -413,6 +420,58 @@ export interface FixResumeWithProviderParams {
   provider?: AtsProvider;
   apiKey?: string;
   model?: string;
+  /**
+   * Called with each AI render section as it is generated (before keyword injection), when the
+   * server can stream (local_fix_resume_server.py). The returned result is final either way.
+   */
+  onPartial?: (event: FixResumePartialEvent) => void;
+}
+
+/** Streamed piece of an AI JSON / HTML render; see resume_fix_engine on_partial. */
+export type FixResumePartialEvent =
+  | { event: 'field'; key: 'name' | 'subtitle' | 'contacts'; value: unknown }
+  | { event: 'section'; index: number; section?: Record<string, unknown>; title?: string; html?: string }
+  | { event: 'header'; html: string };
+
+/** Reads a text/event-stream response: forwards `partial` events, returns the `result` event's data. */
+async function readFixResumeEventStream(
+  res: Response,
+  onPartial: (event: FixResumePartialEvent) => void
+): Promise<string> {
+  const reader = res.body!.getReader();
+  const decoder = new TextDecoder();
+  let buf = '';
+  let result = '';
+  const dispatch = (block: string) => {
+    let name = 'message';
+    const data: string[] = [];
+    for (const line of block.split('\n')) {
+      if (line.startsWith('event:')) name = line.slice(6).trim();
+      else if (line.startsWith('data:')) data.push(line.slice(5).replace(/^ /, ''));
+    }
+    if (name === 'result') {
+      result = data.join('\n');
+    } else if (name === 'partial' && data.length) {
+      try {
+        onPartial(JSON.parse(data.join('\n')) as FixResumePartialEvent);
+      } catch {
+        /* ignore malformed partials; the final result is authoritative */
+      }
+    }
+  };
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buf += decoder.decode(value, { stream: true }).replace(/\r\n/g, '\n');
+    let sep = buf.indexOf('\n\n');
+    while (sep >= 0) {
+      dispatch(buf.slice(0, sep));
+      buf = buf.slice(sep + 2);
+      sep = buf.indexOf('\n\n');
+    }
+  }
+  if (buf.trim()) dispatch(buf);
+  return result;
 }
 
 /**
@@ -421,7 +480,7 @@ export interface FixResumeWithProviderParams {
 export async function fixResumeWithProvider(
   params: FixResumeWithProviderParams
 ): Promise<FixResumeResult> {
-  const { resumeFile, missingKeywords, userId, useLlmEnhance, useLlmMapFields, useLlmRenderHtml, useLlmRenderResumeJson, provider, apiKey, model } = params;
+  const { resumeFile, missingKeywords, userId, useLlmEnhance, useLlmMapFields, useLlmRenderHtml, useLlmRenderResumeJson, provider, apiKey, model, onPartial } = params;
   const resumeBase64 = await fileToBase64(resumeFile);
   const body: Record<string, unknown> = {
     resumeBase64,
@@ -455,12 +514,17 @@ export async function fixResumeWithProvider(
   }
   const res = await fetch(FIX_RESUME_ENDPOINT, {
     method: 'POST',
-    headers: { 'Content-Type': 'application/json' },
+    headers: {
+      'Content-Type': 'application/json',
+      ...(onPartial ? { Accept: 'text/event-stream, application/json' } : {}),
+    },
     body: JSON.stringify(body),
   });
   let data: FixResumeResult = { success: false };
   try {
-    const text = await res.text();
+    // Deployed Lambda answers with plain JSON; only a streaming-capable server sends events.
+    const streamed = Boolean(onPartial && res.body && res.headers.get('content-type')?.includes('text/event-stream'));
+    const text = streamed ? await readFixResumeEventStream(res, onPartial!) : await res.text();
     data = text ? (JSON.parse(text) as FixResumeResult) : { success: false };
   } catch {
     return { success: false, message: 'Invalid response from fix-resume service' };
@@ -483,7 +547,7 @@ export async function fixResumeWithProvider(
 export async function analyzeAtsWithProvider(
   params: AnalyzeAtsWithProviderParams
 ): Promise<{ success: boolean; atsResult?: AtsResult; message?: string }> {
-  const { provider, userId, apiKey, jobDescription, resumeFile, model } = params;
+  const { provider, userId, apiKey, jobDescription, resumeFile, model, scoringMode } = params;
   const resumeBase64 = await fileToBase64(resumeFile);
   const legacyProvider = provider === 'anthropic' ? 'claude' : provider;
   const res = await fetch(ATS_SCORER_ENDPOINT, {
@@ -497,6 +561,7 @@ export async function analyzeAtsWithProvider(
       ...(userId ? { userId } : {}),
       ...(apiKey?.trim() ? { apiKey: apiKey.trim() } : {}),
       ...(model ? { model } : {}),
+      ...(scoringMode ? { scoringMode } : {}),
     }),
   });
   let data: { success?: boolean; atsResult?: AtsResult; message?: string } = {};
@@ -532,6 +597,78 @@ export async function analyzeAtsWithProvider(
   };
 }
 
+/** One saved listing to score in a batch (JobListings rows with id / description also work). */
+export interface AtsBatchJob {
+  jobId: string;
+  jobDescription: string;
+}
+
+export interface AtsBatchJobResult {
+  jobId: string;
+  success: boolean;
+  /** 'local' when the deterministic estimate was used; otherwise the LLM provider. */
+  provider?: string;
+  atsResult?: AtsResult;
+  message?: string;
+}
+
+export interface ScoreResumeAgainstJobsParams {
+  jobs: AtsBatchJob[];
+  userId?: string;
+  /** With apiKey: BYOK. Without: the user's saved keys (provider optional). */
+  provider?: AtsProvider;
+  apiKey?: string;
+  model?: string;
+  resumeText?: string;
+  resumeFile?: File;
+  scoringMode?: AtsScoringMode;
+}
+
+/** Jobs per batch request; matches the Lambda's ATS_BATCH_MAX_JOBS so each request fits the gateway timeout. */
+const ATS_BATCH_SIZE = 8;
+
+/**
+ * Score one résumé against many jobs. Jobs are sent ATS_BATCH_SIZE per request, one request after
+ * another; each scored job uses one trial scan and is saved to history. Results come back in the
+ * order of `jobs`; a job that could not be scored has success: false and a message. If a request
+ * fails, the results of the earlier requests are still returned.
+ */
+export async function scoreResumeAgainstJobs(
+  params: ScoreResumeAgainstJobsParams
+): Promise<{ success: boolean; results?: AtsBatchJobResult[]; message?: string }> {
+  const { jobs, userId, provider, apiKey, model, resumeText, resumeFile, scoringMode } = params;
+  const resume = resumeFile
+    ? { resumeBase64: await fileToBase64(resumeFile), resumeFileName: resumeFile.name || 'resume.pdf' }
+    : { resumeText: resumeText || '', resumeFileName: 'resume-from-builder.txt' };
+  const results: AtsBatchJobResult[] = [];
+  for (let start = 0; start < jobs.length; start += ATS_BATCH_SIZE) {
+    const res = await fetch(ATS_SCORER_ENDPOINT, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        jobs: jobs.slice(start, start + ATS_BATCH_SIZE),
+        ...resume,
+        ...(userId ? { userId } : {}),
+        ...(provider ? { provider } : {}),
+        ...(apiKey?.trim() ? { apiKey: apiKey.trim() } : {}),
+        ...(model ? { model } : {}),
+        ...(scoringMode ? { scoringMode } : {}),
+      }),
+    });
+    let data: { success?: boolean; results?: AtsBatchJobResult[]; message?: string } = {};
+    try {
+      data = await res.json();
+    } catch {
+      return { success: false, results, message: `Invalid response (${res.status})` };
+    }
+    if (!res.ok || !data.success) {
+      return { success: false, results, message: data.message || `Request failed (${res.status})` };
+    }
+    results.push(...(data.results || []));
+  }
+  return { success: true, results };
+}
+
 export interface AtsHistoryItem {
   userId: string;
   reportId: string;
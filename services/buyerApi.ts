@@ -928,6 +928,8 @@ export interface FetchJobsResponse {
     limit: number;
     offset: number;
     has_more: boolean;
+    /** Opaque cursor for the next page (send back as `cursor`) */
+    next_cursor?: string | null;
   };
   error?: {
     code: string;
@@ -977,6 +979,8 @@ export function getJobHuntUserId(): string | null {
 export interface FetchJobsOptions {
   limit?: number;
   offset?: number;
+  /** `next_cursor` from the previous page; the server reads from there instead of skipping `offset` rows */
+  cursor?: string;
   /** When set, each job may include `saved` and server tracks bookmarks */
   userId?: string;
   /** Only jobs saved for `userId` (requires `userId`) */
@@ -994,10 +998,11 @@ export const fetchJobs = async (options: FetchJobsOptions = {}): Promise<FetchJo
     };
   }
   try {
-    const { limit = 12, offset = 0, userId, savedOnly } = options;
+    const { limit = 12, offset = 0, cursor, userId, savedOnly } = options;
     const query = new URLSearchParams();
     query.set('limit', String(limit));
     query.set('offset', String(offset));
+    if (cursor) query.set('cursor', cursor);
     if (userId?.trim()) query.set('userId', userId.trim());
     if (savedOnly && userId?.trim()) query.set('saved_only', '1');
     const url = `${FETCH_JOBS_ENDPOINT}?${query.toString()}`;
@@ -1074,6 +1079,7 @@ export const fetchJobs = async (options: FetchJobsOptions = {}): Promise<FetchJo
         limit: typeof payload.limit === 'number' ? payload.limit : limit,
         offset: typeof payload.offset === 'number' ? payload.offset : offset,
         has_more: Boolean(payload.has_more),
+        next_cursor: typeof payload.next_cursor === 'string' ? payload.next_cursor : null,
       },
     };
   } catch (error) {